@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from great_expectations.compatibility.not_imported import NotImported
+
+POLARS_NOT_IMPORTED = NotImported(
+    "polars is not installed, please 'pip install polars'"
+)
+
+try:
+    import polars
+except ImportError:
+    polars = POLARS_NOT_IMPORTED
@@ -10,3 +10,28 @@ try:
     import pyarrow
 except ImportError:
     pyarrow = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import parquet
+except ImportError:
+    parquet = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import compute
+except ImportError:
+    compute = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import csv
+except ImportError:
+    csv = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = PYARROW_NOT_IMPORTED
+
+try:
+    from pyarrow import json
+except ImportError:
+    json = PYARROW_NOT_IMPORTED
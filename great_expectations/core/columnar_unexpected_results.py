@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+import numpy as np
+import pandas as pd
+
+from great_expectations._docs_decorators import public_api
+from great_expectations.compatibility.pyarrow import parquet
+from great_expectations.compatibility.pyarrow import pyarrow as pa
+from great_expectations.compatibility.typing_extensions import override
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from great_expectations.alias_types import JSONValues
+
+COLUMNAR_LAYOUT = "columnar"
+
+# Name of the only column of "flat" results (e.g., "unexpected_list" of Column Map Expectations).
+FLAT_COLUMN_NAME = "value"
+
+DEFAULT_PAGE_SIZE = 10_000
+
+# Parquet metadata keys, recording how results were laid out and which columns could only be stored as JSON strings.
+_PARQUET_FLAT_METADATA_KEY = b"great_expectations.flat"
+_PARQUET_ENCODING_METADATA_KEY = b"great_expectations.encoding"
+_PARQUET_JSON_ENCODING = b"json"
+
+
+def use_columnar_unexpected_results(result_format: dict) -> bool:
+    """Returns True if unexpected values and indices should be returned as "ColumnarUnexpectedResults" objects.
+
+    Columnar results are opted into with "columnar_unexpected_results" key of "COMPLETE" "result_format" dictionary.
+    """
+    return bool(
+        result_format.get("columnar_unexpected_results", False)
+        and result_format.get("result_format") == "COMPLETE"
+    )
+
+
+@public_api
+class ColumnarUnexpectedResults(Sequence):
+    """Unexpected values or unexpected row identifiers of Map Expectation, stored as one typed array per column.
+
+    Behaves as read-only sequence of rows, so it can be used wherever "unexpected_list" and "unexpected_index_list" are
+    consumed as lists.  Each row is single value for "flat" results (e.g., "unexpected_list" of Column Map
+    Expectations, or positions of unexpected rows) or dictionary, keyed by column name, otherwise (e.g., values of
+    "unexpected_index_column_names" along with unexpected values).  Rows are only materialized when accessed.
+
+    Results serialize to columnar JSON (one list per column), unless they have been persisted separately (e.g., as
+    Parquet side-car file by "ValidationsStore"), in which case JSON only references them by their "storage_key".
+
+    Args:
+        columns: Dictionary of column name to values; all columns must have the same number of values.
+        flat: Whether or not rows are single values of the only column (rather than dictionaries).
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, Union[npt.NDArray, Sequence[Any], pd.Series]],
+        flat: bool = False,
+    ) -> None:
+        arrays: Dict[str, npt.NDArray] = {
+            str(column_name): _to_typed_array(values)
+            for column_name, values in columns.items()
+        }
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                "All columns of ColumnarUnexpectedResults must have the same number of values."
+            )
+
+        if flat and len(arrays) != 1:
+            raise ValueError(
+                "Flat ColumnarUnexpectedResults must have exactly one column."
+            )
+
+        self._columns: Optional[Dict[str, npt.NDArray]] = arrays
+        self._column_names: List[str] = list(arrays)
+        self._num_rows: int = lengths.pop() if lengths else 0
+        self._flat = flat
+        self._parquet_path: Optional[str] = None
+        self.storage_key: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any]) -> ColumnarUnexpectedResults:
+        """Builds ColumnarUnexpectedResults from list of single values or list of dictionaries with common keys."""
+        if isinstance(rows, ColumnarUnexpectedResults):
+            return rows
+
+        if len(rows) > 0 and isinstance(rows[0], dict):
+            return cls(
+                columns={
+                    column_name: [row.get(column_name) for row in rows]
+                    for column_name in rows[0]
+                }
+            )
+
+        return cls(columns={FLAT_COLUMN_NAME: rows}, flat=True)
+
+    @classmethod
+    def from_parquet(
+        cls, path: str, storage_key: Optional[Tuple[str, ...]] = None
+    ) -> ColumnarUnexpectedResults:
+        """Refers to results, written by "to_parquet()"; only Parquet metadata is read until rows are accessed."""
+        parquet_file = parquet.ParquetFile(path)
+        metadata = parquet_file.schema_arrow.metadata or {}
+        results = cls.__new__(cls)
+        results._columns = None
+        results._column_names = list(parquet_file.schema_arrow.names)
+        results._num_rows = parquet_file.metadata.num_rows
+        results._flat = metadata.get(_PARQUET_FLAT_METADATA_KEY) == b"true"
+        results._parquet_path = path
+        results.storage_key = storage_key
+        return results
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> ColumnarUnexpectedResults:
+        """Rebuilds ColumnarUnexpectedResults from output of "to_json_dict()".
+
+        Results that were persisted separately are rebuilt without data; their rows can be accessed once they are
+        loaded from their storage (e.g., by "ValidationsStore").
+        """
+        flat: bool = json_dict.get("flat", False)
+        if "columns" in json_dict:
+            return cls(columns=json_dict["columns"], flat=flat)
+
+        results = cls.__new__(cls)
+        results._columns = None
+        results._column_names = list(json_dict.get("column_names", []))
+        results._num_rows = json_dict.get("num_rows", 0)
+        results._flat = flat
+        results._parquet_path = None
+        storage_key = json_dict.get("storage_key")
+        results.storage_key = tuple(storage_key) if storage_key is not None else None
+        return results
+
+    @staticmethod
+    def is_columnar_json_dict(value: Any) -> bool:
+        return isinstance(value, dict) and value.get("layout") == COLUMNAR_LAYOUT
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._column_names)
+
+    @property
+    def flat(self) -> bool:
+        return self._flat
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._columns is not None
+
+    @property
+    def columns(self) -> Dict[str, npt.NDArray]:
+        """Typed arrays of values by column name (read from storage, if necessary)."""
+        if self._columns is None:
+            if self._parquet_path is None:
+                raise ValueError(
+                    f"ColumnarUnexpectedResults stored under key {self.storage_key} have not been loaded; retrieve "
+                    "validation results from their ValidationsStore in order to access them."
+                )
+
+            self._columns = _columns_from_arrow_table(
+                table=parquet.read_table(self._parquet_path)
+            )
+
+        return self._columns
+
+    @override
+    def __len__(self) -> int:
+        return self._num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    @override
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self._rows(
+                {
+                    column_name: array[index]
+                    for column_name, array in self.columns.items()
+                }
+            )
+
+        if index < 0:
+            index += self._num_rows
+
+        if not 0 <= index < self._num_rows:
+            raise IndexError("ColumnarUnexpectedResults index out of range")
+
+        return self[index : index + 1][0]
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        for page in self.iter_pages():
+            yield from page
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ColumnarUnexpectedResults):
+            return (
+                self._flat == other._flat
+                and self._column_names == other._column_names
+                and self.to_json_dict() == other.to_json_dict()
+            )
+
+        if isinstance(other, list):
+            return self.to_list() == other
+
+        return NotImplemented
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(num_rows={self._num_rows}, column_names={self._column_names}, flat={self._flat})"
+
+    def iter_pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[List[Any]]:
+        """Yields rows in lists of at most "page_size" rows; results stored in Parquet are read one page at a time."""
+        if self._columns is None and self._parquet_path is not None:
+            parquet_file = parquet.ParquetFile(self._parquet_path)
+            for record_batch in parquet_file.iter_batches(batch_size=page_size):
+                yield self._rows(
+                    _columns_from_arrow_table(
+                        table=pa.Table.from_batches([record_batch]),
+                        schema=parquet_file.schema_arrow,
+                    )
+                )
+
+            return
+
+        columns = self.columns
+        for start in range(0, self._num_rows, page_size):
+            yield self._rows(
+                {
+                    column_name: array[start : start + page_size]
+                    for column_name, array in columns.items()
+                }
+            )
+
+    def to_list(self) -> List[Any]:
+        return self[:]
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {column_name: array for column_name, array in self.columns.items()},
+            columns=self._column_names,
+        )
+
+    def to_arrow_table(self) -> pa.Table:
+        """Converts results to pyarrow Table; columns that Arrow cannot type (e.g., mixed types) are stored as JSON."""
+        from great_expectations.core.util import convert_to_json_serializable
+
+        arrays: List[pa.Array] = []
+        fields: List[pa.Field] = []
+        for column_name, array in self.columns.items():
+            try:
+                arrow_array = pa.array(array, from_pandas=True)
+                field_metadata = None
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                arrow_array = pa.array(
+                    [
+                        json.dumps(value)
+                        for value in convert_to_json_serializable(array)
+                    ],
+                    type=pa.string(),
+                )
+                field_metadata = {
+                    _PARQUET_ENCODING_METADATA_KEY: _PARQUET_JSON_ENCODING
+                }
+
+            arrays.append(arrow_array)
+            fields.append(
+                pa.field(column_name, arrow_array.type, metadata=field_metadata)
+            )
+
+        return pa.Table.from_arrays(
+            arrays,
+            schema=pa.schema(
+                fields,
+                metadata={
+                    _PARQUET_FLAT_METADATA_KEY: b"true" if self._flat else b"false"
+                },
+            ),
+        )
+
+    def to_parquet(self, where: Any) -> None:
+        """Writes results to Parquet file (path or writable file-like object), readable with "from_parquet()"."""
+        parquet.write_table(self.to_arrow_table(), where)
+
+    def to_json_dict(self) -> Dict[str, JSONValues]:
+        from great_expectations.core.util import convert_to_json_serializable
+
+        json_dict: Dict[str, JSONValues] = {
+            "layout": COLUMNAR_LAYOUT,
+            "flat": self._flat,
+            "num_rows": self._num_rows,
+            "column_names": self.column_names,
+        }
+        if self.storage_key is not None:
+            json_dict["storage_key"] = list(self.storage_key)
+        else:
+            json_dict["columns"] = {
+                column_name: convert_to_json_serializable(array)
+                for column_name, array in self.columns.items()
+            }
+
+        return json_dict
+
+    def _rows(self, columns: Dict[str, npt.NDArray]) -> List[Any]:
+        values_by_column: List[List[Any]] = [
+            _to_python_values(columns[column_name])
+            for column_name in self._column_names
+        ]
+        if self._flat:
+            return values_by_column[0]
+
+        return [
+            dict(zip(self._column_names, row_values))
+            for row_values in zip(*values_by_column)
+        ]
+
+
+def _to_typed_array(
+    values: Union[npt.NDArray, Sequence[Any], pd.Series]
+) -> npt.NDArray:
+    if isinstance(values, np.ndarray):
+        return values
+
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy()
+
+    if pa and isinstance(values, (pa.Array, pa.ChunkedArray)):
+        if values.null_count == 0:
+            return np.asarray(values)
+
+        return _to_typed_array(values.to_pylist())
+
+    # Only homogeneous numeric and boolean values get native dtype; anything else (including values with nulls) is kept
+    # as Python objects, so that no value changes its type (e.g., "int" to "float" or to "str").
+    if pd.api.types.infer_dtype(values, skipna=False) in (
+        "integer",
+        "floating",
+        "mixed-integer-float",
+        "boolean",
+    ):
+        return np.asarray(values)
+
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_python_values(array: npt.NDArray) -> List[Any]:
+    if array.dtype.kind in "mM":
+        # "tolist()" would turn nanosecond-precision values into integers.
+        return pd.Series(array).tolist()
+
+    return array.tolist()
+
+
+def _columns_from_arrow_table(
+    table: pa.Table, schema: Optional[pa.Schema] = None
+) -> Dict[str, npt.NDArray]:
+    schema = schema or table.schema
+    columns: Dict[str, npt.NDArray] = {}
+    for field in schema:
+        column = table.column(field.name)
+        if (field.metadata or {}).get(
+            _PARQUET_ENCODING_METADATA_KEY
+        ) == _PARQUET_JSON_ENCODING:
+            columns[field.name] = _to_typed_array(
+                [json.loads(value) for value in column.to_pylist()]
+            )
+        else:
+            columns[field.name] = _to_typed_array(column)
+
+    return columns
@@ -11,6 +11,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Optional,
     Sequence,
@@ -61,6 +62,90 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Criteria, by which ExpectationConfiguration objects of ExpectationSuite are indexed (see "isEquivalentTo()").
+_EXPECTATION_MATCH_TYPES: Tuple[str, ...] = ("domain", "success", "runtime")
+
+
+class _ExpectationConfigurationList(list):
+    """List of ExpectationConfiguration objects, which counts its modifications.
+
+    ExpectationSuite indexes its ExpectationConfiguration objects by position; the count ("version") allows indexes to
+    detect modifications, made to the list directly (rather than through ExpectationSuite methods), and be rebuilt.
+    """
+
+    version: int = 0
+
+    @override
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self.version += 1
+
+    @override
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    @override
+    def __iadd__(self, values):
+        self.version += 1
+        return super().__iadd__(values)
+
+    @override
+    def __imul__(self, value):
+        self.version += 1
+        return super().__imul__(value)
+
+    @override
+    def append(self, value) -> None:
+        super().append(value)
+        self.version += 1
+
+    @override
+    def extend(self, values) -> None:
+        super().extend(values)
+        self.version += 1
+
+    @override
+    def insert(self, index, value) -> None:
+        super().insert(index, value)
+        self.version += 1
+
+    @override
+    def pop(self, index=-1):
+        self.version += 1
+        return super().pop(index)
+
+    @override
+    def remove(self, value) -> None:
+        super().remove(value)
+        self.version += 1
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    @override
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    @override
+    def reverse(self) -> None:
+        super().reverse()
+        self.version += 1
+
+
+def _to_hashable(value: JSONValues) -> Hashable:
+    """Converts JSON-serializable value to hashable one, which is equal for equal values (dictionaries are unordered)."""
+    if isinstance(value, dict):
+        return frozenset((key, _to_hashable(val)) for key, val in value.items())
+
+    if isinstance(value, list):
+        return tuple(_to_hashable(element) for element in value)
+
+    return value
+
 
 @public_api
 @deprecated_argument(argument_name="data_asset_type", version="0.14.0")
@@ -84,6 +169,11 @@ class ExpectationSuite(SerializableDictDot):
         ge_cloud_id: Great Expectations Cloud id for this Expectation Suite.
     """
 
+    # Indexes of "expectation_configurations" (positions by index type and key), and state of list they were built for.
+    _expectation_indexes: Dict[str, Dict[Hashable, List[int]]]
+    _indexed_expectation_configurations: Optional[_ExpectationConfigurationList] = None
+    _expectation_indexes_version: int = -1
+
     def __init__(  # noqa: PLR0913
         self,
         name: Optional[str] = None,
@@ -113,12 +203,12 @@ class ExpectationSuite(SerializableDictDot):
 
         if expectations is None:
             expectations = []
-        self.expectation_configurations = [
+        self.expectation_configurations = _ExpectationConfigurationList(
             ExpectationConfiguration(**expectation)
             if isinstance(expectation, dict)
             else expectation
             for expectation in expectations
-        ]
+        )
         if evaluation_parameters is None:
             evaluation_parameters = {}
         self.evaluation_parameters = evaluation_parameters
@@ -165,13 +255,14 @@ class ExpectationSuite(SerializableDictDot):
                 "and set `Expectation.id = None`."
             )
         should_save_expectation = self._has_been_saved()
-        expectation_is_unique = all(
-            expectation.configuration != existing_config
-            for existing_config in self.expectation_configurations
+        expectation_is_unique = not self._find_equal_expectation_indexes(
+            expectation_configuration=expectation.configuration
         )
         if expectation_is_unique:
             # suite is a set-like collection, so don't add if it not unique
-            self.expectation_configurations.append(expectation.configuration)
+            self._set_expectation_configuration(
+                position=None, expectation_configuration=expectation.configuration
+            )
             if should_save_expectation:
                 try:
                     expectation = self._store.add_expectation(
@@ -192,17 +283,12 @@ class ExpectationSuite(SerializableDictDot):
         Raises:
             KeyError: Expectation not found in suite.
         """
-        remaining_expectation_configs = [
-            exp_config
-            for exp_config in self.expectation_configurations
-            if exp_config != expectation.configuration
-        ]
-        if (
-            len(remaining_expectation_configs)
-            != len(self.expectation_configurations) - 1
-        ):
+        matching_indexes: List[int] = self._find_equal_expectation_indexes(
+            expectation_configuration=expectation.configuration
+        )
+        if len(matching_indexes) != 1:
             raise KeyError("No matching expectation was found.")
-        self.expectation_configurations = remaining_expectation_configs
+        self.expectation_configurations.pop(matching_indexes[0])
 
         if self._has_been_saved():
             # only persist on delete if the suite has already been saved
@@ -443,7 +529,9 @@ class ExpectationSuite(SerializableDictDot):
            Notes:
                May want to add type-checking in the future.
         """
-        self.expectation_configurations.append(expectation_config)
+        self._set_expectation_configuration(
+            position=None, expectation_configuration=expectation_config
+        )
 
     @public_api
     @new_argument(
@@ -567,18 +655,183 @@ class ExpectationSuite(SerializableDictDot):
                 "Ensure that expectation configuration is valid."
             )
 
-        match_indexes = []
-        for idx, expectation in enumerate(self.expectation_configurations):
-            if ge_cloud_id is not None:
-                if expectation.ge_cloud_id == ge_cloud_id:
-                    match_indexes.append(idx)
-            else:  # noqa: PLR5501
-                if expectation.isEquivalentTo(
+        if ge_cloud_id is not None:
+            return self._find_expectation_indexes_by_ge_cloud_id(
+                ge_cloud_id=ge_cloud_id
+            )
+
+        if match_type not in _EXPECTATION_MATCH_TYPES:
+            return []
+
+        # Only ExpectationConfiguration objects with the same index key can be equivalent; they are compared in full.
+        candidate_indexes: List[int] = self._get_expectation_index(
+            index_type=match_type
+        ).get(
+            self._get_expectation_index_key(
+                expectation_configuration=expectation_configuration,  # type: ignore[arg-type]
+                index_type=match_type,
+            ),
+            [],
+        )
+        return sorted(
+            {
+                idx
+                for idx in candidate_indexes
+                if self.expectation_configurations[idx].isEquivalentTo(
                     other=expectation_configuration, match_type=match_type  # type: ignore[arg-type]
-                ):
-                    match_indexes.append(idx)
+                )
+            }
+        )
+
+    def _find_expectation_indexes_by_ge_cloud_id(self, ge_cloud_id: str) -> List[int]:
+        match_indexes: List[int] = [
+            idx
+            for idx in self._get_expectation_index(index_type="ge_cloud_id").get(
+                ge_cloud_id, []
+            )
+            if self.expectation_configurations[idx].ge_cloud_id == ge_cloud_id
+        ]
+        if not match_indexes:
+            # Ids can be assigned to ExpectationConfiguration objects after they have been indexed.
+            match_indexes = [
+                idx
+                for idx, expectation in enumerate(self.expectation_configurations)
+                if expectation.ge_cloud_id == ge_cloud_id
+            ]
+
+        return sorted(set(match_indexes))
+
+    def _find_equal_expectation_indexes(
+        self, expectation_configuration: ExpectationConfiguration
+    ) -> List[int]:
+        """Returns indexes of ExpectationConfiguration objects equal to given one (including "meta")."""
+        candidate_indexes: List[int] = self._get_expectation_index(
+            index_type="runtime"
+        ).get(
+            self._get_expectation_index_key(
+                expectation_configuration=expectation_configuration,
+                index_type="runtime",
+            ),
+            [],
+        )
+        return sorted(
+            {
+                idx
+                for idx in candidate_indexes
+                if self.expectation_configurations[idx] == expectation_configuration
+            }
+        )
 
-        return match_indexes
+    def _get_counted_expectation_configurations(self) -> _ExpectationConfigurationList:
+        """Returns "expectation_configurations" (as counted list), dropping indexes, which are no longer current.
+
+        Indexes are dropped, if "expectation_configurations" has been reassigned or modified directly (rather than
+        through methods of ExpectationSuite); they are rebuilt, when they are needed next.
+        """
+        expectation_configurations = self.expectation_configurations
+        if not isinstance(expectation_configurations, _ExpectationConfigurationList):
+            expectation_configurations = _ExpectationConfigurationList(
+                expectation_configurations
+            )
+            self.expectation_configurations = expectation_configurations
+
+        if (
+            expectation_configurations is not self._indexed_expectation_configurations
+            or expectation_configurations.version != self._expectation_indexes_version
+        ):
+            self._indexed_expectation_configurations = expectation_configurations
+            self._expectation_indexes_version = expectation_configurations.version
+            self._expectation_indexes = {}
+
+        return expectation_configurations
+
+    def _get_expectation_index(self, index_type: str) -> Dict[Hashable, List[int]]:
+        """Returns index of given type (match type or "ge_cloud_id"), building it on first use."""
+        expectation_configurations: _ExpectationConfigurationList = (
+            self._get_counted_expectation_configurations()
+        )
+
+        index: Optional[Dict[Hashable, List[int]]] = self._expectation_indexes.get(
+            index_type
+        )
+        if index is None:
+            index = {}
+            idx: int
+            expectation_configuration: ExpectationConfiguration
+            for idx, expectation_configuration in enumerate(expectation_configurations):
+                index.setdefault(
+                    self._get_expectation_index_key(
+                        expectation_configuration=expectation_configuration,
+                        index_type=index_type,
+                    ),
+                    [],
+                ).append(idx)
+
+            self._expectation_indexes[index_type] = index
+
+        return index
+
+    @staticmethod
+    def _get_expectation_index_key(
+        expectation_configuration: ExpectationConfiguration, index_type: str
+    ) -> Hashable:
+        """Returns key, which is equal for ExpectationConfiguration objects equivalent under given match type."""
+        if index_type == "ge_cloud_id":
+            return expectation_configuration.ge_cloud_id
+
+        kwargs: dict
+        if index_type == "domain":
+            kwargs = expectation_configuration.get_domain_kwargs()
+        elif index_type == "success":
+            kwargs = expectation_configuration.get_success_kwargs()
+        else:
+            kwargs = expectation_configuration.kwargs
+
+        try:
+            return expectation_configuration.expectation_type, _to_hashable(
+                convert_to_json_serializable(data=kwargs)
+            )
+        except TypeError:
+            # Kwargs, which are not JSON-serializable, share one key (candidates are compared in full anyway).
+            return expectation_configuration.expectation_type, None
+
+    def _set_expectation_configuration(
+        self,
+        position: Optional[int],
+        expectation_configuration: ExpectationConfiguration,
+    ) -> None:
+        """Stores ExpectationConfiguration at position (appends it, if position is None), updating built indexes."""
+        expectation_configurations: _ExpectationConfigurationList = (
+            self._get_counted_expectation_configurations()
+        )
+
+        index_type: str
+        index: Dict[Hashable, List[int]]
+        if position is None:
+            expectation_configurations.append(expectation_configuration)
+            position = len(expectation_configurations) - 1
+        else:
+            for index_type, index in self._expectation_indexes.items():
+                index_key: Hashable = self._get_expectation_index_key(
+                    expectation_configuration=expectation_configurations[position],
+                    index_type=index_type,
+                )
+                # Key may be outdated (e.g., "ge_cloud_id" assigned in place); stale entries fail comparison anyway.
+                if position in index.get(index_key, []):
+                    index[index_key].remove(position)
+
+            expectation_configurations[position] = expectation_configuration
+
+        for index_type, index in self._expectation_indexes.items():
+            index.setdefault(
+                self._get_expectation_index_key(
+                    expectation_configuration=expectation_configuration,
+                    index_type=index_type,
+                ),
+                [],
+            ).append(position)
+
+        self._expectation_indexes_version = expectation_configurations.version
 
     @public_api
     def find_expectations(
@@ -669,7 +922,10 @@ class ExpectationSuite(SerializableDictDot):
         elif len(found_expectation_indexes) == 0:
             raise ValueError("No matching Expectation was found.")
 
-        self.expectation_configurations[found_expectation_indexes[0]] = new_expectation_configuration  # type: ignore[assignment]
+        self._set_expectation_configuration(
+            position=found_expectation_indexes[0],
+            expectation_configuration=new_expectation_configuration,  # type: ignore[arg-type]
+        )
 
     def _add_expectation(
         self,
@@ -727,9 +983,10 @@ class ExpectationSuite(SerializableDictDot):
                         existing_expectation_ge_cloud_id
                     )
 
-                self.expectation_configurations[
-                    found_expectation_indexes[0]
-                ] = expectation_configuration
+                self._set_expectation_configuration(
+                    position=found_expectation_indexes[0],
+                    expectation_configuration=expectation_configuration,
+                )
             else:
                 if send_usage_event:
                     self.send_usage_event(success=False)
@@ -15,6 +15,9 @@ from great_expectations._docs_decorators import public_api
 from great_expectations.alias_types import JSONValues  # noqa: TCH001
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch import BatchDefinition, BatchMarkers  # noqa: TCH001
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+)
 from great_expectations.core.id_dict import BatchSpec  # noqa: TCH001
 from great_expectations.core.run_identifier import RunIdentifier  # noqa: TCH001
 from great_expectations.core.util import (
@@ -429,6 +432,15 @@ class ExpectationValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @post_load
     def make_expectation_validation_result(self, data, **kwargs):
+        result = data.get("result")
+        if result:
+            data["result"] = {
+                key: ColumnarUnexpectedResults.from_json_dict(value)
+                if ColumnarUnexpectedResults.is_columnar_json_dict(value)
+                else value
+                for key, value in result.items()
+            }
+
         return ExpectationValidationResult(**data)
 
 
@@ -1,19 +1,59 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+import math
+from typing import Any, Optional, Set, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import convert_to_json_serializable
 
 T = TypeVar("T")
 
+# Values of these (exact) types are immutable and encode to JSON as they are; ids of IDDict objects, whose values are
+# all of these types, can only change when the IDDict itself is modified, and are therefore cached until then.
+_IMMUTABLE_SCALAR_TYPES: Set[type] = {str, int, float, bool, type(None)}
+
+
+def _to_canonical_json_value(value: Any) -> Any:
+    """Returns JSON-serializable form of "value" used for computing ids (same as "convert_to_json_serializable()").
+
+    Common kwargs values (scalars, and lists and dictionaries thereof) are converted directly; only other types are
+    delegated to "convert_to_json_serializable()", which is considerably slower.
+    """
+    value_type: type = type(value)
+    if value_type is float:
+        return None if math.isnan(value) else value
+
+    if value_type in _IMMUTABLE_SCALAR_TYPES:
+        return value
+
+    if value_type in (list, tuple, set):
+        return [_to_canonical_json_value(element) for element in value]
+
+    if value_type in (dict, IDDict):
+        return {str(key): _to_canonical_json_value(val) for key, val in value.items()}
+
+    return convert_to_json_serializable(data=value)
+
 
 class IDDict(dict):
+    """Dictionary, identified by (deterministic) digest of its contents, which is used as its hash.
+
+    The id is cached, if all values are immutable scalars (modifying the dictionary resets the cache); otherwise, it
+    is recomputed on every call, since nested values may be changed in place.  "FrozenIDDict" always caches its id.
+    """
+
     _id_ignore_keys: Set[str] = set()
 
+    _cached_id: Optional[Union[str, tuple]] = None
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        use_cache: bool = id_keys is None and id_ignore_keys is None
+        if use_cache and self._cached_id is not None:
+            return self._cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
@@ -23,12 +63,63 @@ class IDDict(dict):
             return tuple()
         elif len(id_keys) == 1:
             key = list(id_keys)[0]
-            return f"{key}={self[key]!s}"
+            _id = f"{key}={self[key]!s}"
+        else:
+            _id_dict = _to_canonical_json_value({k: self[k] for k in id_keys})
+            _id = hashlib.md5(
+                json.dumps(_id_dict, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+
+        if use_cache and self._is_id_cacheable():
+            self._cached_id = _id
+
+        return _id
+
+    def _is_id_cacheable(self) -> bool:
+        return all(type(value) in _IMMUTABLE_SCALAR_TYPES for value in self.values())
+
+    def _reset_id(self) -> None:
+        self._cached_id = None
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._reset_id()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._reset_id()
+        super().__delitem__(key)
+
+    @override
+    def __ior__(self, other):  # type: ignore[override,misc]
+        self._reset_id()
+        return super().__ior__(other)
+
+    @override
+    def clear(self) -> None:
+        self._reset_id()
+        super().clear()
 
-        _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
-        return hashlib.md5(
-            json.dumps(_id_dict, sort_keys=True).encode("utf-8")
-        ).hexdigest()
+    @override
+    def pop(self, *args):
+        self._reset_id()
+        return super().pop(*args)
+
+    @override
+    def popitem(self):
+        self._reset_id()
+        return super().popitem()
+
+    @override
+    def setdefault(self, *args):
+        self._reset_id()
+        return super().setdefault(*args)
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._reset_id()
+        super().update(*args, **kwargs)
 
     @override
     def __hash__(self) -> int:  # type: ignore[override]
@@ -37,6 +128,40 @@ class IDDict(dict):
         return _result_hash
 
 
+class FrozenIDDict(IDDict):
+    """Immutable "IDDict", whose id (and hash) is computed once, regardless of types of its values.
+
+    Attempts to modify "FrozenIDDict" raise "TypeError"; values nested in it must not be modified in place either.
+    Copies (e.g., made by callers, which split or update domain kwargs) are regular, mutable "IDDict" objects.
+    """
+
+    @override
+    def _is_id_cacheable(self) -> bool:
+        return True
+
+    def _raise_immutable(self, *args, **kwargs):
+        raise TypeError(f'"{type(self).__name__}" object is immutable.')
+
+    __setitem__ = _raise_immutable  # type: ignore[assignment]
+    __delitem__ = _raise_immutable  # type: ignore[assignment]
+    __ior__ = _raise_immutable  # type: ignore[assignment]
+    clear = _raise_immutable  # type: ignore[assignment]
+    pop = _raise_immutable  # type: ignore[assignment]
+    popitem = _raise_immutable  # type: ignore[assignment]
+    setdefault = _raise_immutable  # type: ignore[assignment]
+    update = _raise_immutable  # type: ignore[assignment]
+
+    def __copy__(self) -> IDDict:
+        return IDDict(self)
+
+    def __deepcopy__(self, memo: dict) -> IDDict:
+        return IDDict(copy.deepcopy(dict(self), memo))
+
+    @override
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict]
 ) -> Union[T, IDDict]:
@@ -0,0 +1,191 @@
+"""Approximate ("sketch") computations of aggregate metrics, used when "approximate" metric value kwarg is set.
+
+Approximate metrics trade exactness for bounded cost: distinct counts are estimated with HyperLogLog (memory does not
+grow with cardinality), and quantiles are computed on a uniform sample, whose size depends only on the requested rank
+error (not on the number of rows).  Backends, which implement approximate functions natively (e.g., Spark
+"approx_count_distinct" and "approxQuantile", SQL "APPROX_COUNT_DISTINCT"), use those instead.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+# Error used when "approximate" is True (rather than explicit error, expressed as a float).
+DEFAULT_APPROXIMATION_ERROR: float = 1.0e-2
+
+# Probability, with which sampled quantiles are within their reported rank error.
+QUANTILE_SAMPLE_CONFIDENCE: float = 0.99
+
+# Number of standard errors spanned by confidence interval reported for HyperLogLog estimates (approximately 95%).
+DISTINCT_COUNT_CONFIDENCE_STANDARD_ERRORS: float = 2.0
+
+HYPERLOGLOG_MIN_PRECISION: int = 4
+HYPERLOGLOG_MAX_PRECISION: int = 18
+
+# Native SQL functions, which estimate number of distinct values of a column.
+APPROXIMATE_COUNT_DISTINCT_SQL_FUNCTIONS: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.AWSATHENA: "approx_distinct",
+    GXSqlDialect.BIGQUERY: "APPROX_COUNT_DISTINCT",
+    GXSqlDialect.DATABRICKS: "approx_count_distinct",
+    GXSqlDialect.MSSQL: "APPROX_COUNT_DISTINCT",
+    GXSqlDialect.SNOWFLAKE: "APPROX_COUNT_DISTINCT",
+    GXSqlDialect.TRINO: "approx_distinct",
+}
+
+# Native SQL functions, which estimate percentile of a column, called as "function(column, percentile)".
+APPROXIMATE_PERCENTILE_SQL_FUNCTIONS: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.AWSATHENA: "approx_percentile",
+    GXSqlDialect.DATABRICKS: "percentile_approx",
+    GXSqlDialect.SNOWFLAKE: "APPROX_PERCENTILE",
+    GXSqlDialect.TRINO: "approx_percentile",
+}
+
+
+def get_approximation_error(approximate: Union[bool, float, None]) -> Optional[float]:
+    """Returns error, requested by "approximate" metric value kwarg, or None if exact computation is requested.
+
+    Args:
+        approximate: False/None (exact computation), True (default error), or error, as float between 0 and 1.
+
+    Returns:
+        Requested error (relative standard error for distinct counts; rank error for quantiles) or None.
+    """
+    if approximate is None or approximate is False:
+        return None
+
+    if approximate is True:
+        return DEFAULT_APPROXIMATION_ERROR
+
+    if (
+        not isinstance(approximate, (int, float))
+        or approximate <= 0.0  # noqa: PLR2004
+        or approximate >= 1.0  # noqa: PLR2004
+    ):
+        raise ValueError(
+            f'"approximate" must be a boolean or a float between 0 and 1 (exclusive), not "{approximate}".'
+        )
+
+    return float(approximate)
+
+
+def hyperloglog_precision(relative_error: float) -> int:
+    """Returns HyperLogLog precision (log2 of number of registers), whose relative standard error is at most given."""
+    precision: int = math.ceil(2.0 * math.log2(1.04 / relative_error))
+    return min(max(precision, HYPERLOGLOG_MIN_PRECISION), HYPERLOGLOG_MAX_PRECISION)
+
+
+def hyperloglog_relative_error(precision: int) -> float:
+    """Returns relative standard error of HyperLogLog estimates, made with 2**precision registers."""
+    return 1.04 / math.sqrt(2**precision)
+
+
+def hyperloglog_distinct_count(column: pd.Series, precision: int) -> int:
+    """Estimates number of distinct non-null values of "column" with HyperLogLog, using 2**precision registers.
+
+    Values are hashed to 64 bits (vectorized); the leading "precision" bits select register, and register retains
+    maximum position of leftmost 1-bit among remaining bits.  Small cardinalities are corrected with linear counting.
+    """
+    values: pd.Series = column.dropna()
+    if values.empty:
+        return 0
+
+    hashes: np.ndarray = pd.util.hash_pandas_object(values, index=False).to_numpy(
+        dtype=np.uint64
+    )
+
+    number_of_registers: int = 1 << precision
+    remaining_bits: int = 64 - precision
+    register_indexes: np.ndarray = (hashes >> np.uint64(remaining_bits)).astype(
+        np.int64
+    )
+    remainders: np.ndarray = hashes & np.uint64((1 << remaining_bits) - 1)
+
+    # Bit lengths are exact, since 32-bit halves are represented exactly as float64.
+    high: np.ndarray = (remainders >> np.uint64(32)).astype(np.float64)
+    low: np.ndarray = (remainders & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    bit_lengths: np.ndarray = np.where(
+        high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1]
+    )
+    ranks: np.ndarray = (remaining_bits - bit_lengths + 1).astype(np.uint8)
+
+    registers: np.ndarray = np.zeros(number_of_registers, dtype=np.uint8)
+    np.maximum.at(registers, register_indexes, ranks)
+
+    alpha: float = 0.7213 / (1.0 + 1.079 / number_of_registers)
+    estimate: float = (
+        alpha
+        * number_of_registers**2
+        / np.sum(np.ldexp(1.0, -registers.astype(np.int64)))
+    )
+
+    number_of_empty_registers: int = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * number_of_registers and number_of_empty_registers > 0:
+        estimate = number_of_registers * math.log(
+            number_of_registers / number_of_empty_registers
+        )
+
+    return int(round(estimate))
+
+
+def quantile_sample_size(rank_error: float) -> int:
+    """Returns uniform sample size, whose quantiles are within "rank_error" of population ranks with high probability.
+
+    By Dvoretzky-Kiefer-Wolfowitz inequality, all sample quantiles are within "rank_error" with probability of at least
+    QUANTILE_SAMPLE_CONFIDENCE, if sample has ln(2 / (1 - confidence)) / (2 * rank_error**2) elements.
+    """
+    return math.ceil(
+        math.log(2.0 / (1.0 - QUANTILE_SAMPLE_CONFIDENCE)) / (2.0 * rank_error**2)
+    )
+
+
+def sampled_quantiles(
+    column: pd.Series,
+    quantiles: Sequence[float],
+    rank_error: float,
+    interpolation: str = "nearest",
+) -> List[float]:
+    """Returns quantiles of non-null values of "column", computed on uniform sample (exact if column is small)."""
+    values: pd.Series = column.dropna()
+    sample_size: int = quantile_sample_size(rank_error=rank_error)
+    if len(values) > sample_size:
+        rng: np.random.Generator = np.random.default_rng()
+        values = values.iloc[
+            rng.choice(len(values), size=sample_size, replace=False, shuffle=False)
+        ]
+
+    return values.quantile(list(quantiles), interpolation=interpolation).tolist()
+
+
+def get_distinct_count_error_bounds(
+    observed_value: Optional[int], relative_error: float
+) -> dict:
+    """Returns description of error of approximate distinct count (with confidence interval of observed value)."""
+    error_bounds: dict = {
+        "method": "hyperloglog",
+        "relative_standard_error": relative_error,
+    }
+    if observed_value is not None:
+        margin: float = (
+            DISTINCT_COUNT_CONFIDENCE_STANDARD_ERRORS * relative_error * observed_value
+        )
+        error_bounds["confidence_interval"] = [
+            max(observed_value - margin, 0.0),
+            observed_value + margin,
+        ]
+
+    return error_bounds
+
+
+def get_quantile_error_bounds(rank_error: float) -> dict:
+    """Returns description of error of approximate quantiles (ranks of observed values are within "rank_error")."""
+    return {
+        "method": "sampled_quantiles",
+        "rank_error": rank_error,
+        "confidence": QUANTILE_SAMPLE_CONFIDENCE,
+    }
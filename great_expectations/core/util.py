@@ -35,10 +35,14 @@ from IPython import get_ipython
 from great_expectations import exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import pydantic, pyspark, sqlalchemy
+from great_expectations.compatibility.pyarrow import pyarrow as pa
 from great_expectations.compatibility.sqlalchemy import (
     SQLALCHEMY_NOT_IMPORTED,
     LegacyRow,
 )
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+)
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.types import SerializableDictDot
@@ -245,8 +249,8 @@ def convert_to_json_serializable(
     ...
 
 
-@public_api  # - complexity 32
-def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+@public_api
+def convert_to_json_serializable(
     data: JSONConvertable,
 ) -> JSONValues:
     """Converts an object to one that is JSON-serializable.
@@ -271,6 +275,145 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
+    # Most values (and all elements of large result lists) are of a handful of exact types; dispatching on type
+    # first keeps them off of the long "isinstance()" chain below.
+    converter = _JSON_SERIALIZABLE_CONVERTERS_BY_TYPE.get(type(data))
+    if converter is not None:
+        return converter(data)
+
+    return _convert_to_json_serializable_by_instance(data)
+
+
+def _return_unchanged(data: JSONValues) -> JSONValues:
+    return data
+
+
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    # "NaN" is the only value that is not equal to itself.
+    return None if data != data else data  # noqa: PLR0124
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string
+    return {
+        str(key): convert_to_json_serializable(value) for key, value in data.items()
+    }
+
+
+def _convert_collection_to_json_serializable(
+    data: Union[list, tuple, set]
+) -> List[JSONValues]:
+    return [convert_to_json_serializable(value) for value in data]
+
+
+def _convert_ndarray_to_json_serializable(data: npt.NDArray) -> List[JSONValues]:
+    """Converts numpy array to (nested) list of JSON-serializable values in vectorized manner, where possible.
+
+    Boolean, numeric, string, and datetime arrays are converted without visiting their elements in Python;
+    arrays of other types are converted element by element.
+    """
+    kind: str = data.dtype.kind
+    if kind in "biuU":
+        # "tolist()" already returns Python "bool", "int", and "str" values.
+        return data.tolist()
+
+    if kind == "f":
+        nan_mask = np.isnan(data)
+        if nan_mask.any():
+            data = data.astype(object)
+            data[nan_mask] = None
+
+        return data.tolist()
+
+    if kind == "M":
+        return _convert_datetime64_ndarray_to_json_serializable(data=data)
+
+    return [convert_to_json_serializable(value) for value in data.tolist()]
+
+
+def _convert_datetime64_ndarray_to_json_serializable(
+    data: npt.NDArray,
+) -> List[JSONValues]:
+    """Formats "datetime64" array as ISO 8601 strings, using format of "isoformat()" of corresponding Python values.
+
+    Dates (day or coarser units) are rendered as "YYYY-MM-DD"; datetimes include fractional seconds only if non-zero.
+    """
+    unit, _ = np.datetime_data(data.dtype)
+    if unit in ("Y", "M", "W", "D"):
+        iso_strings = np.datetime_as_string(data.astype("datetime64[D]"), unit="D")
+    elif unit in ("h", "m", "s", "ms", "us", "ns"):
+        ticks_per_microsecond: int = 1_000 if unit == "ns" else 1
+        data = data.astype("datetime64[ns]" if unit == "ns" else "datetime64[us]")
+        ticks = data.view(np.int64)
+        iso_strings = np.datetime_as_string(data, unit="s")
+        has_fraction = ticks % (1_000_000 * ticks_per_microsecond) != 0
+        if has_fraction.any():
+            iso_strings = np.where(
+                has_fraction, np.datetime_as_string(data, unit="us"), iso_strings
+            )
+
+        has_nanoseconds = ticks % ticks_per_microsecond != 0
+        if has_nanoseconds.any():
+            iso_strings = np.where(
+                has_nanoseconds, np.datetime_as_string(data, unit="ns"), iso_strings
+            )
+    else:
+        return [convert_to_json_serializable(value) for value in data.tolist()]
+
+    values = iso_strings.astype(object)
+    values[np.isnat(data)] = None
+    return values.tolist()
+
+
+def _convert_pandas_values_to_json_serializable(
+    data: Union[pd.Index, pd.Series]
+) -> List[JSONValues]:
+    if isinstance(data.dtype, np.dtype) and data.dtype.kind in "biufM":
+        return _convert_ndarray_to_json_serializable(data.to_numpy())
+
+    return [convert_to_json_serializable(value) for value in data.tolist()]
+
+
+def _convert_arrow_array_to_json_serializable(
+    data: Union[pa.Array, pa.ChunkedArray]
+) -> List[JSONValues]:
+    data_type = data.type
+    if pa.types.is_floating(data_type) or (
+        data.null_count == 0
+        and (pa.types.is_integer(data_type) or pa.types.is_boolean(data_type))
+    ):
+        # Nulls of floating point arrays become "NaN", which is converted to "None" along with actual "NaN" values.
+        return _convert_ndarray_to_json_serializable(np.asarray(data))
+
+    return [convert_to_json_serializable(value) for value in data.to_pylist()]
+
+
+_JSON_SERIALIZABLE_CONVERTERS_BY_TYPE: Dict[type, Callable[[Any], JSONValues]] = {
+    str: _return_unchanged,
+    int: _return_unchanged,
+    bool: _return_unchanged,
+    type(None): _return_unchanged,
+    float: _convert_float_to_json_serializable,
+    np.float64: _convert_float_to_json_serializable,
+    np.int64: int,
+    np.bool_: bool,
+    dict: _convert_dict_to_json_serializable,
+    list: _convert_collection_to_json_serializable,
+    tuple: _convert_collection_to_json_serializable,
+    set: _convert_collection_to_json_serializable,
+    range: list,
+    np.ndarray: _convert_ndarray_to_json_serializable,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.date: datetime.date.isoformat,
+    pd.Timestamp: pd.Timestamp.isoformat,
+    uuid.UUID: str,
+    ColumnarUnexpectedResults: ColumnarUnexpectedResults.to_json_dict,
+}
+
+
+def _convert_to_json_serializable_by_instance(  # noqa: C901, PLR0911, PLR0912
+    data: JSONConvertable,
+) -> JSONValues:
     if isinstance(data, pydantic.BaseModel):
         return json.loads(data.json())
 
@@ -303,12 +446,18 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
 
         return new_list
 
-    if isinstance(data, (np.ndarray, pd.Index)):
+    if isinstance(data, pd.Index):
+        return _convert_pandas_values_to_json_serializable(data)
+
+    if isinstance(data, np.ndarray):
         # test_obj[key] = test_obj[key].tolist()
         # If we have an array or index, convert it first to a list--causing coercion to float--and then round
         # to the number of digits for which the string representation will equal the float representation
         return [convert_to_json_serializable(x) for x in data.tolist()]
 
+    if pa and isinstance(data, (pa.Array, pa.ChunkedArray)):
+        return _convert_arrow_array_to_json_serializable(data)
+
     if isinstance(data, np.int64):
         return int(data)
 
@@ -371,11 +520,11 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         index_name = data.index.name or "index"
         value_name = data.name or "value"
         return [
-            {
-                index_name: convert_to_json_serializable(idx),  # type: ignore[call-overload]
-                value_name: convert_to_json_serializable(val),  # type: ignore[dict-item]
-            }
-            for idx, val in data.items()
+            {index_name: idx, value_name: val}
+            for idx, val in zip(
+                _convert_pandas_values_to_json_serializable(data.index),
+                _convert_pandas_values_to_json_serializable(data),
+            )
         ]
 
     if isinstance(data, pd.DataFrame):
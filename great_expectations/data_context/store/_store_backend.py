@@ -4,7 +4,19 @@ import logging
 import urllib
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Any, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import pyparsing as pp
 
@@ -12,6 +24,9 @@ from great_expectations.exceptions import InvalidKeyError, StoreBackendError, St
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class StoreBackend(metaclass=ABCMeta):
     """A store backend acts as a key-value store that can accept tuples as keys, to abstract away
@@ -22,9 +37,15 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Bulk operations ("get_many", "set_many", "remove_many") fall back to single-key operations; implementations may
+    override "_get_many", "_set_many", and "_remove_many" (e.g., to use single statement), or raise
+    "BULK_OPERATION_MAX_WORKERS" (e.g., when every operation is round trip to remote service).
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
+    # Maximum number of keys, which default bulk operations process concurrently.
+    BULK_OPERATION_MAX_WORKERS: ClassVar[int] = 1
     STORE_BACKEND_ID_KEY = (".ge_store_backend_id",)
     STORE_BACKEND_ID_PREFIX = "store_backend_id = "
     STORE_BACKEND_INVALID_CONFIGURATION_ID = "00000000-0000-0000-0000-00000000e003"
@@ -123,6 +144,17 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> List[Optional[Any]]:
+        """Returns values of "keys" (in same order); value of key, which is not found in store, is None."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        if not keys:
+            return []
+
+        return self._get_many(keys, **kwargs)
+
     def get_all(self):
         return self._get_all()
 
@@ -136,6 +168,35 @@ class StoreBackend(metaclass=ABCMeta):
             logger.debug(str(e))
             raise StoreBackendError("ValueError while calling _set on store backend.")
 
+    def set_many(
+        self, key_value_pairs: Iterable[Tuple[tuple, Any]], **kwargs
+    ) -> List[Any]:
+        """Sets value of each key of "key_value_pairs"; returns what setter returned for each pair (in same order)."""
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+
+        if not key_value_pairs:
+            return []
+
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def remove_many(self, keys: Iterable[tuple]) -> None:
+        """Removes "keys" from store."""
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+
+        if keys:
+            self._remove_many(keys)
+
     def add(self, key, value, **kwargs):
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
@@ -221,6 +282,37 @@ class StoreBackend(metaclass=ABCMeta):
     def _get(self, key) -> None:
         raise NotImplementedError
 
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Optional[Any]]:
+        return self._map_bulk_operation(
+            lambda key: self._get_if_present(key, **kwargs), keys
+        )
+
+    def _get_if_present(self, key: tuple, **kwargs) -> Optional[Any]:
+        try:
+            return self._get(key, **kwargs)
+        except StoreError:
+            return None
+
+    def _set_many(
+        self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs
+    ) -> List[Any]:
+        return self._map_bulk_operation(
+            lambda key_value_pair: self._set(*key_value_pair, **kwargs),
+            key_value_pairs,
+        )
+
+    def _remove_many(self, keys: List[tuple]) -> None:
+        self._map_bulk_operation(self.remove_key, keys)
+
+    def _map_bulk_operation(self, fn: Callable[[T], R], items: List[T]) -> List[R]:
+        """Applies "fn" to "items" on up to "BULK_OPERATION_MAX_WORKERS" threads; results are in order of "items"."""
+        max_workers: int = min(self.BULK_OPERATION_MAX_WORKERS, len(items))
+        if max_workers <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, items))
+
     @abstractmethod
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
@@ -237,6 +329,10 @@ class StoreBackend(metaclass=ABCMeta):
     def list_keys(self, prefix=()) -> Union[List[str], List[tuple]]:
         raise NotImplementedError
 
+    def iter_keys(self, prefix=()) -> Iterator[Union[str, tuple]]:
+        """Yields keys, which start with "prefix" (backends that list keys page by page yield them as they arrive)."""
+        yield from self.list_keys(prefix=prefix)
+
     @abstractmethod
     def remove_key(self, key) -> None:
         raise NotImplementedError
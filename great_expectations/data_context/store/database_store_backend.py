@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
@@ -27,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    # Some databases (e.g., older versions of SQLite) limit number of bind parameters per statement; bulk operations
+    # issue one statement per chunk of keys, so that no statement exceeds this many bind parameters.
+    MAX_BIND_PARAMETERS_PER_STATEMENT = 900
+
     def __init__(  # noqa: PLR0912, PLR0913
         self,
         table_name,
@@ -255,6 +259,144 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug(f"Error fetching value: {e!s}")
             raise gx_exceptions.StoreError(f"Unable to fetch value for key: {key!s}")
 
+    @override
+    def _get_many(self, keys: List[tuple], **kwargs) -> List[Optional[Any]]:
+        """Fetches values of all "keys" with single "SELECT ... WHERE <key> IN (...)" statement (per chunk of keys)."""
+        columns = [
+            getattr(self._table.columns, key_col) for key_col in self.key_columns
+        ]
+        values: Dict[tuple, Any] = {}
+        try:
+            with self.engine.begin() as connection:
+                for keys_chunk in self._chunk_keys(keys=keys):
+                    sel = sa.select(*columns, self._table.columns.value).where(
+                        self._build_keys_clause(keys=keys_chunk)
+                    )
+                    for row in connection.execute(sel).fetchall():
+                        values[tuple(row[: len(self.key_columns)])] = row[-1]
+        except SQLAlchemyError as e:
+            logger.debug(f"Error fetching values: {e!s}")
+            raise gx_exceptions.StoreError(f"Unable to fetch values for keys: {e!s}")
+
+        return [values.get(tuple(key)) for key in keys]
+
+    @override
+    def _set_many(
+        self, key_value_pairs: List[Tuple[tuple, Any]], allow_update=True, **kwargs
+    ) -> List[None]:
+        """Upserts all pairs in one transaction: one multi-row "INSERT" for new keys, one batched "UPDATE" for others.
+
+        Keys, which exist already, are selected first (with "_get_many"), since portable "UPSERT" is not available
+        across dialects.
+        """
+        values: Dict[tuple, Any] = {tuple(key): value for key, value in key_value_pairs}
+        keys: List[tuple] = list(values)
+        existing_keys = set()
+        if allow_update:
+            existing_keys = {
+                key
+                for key, value in zip(keys, self._get_many(keys=keys))
+                if value is not None
+            }
+
+        rows_to_insert: List[dict] = [
+            self._build_row(key=key, value=value)
+            for key, value in values.items()
+            if key not in existing_keys
+        ]
+        rows_to_update: List[dict] = [
+            {
+                **{f"_{key_col}": val for key_col, val in zip(self.key_columns, key)},
+                "_value": values[key],
+            }
+            for key in keys
+            if key in existing_keys
+        ]
+        try:
+            with self.engine.begin() as connection:
+                rows_per_statement: int = max(
+                    1,
+                    self.MAX_BIND_PARAMETERS_PER_STATEMENT
+                    // (len(self.key_columns) + 1),
+                )
+                for idx in range(0, len(rows_to_insert), rows_per_statement):
+                    connection.execute(
+                        self._table.insert().values(
+                            rows_to_insert[idx : idx + rows_per_statement]
+                        )
+                    )
+                if rows_to_update:
+                    connection.execute(
+                        self._table.update()
+                        .where(
+                            sa.and_(
+                                *(
+                                    getattr(self._table.columns, key_col)
+                                    == sa.bindparam(f"_{key_col}")
+                                    for key_col in self.key_columns
+                                )
+                            )
+                        )
+                        .values(value=sa.bindparam("_value")),
+                        rows_to_update,
+                    )
+        except sqlalchemy.IntegrityError as e:
+            # Keys may have been inserted concurrently; fall back to setting them one by one.
+            logger.debug(f"Integrity error {e!s} while storing keys in bulk")
+            for key, value in values.items():
+                self._set(key, value, allow_update=allow_update, **kwargs)
+
+        return [None] * len(key_value_pairs)
+
+    @override
+    def _remove_many(self, keys: List[tuple]) -> None:
+        """Deletes all "keys" with single "DELETE ... WHERE <key> IN (...)" statement (per chunk of keys)."""
+        try:
+            with self.engine.begin() as connection:
+                for keys_chunk in self._chunk_keys(keys=keys):
+                    connection.execute(
+                        self._table.delete().where(
+                            self._build_keys_clause(keys=keys_chunk)
+                        )
+                    )
+        except SQLAlchemyError as e:
+            raise gx_exceptions.StoreBackendError(
+                f"Unable to delete keys: got sqlalchemy error {e!s}"
+            )
+
+    def _chunk_keys(self, keys: List[tuple]) -> List[List[tuple]]:
+        keys_per_statement: int = max(
+            1, self.MAX_BIND_PARAMETERS_PER_STATEMENT // len(self.key_columns)
+        )
+        return [
+            keys[idx : idx + keys_per_statement]
+            for idx in range(0, len(keys), keys_per_statement)
+        ]
+
+    def _build_keys_clause(self, keys: List[tuple]):
+        """Builds clause matching any of "keys" ("IN" for single key column; "OR" of key column matches otherwise)."""
+        if len(self.key_columns) == 1:
+            return getattr(self._table.columns, self.key_columns[0]).in_(
+                [key[0] for key in keys]
+            )
+
+        return sa.or_(
+            *(
+                sa.and_(
+                    *(
+                        getattr(self._table.columns, key_col) == val
+                        for key_col, val in zip(self.key_columns, key)
+                    )
+                )
+                for key in keys
+            )
+        )
+
+    def _build_row(self, key: tuple, value: Any) -> dict:
+        row: dict = {k: v for (k, v) in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
     @override
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
@@ -6,6 +6,7 @@ import pathlib
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Optional
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.core.data_context_key import DataContextKey
@@ -106,6 +107,9 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    # Relative to site root; written only by incremental builds (see "SiteBuilder").
+    BUILD_MANIFEST_FILEPATH = "data_docs_build_manifest.json"
+
     def __init__(self, store_backend=None, runtime_environment=None) -> None:
         store_backend_module_name = store_backend.get(
             "module_name", "great_expectations.data_context.store"
@@ -231,11 +235,34 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        build_manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": self.BUILD_MANIFEST_FILEPATH,
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            build_manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+        build_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=build_manifest_config_defaults,
+        )
+        if not build_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         self.store_backends = {
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
             "static_assets": static_assets_obj,
+            "build_manifest": build_manifest_obj,
         }
 
         # NOTE: Instead of using the filesystem as the source of record for keys,
@@ -373,6 +400,23 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_build_manifest(self) -> Optional[str]:
+        """Returns JSON of build manifest of site (see "SiteBuildManifest"), or None if it was never written."""
+        store_backend = self.store_backends["build_manifest"]
+        if not store_backend.has_key(()):
+            return None
+
+        return store_backend.get(())
+
+    def write_build_manifest(self, manifest_json: str):
+        """Like index page, build manifest is stored under zero-length tuple key."""
+        return self.store_backends["build_manifest"].set(
+            (),
+            manifest_json,
+            content_encoding="utf-8",
+            content_type="application/json; charset=utf-8",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
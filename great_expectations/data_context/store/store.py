@@ -6,6 +6,7 @@ from typing import (
     Any,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Optional,
     Tuple,
@@ -211,6 +212,34 @@ class Store:
 
         return None
 
+    def get_many(
+        self,
+        keys: Iterable[DataContextKey | GXCloudIdentifier | ConfigurationIdentifier],
+    ) -> List[Optional[Any]]:
+        """Returns values of "keys" (in same order), retrieved with one bulk call to store backend.
+
+        Unlike "get()", key that is not found in store does not raise; its value is None.
+        """
+        keys = list(keys)
+        values: List[Optional[Any]] = self._store_backend.get_many(
+            [self._validate_key_and_convert_to_tuple(key) for key in keys]
+        )
+        return [
+            value
+            if key == StoreBackend.STORE_BACKEND_ID_KEY
+            else self._deserialize_if_present(value)
+            for key, value in zip(keys, values)
+        ]
+
+    def _deserialize_if_present(self, value: Any) -> Optional[Any]:
+        if not value:
+            return None
+
+        if self.cloud_mode:
+            value = self.gx_cloud_response_json_to_object_dict(response_json=value)
+
+        return self.deserialize(value)
+
     def get_all(self) -> list[Any]:
         objs = self._store_backend.get_all()
         if self.cloud_mode:
@@ -227,6 +256,38 @@ class Store:
             self.key_to_tuple(key), self.serialize(value), **kwargs
         )
 
+    def set_many(
+        self, key_value_pairs: Iterable[Tuple[DataContextKey, Any]], **kwargs
+    ) -> List[Any]:
+        """Sets value of each key of "key_value_pairs" with one bulk call to store backend."""
+        return self._store_backend.set_many(
+            [
+                (
+                    self._validate_key_and_convert_to_tuple(key),
+                    value
+                    if key == StoreBackend.STORE_BACKEND_ID_KEY
+                    else self.serialize(value),
+                )
+                for key, value in key_value_pairs
+            ],
+            **kwargs,
+        )
+
+    def remove_many(self, keys: Iterable[DataContextKey]) -> None:
+        """Removes "keys" from store with one bulk call to store backend."""
+        self._store_backend.remove_many(
+            [self._validate_key_and_convert_to_tuple(key) for key in keys]
+        )
+
+    def _validate_key_and_convert_to_tuple(
+        self, key: DataContextKey
+    ) -> Tuple[str, ...]:
+        if key == StoreBackend.STORE_BACKEND_ID_KEY:
+            return key  # type: ignore[return-value]
+
+        self._validate_key(key)
+        return self.key_to_tuple(key)
+
     def add(self, key: DataContextKey, value: Any, **kwargs) -> None:
         """
         Essentially `set` but validates that a given key-value pair does not already exist.
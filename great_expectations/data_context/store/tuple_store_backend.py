@@ -8,8 +8,10 @@ import pathlib
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, ClassVar, Iterable, Iterator, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
@@ -19,6 +21,47 @@ from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of sub-prefixes (of prefix being listed), which are listed concurrently by cloud store backends.
+MAX_LIST_KEYS_WORKERS = 8
+
+# Maximum number of objects, which bulk operations of cloud store backends ("get_many", etc.) transfer concurrently.
+MAX_BULK_OPERATION_WORKERS = 8
+
+# Creation of boto3 clients (and resources) from default session is not thread-safe; bulk operations create them on
+# several threads.
+_BOTO3_CLIENT_CREATION_LOCK = threading.Lock()
+
+
+def _iter_object_names_concurrently(
+    object_name_prefix: str,
+    list_object_names_and_sub_prefixes: Callable[[str], Tuple[List[str], List[str]]],
+    list_object_names: Callable[[str], Iterable[str]],
+) -> Iterator[str]:
+    """Yields names of objects, which start with "object_name_prefix", listing its sub-prefixes concurrently.
+
+    Objects directly under "object_name_prefix" and its sub-prefixes (up to next "/") are listed first; objects under
+    each sub-prefix are then listed on separate threads, and yielded in order of sub-prefixes as they become available.
+    """
+    object_names, sub_prefixes = list_object_names_and_sub_prefixes(object_name_prefix)
+    yield from object_names
+    if len(sub_prefixes) <= 1:
+        for sub_prefix in sub_prefixes:
+            yield from list_object_names(sub_prefix)
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_LIST_KEYS_WORKERS, len(sub_prefixes))
+    ) as executor:
+        for sub_prefix_object_names in executor.map(
+            lambda sub_prefix: list(list_object_names(sub_prefix)), sub_prefixes
+        ):
+            yield from sub_prefix_object_names
+
+
+def _is_path_on_filepath_prefix(path: str, filepath_prefix: str) -> bool:
+    """Returns True if filepaths, which start with "filepath_prefix", can be found in directory "path"."""
+    return path.startswith(filepath_prefix) or filepath_prefix.startswith(path + os.sep)
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -206,6 +249,55 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = pathlib.Path(filepath).parts
         return new_key
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix: Tuple = ()) -> str:
+        """Returns longest string, which starts filepaths of all keys that start with "prefix".
+
+        Filepaths of other keys may start with it as well; keys, converted from listed filepaths, must still be
+        compared with "prefix" (see "_convert_listed_filepath_to_key()").
+        """
+        prefix = tuple(prefix)
+        if prefix == self.STORE_BACKEND_ID_KEY:
+            return self._convert_key_to_filepath(prefix)
+
+        if not prefix:
+            # Store backend ID is stored outside of "filepath_template".
+            converted_string = ""
+        elif self.filepath_template:
+            # Template is filled in up to its first element, which is not determined by "prefix".
+            template_parts: List[str] = re.split(r"{(\d+)}", self.filepath_template)
+            converted_string = template_parts[0]
+            for idx in range(1, len(template_parts), 2):
+                tuple_index = int(template_parts[idx])
+                if tuple_index >= len(prefix):
+                    break
+
+                converted_string += prefix[tuple_index] + template_parts[idx + 1]
+        else:
+            converted_string = "/".join(prefix)
+
+        if self.filepath_prefix:
+            converted_string = f"{self.filepath_prefix}/{converted_string}"
+        if self.platform_specific_separator:
+            converted_string = converted_string.replace("/", os.sep)
+
+        return converted_string
+
+    def _convert_listed_filepath_to_key(
+        self, filepath: str, prefix: Tuple = ()
+    ) -> Optional[Tuple]:
+        """Returns key of listed filepath (None, if filepath is not that of a key, which starts with "prefix")."""
+        if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+            return None
+
+        if self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+            return None
+
+        key = self._convert_filepath_to_key(filepath)
+        if not key or tuple(key[: len(prefix)]) != tuple(prefix):
+            return None
+
+        return key
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -365,36 +457,42 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
+
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        # Only directories, whose paths can lead to filepaths of keys starting with "prefix", are walked.
+        filepath_prefix: str = self._convert_key_prefix_to_filepath_prefix(
+            prefix=prefix
+        )
         for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
+            os.path.join(  # noqa: PTH118
+                self.full_base_directory,
+                os.path.dirname(filepath_prefix),  # noqa: PTH120
+            )
         ):
-            for file_ in files:
-                full_path, file_name = os.path.split(
-                    os.path.join(root, file_)  # noqa: PTH118
+            relative_path = os.path.relpath(root, self.full_base_directory)
+            if relative_path == ".":
+                relative_path = ""
+
+            dirs[:] = [
+                dir_
+                for dir_ in dirs
+                if _is_path_on_filepath_prefix(
+                    path=os.path.join(relative_path, dir_),  # noqa: PTH118
+                    filepath_prefix=filepath_prefix,
                 )
-                relative_path = os.path.relpath(
-                    full_path,
-                    self.full_base_directory,
-                )
-                if relative_path == ".":
-                    filepath = file_name
-                else:
-                    filepath = os.path.join(relative_path, file_name)  # noqa: PTH118
-
-                if self.filepath_prefix and not filepath.startswith(
-                    self.filepath_prefix
-                ):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(
-                    self.filepath_suffix
-                ):
+            ]
+            for file_ in files:
+                filepath = os.path.join(relative_path, file_)  # noqa: PTH118
+                if not filepath.startswith(filepath_prefix):
                     continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
 
-        return key_list
+                key = self._convert_listed_filepath_to_key(
+                    filepath=filepath, prefix=prefix
+                )
+                if key and not self.is_ignored_key(key):
+                    yield key
 
     def rrmdir(self, mroot, curpath) -> None:
         """
@@ -470,6 +568,8 @@ class TupleS3StoreBackend(TupleStoreBackend):
     The filepath_template is a string template used to convert the key to a filepath.
     """
 
+    BULK_OPERATION_MAX_WORKERS: ClassVar[int] = MAX_BULK_OPERATION_WORKERS
+
     def __init__(  # noqa: PLR0913
         self,
         bucket,
@@ -632,16 +732,45 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        s3r = self._create_resource()
-        bucket = s3r.Bucket(self.bucket)
-        key_list = []
-        if self.prefix:
-            objects_list = bucket.objects.filter(Prefix=self.prefix)
-        else:
-            objects_list = bucket.objects.all()
-        for s3_object_info in objects_list:
-            s3_object_key = s3_object_info.key
+        return list(self.iter_keys(prefix=prefix))
+
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        # Objects are listed (page by page) under longest S3 prefix, shared by keys starting with "prefix".
+        s3 = self._create_client()
+        paginator = s3.get_paginator("list_objects_v2")
+
+        def _list_object_names(object_name_prefix: str) -> Iterator[str]:
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=object_name_prefix
+            ):
+                for s3_object_info in page.get("Contents", []):
+                    yield s3_object_info["Key"]
+
+        def _list_object_names_and_sub_prefixes(
+            object_name_prefix: str,
+        ) -> Tuple[List[str], List[str]]:
+            object_names: List[str] = []
+            sub_prefixes: List[str] = []
+            for page in paginator.paginate(
+                Bucket=self.bucket, Prefix=object_name_prefix, Delimiter="/"
+            ):
+                object_names.extend(
+                    s3_object_info["Key"] for s3_object_info in page.get("Contents", [])
+                )
+                sub_prefixes.extend(
+                    common_prefix["Prefix"]
+                    for common_prefix in page.get("CommonPrefixes", [])
+                )
+
+            return object_names, sub_prefixes
+
+        for s3_object_name in _iter_object_names_concurrently(
+            object_name_prefix=self._build_s3_object_key_prefix(prefix=prefix),
+            list_object_names_and_sub_prefixes=_list_object_names_and_sub_prefixes,
+            list_object_names=_list_object_names,
+        ):
+            s3_object_key = s3_object_name
             if self.platform_specific_separator:
                 s3_object_key = os.path.relpath(s3_object_key, self.prefix)
             else:  # noqa: PLR5501
@@ -651,19 +780,20 @@ class TupleS3StoreBackend(TupleStoreBackend):
                 else:  # noqa: PLR5501
                     if s3_object_key.startswith(f"{self.prefix}/"):
                         s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
+            key = self._convert_listed_filepath_to_key(
+                filepath=s3_object_key, prefix=prefix
+            )
             if key:
-                key_list.append(key)
+                yield key
+
+    def _build_s3_object_key_prefix(self, prefix: Tuple = ()) -> str:
+        filepath_prefix: str = self._convert_key_prefix_to_filepath_prefix(
+            prefix=prefix
+        )
+        if self.prefix:
+            return f"{self.prefix}/{filepath_prefix}"
 
-        return key_list
+        return filepath_prefix
 
     def get_url_for_key(self, key, protocol=None):
         location = None
@@ -718,8 +848,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             return False
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
     def _assume_role_and_get_secret_credentials(self):
         role_session_name = "GXAssumeRoleSession"
@@ -754,10 +883,12 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return result
 
     def _create_client(self):
-        return aws.boto3.client("s3", **self.boto3_options)
+        with _BOTO3_CLIENT_CREATION_LOCK:
+            return aws.boto3.client("s3", **self.boto3_options)
 
     def _create_resource(self):
-        return aws.boto3.resource("s3", **self.boto3_options)
+        with _BOTO3_CLIENT_CREATION_LOCK:
+            return aws.boto3.resource("s3", **self.boto3_options)
 
     @property
     @override
@@ -775,6 +906,8 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     The filepath_template is a string template used to convert the key to a filepath.
     """
 
+    BULK_OPERATION_MAX_WORKERS: ClassVar[int] = MAX_BULK_OPERATION_WORKERS
+
     def __init__(  # noqa: PLR0913
         self,
         bucket,
@@ -914,31 +1047,59 @@ class TupleGCSStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
 
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        # Blobs are listed (page by page) under longest GCS prefix, shared by keys starting with "prefix".
         from great_expectations.compatibility import google
 
         gcs = google.storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
-            gcs_object_name = blob.name
-            gcs_object_key = os.path.relpath(
-                gcs_object_name,
-                self.prefix,
-            )
-            if self.filepath_prefix and not gcs_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not gcs_object_key.endswith(
-                self.filepath_suffix
+        def _list_object_names(object_name_prefix: str) -> Iterator[str]:
+            # Sub-prefixes are listed on separate threads, each of which uses its own client.
+            for blob in google.storage.Client(self.project).list_blobs(
+                self.bucket, prefix=object_name_prefix
             ):
-                continue
-            key = self._convert_filepath_to_key(gcs_object_key)
+                yield blob.name
+
+        def _list_object_names_and_sub_prefixes(
+            object_name_prefix: str,
+        ) -> Tuple[List[str], List[str]]:
+            blobs = gcs.list_blobs(
+                self.bucket, prefix=object_name_prefix, delimiter="/"
+            )
+            object_names: List[str] = [blob.name for blob in blobs]
+            # Sub-prefixes are collected from pages, as these are iterated over.
+            return object_names, sorted(blobs.prefixes)
+
+        for gcs_object_name in _iter_object_names_concurrently(
+            object_name_prefix=self._build_gcs_object_key_prefix(prefix=prefix),
+            list_object_names_and_sub_prefixes=_list_object_names_and_sub_prefixes,
+            list_object_names=_list_object_names,
+        ):
+            gcs_object_key = (
+                os.path.relpath(
+                    gcs_object_name,
+                    self.prefix,
+                )
+                if self.prefix
+                else gcs_object_name
+            )
+            key = self._convert_listed_filepath_to_key(
+                filepath=gcs_object_key, prefix=prefix
+            )
             if key:
-                key_list.append(key)
-        return key_list
+                yield key
+
+    def _build_gcs_object_key_prefix(self, prefix: Tuple = ()) -> str:
+        filepath_prefix: str = self._convert_key_prefix_to_filepath_prefix(
+            prefix=prefix
+        )
+        if self.prefix:
+            return f"{self.prefix}/{filepath_prefix}"
+
+        return filepath_prefix
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -989,8 +1150,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return True
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
@@ -1005,6 +1165,8 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
     https://docs.microsoft.com/en-us/azure/storage/blobs/storage-quickstart-blobs-python
     """
 
+    BULK_OPERATION_MAX_WORKERS: ClassVar[int] = MAX_BULK_OPERATION_WORKERS
+
     # We will use blobclient here
     def __init__(  # noqa: PLR0913
         self,
@@ -1093,6 +1255,15 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             self._container_client.download_blob(az_blob_key).readall().decode("utf-8")
         )
 
+    @override
+    def _get_if_present(self, key, **kwargs) -> Optional[Any]:
+        from great_expectations.compatibility import azure
+
+        try:
+            return self._get(key, **kwargs)
+        except azure.ResourceNotFoundError:
+            return None
+
     @override
     def _get_all(self) -> list[Any]:
         raise NotImplementedError
@@ -1129,25 +1300,52 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        # Note that the prefix arg is only included to maintain consistency with the parent class signature
-        key_list = []
+        return list(self.iter_keys(prefix=prefix))
 
-        for obj in self._container_client.list_blobs(name_starts_with=self.prefix):
-            az_blob_key = os.path.relpath(obj.name)
-            if az_blob_key.startswith(f"{self.prefix}{os.path.sep}"):
-                az_blob_key = az_blob_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not az_blob_key.startswith(
-                self.filepath_prefix
+    @override
+    def iter_keys(self, prefix: Tuple = ()) -> Iterator[Tuple]:
+        # Blobs are listed (page by page) under longest blob name prefix, shared by keys starting with "prefix".
+        from great_expectations.compatibility import azure
+
+        container_client = self._container_client
+
+        def _list_object_names(object_name_prefix: str) -> Iterator[str]:
+            for blob in container_client.list_blobs(
+                name_starts_with=object_name_prefix
             ):
-                continue
-            elif self.filepath_suffix and not az_blob_key.endswith(
-                self.filepath_suffix
+                yield blob.name
+
+        def _list_object_names_and_sub_prefixes(
+            object_name_prefix: str,
+        ) -> Tuple[List[str], List[str]]:
+            object_names: List[str] = []
+            sub_prefixes: List[str] = []
+            for blob_or_prefix in container_client.walk_blobs(
+                name_starts_with=object_name_prefix, delimiter="/"
             ):
-                continue
-            key = self._convert_filepath_to_key(az_blob_key)
+                if isinstance(blob_or_prefix, azure.BlobPrefix):
+                    sub_prefixes.append(blob_or_prefix.name)
+                else:
+                    object_names.append(blob_or_prefix.name)
+
+            return object_names, sub_prefixes
 
-            key_list.append(key)
-        return key_list
+        for az_blob_name in _iter_object_names_concurrently(
+            object_name_prefix=os.path.join(  # noqa: PTH118
+                self.prefix,
+                self._convert_key_prefix_to_filepath_prefix(prefix=prefix),
+            ),
+            list_object_names_and_sub_prefixes=_list_object_names_and_sub_prefixes,
+            list_object_names=_list_object_names,
+        ):
+            az_blob_key = os.path.relpath(az_blob_name)
+            if az_blob_key.startswith(f"{self.prefix}{os.path.sep}"):
+                az_blob_key = az_blob_key[len(self.prefix) + 1 :]
+            key = self._convert_listed_filepath_to_key(
+                filepath=az_blob_key, prefix=prefix
+            )
+            if key:
+                yield key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1161,8 +1359,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         )
 
     def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
+        return key in self.list_keys(prefix=key)
 
     @override
     def _move(self, source_key, dest_key, **kwargs) -> None:
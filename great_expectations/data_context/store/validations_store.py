@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import io
+import os
 import random
 import uuid
-from typing import ClassVar, Dict, Type
+from typing import Any, ClassVar, Dict, List, Optional, Type
 
+from great_expectations.compatibility.pyarrow import parquet
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+)
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationSuiteValidationResultSchema,
@@ -14,13 +20,19 @@ from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
-from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
+from great_expectations.data_context.store.tuple_store_backend import (
+    TupleFilesystemStoreBackend,
+    TupleStoreBackend,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
     GXCloudIdentifier,
     ValidationResultIdentifier,
 )
-from great_expectations.data_context.util import load_class
+from great_expectations.data_context.util import (
+    instantiate_class_from_config,
+    load_class,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -94,6 +106,10 @@ class ValidationsStore(Store):
             bug_risk: Moderate
 
     --ge-feature-maturity-info--
+
+    When Validation Results are stored on a filesystem (and pyarrow is installed), columnar unexpected results (see
+    "columnar_unexpected_results" key of "result_format") are written to Parquet side-car files, next to JSON files of
+    Validation Results, which only reference them; they are read lazily, when Validation Results are retrieved.
     """
 
     _key_class: ClassVar[Type] = ValidationResultIdentifier
@@ -143,6 +159,28 @@ class ValidationsStore(Store):
             store_name=store_name,
         )
 
+        self._unexpected_results_store_backend: Optional[
+            TupleFilesystemStoreBackend
+        ] = None
+        if (
+            parquet
+            and store_backend is not None
+            and issubclass(store_backend_class, TupleFilesystemStoreBackend)
+            and store_backend.get("filepath_template") is None
+        ):
+            self._unexpected_results_store_backend = instantiate_class_from_config(
+                config={
+                    **store_backend,
+                    "filepath_suffix": ".parquet",
+                    "suppress_store_backend_id": True,
+                },
+                runtime_environment=runtime_environment or {},
+                config_defaults={
+                    "module_name": "great_expectations.data_context.store",
+                    "store_name": store_name,
+                },
+            )
+
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
         self._config = {
@@ -178,9 +216,80 @@ class ValidationsStore(Store):
 
     def deserialize(self, value):
         if isinstance(value, dict):
-            return self._expectationSuiteValidationResultSchema.load(value)
+            validation_result = self._expectationSuiteValidationResultSchema.load(value)
         else:
-            return self._expectationSuiteValidationResultSchema.loads(value)
+            validation_result = self._expectationSuiteValidationResultSchema.loads(
+                value
+            )
+
+        if self._unexpected_results_store_backend is not None:
+            self._load_columnar_unexpected_results(validation_result=validation_result)
+
+        return validation_result
+
+    @override
+    def set(self, key, value, **kwargs) -> None:
+        if self._unexpected_results_store_backend is not None and isinstance(
+            value, ExpectationSuiteValidationResult
+        ):
+            self._store_columnar_unexpected_results(key=key, value=value)
+
+        return super().set(key=key, value=value, **kwargs)
+
+    @override
+    def set_many(self, key_value_pairs, **kwargs) -> List[Any]:
+        key_value_pairs = list(key_value_pairs)
+        if self._unexpected_results_store_backend is not None:
+            for key, value in key_value_pairs:
+                if isinstance(value, ExpectationSuiteValidationResult):
+                    self._store_columnar_unexpected_results(key=key, value=value)
+
+        return super().set_many(key_value_pairs=key_value_pairs, **kwargs)
+
+    def _store_columnar_unexpected_results(
+        self, key: ValidationResultIdentifier, value: ExpectationSuiteValidationResult
+    ) -> None:
+        """Writes columnar unexpected results to Parquet side-car files; JSON of "value" then only references them."""
+        for result_index, expectation_validation_result in enumerate(value.results):
+            for result_key, result_value in (
+                expectation_validation_result.result or {}
+            ).items():
+                if not isinstance(result_value, ColumnarUnexpectedResults):
+                    continue
+
+                storage_key = (*self.key_to_tuple(key), f"{result_index}_{result_key}")
+                if result_value.storage_key == storage_key:
+                    continue
+
+                buffer = io.BytesIO()
+                result_value.to_parquet(buffer)
+                self._unexpected_results_store_backend.set(  # type: ignore[union-attr] # checked by caller
+                    storage_key, buffer.getvalue()
+                )
+                result_value.storage_key = storage_key
+
+    def _load_columnar_unexpected_results(
+        self, validation_result: ExpectationSuiteValidationResult
+    ) -> None:
+        """Binds columnar unexpected results, referenced by JSON of "validation_result", to their Parquet files."""
+        for expectation_validation_result in validation_result.results:
+            result: dict = expectation_validation_result.result or {}
+            for result_key, result_value in result.items():
+                if (
+                    isinstance(result_value, ColumnarUnexpectedResults)
+                    and not result_value.is_loaded
+                    and result_value.storage_key is not None
+                ):
+                    path: str = os.path.join(  # noqa: PTH118
+                        self._unexpected_results_store_backend.full_base_directory,  # type: ignore[union-attr] # checked by caller
+                        self._unexpected_results_store_backend._convert_key_to_filepath(  # type: ignore[union-attr] # checked by caller
+                            result_value.storage_key
+                        ),
+                    )
+                    if os.path.exists(path):  # noqa: PTH110
+                        result[result_key] = ColumnarUnexpectedResults.from_parquet(
+                            path=path, storage_key=result_value.storage_key
+                        )
 
     def self_check(self, pretty_print):
         return_obj = {}
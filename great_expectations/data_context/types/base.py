@@ -1436,13 +1436,32 @@ class IncludeRenderedContentConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    # BigQuery has a limit of 100 for "Concurrent rate limit for interactive queries" as described at
+    # (https://cloud.google.com/bigquery/quotas#query_jobs).
+    DEFAULT_MAX_DATABASE_QUERY_CONCURRENCY: int = 100
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_database_query_concurrency: Optional[int] = None,
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            max_database_query_concurrency: Max number of concurrent database queries; if set, SqlAlchemy connection
+                pools keep this many connections open (defaults to DEFAULT_MAX_DATABASE_QUERY_CONCURRENCY queries on
+                unpooled connections).
         """
+        if max_database_query_concurrency is not None and (
+            max_database_query_concurrency < 1
+        ):
+            raise ValueError(
+                f'"max_database_query_concurrency" must be a positive integer (got {max_database_query_concurrency}).'
+            )
+
         self._enabled = enabled
+        self._max_database_query_concurrency = max_database_query_concurrency
 
     @property
     def enabled(self):
@@ -1452,10 +1471,10 @@ class ConcurrencyConfig(DictDot):
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
-        # BigQuery has a limit of 100 for "Concurrent rate limit for interactive queries" as described at
-        # (https://cloud.google.com/bigquery/quotas#query_jobs). If necessary, this can later be tuned for other
-        # databases and/or be manually user configurable.
-        return 100
+        if self._max_database_query_concurrency is None:
+            return ConcurrencyConfig.DEFAULT_MAX_DATABASE_QUERY_CONCURRENCY
+
+        return self._max_database_query_concurrency
 
     def add_sqlalchemy_create_engine_parameters(
         self, parameters: MutableMapping[str, Any]
@@ -1472,7 +1491,8 @@ class ConcurrencyConfig(DictDot):
 
         if "pool_size" not in parameters:
             # https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.pool_size
-            parameters["pool_size"] = 0
+            # Without explicit "max_database_query_concurrency", pool size is unbounded (connections are not retained).
+            parameters["pool_size"] = self._max_database_query_concurrency or 0
         if "max_overflow" not in parameters:
             # https://docs.sqlalchemy.org/en/14/core/engines.html#sqlalchemy.create_engine.params.max_overflow
             parameters["max_overflow"] = -1
@@ -1482,6 +1502,23 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    max_database_query_concurrency = fields.Integer(
+        required=False, allow_none=True, validate=lambda x: x is None or x > 0
+    )
+
+    # noinspection PyUnusedLocal
+    @post_dump()
+    def remove_default_max_database_query_concurrency(
+        self, data: dict, **kwargs
+    ) -> dict:
+        """Omits default "max_database_query_concurrency" so that existing serialized configurations are unchanged."""
+        if data.get("max_database_query_concurrency") in (
+            None,
+            ConcurrencyConfig.DEFAULT_MAX_DATABASE_QUERY_CONCURRENCY,
+        ):
+            data.pop("max_database_query_concurrency", None)
+
+        return data
 
 
 class GXCloudConfig(DictDot):
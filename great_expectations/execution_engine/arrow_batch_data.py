@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from great_expectations.core.batch import BatchData
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility.pyarrow import pyarrow as pa
+
+
+class ArrowBatchData(BatchData):
+    def __init__(self, execution_engine, table: pa.Table) -> None:
+        super().__init__(execution_engine=execution_engine)
+        self._table = table
+
+    @property
+    def table(self) -> pa.Table:
+        return self._table
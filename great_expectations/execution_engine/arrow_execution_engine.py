@@ -0,0 +1,432 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations._docs_decorators import public_api
+from great_expectations.compatibility.pyarrow import (
+    compute as pc,
+)
+from great_expectations.compatibility.pyarrow import (
+    csv as pa_csv,
+)
+from great_expectations.compatibility.pyarrow import (
+    feather,
+    parquet,
+)
+from great_expectations.compatibility.pyarrow import (
+    json as pa_json,
+)
+from great_expectations.compatibility.pyarrow import (
+    pyarrow as pa,
+)
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch_spec import (
+    AzureBatchSpec,
+    BatchSpec,
+    GCSBatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.core.metric_domain_types import (
+    MetricDomainTypes,  # noqa: TCH001
+)
+from great_expectations.execution_engine.arrow_batch_data import ArrowBatchData
+from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    SplitDomainKwargs,
+)
+from great_expectations.expectations.row_conditions import (
+    RowCondition,
+    RowConditionParserType,
+    parse_condition_to_arrow,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@public_api
+class ArrowExecutionEngine(ExecutionEngine):
+    """ArrowExecutionEngine instantiates the ExecutionEngine API to support computations using Apache Arrow.
+
+    Batch data is held as a `pyarrow.Table`; metrics are computed with `pyarrow.compute` kernels, which operate on
+    columnar (and, for strings, non-object) memory and release the GIL, so that independent metrics are resolved on
+    multiple threads when concurrency is enabled.  Parquet and Arrow IPC (Feather) files are memory-mapped, so that
+    their columns are read without copying.
+
+    Constructor builds an ArrowExecutionEngine, using provided configuration options.
+
+    Args:
+        *args: Positional arguments for configuring ArrowExecutionEngine
+        use_threads: If True (default), then pyarrow readers use multiple threads
+        memory_map: If True (default), then Parquet and Arrow IPC files are memory-mapped
+        **kwargs: Keyword arguments for configuring ArrowExecutionEngine
+
+    For example:
+    ```python
+        execution_engine: ExecutionEngine = ArrowExecutionEngine(batch_data_dict={batch.id: batch.data})
+    ```
+    """
+
+    recognized_batch_spec_defaults = {
+        "reader_method",
+        "reader_options",
+    }
+
+    def __init__(
+        self,
+        *args,
+        use_threads: bool = True,
+        memory_map: bool = True,
+        **kwargs,
+    ) -> None:
+        if not pa:
+            raise gx_exceptions.ExecutionEngineError(
+                "ArrowExecutionEngine requires pyarrow, please 'pip install pyarrow'."
+            )
+
+        self._use_threads = use_threads
+        self._memory_map = memory_map
+
+        super().__init__(*args, **kwargs)
+
+        self._config.update(
+            {
+                "use_threads": self._use_threads,
+                "memory_map": self._memory_map,
+            }
+        )
+
+    @override
+    def load_batch_data(
+        self, batch_id: str, batch_data: Union[ArrowBatchData, pa.Table, pd.DataFrame]  # type: ignore[override]
+    ) -> None:
+        if isinstance(batch_data, pd.DataFrame):
+            batch_data = ArrowBatchData(
+                self, pa.Table.from_pandas(batch_data, preserve_index=False)
+            )
+        elif isinstance(batch_data, pa.Table):
+            batch_data = ArrowBatchData(self, batch_data)
+        elif not isinstance(batch_data, ArrowBatchData):
+            raise gx_exceptions.GreatExpectationsError(
+                "ArrowExecutionEngine requires batch data that is either a pyarrow Table, a Pandas DataFrame, or an ArrowBatchData object"
+            )
+
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    @override
+    def get_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Tuple[ArrowBatchData, BatchMarkers]:
+        # We need to build a batch_markers to be used in the table
+        batch_markers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            raise gx_exceptions.ExecutionEngineError(
+                "Splitting and sampling are not supported by ArrowExecutionEngine."
+            )
+
+        table: pa.Table
+        if isinstance(batch_spec, RuntimeDataBatchSpec):
+            # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
+            batch_data = batch_spec.batch_data
+            if isinstance(batch_data, ArrowBatchData):
+                table = batch_data.table
+            elif isinstance(batch_data, pa.Table):
+                table = batch_data
+            elif isinstance(batch_data, pd.DataFrame):
+                table = pa.Table.from_pandas(batch_data, preserve_index=False)
+            else:
+                raise ValueError(
+                    "RuntimeDataBatchSpec must provide a pyarrow Table, a Pandas DataFrame, or an ArrowBatchData object."
+                )
+
+            batch_spec.batch_data = "ArrowTable"
+
+        elif isinstance(batch_spec, (S3BatchSpec, AzureBatchSpec, GCSBatchSpec)):
+            raise gx_exceptions.BatchSpecError(
+                f"""ArrowExecutionEngine reads local files only; {batch_spec.__class__.__name__} is not supported."""
+            )
+
+        elif isinstance(batch_spec, PathBatchSpec):
+            path: str = batch_spec.path
+            reader_method: Optional[str] = batch_spec.reader_method
+            if reader_method is None:
+                reader_method = self.guess_reader_method_from_path(path=path)[
+                    "reader_method"
+                ]
+
+            table = self._read_table(
+                path=path,
+                reader_method=reader_method,
+                reader_options=batch_spec.reader_options or {},
+            )
+
+        else:
+            raise gx_exceptions.BatchSpecError(
+                f"""batch_spec must be of type RuntimeDataBatchSpec or PathBatchSpec, \
+not {batch_spec.__class__.__name__}"""
+            )
+
+        return ArrowBatchData(execution_engine=self, table=table), batch_markers
+
+    def _read_table(
+        self, path: str, reader_method: str, reader_options: dict
+    ) -> pa.Table:
+        if reader_method == "read_parquet":
+            return parquet.read_table(
+                path,
+                memory_map=self._memory_map,
+                use_threads=self._use_threads,
+                **reader_options,
+            )
+
+        if reader_method == "read_feather":
+            # Arrow IPC (Feather V2) files are memory-mapped and read without copying.
+            return feather.read_table(
+                path,
+                memory_map=self._memory_map,
+                use_threads=self._use_threads,
+                **reader_options,
+            )
+
+        if reader_method == "read_csv":
+            return pa_csv.read_csv(
+                path,
+                read_options=reader_options.pop(
+                    "read_options", pa_csv.ReadOptions(use_threads=self._use_threads)
+                ),
+                **reader_options,
+            )
+
+        if reader_method == "read_json":
+            return pa_json.read_json(
+                path,
+                read_options=reader_options.pop(
+                    "read_options", pa_json.ReadOptions(use_threads=self._use_threads)
+                ),
+                **reader_options,
+            )
+
+        raise gx_exceptions.ExecutionEngineError(
+            f'Unable to find reader_method "{reader_method}" for ArrowExecutionEngine.'
+        )
+
+    @staticmethod
+    def guess_reader_method_from_path(path: str) -> dict:
+        """Helper method for determining which pyarrow reader method to use, based on file extension.
+
+        Args:
+            path (str): the path used to guess.
+
+        Returns:
+            ReaderMethod to use for the filepath
+        """
+        path = path.lower()
+        if path.endswith((".parquet", ".parq", ".pqt")):
+            return {"reader_method": "read_parquet"}
+        elif path.endswith((".feather", ".arrow", ".ipc")):
+            return {"reader_method": "read_feather"}
+        elif path.endswith((".csv", ".csv.gz")):
+            return {"reader_method": "read_csv"}
+        elif path.endswith((".json", ".jsonl")):
+            return {"reader_method": "read_json"}
+
+        raise gx_exceptions.ExecutionEngineError(
+            f'Unable to determine reader method from path: "{path}".'
+        )
+
+    @property
+    def table(self) -> pa.Table:
+        """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
+        ValueError Exception
+        """
+        if self.batch_manager.active_batch_data is None:
+            raise ValueError(
+                "Batch has not been loaded - please run load_batch_data() to load a batch."
+            )
+
+        return cast(ArrowBatchData, self.batch_manager.active_batch_data).table
+
+    @override
+    def resolve_metric_bundle(
+        self, metric_fn_bundle
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""
+        return (
+            {}
+        )  # This is NO-OP for "ArrowExecutionEngine" (no bundling for direct execution computational backend).
+
+    @public_api
+    @override
+    def get_domain_records(
+        self,
+        domain_kwargs: dict,
+    ) -> pa.Table:
+        """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a Batch of data.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            A pyarrow Table (the data on which to compute)
+        """
+        table_name = domain_kwargs.get("table", None)
+        if table_name:
+            raise ValueError(
+                "ArrowExecutionEngine does not currently support multiple named tables."
+            )
+
+        batch_id = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            # We allow no batch id specified if there is only one batch
+            if self.batch_manager.active_batch_data_id is not None:
+                data = cast(ArrowBatchData, self.batch_manager.active_batch_data).table
+            else:
+                raise gx_exceptions.ValidationError(
+                    "No batch is specified, but could not identify a loaded batch."
+                )
+        elif batch_id in self.batch_manager.batch_data_cache:
+            data = cast(
+                ArrowBatchData, self.batch_manager.batch_data_cache[batch_id]
+            ).table
+        else:
+            raise gx_exceptions.ValidationError(
+                f"Unable to find batch with batch_id {batch_id}"
+            )
+
+        return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+    @staticmethod
+    def _filter_domain_records(  # noqa: PLR0911, PLR0912
+        data: pa.Table, domain_kwargs: dict
+    ) -> pa.Table:
+        """Applies "row_condition", "filter_conditions", and "ignore_row_if" directives of "domain_kwargs" to "data"."""
+        # Filtering by row condition.
+        row_condition = domain_kwargs.get("row_condition", None)
+        if row_condition:
+            condition_parser = domain_kwargs.get("condition_parser", None)
+            if condition_parser == "great_expectations__experimental__":
+                parsed_condition = parse_condition_to_arrow(row_condition)
+                data = data.filter(parsed_condition)
+            else:
+                raise gx_exceptions.GreatExpectationsError(
+                    f"unrecognized condition_parser {condition_parser!s} for Arrow execution engine"
+                )
+
+        # Filtering by filter_conditions
+        filter_conditions: list = domain_kwargs.get("filter_conditions", [])
+        if len(filter_conditions) > 0:
+            for filter_condition in filter_conditions:
+                filter_condition = cast(RowCondition, filter_condition)
+                if filter_condition.condition_type != RowConditionParserType.GE:
+                    raise gx_exceptions.GreatExpectationsError(
+                        "Filter condition must be of type GX for ArrowExecutionEngine"
+                    )
+
+                data = data.filter(parse_condition_to_arrow(filter_condition.condition))
+
+        if "column" in domain_kwargs:
+            return data
+
+        ignore_row_if: Optional[str] = domain_kwargs.get("ignore_row_if")
+        if (
+            "column_A" in domain_kwargs
+            and "column_B" in domain_kwargs
+            and ignore_row_if
+        ):
+            column_names = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
+            if ignore_row_if == "both_values_are_missing":
+                return _drop_missing(data=data, column_names=column_names, how="all")
+
+            if ignore_row_if == "either_value_is_missing":
+                return _drop_missing(data=data, column_names=column_names, how="any")
+
+            if ignore_row_if != "neither":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+
+            return data
+
+        if "column_list" in domain_kwargs and ignore_row_if:
+            column_names = domain_kwargs["column_list"]
+            if ignore_row_if == "all_values_are_missing":
+                return _drop_missing(data=data, column_names=column_names, how="all")
+
+            if ignore_row_if == "any_value_is_missing":
+                return _drop_missing(data=data, column_names=column_names, how="any")
+
+            if ignore_row_if != "never":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+
+        return data
+
+    @override
+    def get_compute_domain(
+        self,
+        domain_kwargs: dict,
+        domain_type: Union[str, MetricDomainTypes],
+        accessor_keys: Optional[Iterable[str]] = None,
+    ) -> Tuple[pa.Table, dict, dict]:
+        """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a batch.
+
+        Returns in the format of a pyarrow Table along with Domain arguments required for computing.  If the Domain \
+        is a single column, this is added to 'accessor Domain kwargs' and used for later access.
+
+        Args:
+            domain_kwargs (dict): a dictionary consisting of the Domain kwargs specifying which data to obtain
+            domain_type (str or MetricDomainTypes): an Enum value indicating which metric Domain the user would like \
+            to be using, or a corresponding string value representing it.  String types include "column", \
+            "column_pair", "table", and "other".  Enum types include capitalized versions of these from the class \
+            MetricDomainTypes.
+            accessor_keys (str iterable): keys that are part of the compute Domain but should be ignored when \
+            describing the Domain and simply transferred with their associated values into accessor_domain_kwargs.
+
+        Returns:
+            A tuple including:
+              - a pyarrow Table (the data on which to compute)
+              - a dictionary of compute_domain_kwargs, describing the Table
+              - a dictionary of accessor_domain_kwargs, describing any accessors needed to
+                identify the Domain within the compute domain
+        """
+        data: pa.Table = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        split_domain_kwargs: SplitDomainKwargs = self._split_domain_kwargs(
+            domain_kwargs, domain_type, accessor_keys
+        )
+
+        return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
+
+
+def _drop_missing(data: pa.Table, column_names: list, how: str) -> pa.Table:
+    """Removes rows, in which "all" (or "any") of the given columns are NULL (equivalent of "DataFrame.dropna()")."""
+    missing: list = [pc.is_null(data[column_name]) for column_name in column_names]
+    combine: Any = pc.and_ if how == "all" else pc.or_
+    condition = missing[0]
+    for column_missing in missing[1:]:
+        condition = combine(condition, column_missing)
+
+    return data.filter(pc.invert(condition))
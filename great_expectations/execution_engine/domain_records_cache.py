@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple, Union
+
+from great_expectations.core.id_dict import IDDict
+
+logger = logging.getLogger(__name__)
+
+# Domain kwargs, whose presence makes "get_domain_records()" filter records of the Batch.
+_FILTERING_DOMAIN_KWARGS = (
+    "row_condition",
+    "filter_conditions",
+    "ignore_row_if",
+)
+
+
+class DomainRecordsCache:
+    """Bounded, least-recently-used cache of filtered Domain records (e.g., DataFrames satisfying "row_condition").
+
+    Entries are keyed by the (unfiltered) Batch data they were obtained from and by the Domain kwargs directing the
+    filtering; hence, entries of Batch data that has been replaced are never returned (and are eventually evicted).
+    Metrics of different columns share the filtered records of their common Domain, since column names do not change
+    which records are returned.
+
+    Args:
+        max_entries: maximum number of entries retained (no limit if None).
+        max_size_bytes: maximum combined size of entries retained, as measured by "sizeof" (no limit if None).
+        sizeof: returns size of records in bytes (required for "max_size_bytes" to apply).
+        on_evict: called with records of every entry that is removed (e.g., to release cached Spark DataFrames).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        on_evict: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes if sizeof is not None else None
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+
+        self._lock = threading.Lock()
+        # Values are (source data, records, size); source data is retained, so that its "id()" is not reused.
+        self._entries: OrderedDict[
+            Tuple[int, Union[str, tuple]], Tuple[Any, Any, int]
+        ] = OrderedDict()
+        self._size_bytes: int = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries != 0 and self._max_size_bytes != 0
+
+    @staticmethod
+    def build_key(domain_kwargs: dict) -> Optional[Union[str, tuple]]:
+        """Returns key identifying filtering directed by "domain_kwargs", or None if records are not filtered."""
+        if not any(
+            domain_kwargs.get(key) is not None for key in _FILTERING_DOMAIN_KWARGS
+        ):
+            return None
+
+        key_kwargs: dict = {
+            key: value
+            for key, value in domain_kwargs.items()
+            if key not in ("batch_id", "column")
+        }
+        # Only presence of "column" affects filtering (column Domains skip "ignore_row_if" directives).
+        key_kwargs["column"] = "column" in domain_kwargs
+        return IDDict(key_kwargs).to_id()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: Any, key: Union[str, tuple]) -> Optional[Any]:
+        """Returns records cached for "source" data and "key" (and marks them as most recently used), or None."""
+        with self._lock:
+            entry: Optional[Tuple[Any, Any, int]] = self._entries.get((id(source), key))
+            if entry is None or entry[0] is not source:
+                return None
+
+            self._entries.move_to_end((id(source), key))
+            return entry[1]
+
+    def set(self, source: Any, key: Union[str, tuple], records: Any) -> None:
+        """Caches "records", obtained from "source" data, evicting least-recently-used entries to satisfy limits."""
+        if not self.enabled:
+            return
+
+        size: int = self._sizeof(records) if self._sizeof is not None else 0
+        if self._max_size_bytes is not None and size > self._max_size_bytes:
+            logger.debug(
+                f"Domain records of {size} bytes exceed cache budget of {self._max_size_bytes} bytes; not cached."
+            )
+            return
+
+        evicted: list = []
+        with self._lock:
+            previous: Optional[Tuple[Any, Any, int]] = self._entries.pop(
+                (id(source), key), None
+            )
+            if previous is not None:
+                self._size_bytes -= previous[2]
+                if previous[1] is not records:
+                    evicted.append(previous[1])
+
+            self._entries[(id(source), key)] = (source, records, size)
+            self._size_bytes += size
+
+            while self._entries and (
+                (
+                    self._max_entries is not None
+                    and len(self._entries) > self._max_entries
+                )
+                or (
+                    self._max_size_bytes is not None
+                    and self._size_bytes > self._max_size_bytes
+                )
+            ):
+                _, (_, evicted_records, evicted_size) = self._entries.popitem(
+                    last=False
+                )
+                self._size_bytes -= evicted_size
+                evicted.append(evicted_records)
+
+        self._release(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            evicted: list = [records for _, records, _ in self._entries.values()]
+            self._entries.clear()
+            self._size_bytes = 0
+
+        self._release(evicted)
+
+    def _release(self, evicted: list) -> None:
+        if self._on_evict is None:
+            return
+
+        for records in evicted:
+            try:
+                self._on_evict(records)
+            except Exception as e:
+                logger.debug(f"Unable to release evicted domain records: {e}")
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import logging
+import os
+import pathlib
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from typing import (
     TYPE_CHECKING,
@@ -10,6 +15,7 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -22,7 +28,11 @@ from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypeSuffixes,
+)
 from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -45,6 +55,9 @@ if TYPE_CHECKING:
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.query_instrumentation import (
+        QueryInstrumentation,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
@@ -136,6 +149,8 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: dictionary of BatchSpec overrides (useful for amending configuration at runtime).
         batch_data_dict: dictionary of Batch objects with corresponding IDs as keys supplied at initialization time
         validator: Validator object (optional) -- not utilized in V3 and later versions
+        metric_cache: MetricCache object, or its configuration dictionary (e.g., {"class_name": "SqliteMetricCache", \
+            "path": "..."}), for persisting resolved metrics of fingerprinted Batch data across ExecutionEngine instances
     """
 
     recognized_batch_spec_defaults: Set[str] = set()
@@ -147,6 +162,7 @@ class ExecutionEngine(ABC):
         batch_spec_defaults: Optional[dict] = None,
         batch_data_dict: Optional[dict] = None,
         validator: Optional[Validator] = None,
+        metric_cache: Optional[Union[dict, MetricCache]] = None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -160,6 +176,13 @@ class ExecutionEngine(ABC):
         else:
             self._metric_cache = NoOpDict()
 
+        self._persisted_metric_cache: Optional[MetricCache] = self._build_metric_cache(
+            metric_cache=metric_cache
+        )
+
+        # Engines that issue queries (e.g., "SqlAlchemyExecutionEngine") may be configured to record their cost.
+        self._query_instrumentation: Optional[QueryInstrumentation] = None
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -192,6 +215,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -216,6 +240,196 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Whether independent groups of metrics may be resolved on separate threads (when concurrency is enabled)."""
+        return True
+
+    @property
+    def persisted_metric_cache(self) -> Optional[MetricCache]:
+        """Getter for durable "MetricCache" (None, unless configured)"""
+        return self._persisted_metric_cache
+
+    @property
+    def query_instrumentation(self) -> Optional[QueryInstrumentation]:
+        """Getter for "QueryInstrumentation" (None, unless configured)"""
+        return self._query_instrumentation
+
+    @contextmanager
+    def _attribute_queries_to(
+        self, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> Iterator[None]:
+        """Attributes queries, issued on current thread while in this context, to supplied "MetricConfiguration" IDs."""
+        if self._query_instrumentation is None:
+            yield
+        else:
+            with self._query_instrumentation.attribute_to(metric_ids=metric_ids):
+                yield
+
+    @contextmanager
+    def retaining_batch_data(self) -> Iterator[None]:
+        """Context, for the duration of which loaded Batch data may be retained (e.g., cached) for reuse by all metrics.
+
+        "Validator" resolves metrics of each validation run within this context.  Engines, which cache Batch data
+        (e.g., "SparkDFExecutionEngine"), release it when outermost such context exits; by default, nothing is done.
+        """
+        yield
+
+    @staticmethod
+    def _build_metric_cache(
+        metric_cache: Optional[Union[dict, MetricCache]]
+    ) -> Optional[MetricCache]:
+        if metric_cache is None or isinstance(metric_cache, MetricCache):
+            return metric_cache
+
+        from great_expectations.data_context.util import instantiate_class_from_config
+
+        metric_cache_instance = instantiate_class_from_config(
+            config=metric_cache,
+            runtime_environment={},
+            config_defaults={
+                "module_name": "great_expectations.execution_engine.metric_cache"
+            },
+        )
+        if not isinstance(metric_cache_instance, MetricCache):
+            raise gx_exceptions.InvalidConfigError(
+                f"metric_cache must be a MetricCache, not {type(metric_cache_instance).__name__}."
+            )
+
+        return metric_cache_instance
+
+    def get_batch_fingerprint(self, batch_id: Optional[str]) -> Optional[str]:
+        """Computes fingerprint, identifying content of loaded Batch data, suitable for keying persisted metrics.
+
+        Content is identified by an explicit "batch_fingerprint" in BatchSpec (e.g., SQL table snapshot ID), by the
+        "pandas_data_fingerprint" batch marker, or by modification time and size of local file referenced by BatchSpec.
+
+        Args:
+            batch_id: ID of loaded Batch
+
+        Returns:
+            Fingerprint string, or None if content of Batch data cannot be identified (such Batch is not cacheable).
+        """
+        batch = self._batch_manager.batch_cache.get(batch_id)  # type: ignore[arg-type]
+        if batch is None:
+            return None
+
+        batch_spec: dict = batch.batch_spec or {}
+        batch_markers: dict = batch.batch_markers or {}
+
+        content_markers: Dict[str, Any] = {}
+        if batch_spec.get("batch_fingerprint") is not None:
+            content_markers["batch_fingerprint"] = batch_spec["batch_fingerprint"]
+
+        if batch_markers.get("pandas_data_fingerprint") is not None:
+            content_markers["pandas_data_fingerprint"] = batch_markers[
+                "pandas_data_fingerprint"
+            ]
+
+        path = batch_spec.get("path")
+        if isinstance(path, str) and pathlib.Path(path).is_file():
+            stat_result: os.stat_result = pathlib.Path(path).stat()
+            content_markers["path"] = path
+            content_markers["mtime_ns"] = stat_result.st_mtime_ns
+            content_markers["size"] = stat_result.st_size
+
+        if not content_markers:
+            return None
+
+        content_markers["batch_id"] = batch_id
+        content_markers["execution_engine"] = self.__class__.__name__
+        return hashlib.md5(
+            json.dumps(
+                convert_to_json_serializable(data=content_markers), sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get_persisted_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Looks up supplied "MetricConfiguration" objects in durable "MetricCache" (if configured).
+
+        Args:
+            metric_configurations: metrics, whose values are sought
+
+        Returns:
+            Dictionary of previously persisted metric values, keyed by "MetricConfiguration" ID, for cache hits only.
+        """
+        if self._persisted_metric_cache is None:
+            return {}
+
+        keys_by_metric_id: Dict[
+            Tuple[str, str, str], str
+        ] = self._get_persisted_metric_keys(metric_configurations=metric_configurations)
+        if not keys_by_metric_id:
+            return {}
+
+        cached_values: Dict[str, Any] = self._persisted_metric_cache.get_many(
+            keys=keys_by_metric_id.values()
+        )
+        return {
+            metric_id: cached_values[key]
+            for metric_id, key in keys_by_metric_id.items()
+            if key in cached_values
+        }
+
+    def _persist_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        if self._persisted_metric_cache is None:
+            return
+
+        keys_by_metric_id: Dict[
+            Tuple[str, str, str], str
+        ] = self._get_persisted_metric_keys(metric_configurations=metric_configurations)
+        self._persisted_metric_cache.set_many(
+            items={
+                key: resolved_metrics[metric_id]
+                for metric_id, key in keys_by_metric_id.items()
+                if metric_id in resolved_metrics
+            }
+        )
+
+    def _get_persisted_metric_keys(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple[str, str, str], str]:
+        """Builds durable cache keys for metrics eligible for persistence.
+
+        Partial-function metrics (deferred computations, such as "aggregate_fn" or "condition") and metrics on Batch data
+        that cannot be fingerprinted are not eligible.
+        """
+        partial_fn_suffixes: Tuple[str, ...] = tuple(
+            f".{suffix.value}" for suffix in MetricPartialFunctionTypeSuffixes
+        )
+        fingerprints_by_batch_id: Dict[Optional[str], Optional[str]] = {}
+        keys_by_metric_id: Dict[Tuple[str, str, str], str] = {}
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            if metric_configuration.metric_name.endswith(partial_fn_suffixes):
+                continue
+
+            batch_id: Optional[str] = metric_configuration.metric_domain_kwargs.get(
+                "batch_id", self._batch_manager.active_batch_id
+            )
+            if batch_id not in fingerprints_by_batch_id:
+                fingerprints_by_batch_id[batch_id] = self.get_batch_fingerprint(
+                    batch_id=batch_id
+                )
+
+            batch_fingerprint: Optional[str] = fingerprints_by_batch_id[batch_id]
+            if batch_fingerprint is None:
+                continue
+
+            keys_by_metric_id[metric_configuration.id] = MetricCache.build_key(
+                batch_fingerprint=batch_fingerprint,
+                metric_id=metric_configuration.id,
+            )
+
+        return keys_by_metric_id
+
     def _load_batch_data_from_dict(
         self, batch_data_dict: Dict[str, BatchDataType]
     ) -> None:
@@ -543,11 +757,16 @@ class ExecutionEngine(ABC):
 
         for metric_computation_configuration in metric_fn_direct_configurations:
             try:
-                resolved_metrics[
-                    metric_computation_configuration.metric_configuration.id
-                ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
-                    **metric_computation_configuration.metric_provider_kwargs
-                )
+                with self._attribute_queries_to(
+                    metric_ids=(
+                        metric_computation_configuration.metric_configuration.id,
+                    )
+                ):
+                    resolved_metrics[
+                        metric_computation_configuration.metric_configuration.id
+                    ] = metric_computation_configuration.metric_fn(  # type: ignore[misc] # F not callable
+                        **metric_computation_configuration.metric_provider_kwargs
+                    )
             except Exception as e:
                 raise gx_exceptions.MetricResolutionError(
                     message=str(e),
@@ -564,6 +783,9 @@ class ExecutionEngine(ABC):
                 metric_fn_bundle=metric_fn_bundle_configurations
             )
             resolved_metrics.update(resolved_metric_bundle)
+        except gx_exceptions.MetricResolutionError:
+            # Engine has already identified the failed metrics of the bundle.
+            raise
         except Exception as e:
             raise gx_exceptions.MetricResolutionError(
                 message=str(e),
@@ -576,6 +798,15 @@ class ExecutionEngine(ABC):
         if self._caching:
             self._metric_cache.update(resolved_metrics)
 
+        self._persist_metrics(
+            metric_configurations=[
+                metric_computation_configuration.metric_configuration
+                for metric_computation_configuration in metric_fn_direct_configurations
+                + metric_fn_bundle_configurations
+            ],
+            resolved_metrics=resolved_metrics,
+        )
+
         return resolved_metrics
 
     def _split_domain_kwargs(
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import pathlib
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MetricCache(ABC):
+    """MetricCache is the interface for durable stores of resolved metric values.
+
+    Unlike the in-memory cache that every "ExecutionEngine" keeps for the lifetime of the engine, a "MetricCache"
+    outlives the engine (and the process).  Entries are keyed by an opaque string, which "ExecutionEngine" composes
+    from the fingerprint of the Batch (identifying the content of the data) and the ID of "MetricConfiguration"; hence,
+    repeated validations of unchanged Batch data are able to skip metric computation entirely.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Returns cached values for those of the supplied keys that are present (and have not expired)."""
+        pass
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Stores supplied key/value pairs, evicting older entries if configured limits are exceeded."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all entries."""
+        pass
+
+    def close(self) -> None:  # noqa: B027 # empty-method-without-abstract-decorator
+        """Releases resources held by this cache (if any)."""
+        pass
+
+    @staticmethod
+    def build_key(batch_fingerprint: str, metric_id: Tuple[str, str, str]) -> str:
+        """Composes cache key from Batch fingerprint and "MetricConfiguration" ID."""
+        return hashlib.md5(
+            "|".join((batch_fingerprint, *(str(part) for part in metric_id))).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+
+class SqliteMetricCache(MetricCache):
+    """MetricCache backed by a local SQLite database file.
+
+    Values are pickled; values that cannot be pickled, or whose pickled size exceeds "max_entry_size_bytes", are not
+    stored.  Eviction is least-recently-used, driven by "max_entries" and "max_size_bytes"; entries older than
+    "ttl_seconds" are treated as absent and purged lazily.
+
+    Args:
+        path: location of SQLite database file (created if it does not exist).
+        max_entries: maximum number of entries retained (no limit if None).
+        max_size_bytes: maximum combined size of pickled values retained (no limit if None).
+        max_entry_size_bytes: largest pickled value that will be stored (no limit if None).
+        ttl_seconds: age after which entries expire (entries never expire if None).
+    """
+
+    _TABLE_NAME = "gx_metric_cache"
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: str,
+        max_entries: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        max_entry_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self._path = str(pathlib.Path(path).expanduser())
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+        self._max_entry_size_bytes = max_entry_size_bytes
+        self._ttl_seconds = ttl_seconds
+
+        pathlib.Path(self._path).resolve().parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self._path, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self._TABLE_NAME} (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._TABLE_NAME}_accessed_at_idx ON {self._TABLE_NAME} (accessed_at)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM {self._TABLE_NAME}"
+            ).fetchone()[0]
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        now: float = time.time()
+        rows: list = []
+        with self._lock, self._connection:
+            if self._ttl_seconds is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self._TABLE_NAME} WHERE created_at < ?",
+                    (now - self._ttl_seconds,),
+                )
+
+            # SQLite limits the number of host parameters per statement; query in chunks well below that limit.
+            chunk_size = 500
+            for idx in range(0, len(keys), chunk_size):
+                chunk = keys[idx : idx + chunk_size]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows.extend(
+                    self._connection.execute(
+                        f"SELECT key, value FROM {self._TABLE_NAME} WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+                self._connection.execute(
+                    f"UPDATE {self._TABLE_NAME} SET accessed_at = ? WHERE key IN ({placeholders})",
+                    (now, *chunk),
+                )
+
+        values: Dict[str, Any] = {}
+        for key, value in rows:
+            try:
+                values[key] = pickle.loads(value)
+            except Exception as e:
+                logger.debug(f"Unable to load cached metric value for key {key}: {e}")
+
+        return values
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        now: float = time.time()
+        records: list = []
+        for key, value in items.items():
+            try:
+                blob: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(f"Metric value for key {key} cannot be cached: {e}")
+                continue
+
+            if (
+                self._max_entry_size_bytes is not None
+                and len(blob) > self._max_entry_size_bytes
+            ):
+                continue
+
+            records.append((key, blob, len(blob), now, now))
+
+        if not records:
+            return
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self._TABLE_NAME} (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                records,
+            )
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self._TABLE_NAME}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _evict(self) -> None:
+        """Removes least-recently-used entries until configured limits are satisfied (caller holds the lock)."""
+        if self._max_entries is not None:
+            self._connection.execute(
+                f"""DELETE FROM {self._TABLE_NAME} WHERE key IN (
+                    SELECT key FROM {self._TABLE_NAME} ORDER BY accessed_at DESC, rowid DESC LIMIT -1 OFFSET ?
+                )""",
+                (self._max_entries,),
+            )
+
+        if self._max_size_bytes is not None:
+            total_size: int = self._connection.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM {self._TABLE_NAME}"
+            ).fetchone()[0]
+            if total_size <= self._max_size_bytes:
+                return
+
+            cursor = self._connection.execute(
+                f"SELECT key, size FROM {self._TABLE_NAME} ORDER BY accessed_at ASC, rowid ASC"
+            )
+            evicted_keys: list = []
+            for key, size in cursor:
+                if total_size <= self._max_size_bytes:
+                    break
+                evicted_keys.append((key,))
+                total_size -= size
+
+            self._connection.executemany(
+                f"DELETE FROM {self._TABLE_NAME} WHERE key = ?", evicted_keys
+            )
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import Callable, Iterable, Iterator, Optional
+
+import pandas as pd
 
 from great_expectations.core.batch import BatchData
 
-if TYPE_CHECKING:
-    import pandas as pd
+logger = logging.getLogger(__name__)
 
 
 class PandasBatchData(BatchData):
@@ -16,3 +18,53 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class PandasChunkedBatchData(PandasBatchData):
+    """Batch data, which is read in chunks (e.g., with "chunksize" reader option), rather than into one DataFrame.
+
+    Metrics, which "PandasExecutionEngine" is able to compute chunk by chunk, never hold more than one chunk in memory;
+    other metrics access "dataframe" property, which reads all chunks into one DataFrame (once) as a fallback.
+
+    Args:
+        execution_engine: "PandasExecutionEngine", which loaded Batch data.
+        chunk_factory: returns new iterable of DataFrame chunks each time it is called (chunks are read from source).
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_factory: Callable[[], Iterable[pd.DataFrame]],
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._chunk_factory = chunk_factory
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._dataframe is not None
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks, indexed by row positions in Batch (hence, chunks concatenate into "dataframe")."""
+        if self._dataframe is not None:
+            yield self._dataframe
+            return
+
+        offset: int = 0
+        chunk: Optional[pd.DataFrame] = None
+        for chunk in self._chunk_factory():
+            chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+
+        if chunk is None:
+            yield pd.DataFrame()
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            logger.warning(
+                "Reading all chunks of Batch data into memory, since requested metrics cannot be computed chunk by chunk."
+            )
+            self._dataframe = pd.concat(list(self.iter_chunks()))
+
+        return self._dataframe
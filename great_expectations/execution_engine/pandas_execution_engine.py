@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import copy
 import datetime
 import hashlib
 import logging
 import pickle
+from collections import defaultdict
+from dataclasses import dataclass
 from functools import partial
 from io import BytesIO
 from typing import (
@@ -12,6 +15,8 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,11 +24,12 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -40,15 +46,24 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import (
     MetricDomainTypes,  # noqa: TCH001
 )
+from great_expectations.core.metric_function_types import (
+    SummarizationMetricNameSuffixes,
+)
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import DomainRecordsCache
 from great_expectations.execution_engine.execution_engine import (
-    SplitDomainKwargs,  # noqa: TCH001
+    MetricComputationConfiguration,
+    SplitDomainKwargs,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    PandasChunkedBatchData,
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
@@ -57,16 +72,155 @@ from great_expectations.execution_engine.split_and_sample.pandas_data_splitter i
 )
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
     from typing_extensions import TypeAlias
 
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
 HASH_THRESHOLD = 1e9
 
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# pandas reader methods, which return iterator of DataFrame chunks, when "chunksize" reader option is given.
+_CHUNKED_READER_METHODS = ("read_csv", "read_table", "read_fwf", "read_json")
+
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
+@dataclass(frozen=True)
+class PandasColumnAggregate:
+    """Deferred aggregate of single column, computed by "PandasExecutionEngine.resolve_metric_bundle()".
+
+    "column_aggregate_value" metric functions of "PandasExecutionEngine" are bundled in this form (the counterpart of
+    SQLAlchemy and Spark aggregate expressions for the other engines).
+
+    Attributes:
+        fn: computes aggregate value from pandas Series of column
+        reduction: name of equivalent pandas reduction (e.g., "max"), which skips NULL values; for numeric columns, it
+            is computed in one vectorized call for all columns of the same Domain and dtype (if None, "fn" is used)
+        filter_column_isnull: whether or not NULL values are removed from column before "fn" is applied to it
+    """
+
+    fn: Callable[[pd.Series], Any]
+    reduction: Optional[str] = None
+    filter_column_isnull: bool = False
+
+
+@dataclass(frozen=True)
+class PandasColumnCondition:
+    """Deferred column map condition, evaluated by "PandasExecutionEngine.resolve_metric_bundle()".
+
+    "column_condition_partial" metric functions of "PandasExecutionEngine" are bundled in this form if the engine is
+    configured with "fuse_map_conditions", so that all conditions of the same Domain are evaluated in one pass.
+
+    Attributes:
+        fn: evaluates, for pandas Series of column, whether or not every value meets condition
+        filter_column_isnull: whether or not NULL values are removed from column before "fn" is applied to it (such
+            values are never unexpected)
+    """
+
+    fn: Callable[[pd.Series], Any]
+    filter_column_isnull: bool = True
+
+
+class _FusedMapConditions:
+    """Unexpected conditions of column map metrics of the same Domain, held as one 2-D boolean matrix.
+
+    Column "position" of "unexpected" matrix (one row per Domain record) flags records, whose values do not meet that
+    condition; condition of every metric is a view of its column, and unexpected counts of all conditions are computed
+    together, the first time any of them is requested.
+    """
+
+    def __init__(self, unexpected: npt.NDArray[np.bool_], index: pd.Index) -> None:
+        self._unexpected = unexpected
+        self._index = index
+        self._unexpected_counts: Optional[npt.NDArray[np.intp]] = None
+
+    def set_unexpected(
+        self,
+        position: int,
+        unexpected: npt.NDArray[np.bool_],
+        rows: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> None:
+        """Sets column "position" of matrix, for all records or only for those selected by "rows" boolean mask."""
+        if rows is None:
+            self._unexpected[:, position] = unexpected
+        else:
+            self._unexpected[rows, position] = unexpected
+
+    def unexpected_condition(self, position: int) -> pd.Series:
+        return pd.Series(self._unexpected[:, position], index=self._index, copy=False)
+
+    def unexpected_count(self, position: int, **kwargs) -> int:
+        if self._unexpected_counts is None:
+            self._unexpected_counts = np.count_nonzero(self._unexpected, axis=0)
+
+        return int(self._unexpected_counts[position])
+
+
+class _ColumnAggregateState:
+    """Mergeable partial state of "PandasColumnAggregate", which is accumulated over chunks of column values.
+
+    Extrema and sums are reduced again over per-chunk results; mean and standard deviation are accumulated as count,
+    mean, and sum of squared deviations (merged pairwise, as in Chan et al.).
+    """
+
+    MERGEABLE_REDUCTIONS = ("min", "max", "sum", "mean", "std")
+
+    def __init__(self, column_aggregate: PandasColumnAggregate) -> None:
+        self._column_aggregate = column_aggregate
+        self._partial_values: list = []
+        self._empty_column: Optional[pd.Series] = None
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._m2: float = 0.0
+
+    def update(self, column: pd.Series) -> None:
+        if self._column_aggregate.filter_column_isnull:
+            column = column[column.notnull()]
+
+        if self._column_aggregate.reduction in ("min", "max", "sum"):
+            if len(column) == 0:
+                self._empty_column = column
+            else:
+                self._partial_values.append(self._column_aggregate.fn(column))
+
+            return
+
+        values: pd.Series = column.dropna().astype(float)
+        count: int = len(values)
+        if count == 0:
+            return
+
+        mean: float = values.mean()
+        m2: float = ((values - mean) ** 2).sum()
+        total: int = self._count + count
+        delta: float = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta**2 * self._count * count / total
+        self._count = total
+
+    def result(self) -> Any:
+        if self._column_aggregate.reduction in ("min", "max", "sum"):
+            if not self._partial_values:
+                return self._column_aggregate.fn(
+                    self._empty_column
+                    if self._empty_column is not None
+                    else pd.Series(dtype=float)
+                )
+
+            return self._column_aggregate.fn(pd.Series(self._partial_values))
+
+        if self._column_aggregate.reduction == "mean":
+            return self._mean if self._count > 0 else np.nan
+
+        return np.sqrt(self._m2 / (self._count - 1)) if self._count > 1 else np.nan
+
+
 @public_api
 class PandasExecutionEngine(ExecutionEngine):
     """PandasExecutionEngine instantiates the ExecutionEngine API to support computations using Pandas.
@@ -122,6 +276,23 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        # Filtered Domain records (e.g., for "row_condition") are reused by all metrics of the same Domain (0 disables).
+        domain_records_cache_max_bytes: Optional[int] = kwargs.pop(
+            "domain_records_cache_max_bytes", None
+        )
+        self._domain_records_cache = DomainRecordsCache(
+            max_size_bytes=DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+            if domain_records_cache_max_bytes is None
+            else domain_records_cache_max_bytes,
+            sizeof=_get_dataframe_size_bytes,
+        )
+
+        # Column map conditions of the same Domain are evaluated together, into one matrix of unexpected values.
+        self._fuse_map_conditions: bool = kwargs.pop("fuse_map_conditions", False)
+        self._fused_map_conditions: Dict[
+            Tuple[str, str, str], Tuple[_FusedMapConditions, int]
+        ] = {}
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -132,6 +303,12 @@ class PandasExecutionEngine(ExecutionEngine):
                 "gcs_options": gcs_options,
             }
         )
+        if domain_records_cache_max_bytes is not None:
+            self._config[
+                "domain_records_cache_max_bytes"
+            ] = domain_records_cache_max_bytes
+        if self._fuse_map_conditions:
+            self._config["fuse_map_conditions"] = self._fuse_map_conditions
 
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
@@ -204,6 +381,7 @@ class PandasExecutionEngine(ExecutionEngine):
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
 
+        self._fused_map_conditions.clear()
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
     @override
@@ -334,6 +512,17 @@ Bucket: {error}"""
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
+            if reader_options.get("chunksize"):
+                return (
+                    self._get_chunked_batch_data(
+                        batch_spec=batch_spec,
+                        path=path,
+                        reader_method=reader_method,
+                        reader_options=reader_options,
+                    ),
+                    batch_markers,
+                )
+
             reader_fn = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -373,6 +562,58 @@ not {batch_spec.__class__.__name__}"""
 
         return typed_batch_data, batch_markers
 
+    def _get_chunked_batch_data(
+        self,
+        batch_spec: PathBatchSpec,
+        path: str,
+        reader_method: Optional[str],
+        reader_options: dict,
+    ) -> PandasChunkedBatchData:
+        """Builds Batch data, whose records are read from local file in chunks of "chunksize" rows, as metrics need them.
+
+        CSV, fixed-width, and JSON lines files are read with pandas "chunksize" reader option; Parquet files are read
+        in record batches of "chunksize" rows with pyarrow.
+        """
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            raise gx_exceptions.ExecutionEngineError(
+                'Splitting and sampling are not supported for Batch data, which is read in chunks ("chunksize" reader option).'
+            )
+
+        reader_options = copy.deepcopy(reader_options)
+        chunksize: int = reader_options.pop("chunksize")
+        reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, path)
+        if reader_method is None:
+            reader_method = self.guess_reader_method_from_path(path)["reader_method"]
+
+        chunk_factory: Callable[[], Iterator[pd.DataFrame]]
+        if reader_method == "read_parquet":
+            if not pyarrow.parquet:
+                raise gx_exceptions.ExecutionEngineError(
+                    "pyarrow is required to read Parquet files in chunks, please 'pip install pyarrow'."
+                )
+
+            def chunk_factory() -> Iterator[pd.DataFrame]:
+                parquet_file = pyarrow.parquet.ParquetFile(path)
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=chunksize, columns=reader_options.get("columns")
+                ):
+                    yield record_batch.to_pandas()
+
+        elif reader_method in _CHUNKED_READER_METHODS:
+
+            def chunk_factory() -> Iterator[pd.DataFrame]:
+                with reader_fn(path, chunksize=chunksize, **reader_options) as reader:
+                    yield from reader
+
+        else:
+            raise gx_exceptions.ExecutionEngineError(
+                f'Reader method "{reader_method}" does not support reading in chunks ("chunksize" reader option).'
+            )
+
+        return PandasChunkedBatchData(
+            execution_engine=self, chunk_factory=chunk_factory
+        )
+
     def _apply_splitting_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
@@ -500,17 +741,417 @@ not {batch_spec.__class__.__name__}"""
             )
 
     @override
-    def resolve_metric_bundle(
-        self, metric_fn_bundle
-    ) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""
-        return (
-            {}
-        )  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).
+    def _build_direct_and_bundled_metric_computation_configurations(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[
+        List[MetricComputationConfiguration],
+        List[MetricComputationConfiguration],
+    ]:
+        """In addition to aggregate partial metrics, bundles column aggregates declared by "column_aggregate_value"
+        decorator, which would otherwise each obtain (and filter) records of their Domain separately.
+
+        If the engine is configured with "fuse_map_conditions", conditions declared by "column_condition_partial"
+        decorator are bundled as well, and unexpected counts of conditions thus evaluated are read off their matrix.
+        """
+        (
+            metric_fn_direct_configurations,
+            metric_fn_bundle_configurations,
+        ) = super()._build_direct_and_bundled_metric_computation_configurations(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+        remaining_direct_configurations: List[MetricComputationConfiguration] = []
+
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            fused_map_condition: Optional[
+                Tuple[_FusedMapConditions, int]
+            ] = self._pop_fused_map_condition_of_unexpected_count(
+                metric_configuration=metric_computation_configuration.metric_configuration
+            )
+            if fused_map_condition is not None:
+                fused_map_conditions, position = fused_map_condition
+                remaining_direct_configurations.append(
+                    MetricComputationConfiguration(
+                        metric_configuration=metric_computation_configuration.metric_configuration,
+                        metric_fn=partial(
+                            fused_map_conditions.unexpected_count, position=position
+                        ),
+                        metric_provider_kwargs=metric_computation_configuration.metric_provider_kwargs,
+                    )
+                )
+                continue
+
+            build_bundled_metric_fn: Optional[Callable] = getattr(
+                metric_computation_configuration.metric_fn,
+                "build_pandas_column_aggregate",
+                None,
+            )
+            if build_bundled_metric_fn is None and self._fuse_map_conditions:
+                build_bundled_metric_fn = getattr(
+                    metric_computation_configuration.metric_fn,
+                    "build_pandas_column_condition",
+                    None,
+                )
+
+            if build_bundled_metric_fn is None:
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            try:
+                (
+                    bundled_metric_fn,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                ) = build_bundled_metric_fn(
+                    **metric_computation_configuration.metric_provider_kwargs
+                )
+            except Exception as e:
+                # Direct computation reports the problem (e.g., nonexistent column) for this metric alone.
+                logger.debug(
+                    f"Metric {metric_computation_configuration.metric_configuration.id} cannot be bundled: {e}"
+                )
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            if isinstance(
+                bundled_metric_fn, PandasColumnCondition
+            ) and self.has_chunked_batch_data(domain_kwargs=compute_domain_kwargs):
+                # Conditions are evaluated chunk by chunk (and are not fused) for Batch data read in chunks.
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            metric_fn_bundle_configurations.append(
+                MetricComputationConfiguration(
+                    metric_configuration=metric_computation_configuration.metric_configuration,
+                    metric_fn=bundled_metric_fn,
+                    metric_provider_kwargs=metric_computation_configuration.metric_provider_kwargs,
+                    compute_domain_kwargs=compute_domain_kwargs,
+                    accessor_domain_kwargs=accessor_domain_kwargs,
+                )
+            )
+
+        return remaining_direct_configurations, metric_fn_bundle_configurations
+
+    def _pop_fused_map_condition_of_unexpected_count(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[Tuple[_FusedMapConditions, int]]:
+        """Returns fused matrix (and column position in it) of condition, whose unexpected count is to be resolved.
+
+        Matrix is retained by the engine only until unexpected counts of its conditions have been requested.
+        """
+        if not (
+            self._fused_map_conditions
+            and metric_configuration.metric_name.endswith(
+                f".{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+            )
+        ):
+            return None
+
+        unexpected_condition: Optional[
+            MetricConfiguration
+        ] = metric_configuration.metric_dependencies.get("unexpected_condition")
+        if unexpected_condition is None:
+            return None
+
+        return self._fused_map_conditions.pop(unexpected_condition.id, None)
+
+    @override
+    def resolve_metric_bundle(  # noqa: PLR0912
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """For every metric in a set of column aggregate Metrics to resolve, obtains records of its compute Domain
+        (once per Domain, rather than once per metric) and computes it on them; aggregates that declare equivalent
+        pandas reduction are computed together, for all numeric columns of the same dtype, in one vectorized call.
+        Column map conditions (see "fuse_map_conditions") of every Domain are evaluated together as well.
+
+            Args:
+                metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
+                    "MetricComputationConfiguration" objects, whose "metric_fn" is "PandasColumnAggregate" or
+                    "PandasColumnCondition" object.
+
+            Returns:
+                A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        bundles: Dict[
+            Union[str, tuple], Tuple[IDDict, List[MetricComputationConfiguration]]
+        ] = {}
+
+        compute_domain_kwargs: IDDict
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            compute_domain_kwargs = IDDict(
+                bundled_metric_configuration.compute_domain_kwargs or {}
+            )
+            bundles.setdefault(
+                compute_domain_kwargs.to_id(), (compute_domain_kwargs, [])
+            )[1].append(bundled_metric_configuration)
+
+        domain_metric_fn_bundle: List[MetricComputationConfiguration]
+        bundled_metric_configurations: List[MetricComputationConfiguration]
+        for compute_domain_kwargs, domain_metric_fn_bundle in bundles.values():
+            column_condition_configurations: List[MetricComputationConfiguration] = [
+                bundled_metric_configuration
+                for bundled_metric_configuration in domain_metric_fn_bundle
+                if isinstance(
+                    bundled_metric_configuration.metric_fn, PandasColumnCondition
+                )
+            ]
+            if column_condition_configurations:
+                self._resolve_column_conditions(
+                    compute_domain_kwargs=compute_domain_kwargs,
+                    metric_fn_bundle=column_condition_configurations,
+                    resolved_metrics=resolved_metrics,
+                )
+
+            bundled_metric_configurations = [
+                bundled_metric_configuration
+                for bundled_metric_configuration in domain_metric_fn_bundle
+                if not isinstance(
+                    bundled_metric_configuration.metric_fn, PandasColumnCondition
+                )
+            ]
+            if not bundled_metric_configurations:
+                continue
+
+            if self.has_chunked_batch_data(domain_kwargs=compute_domain_kwargs):
+                # Aggregates with mergeable partial states are accumulated chunk by chunk; others need all records.
+                bundled_metric_configurations = (
+                    self._resolve_column_aggregates_by_chunk(
+                        compute_domain_kwargs=compute_domain_kwargs,
+                        metric_fn_bundle=domain_metric_fn_bundle,
+                        resolved_metrics=resolved_metrics,
+                    )
+                )
+                if not bundled_metric_configurations:
+                    continue
+
+            df: pd.DataFrame = self.get_domain_records(
+                domain_kwargs=compute_domain_kwargs
+            )
+
+            # Metrics to be computed by vectorized reductions, keyed by reduction and column dtype.
+            vectorized_metrics: Dict[
+                Tuple[str, np.dtype], List[Tuple[MetricConfiguration, str]]
+            ] = defaultdict(list)
+
+            for bundled_metric_configuration in bundled_metric_configurations:
+                metric_configuration: MetricConfiguration = (
+                    bundled_metric_configuration.metric_configuration
+                )
+                column_aggregate: PandasColumnAggregate = (
+                    bundled_metric_configuration.metric_fn
+                )
+                try:
+                    column_name: str = (
+                        bundled_metric_configuration.accessor_domain_kwargs or {}
+                    )["column"]
+                    column: pd.Series = df[column_name]
+                    if column_aggregate.reduction and _is_vectorizable_dtype(
+                        dtype=column.dtype
+                    ):
+                        vectorized_metrics[
+                            (column_aggregate.reduction, column.dtype)
+                        ].append((metric_configuration, column_name))
+                        continue
+
+                    if column_aggregate.filter_column_isnull:
+                        column = column[column.notnull()]
+
+                    resolved_metrics[metric_configuration.id] = column_aggregate.fn(
+                        column
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=(metric_configuration,),
+                    ) from e
+
+            reduction: str
+            metric_columns: List[Tuple[MetricConfiguration, str]]
+            for (reduction, _), metric_columns in vectorized_metrics.items():
+                column_names: List[str] = list(
+                    dict.fromkeys(column_name for _, column_name in metric_columns)
+                )
+                try:
+                    values: pd.Series = getattr(df[column_names], reduction)()
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=[
+                            metric_configuration
+                            for metric_configuration, _ in metric_columns
+                        ],
+                    ) from e
+
+                for metric_configuration, column_name in metric_columns:
+                    resolved_metrics[metric_configuration.id] = values[column_name]
+
+            logger.debug(
+                f"""PandasExecutionEngine computed {len(bundled_metric_configurations)} metrics on domain_id \
+{compute_domain_kwargs.to_id()}"""
+            )
+
+        return resolved_metrics
+
+    def _resolve_column_conditions(
+        self,
+        compute_domain_kwargs: IDDict,
+        metric_fn_bundle: List[MetricComputationConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        """Evaluates column map conditions of the same Domain in one pass over its records, into 2-D boolean matrix of
+        unexpected values (one row per record, one column per condition).
+
+        Condition of every metric is a view of its column of the matrix, spanning all records of Domain (NULL values
+        skipped by condition are not unexpected), rather than only the non-NULL records the condition was applied to.
+        """
+        df: pd.DataFrame = self.get_domain_records(domain_kwargs=compute_domain_kwargs)
+
+        fused_map_conditions = _FusedMapConditions(
+            unexpected=np.zeros(
+                (len(df.index), len(metric_fn_bundle)), dtype=np.bool_, order="F"
+            ),
+            index=df.index,
+        )
+
+        position: int
+        bundled_metric_configuration: MetricComputationConfiguration
+        for position, bundled_metric_configuration in enumerate(metric_fn_bundle):
+            metric_configuration: MetricConfiguration = (
+                bundled_metric_configuration.metric_configuration
+            )
+            column_condition: PandasColumnCondition = (
+                bundled_metric_configuration.metric_fn
+            )
+            nonnull: Optional[npt.NDArray[np.bool_]] = None
+            try:
+                column: pd.Series = df[
+                    (bundled_metric_configuration.accessor_domain_kwargs or {})[
+                        "column"
+                    ]
+                ]
+                if column_condition.filter_column_isnull:
+                    nonnull = column.notnull().to_numpy()
+                    column = column[nonnull]
+
+                meets_expectation_series = column_condition.fn(column)
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=(metric_configuration,),
+                ) from e
+
+            meets_expectation_values: npt.NDArray = np.asarray(meets_expectation_series)
+            if (
+                meets_expectation_values.dtype != np.bool_
+                or meets_expectation_values.shape != (len(column.index),)
+                or (
+                    isinstance(meets_expectation_series, pd.Series)
+                    and not meets_expectation_series.index.equals(column.index)
+                )
+            ):
+                # Condition, which cannot be placed into matrix, is returned exactly as it would be computed directly.
+                resolved_metrics[metric_configuration.id] = (
+                    ~meets_expectation_series,
+                    bundled_metric_configuration.compute_domain_kwargs,
+                    bundled_metric_configuration.accessor_domain_kwargs,
+                )
+                continue
+
+            fused_map_conditions.set_unexpected(
+                position=position, unexpected=~meets_expectation_values, rows=nonnull
+            )
+            resolved_metrics[metric_configuration.id] = (
+                fused_map_conditions.unexpected_condition(position=position),
+                bundled_metric_configuration.compute_domain_kwargs,
+                bundled_metric_configuration.accessor_domain_kwargs,
+            )
+            self._fused_map_conditions[metric_configuration.id] = (
+                fused_map_conditions,
+                position,
+            )
+
+        logger.debug(
+            f"""PandasExecutionEngine evaluated {len(metric_fn_bundle)} column map conditions in one pass on domain_id \
+{compute_domain_kwargs.to_id()}"""
+        )
+
+    def _resolve_column_aggregates_by_chunk(
+        self,
+        compute_domain_kwargs: IDDict,
+        metric_fn_bundle: List[MetricComputationConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> List[MetricComputationConfiguration]:
+        """Resolves column aggregates, whose partial states are mergeable, in one pass over chunks of Domain records.
+
+        Returns:
+            "MetricComputationConfiguration" objects of column aggregates, which cannot be computed chunk by chunk.
+        """
+        states: List[Tuple[MetricComputationConfiguration, _ColumnAggregateState]] = []
+        remaining_metric_fn_bundle: List[MetricComputationConfiguration] = []
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            column_aggregate: PandasColumnAggregate = (
+                bundled_metric_configuration.metric_fn
+            )
+            if column_aggregate.reduction in _ColumnAggregateState.MERGEABLE_REDUCTIONS:
+                states.append(
+                    (
+                        bundled_metric_configuration,
+                        _ColumnAggregateState(column_aggregate=column_aggregate),
+                    )
+                )
+            else:
+                remaining_metric_fn_bundle.append(bundled_metric_configuration)
+
+        if not states:
+            return remaining_metric_fn_bundle
+
+        state: _ColumnAggregateState
+        chunk: pd.DataFrame
+        for chunk in self.iter_domain_records(domain_kwargs=compute_domain_kwargs):
+            for bundled_metric_configuration, state in states:
+                try:
+                    state.update(
+                        column=chunk[
+                            (bundled_metric_configuration.accessor_domain_kwargs or {})[
+                                "column"
+                            ]
+                        ]
+                    )
+                except Exception as e:
+                    raise gx_exceptions.MetricResolutionError(
+                        message=str(e),
+                        failed_metrics=(
+                            bundled_metric_configuration.metric_configuration,
+                        ),
+                    ) from e
+
+        for bundled_metric_configuration, state in states:
+            resolved_metrics[
+                bundled_metric_configuration.metric_configuration.id
+            ] = state.result()
+
+        logger.debug(
+            f"""PandasExecutionEngine computed {len(states)} metrics chunk by chunk on domain_id \
+{compute_domain_kwargs.to_id()}"""
+        )
+
+        return remaining_metric_fn_bundle
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -522,6 +1163,59 @@ not {batch_spec.__class__.__name__}"""
         Returns:
             A DataFrame (the data on which to compute returned in the format of a Pandas DataFrame)
         """
+        data: pd.DataFrame = self._get_batch_data(domain_kwargs=domain_kwargs).dataframe
+
+        cache_key: Optional[Union[str, tuple]] = self._domain_records_cache.build_key(
+            domain_kwargs=domain_kwargs
+        )
+        if cache_key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        records: Optional[pd.DataFrame] = self._domain_records_cache.get(
+            source=data, key=cache_key
+        )
+        if records is None:
+            records = self._filter_domain_records(
+                data=data, domain_kwargs=domain_kwargs
+            )
+            if records is not data:
+                self._domain_records_cache.set(
+                    source=data, key=cache_key, records=records
+                )
+
+        return records
+
+    def iter_domain_records(self, domain_kwargs: dict) -> Iterator[pd.DataFrame]:
+        """Yields records of Domain chunk by chunk, if Batch data is read in chunks (see "PandasChunkedBatchData");
+        otherwise, yields all records of Domain (as returned by "get_domain_records()") at once.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            Iterator of DataFrames, whose concatenation equals records of Domain
+        """
+        batch_data: PandasBatchData = self._get_batch_data(domain_kwargs=domain_kwargs)
+        if (
+            not isinstance(batch_data, PandasChunkedBatchData)
+            or batch_data.is_materialized
+        ):
+            yield self.get_domain_records(domain_kwargs=domain_kwargs)
+            return
+
+        chunk: pd.DataFrame
+        for chunk in batch_data.iter_chunks():
+            yield self._filter_domain_records(data=chunk, domain_kwargs=domain_kwargs)
+
+    def has_chunked_batch_data(self, domain_kwargs: dict) -> bool:
+        """Whether or not Batch of Domain is read in chunks (and has not been read into memory in its entirety)."""
+        batch_data: PandasBatchData = self._get_batch_data(domain_kwargs=domain_kwargs)
+        return (
+            isinstance(batch_data, PandasChunkedBatchData)
+            and not batch_data.is_materialized
+        )
+
+    def _get_batch_data(self, domain_kwargs: dict) -> PandasBatchData:
         table = domain_kwargs.get("table", None)
         if table:
             raise ValueError(
@@ -532,23 +1226,24 @@ not {batch_spec.__class__.__name__}"""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(
-                    PandasBatchData, self.batch_manager.active_batch_data
-                ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:  # noqa: PLR5501
-            if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+                return cast(PandasBatchData, self.batch_manager.active_batch_data)
 
+            raise gx_exceptions.ValidationError(
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(PandasBatchData, self.batch_manager.batch_data_cache[batch_id])
+
+        raise gx_exceptions.ValidationError(
+            f"Unable to find batch with batch_id {batch_id}"
+        )
+
+    @staticmethod
+    def _filter_domain_records(  # noqa: PLR0912
+        data: pd.DataFrame, domain_kwargs: dict
+    ) -> pd.DataFrame:
+        """Applies "row_condition" and "ignore_row_if" directives of Domain kwargs to records of Batch."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -668,6 +1363,16 @@ not {batch_spec.__class__.__name__}"""
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
 
 
+def _get_dataframe_size_bytes(df: pd.DataFrame) -> int:
+    """Shallow memory usage (contents of Python objects in "object" columns are not measured, which is costly)."""
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+def _is_vectorizable_dtype(dtype: Any) -> bool:
+    """NumPy integer and floating point columns are reduced by DataFrame reductions exactly as by Series reductions."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
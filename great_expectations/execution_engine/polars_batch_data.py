@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from great_expectations.core.batch import BatchData
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility.polars import polars as pl
+
+
+class PolarsBatchData(BatchData):
+    """Batch data held as Polars "LazyFrame" (i.e., query plan), which is evaluated only when metrics are computed."""
+
+    def __init__(self, execution_engine, dataframe: pl.LazyFrame) -> None:
+        super().__init__(execution_engine=execution_engine)
+        self._dataframe = dataframe
+
+    @property
+    def dataframe(self) -> pl.LazyFrame:
+        return self._dataframe
@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import datetime
+import logging
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations._docs_decorators import public_api
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch_spec import (
+    AzureBatchSpec,
+    BatchSpec,
+    GCSBatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric_domain_types import (
+    MetricDomainTypes,  # noqa: TCH001
+)
+from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    MetricComputationConfiguration,
+    SplitDomainKwargs,
+)
+from great_expectations.execution_engine.polars_batch_data import PolarsBatchData
+from great_expectations.expectations.row_conditions import (
+    RowCondition,
+    RowConditionParserType,
+    parse_condition_to_polars,
+)
+from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
+
+logger = logging.getLogger(__name__)
+
+
+@public_api
+class PolarsExecutionEngine(ExecutionEngine):
+    """PolarsExecutionEngine instantiates the ExecutionEngine API to support computations using Polars.
+
+    Batch data is held as a Polars `LazyFrame` (files are scanned, rather than read), and metrics are built as Polars
+    expressions.  Aggregate metrics of every compute Domain are combined into one lazy `select()`, and the queries of
+    all Domains are collected together, so that Polars optimizes (e.g., projects only the columns needed, shares
+    common scans) and executes all of them in parallel on its thread pool.
+
+    Constructor builds a PolarsExecutionEngine, using provided configuration options.
+
+    Args:
+        *args: Positional arguments for configuring PolarsExecutionEngine
+        **kwargs: Keyword arguments for configuring PolarsExecutionEngine
+
+    For example:
+    ```python
+        execution_engine: ExecutionEngine = PolarsExecutionEngine(batch_data_dict={batch.id: batch.data})
+    ```
+    """
+
+    recognized_batch_spec_defaults = {
+        "reader_method",
+        "reader_options",
+    }
+
+    def __init__(self, *args, **kwargs) -> None:
+        if not pl:
+            raise gx_exceptions.ExecutionEngineError(
+                "PolarsExecutionEngine requires polars, please 'pip install polars'."
+            )
+
+        super().__init__(*args, **kwargs)
+
+    @override
+    def load_batch_data(
+        self,
+        batch_id: str,
+        batch_data: Union[PolarsBatchData, pl.LazyFrame, pl.DataFrame, pd.DataFrame],  # type: ignore[override]
+    ) -> None:
+        if not isinstance(batch_data, PolarsBatchData):
+            batch_data = PolarsBatchData(
+                self, self._to_lazy_frame(batch_data=batch_data)
+            )
+
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    @staticmethod
+    def _to_lazy_frame(
+        batch_data: Union[pl.LazyFrame, pl.DataFrame, pd.DataFrame]
+    ) -> pl.LazyFrame:
+        if isinstance(batch_data, pl.LazyFrame):
+            return batch_data
+
+        if isinstance(batch_data, pl.DataFrame):
+            return batch_data.lazy()
+
+        if isinstance(batch_data, pd.DataFrame):
+            return pl.from_pandas(batch_data).lazy()
+
+        raise gx_exceptions.GreatExpectationsError(
+            "PolarsExecutionEngine requires batch data that is either a Polars LazyFrame or DataFrame, a Pandas DataFrame, or a PolarsBatchData object"
+        )
+
+    @override
+    def get_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Tuple[PolarsBatchData, BatchMarkers]:
+        # We need to build a batch_markers to be used in the dataframe
+        batch_markers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            raise gx_exceptions.ExecutionEngineError(
+                "Splitting and sampling are not supported by PolarsExecutionEngine."
+            )
+
+        lazy_frame: pl.LazyFrame
+        if isinstance(batch_spec, RuntimeDataBatchSpec):
+            # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
+            batch_data = batch_spec.batch_data
+            if isinstance(batch_data, PolarsBatchData):
+                lazy_frame = batch_data.dataframe
+            else:
+                lazy_frame = self._to_lazy_frame(batch_data=batch_data)
+
+            batch_spec.batch_data = "PolarsLazyFrame"
+
+        elif isinstance(batch_spec, (S3BatchSpec, AzureBatchSpec, GCSBatchSpec)):
+            raise gx_exceptions.BatchSpecError(
+                f"""PolarsExecutionEngine reads local files only; {batch_spec.__class__.__name__} is not supported."""
+            )
+
+        elif isinstance(batch_spec, PathBatchSpec):
+            path: str = batch_spec.path
+            reader_method: Optional[str] = batch_spec.reader_method
+            if reader_method is None:
+                reader_method = self.guess_reader_method_from_path(path=path)[
+                    "reader_method"
+                ]
+
+            reader_fn = getattr(pl, reader_method, None)
+            if reader_fn is None or not reader_method.startswith("scan_"):
+                raise gx_exceptions.ExecutionEngineError(
+                    f'Unable to find reader_method "{reader_method}" for PolarsExecutionEngine (only lazy "scan_*" readers are supported).'
+                )
+
+            lazy_frame = reader_fn(path, **(batch_spec.reader_options or {}))
+
+        else:
+            raise gx_exceptions.BatchSpecError(
+                f"""batch_spec must be of type RuntimeDataBatchSpec or PathBatchSpec, \
+not {batch_spec.__class__.__name__}"""
+            )
+
+        return (
+            PolarsBatchData(execution_engine=self, dataframe=lazy_frame),
+            batch_markers,
+        )
+
+    @staticmethod
+    def guess_reader_method_from_path(path: str) -> dict:
+        """Helper method for determining which (lazy) Polars reader method to use, based on file extension.
+
+        Args:
+            path (str): the path used to guess.
+
+        Returns:
+            ReaderMethod to use for the filepath
+        """
+        path = path.lower()
+        if path.endswith((".parquet", ".parq", ".pqt")):
+            return {"reader_method": "scan_parquet"}
+        elif path.endswith((".feather", ".arrow", ".ipc")):
+            return {"reader_method": "scan_ipc"}
+        elif path.endswith((".csv", ".csv.gz", ".tsv")):
+            return {"reader_method": "scan_csv"}
+        elif path.endswith((".jsonl", ".ndjson")):
+            return {"reader_method": "scan_ndjson"}
+
+        raise gx_exceptions.ExecutionEngineError(
+            f'Unable to determine reader method from path: "{path}".'
+        )
+
+    @property
+    def dataframe(self) -> pl.LazyFrame:
+        """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
+        ValueError Exception
+        """
+        if self.batch_manager.active_batch_data is None:
+            raise ValueError(
+                "Batch has not been loaded - please run load_batch_data() to load a batch."
+            )
+
+        return cast(PolarsBatchData, self.batch_manager.active_batch_data).dataframe
+
+    @public_api
+    @override
+    def get_domain_records(
+        self,
+        domain_kwargs: dict,
+    ) -> pl.LazyFrame:
+        """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a Batch of data.
+
+        Args:
+            domain_kwargs (dict) - A dictionary consisting of the Domain kwargs specifying which data to obtain
+
+        Returns:
+            A Polars LazyFrame (query plan of the data on which to compute)
+        """
+        table = domain_kwargs.get("table", None)
+        if table:
+            raise ValueError(
+                "PolarsExecutionEngine does not currently support multiple named tables."
+            )
+
+        batch_id = domain_kwargs.get("batch_id")
+        if batch_id is None:
+            # We allow no batch id specified if there is only one batch
+            if self.batch_manager.active_batch_data_id is not None:
+                data = cast(
+                    PolarsBatchData, self.batch_manager.active_batch_data
+                ).dataframe
+            else:
+                raise gx_exceptions.ValidationError(
+                    "No batch is specified, but could not identify a loaded batch."
+                )
+        elif batch_id in self.batch_manager.batch_data_cache:
+            data = cast(
+                PolarsBatchData, self.batch_manager.batch_data_cache[batch_id]
+            ).dataframe
+        else:
+            raise gx_exceptions.ValidationError(
+                f"Unable to find batch with batch_id {batch_id}"
+            )
+
+        return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+    @staticmethod
+    def _filter_domain_records(  # noqa: PLR0912
+        data: pl.LazyFrame, domain_kwargs: dict
+    ) -> pl.LazyFrame:
+        """Applies "row_condition", "filter_conditions", and "ignore_row_if" directives of "domain_kwargs" to "data"."""
+        # Filtering by row condition.
+        row_condition = domain_kwargs.get("row_condition", None)
+        if row_condition:
+            condition_parser = domain_kwargs.get("condition_parser", None)
+            if condition_parser == "great_expectations__experimental__":
+                data = data.filter(parse_condition_to_polars(row_condition))
+            else:
+                raise gx_exceptions.GreatExpectationsError(
+                    f"unrecognized condition_parser {condition_parser!s} for Polars execution engine"
+                )
+
+        # Filtering by filter_conditions
+        filter_conditions: List[RowCondition] = domain_kwargs.get(
+            "filter_conditions", []
+        )
+        for filter_condition in filter_conditions:
+            if filter_condition.condition_type != RowConditionParserType.GE:
+                raise gx_exceptions.GreatExpectationsError(
+                    "Filter condition must be of type GX for PolarsExecutionEngine"
+                )
+
+            data = data.filter(parse_condition_to_polars(filter_condition.condition))
+
+        if "column" in domain_kwargs:
+            return data
+
+        ignore_row_if: Optional[str] = domain_kwargs.get("ignore_row_if")
+        column_names: List[str]
+        if (
+            "column_A" in domain_kwargs
+            and "column_B" in domain_kwargs
+            and ignore_row_if
+        ):
+            column_names = [domain_kwargs["column_A"], domain_kwargs["column_B"]]
+            if ignore_row_if == "both_values_are_missing":
+                return data.filter(~pl.all_horizontal(pl.col(column_names).is_null()))
+
+            if ignore_row_if == "either_value_is_missing":
+                return data.drop_nulls(subset=column_names)
+
+            if ignore_row_if != "neither":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+
+        elif "column_list" in domain_kwargs and ignore_row_if:
+            column_names = domain_kwargs["column_list"]
+            if ignore_row_if == "all_values_are_missing":
+                return data.filter(~pl.all_horizontal(pl.col(column_names).is_null()))
+
+            if ignore_row_if == "any_value_is_missing":
+                return data.drop_nulls(subset=column_names)
+
+            if ignore_row_if != "never":
+                raise ValueError(
+                    f'Unrecognized value of ignore_row_if ("{ignore_row_if}").'
+                )
+
+        return data
+
+    @override
+    def get_compute_domain(
+        self,
+        domain_kwargs: dict,
+        domain_type: Union[str, MetricDomainTypes],
+        accessor_keys: Optional[Iterable[str]] = None,
+    ) -> Tuple[pl.LazyFrame, dict, dict]:
+        """Uses the given Domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to obtain and/or query a batch.
+
+        Returns in the format of a Polars LazyFrame along with Domain arguments required for computing.  If the Domain \
+        is a single column, this is added to 'accessor Domain kwargs' and used for later access.
+
+        Args:
+            domain_kwargs (dict): a dictionary consisting of the Domain kwargs specifying which data to obtain
+            domain_type (str or MetricDomainTypes): an Enum value indicating which metric Domain the user would like \
+            to be using, or a corresponding string value representing it.  String types include "column", \
+            "column_pair", "table", and "other".  Enum types include capitalized versions of these from the class \
+            MetricDomainTypes.
+            accessor_keys (str iterable): keys that are part of the compute Domain but should be ignored when \
+            describing the Domain and simply transferred with their associated values into accessor_domain_kwargs.
+
+        Returns:
+            A tuple including:
+              - a LazyFrame (query plan of the data on which to compute)
+              - a dictionary of compute_domain_kwargs, describing the LazyFrame
+              - a dictionary of accessor_domain_kwargs, describing any accessors needed to
+                identify the Domain within the compute domain
+        """
+        data: pl.LazyFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        split_domain_kwargs: SplitDomainKwargs = self._split_domain_kwargs(
+            domain_kwargs, domain_type, accessor_keys
+        )
+
+        return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
+
+    @override
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """For every metric in a set of Metrics to resolve, obtains necessary metric keyword arguments and builds
+        bundles of the metrics into one lazy "select()" per compute Domain; queries of all Domains are collected
+        together, so that Polars optimizes and executes them in parallel.
+
+            Args:
+                metric_fn_bundle (Iterable[MetricComputationConfiguration]): \
+                    "MetricComputationConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
+                    its metric provider function (the function that actually executes the metric), and arguments to pass
+                    to metric provider function (dictionary of metrics defined in registry and corresponding arguments).
+
+            Returns:
+                A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values for domains.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        aggregates: Dict[Union[str, tuple], dict] = {}
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            compute_domain_kwargs: dict = (
+                bundled_metric_configuration.compute_domain_kwargs or {}
+            )
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in aggregates:
+                aggregates[domain_id] = {
+                    "column_aggregates": [],
+                    "metric_ids": [],
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+
+            aggregates[domain_id]["column_aggregates"].append(
+                bundled_metric_configuration.metric_fn
+            )
+            aggregates[domain_id]["metric_ids"].append(
+                bundled_metric_configuration.metric_configuration.id
+            )
+
+        if not aggregates:
+            return resolved_metrics
+
+        # Output columns are named by position, since different metrics may aggregate same column.
+        queries: List[pl.LazyFrame] = [
+            self.get_domain_records(domain_kwargs=aggregate["domain_kwargs"]).select(
+                [
+                    column_aggregate.alias(f"__metric_{idx}")
+                    for idx, column_aggregate in enumerate(
+                        aggregate["column_aggregates"]
+                    )
+                ]
+            )
+            for aggregate in aggregates.values()
+        ]
+        results: List[pl.DataFrame] = pl.collect_all(queries)
+
+        aggregate: dict
+        res: pl.DataFrame
+        for aggregate, res in zip(aggregates.values(), results):
+            logger.debug(
+                f"PolarsExecutionEngine computed {res.width} metrics on domain_id {IDDict(aggregate['domain_kwargs']).to_id()}"
+            )
+
+            assert (
+                res.height == 1
+            ), "all bundle-computed metrics must be single-value statistics"
+            assert (
+                len(aggregate["metric_ids"]) == res.width
+            ), "unexpected number of metrics returned"
+
+            row: tuple = res.row(0)
+            idx: int
+            metric_id: Tuple[str, str, str]
+            for idx, metric_id in enumerate(aggregate["metric_ids"]):
+                resolved_metrics[metric_id] = row[idx]
+
+        return resolved_metrics
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@dataclass
+class QueryRecord:
+    """Cost of one query, executed by "SqlAlchemyExecutionEngine", and IDs of "MetricConfiguration" objects it served.
+
+    Args:
+        query_id: sequential number of query within its "QueryInstrumentation".
+        query: SQL text of query.
+        metric_ids: IDs of "MetricConfiguration" objects, whose computation issued query (empty if not attributable).
+        wall_time_seconds: time elapsed executing query (excluding fetching of rows by caller).
+        row_count: number of rows reported by driver (None, unless driver reports it).
+        bytes_processed: number of bytes processed by database (None, unless driver reports it).
+        explain_plan: rows of "EXPLAIN" output for query (None, unless requested and supported by dialect).
+    """
+
+    query_id: int
+    query: str
+    metric_ids: List[Tuple[str, str, str]] = field(default_factory=list)
+    wall_time_seconds: float = 0.0
+    row_count: Optional[int] = None
+    bytes_processed: Optional[int] = None
+    explain_plan: Optional[List[str]] = None
+
+    def to_json_dict(self) -> dict:
+        json_dict: dict = asdict(self)
+        return convert_to_json_serializable(data=json_dict)
+
+
+class QueryInstrumentation:
+    """Collects "QueryRecord" objects for queries, executed by "SqlAlchemyExecutionEngine".
+
+    Queries are attributed to "MetricConfiguration" objects, whose computation is in progress on the executing thread
+    (see "attribute_to()"); "Validator" further attributes them to "ExpectationConfiguration" objects, whose metrics
+    these are, and adds summaries to "meta" of validation results.
+
+    Args:
+        explain: if True, "EXPLAIN" plan of each query is captured (for dialects that support it); this doubles the
+            number of round trips to database and should be used for diagnosis only.
+        report_path: if set, machine-readable report of queries of every suite validation is appended to this file (as
+            one JSON object per line).
+    """
+
+    def __init__(
+        self, explain: bool = False, report_path: Optional[str] = None
+    ) -> None:
+        self._explain = explain
+        self._report_path = report_path
+        self._records: List[QueryRecord] = []
+        self._lock = threading.Lock()
+        self._attribution = threading.local()
+
+    @property
+    def explain(self) -> bool:
+        return self._explain
+
+    @property
+    def report_path(self) -> Optional[str]:
+        return self._report_path
+
+    @property
+    def query_count(self) -> int:
+        """Number of queries recorded so far (also "query_id" of next query)."""
+        return len(self._records)
+
+    @contextmanager
+    def attribute_to(
+        self, metric_ids: Iterable[Tuple[str, str, str]]
+    ) -> Iterator[None]:
+        """Attributes queries, recorded on current thread while in this context, to supplied "MetricConfiguration" IDs."""
+        previous_metric_ids: List[Tuple[str, str, str]] = self._current_metric_ids()
+        self._attribution.metric_ids = list(metric_ids)
+        try:
+            yield
+        finally:
+            self._attribution.metric_ids = previous_metric_ids
+
+    def record(  # noqa: PLR0913
+        self,
+        query: str,
+        wall_time_seconds: float,
+        row_count: Optional[int] = None,
+        bytes_processed: Optional[int] = None,
+        explain_plan: Optional[List[str]] = None,
+    ) -> QueryRecord:
+        """Records cost of query, attributing it to "MetricConfiguration" IDs of current thread."""
+        with self._lock:
+            query_record = QueryRecord(
+                query_id=len(self._records),
+                query=query,
+                metric_ids=self._current_metric_ids(),
+                wall_time_seconds=wall_time_seconds,
+                row_count=row_count,
+                bytes_processed=bytes_processed,
+                explain_plan=explain_plan,
+            )
+            self._records.append(query_record)
+
+        return query_record
+
+    def get_records(self, since: int = 0) -> List[QueryRecord]:
+        """Returns "QueryRecord" objects, whose "query_id" is no smaller than "since"."""
+        with self._lock:
+            return self._records[since:]
+
+    def get_records_for_metric_ids(
+        self, metric_ids: Set[Tuple[str, str, str]], since: int = 0
+    ) -> List[QueryRecord]:
+        """Returns "QueryRecord" objects (from "since" on), which served any of supplied "MetricConfiguration" IDs."""
+        return [
+            query_record
+            for query_record in self.get_records(since=since)
+            if not metric_ids.isdisjoint(query_record.metric_ids)
+        ]
+
+    @staticmethod
+    def summarize(query_records: List[QueryRecord]) -> dict:
+        """Returns totals of supplied "QueryRecord" objects (in JSON-serializable format).
+
+        Totals of rows and bytes cover those queries, for which driver reported them (None, if it reported none).
+        """
+        row_counts: List[int] = [
+            query_record.row_count
+            for query_record in query_records
+            if query_record.row_count is not None
+        ]
+        bytes_processed: List[int] = [
+            query_record.bytes_processed
+            for query_record in query_records
+            if query_record.bytes_processed is not None
+        ]
+        return {
+            "query_count": len(query_records),
+            "query_ids": [query_record.query_id for query_record in query_records],
+            "wall_time_seconds": sum(
+                query_record.wall_time_seconds for query_record in query_records
+            ),
+            "row_count": sum(row_counts) if row_counts else None,
+            "bytes_processed": sum(bytes_processed) if bytes_processed else None,
+        }
+
+    def to_json_dict(self, since: int = 0) -> dict:
+        """Returns machine-readable report of queries (from "since" on)."""
+        query_records: List[QueryRecord] = self.get_records(since=since)
+        json_dict: Dict = self.summarize(query_records=query_records)
+        json_dict["queries"] = [
+            query_record.to_json_dict() for query_record in query_records
+        ]
+        return json_dict
+
+    def write_report(self, report: dict) -> None:
+        """Appends report (e.g., output of "to_json_dict()" with attribution added) as JSON line to "report_path"."""
+        if self._report_path is None:
+            return
+
+        path = pathlib.Path(self._report_path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, path.open("a") as report_file:
+            report_file.write(json.dumps(report) + "\n")
+
+    def clear(self) -> None:
+        """Removes all records."""
+        with self._lock:
+            self._records = []
+
+    def _current_metric_ids(self) -> List[Tuple[str, str, str]]:
+        return list(getattr(self._attribution, "metric_ids", []))
@@ -3,12 +3,14 @@ from __future__ import annotations
 import copy
 import datetime
 import logging
+from contextlib import contextmanager
 from functools import reduce
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Tuple,
@@ -21,6 +23,9 @@ from dateutil.parser import parse
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import pyspark
+from great_expectations.compatibility.pyspark import (
+    StorageLevel,
+)
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
@@ -50,6 +55,9 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import (
+    DomainRecordsCache,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,  # noqa: TCH001
     SplitDomainKwargs,  # noqa: TCH001
@@ -73,6 +81,27 @@ from great_expectations.validator.metric_configuration import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of filtered Domain DataFrames (e.g., for distinct "row_condition" directives) retained per engine.
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES = 16
+
+# Domain kwargs, which only filter the rows of the DataFrame determined by the remaining Domain kwargs.
+_ROW_FILTERING_DOMAIN_KWARGS = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+)
+
+# Compute Domains consisting only of these kwargs can be folded into the (unfiltered) Domain of their Batch.
+_FOLDABLE_DOMAIN_KWARGS = {
+    "batch_id",
+    *_ROW_FILTERING_DOMAIN_KWARGS,
+}
+
+
+def _unpersist_dataframe(df: pyspark.DataFrame) -> None:
+    if df.is_cached:
+        df.unpersist()
+
 
 # noinspection SpellCheckingInspection
 def apply_dateutil_parse(column):
@@ -93,6 +122,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
     Args:
         *args: Positional arguments for configuring SparkDFExecutionEngine
         persist: If True (default), then creation of the Spark DataFrame is done outside this class
+        storage_level: Name of "pyspark.StorageLevel" (e.g., "MEMORY_AND_DISK"), at which Batch DataFrames (and reused
+            filtered Domain DataFrames) are persisted, if "persist" is True (Spark default for DataFrames, if omitted)
         spark_config: Dictionary of Spark configuration options
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
@@ -191,10 +222,34 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=True,
+        storage_level: Optional[str] = None,
         **kwargs,
     ) -> None:
         self._persist = persist
 
+        self._storage_level: Optional[StorageLevel] = None
+        if storage_level is not None:
+            self._storage_level = getattr(StorageLevel, storage_level, None)
+            if not isinstance(self._storage_level, StorageLevel):
+                raise ValueError(
+                    f'Unrecognized value of storage_level ("{storage_level}"); it must name "pyspark.StorageLevel".'
+                )
+
+        # Batch DataFrames, persisted by this engine (rather than by caller), keyed by "batch_id" (see "load_batch_data()").
+        self._persisted_batch_data: Dict[str, pyspark.DataFrame] = {}
+        self._batch_data_retention_depth = 0
+
+        # Filtered Domain records (e.g., for "row_condition") are reused by all metrics of the same Domain (0 disables).
+        domain_records_cache_max_entries: Optional[int] = kwargs.pop(
+            "domain_records_cache_max_entries", None
+        )
+        self._domain_records_cache = DomainRecordsCache(
+            max_entries=DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES
+            if domain_records_cache_max_entries is None
+            else domain_records_cache_max_entries,
+            on_evict=_unpersist_dataframe,
+        )
+
         if spark_config is None:
             spark_config = {}
 
@@ -219,6 +274,12 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if domain_records_cache_max_entries is not None:
+            self._config[
+                "domain_records_cache_max_entries"
+            ] = domain_records_cache_max_entries
+        if storage_level is not None:
+            self._config["storage_level"] = storage_level
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
@@ -245,10 +306,66 @@ class SparkDFExecutionEngine(ExecutionEngine):
             )
 
         if self._persist:
-            batch_data.dataframe.persist()
+            self._persist_batch_data(batch_id=batch_id, df=batch_data.dataframe)
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    @contextmanager
+    def retaining_batch_data(self) -> Iterator[None]:
+        """Persists loaded Batch DataFrames (unless "persist" is False) for the duration of this context.
+
+        All metrics of a validation run then scan the source of each Batch only once.  When outermost such context
+        exits, DataFrames persisted by this engine are unpersisted (see "unpersist_batch_data()").
+        """
+        if self._batch_data_retention_depth == 0 and self._persist:
+            batch_id: str
+            batch_data: Any
+            for batch_id, batch_data in self.batch_manager.batch_data_cache.items():
+                if isinstance(batch_data, SparkDFBatchData):
+                    self._persist_batch_data(batch_id=batch_id, df=batch_data.dataframe)
+
+        self._batch_data_retention_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_data_retention_depth -= 1
+            if self._batch_data_retention_depth == 0:
+                self.unpersist_batch_data()
+
+    def unpersist_batch_data(self) -> None:
+        """Unpersists Batch DataFrames (and filtered Domain DataFrames), which were persisted by this engine.
+
+        DataFrames, which were already persisted when loaded as Batch data, are left as they are.
+        """
+        df: pyspark.DataFrame
+        for df in self._persisted_batch_data.values():
+            _unpersist_dataframe(df=df)
+
+        self._persisted_batch_data = {}
+        self._domain_records_cache.clear()
+
+    def _persist_batch_data(self, batch_id: str, df: pyspark.DataFrame) -> None:
+        persisted_df: Optional[pyspark.DataFrame] = self._persisted_batch_data.get(
+            batch_id
+        )
+        if persisted_df is not None and persisted_df is not df:
+            # Batch was reloaded with different data; its previous DataFrame is no longer used.
+            _unpersist_dataframe(df=persisted_df)
+            del self._persisted_batch_data[batch_id]
+
+        if df.is_cached:
+            return
+
+        self._persist_dataframe(df=df)
+        self._persisted_batch_data[batch_id] = df
+
+    def _persist_dataframe(self, df: pyspark.DataFrame) -> None:
+        if self._storage_level is None:
+            df.persist()
+        else:
+            df.persist(self._storage_level)
+
     @override
     def get_batch_data_and_markers(  # noqa: PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -472,7 +589,7 @@ illegal.  Please check your config."""
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912, PLR0915
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> "pyspark.DataFrame":  # noqa F821
@@ -514,6 +631,33 @@ illegal.  Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        cache_key: Optional[Union[str, tuple]] = self._domain_records_cache.build_key(
+            domain_kwargs=domain_kwargs
+        )
+        if cache_key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        records: Optional[pyspark.DataFrame] = self._domain_records_cache.get(
+            source=data, key=cache_key
+        )
+        if records is None:
+            records = self._filter_domain_records(
+                data=data, domain_kwargs=domain_kwargs
+            )
+            if records is not data:
+                self._domain_records_cache.set(
+                    source=data, key=cache_key, records=records
+                )
+        elif self._persist and not records.is_cached:
+            # Filtered records are persisted once they are known to be reused (rather than for every Domain).
+            self._persist_dataframe(df=records)
+
+        return records
+
+    def _filter_domain_records(  # noqa: PLR0912
+        self, data: pyspark.DataFrame, domain_kwargs: dict
+    ) -> pyspark.DataFrame:
+        """Applies "row_condition", "filter_conditions", and "ignore_row_if" directives of Domain kwargs to records."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -705,6 +849,55 @@ illegal.  Please check your config."""
 
         return new_domain_kwargs
 
+    def split_row_filtering_condition(
+        self, domain_kwargs: dict
+    ) -> Tuple[Optional[pyspark.Column], dict]:
+        """Splits row filtering of compute Domain into condition and kwargs of (unfiltered) base Domain.
+
+        Aggregates, which ignore NULL inputs, can be computed on base Domain over "F.when(<condition>, <column>)"
+        instead; aggregates of Domains differing only in "row_condition" and "filter_conditions" (e.g., of different
+        columns, each excluding NULL values of its own column) are then bundled into single Spark job.
+
+        Args:
+            domain_kwargs: compute Domain kwargs (not including accessor Domain kwargs, such as "column")
+
+        Returns:
+            Tuple of condition and base Domain kwargs, or (None, "domain_kwargs") if Domain does not filter rows or if
+            its filtering can not be expressed as condition.
+        """
+        if not set(domain_kwargs.keys()) <= _FOLDABLE_DOMAIN_KWARGS:
+            return None, domain_kwargs
+
+        conditions: List[pyspark.Column] = []
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition:
+            condition_parser: Optional[str] = domain_kwargs.get("condition_parser")
+            if condition_parser == "spark":
+                conditions.append(F.expr(row_condition))
+            elif condition_parser == "great_expectations__experimental__":
+                conditions.append(parse_condition_to_spark(row_condition))
+            else:
+                return None, domain_kwargs
+
+        filter_conditions: List[RowCondition] = (
+            domain_kwargs.get("filter_conditions") or []
+        )
+        if len(filter_conditions) > 0:
+            conditions.append(
+                F.expr(self._combine_row_conditions(filter_conditions).condition)
+            )
+
+        if not conditions:
+            return None, domain_kwargs
+
+        base_domain_kwargs: dict = {
+            key: value
+            for key, value in domain_kwargs.items()
+            if key not in _ROW_FILTERING_DOMAIN_KWARGS
+        }
+        return reduce(lambda left, right: left & right, conditions), base_domain_kwargs
+
     @override
     def resolve_metric_bundle(
         self,
@@ -756,33 +949,47 @@ illegal.  Please check your config."""
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        if not aggregates:
+            return resolved_metrics
+
+        # Aggregates of all Domains are computed by single Spark job (one-row aggregate DataFrames are cross-joined).
+        aggregate_dfs: List[pyspark.DataFrame] = []
+        metric_ids: List[Tuple[str, str, str]] = []
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
 
             assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+            aggregate_dfs.append(
+                df.agg(
+                    *[
+                        column_aggregate.alias(f"__metric_{len(metric_ids) + idx}")
+                        for idx, column_aggregate in enumerate(
+                            aggregate["column_aggregates"]
+                        )
+                    ]
+                )
+            )
+            metric_ids.extend(aggregate["metric_ids"])
 
             logger.debug(
-                f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+                f"SparkDFExecutionEngine computed {len(aggregate['metric_ids'])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
             )
 
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(aggregate["metric_ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-
-            idx: int
-            metric_id: Tuple[str, str, str]
-            for idx, metric_id in enumerate(aggregate["metric_ids"]):
-                # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,
-                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.
-                resolved_metrics[metric_id] = convert_to_json_serializable(
-                    data=res[0][idx]
-                )
+        res = reduce(lambda left, right: left.crossJoin(right), aggregate_dfs).collect()
+
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(metric_ids) == len(res[0]), "unexpected number of metrics returned"
+
+        idx: int
+        metric_id: Tuple[str, str, str]
+        for idx, metric_id in enumerate(metric_ids):
+            # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,
+            # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.
+            resolved_metrics[metric_id] = convert_to_json_serializable(data=res[0][idx])
 
         return resolved_metrics
 
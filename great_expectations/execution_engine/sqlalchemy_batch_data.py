@@ -389,11 +389,14 @@ class SqlAlchemyBatchData(BatchData):
             temp_table_schema_name=temp_table_schema_name,
         )
 
-        return sa.Table(
+        temp_table = sa.Table(
             temp_table_name,
             sa.MetaData(),
             schema=temp_table_schema_name,
         )
+        self.execution_engine._register_temp_table(temp_table)
+
+        return temp_table
 
     def _generate_selectable_from_selectable(
         self,
@@ -435,8 +438,11 @@ class SqlAlchemyBatchData(BatchData):
             temp_table_schema_name=temp_table_schema_name,
         )
 
-        return sa.Table(
+        temp_table = sa.Table(
             temp_table_name,
             sa.MetaData(),
             schema=temp_table_schema_name,
         )
+        self.execution_engine._register_temp_table(temp_table)
+
+        return temp_table
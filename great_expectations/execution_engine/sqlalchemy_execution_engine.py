@@ -9,6 +9,7 @@ import os
 import random
 import re
 import string
+import time
 import traceback
 from contextlib import contextmanager
 from pathlib import Path
@@ -49,6 +50,12 @@ from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,
     SplitDomainKwargs,
 )
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,  # noqa: TCH001
+)
+from great_expectations.execution_engine.query_instrumentation import (
+    QueryInstrumentation,
+)
 from great_expectations.execution_engine.split_and_sample.sqlalchemy_data_sampler import (
     SqlAlchemyDataSampler,
 )
@@ -61,6 +68,7 @@ del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
@@ -150,6 +158,8 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.core.async_executor import AsyncResult
+
 
 def _get_dialect_type_module(dialect):
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -216,6 +226,111 @@ _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.BIGQUERY,
 )
 
+# Statement prefixes, which return query plan (rather than query results) for dialects that support this.
+_EXPLAIN_PREFIX_BY_DIALECT: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.SQLITE: "EXPLAIN QUERY PLAN",
+    GXSqlDialect.POSTGRESQL: "EXPLAIN",
+    GXSqlDialect.REDSHIFT: "EXPLAIN",
+    GXSqlDialect.MYSQL: "EXPLAIN",
+    GXSqlDialect.SNOWFLAKE: "EXPLAIN",
+    GXSqlDialect.DATABRICKS: "EXPLAIN",
+    GXSqlDialect.TRINO: "EXPLAIN",
+    GXSqlDialect.VERTICA: "EXPLAIN",
+}
+
+# Dialects, for which "SqlAlchemyBatchData" materializes Batch selectable into regular table (or view), visible to all
+# connections; elsewhere, temporary tables are only visible within the session (connection) that created them.
+_SESSION_INDEPENDENT_TEMP_TABLE_DIALECTS = (
+    GXSqlDialect.BIGQUERY,
+    GXSqlDialect.DREMIO,
+    GXSqlDialect.TRINO,
+    GXSqlDialect.CLICKHOUSE,
+    GXSqlDialect.AWSATHENA,
+)
+
+
+# Domain kwargs, which only filter the rows of the selectable determined by the remaining Domain kwargs.
+_ROW_FILTERING_DOMAIN_KWARGS = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+)
+
+# Compute Domains consisting only of these kwargs can be folded into the (unfiltered) Domain of their Batch (or table).
+_FOLDABLE_DOMAIN_KWARGS = {
+    "batch_id",
+    "table",
+    *_ROW_FILTERING_DOMAIN_KWARGS,
+}
+
+# Single-argument aggregate functions that ignore NULL inputs:  computing them over "CASE WHEN <condition> THEN <argument>
+# END" (with implicit "ELSE NULL") yields same result as computing them over only those rows that satisfy "<condition>".
+_CONDITIONALLY_FOLDABLE_AGGREGATE_FUNCTION_NAMES = {
+    "avg",
+    "count",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+
+
+def _restrict_aggregate_to_condition(
+    metric_fn: Any, condition: sqlalchemy.ColumnElement
+) -> Optional[sqlalchemy.ColumnElement]:
+    """Rewrites aggregate "metric_fn" into conditional aggregate, only considering rows that satisfy "condition".
+
+    Returns None if "metric_fn" is not single aggregate function, known to ignore NULL inputs, or if it references
+    columns of specific selectable (rather than unbound columns, which resolve against any selectable queried).
+    """
+    if isinstance(metric_fn, sqlalchemy.Label):
+        metric_fn = metric_fn.element
+
+    if not (
+        isinstance(metric_fn, sqlalchemy.functions.FunctionElement)
+        and getattr(metric_fn, "name", "").lower()
+        in _CONDITIONALLY_FOLDABLE_AGGREGATE_FUNCTION_NAMES
+        and len(metric_fn.clauses) == 1
+    ):
+        return None
+
+    element: Any
+    for element in sa.sql.visitors.iterate(metric_fn):
+        # SQL functions are themselves "Selectable" (usable in FROM clause); any other "Selectable" is subquery or table.
+        if (
+            isinstance(element, sqlalchemy.Selectable)
+            and not isinstance(element, sqlalchemy.functions.FunctionElement)
+        ) or (
+            isinstance(element, sqlalchemy.ColumnClause) and element.table is not None
+        ):
+            return None
+
+    argument: Any = list(metric_fn.clauses)[0]
+    is_distinct: bool = (
+        isinstance(argument, sa.sql.elements.UnaryExpression)
+        and argument.operator is sa.sql.operators.distinct_op
+    )
+    if is_distinct:
+        argument = argument.element
+
+    if (
+        isinstance(argument, sqlalchemy.ColumnClause)
+        and argument.is_literal
+        and argument.name == "*"
+    ):
+        argument = sa.literal(1)
+
+    argument = sa.case((condition, argument))
+    if is_distinct:
+        argument = sa.distinct(argument)
+
+    return getattr(sa.func, metric_fn.name)(argument)
+
 
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
@@ -286,7 +401,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
-        concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+        concurrency (ConcurrencyConfig or dict): Concurrency config used to configure the sqlalchemy engine \
+            (e.g., connection pool size) and to execute queries of distinct Domains concurrently; if not provided, \
+            that of the DataContext is used.
+        metric_cache (MetricCache or dict): Durable cache of resolved metrics (or its configuration); only Batches \
+            whose BatchSpec carries a "batch_fingerprint" (e.g., table snapshot ID) are cached.
+        query_instrumentation (QueryInstrumentation, dict, or bool): If set (True, or "QueryInstrumentation" \
+            arguments, e.g., {"explain": True}), wall time, rows, bytes (where reported) and (optionally) EXPLAIN plan \
+            of every query are recorded and attributed to metrics and Expectations they served.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -306,11 +428,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
-        concurrency: Optional[ConcurrencyConfig] = None,
+        concurrency: Optional[Union[dict, ConcurrencyConfig]] = None,
+        metric_cache: Optional[Union[dict, MetricCache]] = None,
+        query_instrumentation: Optional[Union[bool, dict, QueryInstrumentation]] = None,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
         **kwargs,
     ) -> None:
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name, batch_data_dict=batch_data_dict, metric_cache=metric_cache
+        )
+        if isinstance(query_instrumentation, QueryInstrumentation):
+            self._query_instrumentation = query_instrumentation
+        elif isinstance(query_instrumentation, dict):
+            self._query_instrumentation = QueryInstrumentation(**query_instrumentation)
+        elif query_instrumentation:
+            self._query_instrumentation = QueryInstrumentation()
         self._name = name
 
         self._credentials = credentials
@@ -326,11 +458,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # then we get errors like sqlite3.ProgrammingError: Cannot operate on a closed database.
         self._connection = None
 
+        # Tables (or views), into which Batch selectables were materialized; these are dropped in "close()".
+        self._temp_tables: List[sqlalchemy.Table] = []
+
         # Use a single instance of SQLAlchemy engine to avoid creating multiple engine instances
         # for the same SQLAlchemy engine. This allows us to take advantage of SQLAlchemy's
         # built-in caching.
         self._inspector = None
 
+        # Concurrency configured for this datasource takes precedence over that of the DataContext.
+        concurrency_config: Optional[dict] = None
+        if isinstance(concurrency, dict):
+            concurrency_config = concurrency
+            concurrency = ConcurrencyConfig(**concurrency)
+        elif concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        self._concurrency: ConcurrencyConfig = concurrency
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -339,12 +487,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
-            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)  # type: ignore[union-attr]
+            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             self._setup_engine(
                 kwargs=kwargs,
@@ -472,6 +615,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "concurrency": concurrency_config,
+            "metric_cache": metric_cache,
+            "query_instrumentation": None
+            if isinstance(query_instrumentation, QueryInstrumentation)
+            else query_instrumentation,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -481,6 +629,23 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._data_splitter = SqlAlchemyDataSplitter(dialect=self.dialect_name)
         self._data_sampler = SqlAlchemyDataSampler()
 
+    @property
+    @override
+    def supports_concurrent_metric_resolution(self) -> bool:
+        """Dialects that share single persisted connection (e.g., for temporary tables) must execute serially; so must
+        Batches materialized into session-scoped temporary tables, which other pooled connections cannot see.
+        """
+        return (
+            self.dialect_name not in _PERSISTED_CONNECTION_DIALECTS
+            and not isinstance(
+                getattr(self.engine, "pool", None), sqlalchemy.StaticPool
+            )
+            and (
+                not self._temp_tables
+                or self.dialect_name in _SESSION_INDEPENDENT_TEMP_TABLE_DIALECTS
+            )
+        )
+
     def _setup_engine(
         self,
         kwargs: MutableMapping[str, Any],
@@ -1051,9 +1216,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
 
-        res: List[sqlalchemy.Row]
-
-        # We need a different query for each Domain (where clause).
+        # We need a different query for each Domain (where clause), except that Domains differing only in row filtering
+        # are folded into one query of their common unfiltered Domain (see "_fold_bundled_metric_into_base_domain()").
         queries: Dict[Tuple[str, str, str], dict] = {}
 
         query: dict
@@ -1072,6 +1236,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             if not isinstance(compute_domain_kwargs, IDDict):
                 compute_domain_kwargs = IDDict(compute_domain_kwargs)
 
+            (
+                metric_fn,
+                compute_domain_kwargs,
+            ) = self._fold_bundled_metric_into_base_domain(
+                metric_fn=metric_fn, compute_domain_kwargs=compute_domain_kwargs
+            )
+
             domain_id = compute_domain_kwargs.to_id()
             if domain_id not in queries:
                 queries[domain_id] = {
@@ -1095,54 +1266,37 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        sa_query_objects: List[sqlalchemy.Select] = []
         for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: sqlalchemy.Selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs
-            )
-
             assert len(query["select"]) == len(query["metric_ids"])
+            sa_query_objects.append(
+                self._build_bundled_query(
+                    select=query["select"], domain_kwargs=query["domain_kwargs"]
+                )
+            )
 
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if sqlalchemy.TextClause and isinstance(
-                    selectable, sqlalchemy.TextClause
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (
-                    sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)
-                ) or (
-                    sqlalchemy.TextualSelect
-                    and isinstance(selectable, sqlalchemy.TextualSelect)
-                ):
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable.subquery()
-                    )
-                else:
-                    sa_query_object = sa.select(*query["select"]).select_from(
-                        selectable
-                    )
-
-                logger.debug(f"Attempting query {sa_query_object!s}")
-                res = self.execute_query(sa_query_object).fetchall()
-
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
+        # Queries of distinct Domains are independent; unless connection must be shared, they run on separate pooled
+        # connections concurrently (bounded by "ConcurrencyConfig"), with results merged in the order of the bundle.
+        with AsyncExecutor(
+            concurrency_config=self._concurrency
+            if self.supports_concurrent_metric_resolution
+            else None,
+            max_workers=len(sa_query_objects),
+        ) as async_executor:
+            async_results: List[AsyncResult[List[sqlalchemy.Row]]] = [
+                async_executor.submit(
+                    self._execute_bundled_query,
+                    sa_query_object=sa_query_object,
+                    domain_kwargs=query["domain_kwargs"],
+                    metric_ids=query["metric_ids"],
                 )
-            except sqlalchemy.OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+                for sa_query_object, query in zip(sa_query_objects, queries.values())
+            ]
+            results: List[List[sqlalchemy.Row]] = [
+                async_result.result() for async_result in async_results
+            ]
 
+        for res, query in zip(results, queries.values()):
             assert (
                 len(res) == 1
             ), "all bundle-computed metrics must be single-value statistics"
@@ -1161,6 +1315,128 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _build_bundled_query(
+        self, select: List[Any], domain_kwargs: dict
+    ) -> sqlalchemy.Select:
+        """Builds single query computing all bundled metric functions (in "select") on records of given Domain."""
+        selectable: sqlalchemy.Selectable = self.get_domain_records(
+            domain_kwargs=domain_kwargs
+        )
+
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if sqlalchemy.TextClause and isinstance(selectable, sqlalchemy.TextClause):
+            return sa.select(*select).select_from(selectable.columns().subquery())
+
+        if (sqlalchemy.Select and isinstance(selectable, sqlalchemy.Select)) or (
+            sqlalchemy.TextualSelect
+            and isinstance(selectable, sqlalchemy.TextualSelect)
+        ):
+            return sa.select(*select).select_from(selectable.subquery())
+
+        return sa.select(*select).select_from(selectable)
+
+    def _execute_bundled_query(
+        self,
+        sa_query_object: sqlalchemy.Select,
+        domain_kwargs: dict,
+        metric_ids: List[Tuple[str, str, str]],
+    ) -> List[sqlalchemy.Row]:
+        """Executes query built by "_build_bundled_query()"; this method may be called from worker threads."""
+        res: List[sqlalchemy.Row]
+        try:
+            logger.debug(f"Attempting query {sa_query_object!s}")
+            with self._attribute_queries_to(metric_ids=metric_ids):
+                res = self.execute_query(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
+{IDDict(domain_kwargs).to_id()}"""
+            )
+        except sqlalchemy.OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += (
+                f'{type(oe).__name__}: "{oe!s}".  Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
+    def _fold_bundled_metric_into_base_domain(
+        self,
+        metric_fn: Any,
+        compute_domain_kwargs: IDDict,
+    ) -> Tuple[Any, IDDict]:
+        """Moves row filtering of compute Domain into aggregate metric function, so that metric is computed on base Domain.
+
+        Metrics whose compute Domains differ only in "row_condition" and "filter_conditions" (e.g., aggregates of
+        different columns, each excluding NULL values of its own column) would otherwise require one scan per Domain.
+        Rewritten as conditional aggregates ("SUM(CASE WHEN <condition> THEN ... END)"), they share a single query of
+        the unfiltered Batch.  Metric function and compute Domain are returned unchanged if the rewrite is not known
+        to be equivalent.
+
+        Args:
+            metric_fn: aggregate metric function (SQLAlchemy expression) to be computed on "compute_domain_kwargs"
+            compute_domain_kwargs: compute Domain kwargs of metric
+
+        Returns:
+            Tuple of metric function and compute Domain kwargs to be used for query
+        """
+        if not set(compute_domain_kwargs.keys()) <= _FOLDABLE_DOMAIN_KWARGS:
+            return metric_fn, compute_domain_kwargs
+
+        conditions: List[sqlalchemy.ColumnElement] = []
+
+        if compute_domain_kwargs.get("row_condition") is not None:
+            if (
+                compute_domain_kwargs.get("condition_parser")
+                != "great_expectations__experimental__"
+            ):
+                return metric_fn, compute_domain_kwargs
+
+            conditions.append(
+                parse_condition_to_sqlalchemy(compute_domain_kwargs["row_condition"])
+            )
+
+        filter_conditions: List[RowCondition] = (
+            compute_domain_kwargs.get("filter_conditions") or []
+        )
+        if len(filter_conditions) > 1 or any(
+            filter_condition.condition_type != RowConditionParserType.GE
+            for filter_condition in filter_conditions
+        ):
+            return metric_fn, compute_domain_kwargs
+
+        conditions.extend(
+            parse_condition_to_sqlalchemy(filter_condition.condition)
+            for filter_condition in filter_conditions
+        )
+
+        base_domain_kwargs = IDDict(
+            {
+                key: value
+                for key, value in compute_domain_kwargs.items()
+                if key not in _ROW_FILTERING_DOMAIN_KWARGS
+            }
+        )
+        if not conditions:
+            return metric_fn, base_domain_kwargs
+
+        folded_metric_fn: Optional[
+            sqlalchemy.ColumnElement
+        ] = _restrict_aggregate_to_condition(
+            metric_fn=metric_fn, condition=sa.and_(*conditions)
+        )
+        if folded_metric_fn is None:
+            return metric_fn, compute_domain_kwargs
+
+        return folded_metric_fn, base_domain_kwargs
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1179,6 +1455,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        self._drop_temp_tables()
+
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1186,6 +1464,89 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             self.engine.dispose()
 
+    def _record_query(
+        self,
+        query: sqlalchemy.Selectable,
+        result: sqlalchemy.CursorResult | sqlalchemy.LegacyCursorResult,
+        connection: sqlalchemy.Connection,
+        wall_time_seconds: float,
+    ) -> None:
+        """Records cost of executed query (and its "EXPLAIN" plan, if requested) with "QueryInstrumentation"."""
+        query_instrumentation = cast(QueryInstrumentation, self._query_instrumentation)
+
+        explain_plan: Optional[List[str]] = None
+        if query_instrumentation.explain:
+            explain_plan = self._explain_query(query=query, connection=connection)
+
+        # DBAPI drivers report -1, if number of rows is not (yet) known.
+        row_count: Optional[int] = result.rowcount if result.rowcount >= 0 else None
+
+        # Of supported drivers, only BigQuery reports amount of data processed by query.
+        query_job = getattr(getattr(result, "cursor", None), "_query_job", None)
+        bytes_processed: Optional[int] = getattr(
+            query_job, "total_bytes_processed", None
+        )
+
+        query_instrumentation.record(
+            query=str(query.compile(dialect=self.engine.dialect))
+            if hasattr(query, "compile")
+            else str(query),
+            wall_time_seconds=wall_time_seconds,
+            row_count=row_count,
+            bytes_processed=bytes_processed,
+            explain_plan=explain_plan,
+        )
+
+    def _explain_query(
+        self, query: sqlalchemy.Selectable, connection: sqlalchemy.Connection
+    ) -> Optional[List[str]]:
+        """Returns rows of "EXPLAIN" output for SELECT query (None, if dialect does not support it or EXPLAIN fails)."""
+        explain_prefix: Optional[str] = _EXPLAIN_PREFIX_BY_DIALECT.get(
+            self.dialect_name
+        )
+        if explain_prefix is None or not getattr(query, "is_select", False):
+            return None
+
+        try:
+            compiled_query = query.compile(
+                dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}
+            )
+            rows = connection.execute(
+                sa.text(f"{explain_prefix} {compiled_query!s}")
+            ).fetchall()
+        except Exception as e:
+            # EXPLAIN is diagnostic only; it must never fail validation.
+            logger.debug(f"Unable to EXPLAIN query: {e!s}")
+            return None
+
+        return [" ".join(str(value) for value in row) for row in rows]
+
+    def _register_temp_table(self, temp_table: sqlalchemy.Table) -> None:
+        """Records table (or view), into which "SqlAlchemyBatchData" has materialized Batch selectable, for cleanup."""
+        self._temp_tables.append(temp_table)
+
+    def _drop_temp_tables(self) -> None:
+        """Drops tables (or views) materialized for Batches of this ExecutionEngine.
+
+        Failures are logged (rather than raised), since session-scoped temporary tables also vanish with their session.
+        """
+        temp_table: sqlalchemy.Table
+        while self._temp_tables:
+            temp_table = self._temp_tables.pop()
+            if self.dialect_name == GXSqlDialect.DATABRICKS:
+                drop_statement = sa.text(f"DROP VIEW IF EXISTS `{temp_table.name}`")
+            elif self.dialect_name == GXSqlDialect.DREMIO:
+                drop_statement = sa.text(f"DROP VDS {temp_table.name}")
+            else:
+                drop_statement = sa.schema.DropTable(temp_table, if_exists=True)
+
+            try:
+                self.execute_query_in_transaction(drop_statement)
+            except sqlalchemy.DatabaseError as e:
+                logger.warning(
+                    f'Unable to drop temporary table "{temp_table.name}": {e!s}'
+                )
+
     def _get_splitter_method(self, splitter_method_name: str) -> Callable:
         """Get the appropriate splitter method from the method name.
 
@@ -1444,8 +1805,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         Returns:
             CursorResult for sqlalchemy 2.0+ or LegacyCursorResult for earlier versions.
         """
+        start_time: float = time.perf_counter()
         with self.get_connection() as connection:
             result = connection.execute(query)
+            if self._query_instrumentation is not None:
+                self._record_query(
+                    query=query,
+                    result=result,
+                    connection=connection,
+                    wall_time_seconds=time.perf_counter() - start_time,
+                )
 
         return result
 
@@ -7,6 +7,10 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.evaluation_parameters import (
     EvaluationParameterDict,  # noqa: TCH001
 )
+from great_expectations.core.sketches import (
+    get_approximation_error,
+    get_quantile_error_bounds,
+)
 from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
@@ -51,6 +55,9 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             If True, the column median must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the column median must be strictly smaller than max_value, default=False
+        approximate (boolean or float): \
+            If set, the median is estimated (on a sample, or with native approximate function of the backend) \
+            rather than computed exactly; a float sets rank error (True means 0.01), default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -84,6 +91,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: Union[bool, float] = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -102,6 +110,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
     )
 
     args_keys = (
@@ -227,9 +236,21 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
+        validation_result = self._validate_metric_value_between(
             metric_name="column.median",
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+
+        approximation_error: Optional[float] = get_approximation_error(
+            approximate=self.configuration.kwargs.get("approximate")
+        )
+        if approximation_error is not None:
+            validation_result["result"]["details"] = {
+                "approximation": get_quantile_error_bounds(
+                    rank_error=approximation_error
+                )
+            }
+
+        return validation_result
@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, Dict, Optional, Union
 from great_expectations.core.evaluation_parameters import (
     EvaluationParameterDict,  # noqa: TCH001
 )
+from great_expectations.core.sketches import (
+    get_approximation_error,
+    get_distinct_count_error_bounds,
+)
 from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
@@ -57,6 +61,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximate (boolean or float): \
+            If set, the number of unique values is estimated (with HyperLogLog, or native approximate function of \
+            the backend) rather than counted exactly; a float sets relative standard error (True means 0.01), default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -89,6 +96,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: Union[bool, float] = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -107,6 +115,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
     )
 
     args_keys = (
@@ -279,9 +288,21 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
+        validation_result = self._validate_metric_value_between(
             metric_name="column.unique_proportion",
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+
+        approximation_error: Optional[float] = get_approximation_error(
+            approximate=self.configuration.kwargs.get("approximate")
+        )
+        if approximation_error is not None:
+            validation_result["result"]["details"] = {
+                "approximation": get_distinct_count_error_bounds(
+                    observed_value=None, relative_error=approximation_error
+                )
+            }
+
+        return validation_result
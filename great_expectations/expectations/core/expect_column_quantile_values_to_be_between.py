@@ -7,6 +7,10 @@ import numpy as np
 from typing_extensions import TypedDict
 
 from great_expectations.compatibility import pydantic
+from great_expectations.core.sketches import (
+    get_approximation_error,
+    get_quantile_error_bounds,
+)
 from great_expectations.exceptions import InvalidExpectationConfigurationError
 from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
@@ -102,6 +106,9 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             and the 'value_ranges' list must be equal.
         allow_relative_error (boolean or string): \
             Whether to allow relative error in quantile communications on backends that support or require it.
+        approximate (boolean or float): \
+            If set, quantiles are estimated (on a sample, or with native approximate function of the backend) \
+            rather than computed exactly; a float sets rank error (True means 0.01), default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -133,6 +140,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
 
     quantile_ranges: QuantileRange
     allow_relative_error: Union[bool, str] = False
+    approximate: Union[bool, float] = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -148,6 +156,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "quantile_ranges",
         "allow_relative_error",
+        "approximate",
     )
 
     args_keys = (
@@ -624,10 +633,19 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        approximation_error: Optional[float] = get_approximation_error(
+            approximate=self.configuration.kwargs.get("approximate")
+        )
+        if approximation_error is not None:
+            details["approximation"] = get_quantile_error_bounds(
+                rank_error=approximation_error
+            )
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
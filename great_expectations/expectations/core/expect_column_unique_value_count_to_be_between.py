@@ -6,6 +6,10 @@ from typing import TYPE_CHECKING, Dict, Optional, Union
 from great_expectations.core.evaluation_parameters import (
     EvaluationParameterDict,  # noqa: TCH001
 )
+from great_expectations.core.sketches import (
+    get_approximation_error,
+    get_distinct_count_error_bounds,
+)
 from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
@@ -51,6 +55,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
             The minimum number of unique values allowed.
         max_value (int or None): \
             The maximum number of unique values allowed.
+        approximate (boolean or float): \
+            If set, the number of unique values is estimated (with HyperLogLog, or native approximate function of \
+            the backend) rather than counted exactly; a float sets relative standard error (True means 0.01), default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -83,6 +90,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: Union[bool, float] = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -99,6 +107,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximate",
     )
 
     args_keys = (
@@ -278,9 +287,22 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
+        validation_result = self._validate_metric_value_between(
             metric_name="column.distinct_values.count",
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+
+        approximation_error: Optional[float] = get_approximation_error(
+            approximate=self.configuration.kwargs.get("approximate")
+        )
+        if approximation_error is not None:
+            validation_result["result"]["details"] = {
+                "approximation": get_distinct_count_error_bounds(
+                    observed_value=validation_result["result"]["observed_value"],
+                    relative_error=approximation_error,
+                )
+            }
+
+        return validation_result
@@ -36,6 +36,10 @@ from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.pydantic import Field, ModelMetaclass
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+    use_columnar_unexpected_results,
+)
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
@@ -2600,6 +2604,14 @@ def _format_map_output(  # noqa: C901, PLR0912, PLR0913, PLR0915
     if result_format["result_format"] == ResultFormat.SUMMARY:
         return return_obj
 
+    if use_columnar_unexpected_results(result_format=result_format):
+        if unexpected_list is not None and not exclude_unexpected_values:
+            unexpected_list = ColumnarUnexpectedResults.from_rows(unexpected_list)
+        if unexpected_index_list is not None:
+            unexpected_index_list = ColumnarUnexpectedResults.from_rows(
+                unexpected_index_list
+            )
+
     if unexpected_list is not None and not exclude_unexpected_values:
         return_obj["result"].update({"unexpected_list": unexpected_list})
     if unexpected_index_list is not None:
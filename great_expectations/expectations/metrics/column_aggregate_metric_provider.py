@@ -2,14 +2,25 @@ from __future__ import annotations
 
 import logging
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
 
 from great_expectations._docs_decorators import public_api
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
+from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
-from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
+    ExecutionEngine,
+    PandasExecutionEngine,
+    PolarsExecutionEngine,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnAggregate,
+)
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     SparkDFExecutionEngine,
 )
@@ -32,7 +43,9 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from great_expectations.compatibility import sqlalchemy
+    import pandas as pd
+
+    from great_expectations.compatibility import pyspark, sqlalchemy
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -43,14 +56,19 @@ def column_aggregate_value(
     engine: Type[ExecutionEngine],
     **kwargs,
 ):
-    """Provides Pandas support for authoring a metric_fn with a simplified signature.
+    """Provides Pandas (or Arrow, or Polars) support for authoring a metric_fn with a simplified signature.
 
     A column_aggregate_value must provide an aggregate function; it will be executed by Pandas
-    to provide a value for validation.
+    (or by "pyarrow.compute", for ArrowExecutionEngine, or on a collected Polars Series, for PolarsExecutionEngine) to
+    provide a value for validation.
 
     A metric function that is decorated as a column_aggregate_partial will be called with a specified Pandas column
     and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    PandasExecutionEngine bundles these metrics, so that records of each compute domain are obtained only once.  If
+    the `reduction` argument names an equivalent pandas reduction (e.g., "max"), that reduction is computed for all
+    numeric columns of the domain in one vectorized call instead.
+
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         **kwargs: Arguments passed to specified function
@@ -99,15 +117,156 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            def build_column_aggregate(  # noqa: PLR0913
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ) -> Tuple[PandasColumnAggregate, dict, dict]:
+                """Defers computation of "inner_func" to "PandasExecutionEngine.resolve_metric_bundle()"."""
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                # noinspection PyProtectedMember
+                split_domain_kwargs = execution_engine._split_domain_kwargs(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                def column_aggregate_fn(column: pd.Series) -> Any:
+                    return metric_fn(
+                        cls,
+                        column=column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
+                return (
+                    PandasColumnAggregate(
+                        fn=column_aggregate_fn,
+                        reduction=kwargs.get("reduction"),
+                        filter_column_isnull=filter_column_isnull,
+                    ),
+                    split_domain_kwargs.compute,
+                    split_domain_kwargs.accessor,
+                )
+
+            inner_func.build_pandas_column_aggregate = build_column_aggregate  # type: ignore[attr-defined]
+            return inner_func
+
+        return wrapper
+    elif issubclass(engine, ArrowExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_value(engine=ArrowExecutionEngine)
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: ArrowExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                table, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                column = table[accessor_domain_kwargs["column"]]
+
+                if filter_column_isnull:
+                    column = pc.drop_null(column)
+
+                return metric_fn(
+                    cls,
+                    column=column,
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+
+            return inner_func
+
+        return wrapper
+    elif issubclass(engine, PolarsExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_value(engine=PolarsExecutionEngine)
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: PolarsExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                data, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                column_name: str = accessor_domain_kwargs["column"]
+                data = data.select(pl.col(column_name))
+                if filter_column_isnull:
+                    data = data.drop_nulls()
+
+                return metric_fn(
+                    cls,
+                    column=data.collect().to_series(),
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+
             return inner_func
 
         return wrapper
     else:
         raise ValueError(
-            "column_aggregate_value decorator only supports PandasExecutionEngine"
+            "column_aggregate_value decorator only supports PandasExecutionEngine, ArrowExecutionEngine, and PolarsExecutionEngine"
         )
 
 
+def _split_spark_column_domain_row_filtering_condition(
+    execution_engine: SparkDFExecutionEngine, domain_kwargs: dict
+) -> Tuple[Optional[pyspark.Column], dict]:
+    """Splits row filtering of column Domain into condition and kwargs of column Domain on unfiltered Batch."""
+    condition: Optional[pyspark.Column]
+    base_domain_kwargs: dict
+    condition, base_domain_kwargs = execution_engine.split_row_filtering_condition(
+        domain_kwargs={
+            key: value for key, value in domain_kwargs.items() if key != "column"
+        }
+    )
+    if condition is None:
+        return None, domain_kwargs
+
+    return condition, dict(base_domain_kwargs, column=domain_kwargs["column"])
+
+
 @public_api
 def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
     """Provides engine-specific support for authoring a metric_fn with a simplified signature.
@@ -118,6 +277,10 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
     A metric function that is decorated as a column_aggregate_partial will be called with the engine-specific column
     type and any value_kwargs associated with the Metric for which the provider function is being declared.
 
+    For SparkDFExecutionEngine, passing `aggregate_ignores_nulls=True` declares that the aggregate function ignores NULL
+    values of its column argument; row filtering of the Domain (e.g., "row_condition") is then applied to the column
+    (as "F.when(<condition>, <column>)"), so that aggregates of all such Domains of a Batch are computed in one job.
+
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function type
@@ -229,6 +392,16 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     # We do not copy here because if compute domain is different, it will be copied by get_compute_domain
                     compute_domain_kwargs = metric_domain_kwargs
 
+                condition: Optional[pyspark.Column] = None
+                if kwargs.get("aggregate_ignores_nulls", False):
+                    (
+                        condition,
+                        compute_domain_kwargs,
+                    ) = _split_spark_column_domain_row_filtering_condition(
+                        execution_engine=execution_engine,
+                        domain_kwargs=compute_domain_kwargs,
+                    )
+
                 (
                     data,
                     compute_domain_kwargs,
@@ -242,6 +415,9 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                 ] = accessor_domain_kwargs["column"]
 
                 column = data[column_name]
+                if condition is not None:
+                    column = F.when(condition, column)
+
                 metric_aggregate = metric_fn(
                     cls,
                     column=column,
@@ -256,6 +432,64 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
 
         return wrapper
 
+    elif issubclass(engine, PolarsExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PolarsExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: PolarsExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                if filter_column_isnull:
+                    compute_domain_kwargs = execution_engine.add_column_row_condition(
+                        metric_domain_kwargs
+                    )
+                else:
+                    # We do not copy here because if compute domain is different, it will be copied by _split_domain_kwargs
+                    compute_domain_kwargs = metric_domain_kwargs
+
+                # Aggregate is a Polars expression, which "PolarsExecutionEngine.resolve_metric_bundle()" combines
+                # with all other aggregates of its compute Domain into one lazy "select()".
+                split_domain_kwargs = execution_engine._split_domain_kwargs(
+                    domain_kwargs=compute_domain_kwargs, domain_type=domain_type
+                )
+
+                column_name: str = split_domain_kwargs.accessor["column"]
+                metric_aggregate = metric_fn(
+                    cls,
+                    column=pl.col(column_name),
+                    **metric_value_kwargs,
+                    _column_name=column_name,
+                    _metrics=metrics,
+                )
+                return (
+                    metric_aggregate,
+                    split_domain_kwargs.compute,
+                    split_domain_kwargs.accessor,
+                )
+
+            return inner_func
+
+        return wrapper
+
     else:
         raise ValueError("Unsupported engine for column_aggregate_partial")
 
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import (
     functions as F,
 )
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    APPROXIMATE_COUNT_DISTINCT_SQL_FUNCTIONS,
+    get_approximation_error,
+    hyperloglog_distinct_count,
+    hyperloglog_precision,
+)
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -26,6 +35,8 @@ if TYPE_CHECKING:
     import pandas as pd
 
     from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.compatibility.polars import polars as pl
+    from great_expectations.compatibility.pyarrow import pyarrow as pa
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -38,6 +49,14 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
     def _pandas(cls, column: pd.Series, **kwargs) -> Set[Any]:
         return set(column.unique())
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _arrow(cls, column: pa.ChunkedArray, **kwargs) -> Set[Any]:
+        return set(pc.unique(column).to_pylist())
+
+    @column_aggregate_value(engine=PolarsExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _polars(cls, column: pl.Series, **kwargs) -> Set[Any]:
+        return set(column.unique().to_list())
+
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
         cls,
@@ -113,16 +132,47 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
 
 
 class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Number of distinct non-null values of column.
+
+    If "approximate" metric value kwarg is set (True or relative standard error, as float), number of distinct values
+    is estimated with HyperLogLog (using native approximate functions of Spark and SQL backends, where available).
+    """
+
     metric_name = "column.distinct_values.count"
+    value_keys = ("approximate",)
+    default_kwarg_values = {"approximate": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)  # type: ignore[misc] # untyped-decorator
-    def _pandas(cls, column: pd.Series, **kwargs) -> int:
+    def _pandas(
+        cls, column: pd.Series, approximate: Union[bool, float] = False, **kwargs
+    ) -> int:
+        relative_error: Optional[float] = get_approximation_error(approximate)
+        if relative_error is not None:
+            return hyperloglog_distinct_count(
+                column=column, precision=hyperloglog_precision(relative_error)
+            )
+
         return column.nunique()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _arrow(cls, column: pa.ChunkedArray, **kwargs) -> int:
+        return pc.count_distinct(column, mode="only_valid").as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _polars(
+        cls, column: pl.Expr, approximate: Union[bool, float] = False, **kwargs
+    ) -> pl.Expr:
+        if get_approximation_error(approximate) is not None:
+            return column.drop_nulls().approx_n_unique()
+
+        return column.drop_nulls().n_unique()
+
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)  # type: ignore[misc] # untyped-decorator
     def _sqlalchemy(
         cls,
         column: sqlalchemy.ColumnClause,
+        approximate: Union[bool, float] = False,
+        _dialect=None,
         **kwargs,
     ) -> sqlalchemy.Selectable:
         """
@@ -130,12 +180,20 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         This was causing performance issues due to the complex query used in column.value_counts and subsequent
         in-memory operations.
         """
+        if get_approximation_error(approximate) is not None and _dialect is not None:
+            approximate_count_distinct: Optional[
+                str
+            ] = APPROXIMATE_COUNT_DISTINCT_SQL_FUNCTIONS.get(_dialect.name)
+            if approximate_count_distinct is not None:
+                return getattr(sa.func, approximate_count_distinct)(column)
+
         return sa.func.count(sa.distinct(column))
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    @column_aggregate_partial(engine=SparkDFExecutionEngine, aggregate_ignores_nulls=True)  # type: ignore[misc] # untyped-decorator
     def _spark(
         cls,
         column: pyspark.Column,
+        approximate: Union[bool, float] = False,
         **kwargs,
     ) -> pyspark.Column:
         """
@@ -143,6 +201,10 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         This was causing performance issues due to the complex query used in column.value_counts and subsequent
         in-memory operations.
         """
+        relative_error: Optional[float] = get_approximation_error(approximate)
+        if relative_error is not None:
+            return F.approx_count_distinct(column, rsd=relative_error)
+
         return F.countDistinct(column)
 
 
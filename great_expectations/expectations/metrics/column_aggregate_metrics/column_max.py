@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -18,14 +21,24 @@ class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
     value_keys = ()
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, reduction="max")
     def _pandas(cls, column, **kwargs):
         return column.max()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        return pc.max(column).as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        return column.max()
+
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
         return sa.func.max(column)
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    @column_aggregate_partial(
+        engine=SparkDFExecutionEngine, aggregate_ignores_nulls=True
+    )
     def _spark(cls, column, **kwargs):
         return F.max(column)
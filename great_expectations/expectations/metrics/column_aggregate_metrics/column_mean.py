@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.pyspark import types
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -21,19 +24,31 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, reduction="mean")
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
         return column.mean()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        """Arrow Mean Implementation"""
+        return pc.mean(column).as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        """Polars Mean Implementation"""
+        return column.mean()
+
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
         """SqlAlchemy Mean Implementation"""
         # column * 1.0 needed for correct calculation of avg in MSSQL
         return sa.func.avg(1.0 * column)
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    @column_aggregate_partial(
+        engine=SparkDFExecutionEngine, aggregate_ignores_nulls=True
+    )
     def _spark(cls, column, _table, _column_name, **kwargs):
         """Spark Mean Implementation"""
         column_data_type = _table.schema[_column_name].dataType
@@ -4,17 +4,26 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import numpy as np
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    APPROXIMATE_PERCENTILE_SQL_FUNCTIONS,
+    get_approximation_error,
+    sampled_quantiles,
+)
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
+    column_aggregate_partial,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
@@ -32,14 +41,35 @@ class ColumnMedian(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.median"
+    value_keys = ("approximate",)
+    default_kwarg_values = {"approximate": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    def _pandas(cls, column, approximate=False, **kwargs):
         """Pandas Median Implementation"""
+        rank_error: Optional[float] = get_approximation_error(approximate)
+        if rank_error is not None:
+            return sampled_quantiles(
+                column=column,
+                quantiles=[0.5],
+                rank_error=rank_error,
+                interpolation="linear",
+            )[0]
+
         column_null_elements_cond: pd.Series = column.isnull()
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
         return column_nonnull_elements.median()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        """Arrow Median Implementation"""
+        return pc.quantile(column, q=0.5, interpolation="linear")[0].as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        """Polars Median Implementation"""
+        return column.median()
+
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(  # noqa: PLR0913
         cls,
@@ -63,6 +93,17 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         if not nonnull_count:
             return None
 
+        if get_approximation_error(metric_value_kwargs.get("approximate")) is not None:
+            approximate_percentile: Optional[
+                str
+            ] = APPROXIMATE_PERCENTILE_SQL_FUNCTIONS.get(execution_engine.dialect_name)
+            if approximate_percentile is not None:
+                return execution_engine.execute_query(
+                    sa.select(
+                        getattr(sa.func, approximate_percentile)(column, 0.5)
+                    ).select_from(selectable)
+                ).scalar()
+
         element_values = execution_engine.execute_query(
             sa.select(column)
             .order_by(column)
@@ -115,12 +156,18 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         # to the 50th percentile such that we always get exactly the middle two values
         # (i.e. 0 < epsilon < 1 / (2 * values))
 
-        # Note that this can be an expensive computation; we are not exposing
-        # spark's ability to estimate.
+        # Note that this can be an expensive computation; spark's ability to estimate
+        # is exposed through the "approximate" metric value kwarg.
         # We add two to 2 * n_values to maintain a legitimate quantile
         # in the degenerate case when n_values = 0
 
         """Spark Median Implementation"""
+        rank_error: Optional[float] = get_approximation_error(
+            metric_value_kwargs.get("approximate")
+        )
+        if rank_error is not None:
+            return df.approxQuantile(column, [0.5], rank_error)[0]
+
         table_row_count = metrics["table.row_count"]
         result = df.approxQuantile(
             column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0
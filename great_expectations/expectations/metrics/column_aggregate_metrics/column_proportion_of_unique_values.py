@@ -40,7 +40,14 @@ def unique_proportion(_metrics):
 
 
 class ColumnUniqueProportion(ColumnAggregateMetricProvider):
+    """Proportion of unique non-null values out of all non-null values of column.
+
+    If "approximate" metric value kwarg is set, it is passed on to "column.distinct_values.count" dependency.
+    """
+
     metric_name = "column.unique_proportion"
+    value_keys = ("approximate",)
+    default_kwarg_values = {"approximate": False}
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(*args, metrics, **kwargs):
@@ -70,9 +77,11 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
+        approximate = metric.metric_value_kwargs.get("approximate")
         dependencies["column.distinct_values.count"] = MetricConfiguration(
             metric_name="column.distinct_values.count",
             metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={"approximate": approximate} if approximate else None,
         )
 
         dependencies[
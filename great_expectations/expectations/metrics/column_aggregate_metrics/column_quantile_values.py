@@ -5,7 +5,7 @@ import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 
@@ -14,6 +14,10 @@ from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.sketches import (
+    get_approximation_error,
+    sampled_quantiles,
+)
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -33,10 +37,13 @@ logger = logging.getLogger(__name__)
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
-    value_keys = ("quantiles", "allow_relative_error")
+    value_keys = ("quantiles", "allow_relative_error", "approximate")
+    default_kwarg_values = {"approximate": False}
 
     @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
+    def _pandas(
+        cls, column, quantiles, allow_relative_error, approximate=False, **kwargs
+    ):
         """Quantile Function"""
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
@@ -49,6 +56,15 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 f"parameter of .quantile() (one of {interpolation_options})"
             )
 
+        rank_error: Optional[float] = get_approximation_error(approximate)
+        if rank_error is not None:
+            return sampled_quantiles(
+                column=column,
+                quantiles=quantiles,
+                rank_error=rank_error,
+                interpolation=allow_relative_error,
+            )
+
         return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -72,6 +88,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         dialect_name = execution_engine.dialect_name
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
+        if get_approximation_error(metric_value_kwargs.get("approximate")) is not None:
+            # Approximate percentile functions are used, where dialect provides them.
+            allow_relative_error = True
+
         table_row_count = metrics.get("table.row_count")
         if dialect_name == GXSqlDialect.MSSQL:
             return _get_column_quantiles_mssql(
@@ -169,7 +189,9 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
 
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         if not allow_relative_error:
-            allow_relative_error = 0.0
+            allow_relative_error = (
+                get_approximation_error(metric_value_kwargs.get("approximate")) or 0.0
+            )
 
         if (
             not isinstance(allow_relative_error, float)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Optional
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
@@ -10,8 +11,10 @@ from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -37,12 +40,22 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, reduction="std")
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
         return column.std()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        """Arrow Standard Deviation implementation"""
+        return pc.stddev(column, ddof=1).as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        """Polars Standard Deviation implementation"""
+        return column.std(ddof=1)
+
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, _dialect, _metrics, **kwargs):
         """SqlAlchemy Standard Deviation implementation"""
@@ -62,7 +75,9 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
         return standard_deviation
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    @column_aggregate_partial(
+        engine=SparkDFExecutionEngine, aggregate_ignores_nulls=True
+    )
     def _spark(cls, column, **kwargs):
         """Spark Standard Deviation implementation"""
         return F.stddev_samp(column)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -18,15 +21,25 @@ from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, reduction="sum")
     def _pandas(cls, column, **kwargs):
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
         return column.sum()
 
+    @column_aggregate_value(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        return pc.sum(column, min_count=0).as_py()
+
+    @column_aggregate_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        return column.sum()
+
     @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
         return sa.func.sum(column)
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine)
+    @column_aggregate_partial(
+        engine=SparkDFExecutionEngine, aggregate_ignores_nulls=True
+    )
     def _spark(cls, column, **kwargs):
         return F.sum(column)
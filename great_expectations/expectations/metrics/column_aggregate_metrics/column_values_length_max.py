@@ -32,6 +32,6 @@ class ColumnValuesLengthMax(ColumnAggregateMetricProvider):
     def _sqlalchemy(cls, column, **kwargs: dict):
         return sa.func.max(sa.func.length(column))
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine, filter_column_isnull=True)  # type: ignore[misc] # untyped-decorator
+    @column_aggregate_partial(engine=SparkDFExecutionEngine, filter_column_isnull=True, aggregate_ignores_nulls=True)  # type: ignore[misc] # untyped-decorator
     def _spark(cls, column, **kwargs: dict):
         return F.max(F.length(column))
@@ -32,6 +32,6 @@ class ColumnValuesLengthMin(ColumnAggregateMetricProvider):
     def _sqlalchemy(cls, column, **kwargs: dict):
         return sa.func.min(sa.func.length(column))
 
-    @column_aggregate_partial(engine=SparkDFExecutionEngine, filter_column_isnull=True)  # type: ignore[misc] # untyped-decorator
+    @column_aggregate_partial(engine=SparkDFExecutionEngine, filter_column_isnull=True, aggregate_ignores_nulls=True)  # type: ignore[misc] # untyped-decorator
     def _spark(cls, column, **kwargs: dict):
         return F.min(F.length(column))
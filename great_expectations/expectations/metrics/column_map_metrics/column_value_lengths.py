@@ -32,7 +32,7 @@ class ColumnValuesValueLengthEquals(ColumnMapMetricProvider):
     condition_metric_name = "column_values.value_length.equals"
     condition_value_keys = ("value",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, value, _metrics, **kwargs):
         column_lengths, _, _ = _metrics.get(
             f"column_values.value_length.{MetricPartialFunctionTypeSuffixes.MAP.value}"
@@ -106,7 +106,7 @@ class ColumnValuesValueLength(ColumnMapMetricProvider):
     def _spark_function(cls, column, **kwargs):
         return F.length(column)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(  # noqa: PLR0913
         cls,
         column,
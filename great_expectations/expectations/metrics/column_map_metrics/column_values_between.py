@@ -6,10 +6,15 @@ from typing import Optional, Union
 import pandas as pd
 from dateutil.parser import parse
 
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
+from great_expectations.compatibility.pyarrow import pyarrow as pa
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -28,7 +33,7 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
         "strict_max",
     )
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(  # noqa: C901, PLR0913
         cls,
         column,
@@ -157,6 +162,74 @@ class ColumnValuesBetween(ColumnMapMetricProvider):
         else:
             return (min_value <= column) & (column <= max_value)
 
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(  # noqa: PLR0913
+        cls,
+        column,
+        min_value=None,
+        max_value=None,
+        strict_min=None,
+        strict_max=None,
+        **kwargs,
+    ):
+        if min_value is None and max_value is None:
+            raise ValueError("min_value and max_value cannot both be None")
+
+        if min_value is not None and max_value is not None and min_value > max_value:
+            raise ValueError("min_value cannot be greater than max_value")
+
+        if pa.types.is_temporal(column.type):
+            if min_value is not None and isinstance(min_value, str):
+                min_value = parse(min_value)
+
+            if max_value is not None and isinstance(max_value, str):
+                max_value = parse(max_value)
+
+        conditions: list = []
+        if min_value is not None:
+            conditions.append(
+                pc.greater(column, min_value)
+                if strict_min
+                else pc.greater_equal(column, min_value)
+            )
+
+        if max_value is not None:
+            conditions.append(
+                pc.less(column, max_value)
+                if strict_max
+                else pc.less_equal(column, max_value)
+            )
+
+        if len(conditions) == 1:
+            return conditions[0]
+
+        return pc.and_(*conditions)
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(  # noqa: PLR0913
+        cls,
+        column,
+        min_value=None,
+        max_value=None,
+        strict_min=None,
+        strict_max=None,
+        **kwargs,
+    ):
+        if min_value is None and max_value is None:
+            raise ValueError("min_value and max_value cannot both be None")
+
+        if min_value is not None and max_value is not None and min_value > max_value:
+            raise ValueError("min_value cannot be greater than max_value")
+
+        conditions: list = []
+        if min_value is not None:
+            conditions.append(column > min_value if strict_min else column >= min_value)
+
+        if max_value is not None:
+            conditions.append(column < max_value if strict_max else column <= max_value)
+
+        return pl.all_horizontal(conditions)
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(  # noqa: PLR0911, PLR0913
         cls,
@@ -12,7 +12,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
     condition_metric_name = "column_values.dateutil_parseable"
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, **kwargs):
         def is_parseable(val):
             try:
@@ -4,9 +4,14 @@ from collections.abc import Sequence
 
 import numpy as np
 
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
+from great_expectations.compatibility.pyarrow import pyarrow as pa
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -14,6 +19,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import get_arrow_value_set
 
 try:
     import sqlalchemy as sa  # noqa: TID251
@@ -25,7 +31,7 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
     condition_metric_name = "column_values.in_set"
     condition_value_keys = ("value_set",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(
         cls,
         column,
@@ -38,6 +44,34 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
 
         return column.isin(value_set)
 
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(
+        cls,
+        column,
+        value_set,
+        **kwargs,
+    ):
+        if value_set is None:
+            # Vacuously true
+            return pa.array(np.ones(len(column), dtype=np.bool_))
+
+        return pc.is_in(
+            column, value_set=get_arrow_value_set(column=column, value_set=value_set)
+        )
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(
+        cls,
+        column,
+        value_set,
+        **kwargs,
+    ):
+        if value_set is None:
+            # Vacuously true
+            return pl.lit(True)
+
+        return column.is_in(list(value_set))
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, value_set, **kwargs):
         return cls._sqlalchemy_impl(column, value_set, **kwargs)
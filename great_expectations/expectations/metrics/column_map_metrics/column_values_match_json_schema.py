@@ -21,7 +21,7 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_json_schema"
     condition_value_keys = ("json_schema",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, json_schema, **kwargs):
         def matches_json_schema(val):
             try:
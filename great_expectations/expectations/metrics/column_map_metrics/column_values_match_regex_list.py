@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import logging
 
-import pandas as pd
-
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -14,7 +12,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    PandasColumnRegexMatcher,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,22 +28,15 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
     )
     default_kwarg_values = {"match_on": "any"}
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, regex_list, match_on, **kwargs):
-        regex_matches = []
-        for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
-        regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
-
         if match_on == "any":
-            result = regex_match_df.any(axis="columns")
+            return PandasColumnRegexMatcher(column).search_any(regex_list=regex_list)
         elif match_on == "all":
-            result = regex_match_df.all(axis="columns")
+            return PandasColumnRegexMatcher(column).search_all(regex_list=regex_list)
         else:
             raise ValueError("match_on must be either 'any' or 'all'")
 
-        return result
-
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex_list, match_on, _dialect, **kwargs):
         if match_on not in ["any", "all"]:
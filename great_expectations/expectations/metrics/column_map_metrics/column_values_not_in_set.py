@@ -3,8 +3,13 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
+from great_expectations.compatibility.pyarrow import pyarrow as pa
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -12,14 +17,17 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import parse_value_set
+from great_expectations.expectations.metrics.util import (
+    get_arrow_value_set,
+    parse_value_set,
+)
 
 
 class ColumnValuesNotInSet(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_in_set"
     condition_value_keys = ("value_set",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(
         cls,
         column,
@@ -36,6 +44,37 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
 
         return ~column.isin(parsed_value_set)
 
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(
+        cls,
+        column,
+        value_set,
+        **kwargs,
+    ):
+        if value_set is None:
+            # Vacuously true
+            return pa.array(np.ones(len(column), dtype=np.bool_))
+
+        return pc.invert(
+            pc.is_in(
+                column,
+                value_set=get_arrow_value_set(column=column, value_set=value_set),
+            )
+        )
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(
+        cls,
+        column,
+        value_set,
+        **kwargs,
+    ):
+        if value_set is None:
+            # Vacuously true
+            return pl.lit(True)
+
+        return ~column.is_in(list(value_set))
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
         cls,
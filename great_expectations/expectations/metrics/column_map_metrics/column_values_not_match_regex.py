@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import logging
 
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -11,7 +15,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    PandasColumnRegexMatcher,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +27,19 @@ class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_regex"
     condition_value_keys = ("regex",)
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, regex, **kwargs):
-        return ~column.astype(str).str.contains(regex)
+        return ~PandasColumnRegexMatcher(column).search(regex=regex)
+
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, regex, **kwargs):
+        return pc.invert(
+            pc.match_substring_regex(pc.cast(column, "string"), pattern=regex)
+        )
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, regex, **kwargs):
+        return ~column.cast(pl.Utf8).str.contains(regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex, _dialect, **kwargs):
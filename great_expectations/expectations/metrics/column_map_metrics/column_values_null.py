@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -32,10 +35,18 @@ class ColumnValuesNull(ColumnMapMetricProvider):
     condition_metric_name = "column_values.null"
     filter_column_isnull = False
 
-    @column_condition_partial(engine=PandasExecutionEngine)
+    @column_condition_partial(engine=PandasExecutionEngine, row_wise=True)
     def _pandas(cls, column, **kwargs):
         return column.isnull()
 
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        return pc.is_null(column)
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        return column.is_null()
+
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, **kwargs):
         return column == None  # noqa: E711
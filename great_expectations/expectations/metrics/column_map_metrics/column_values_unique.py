@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
 from great_expectations.compatibility import pyspark
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
-from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
+    MetricPartialFunctionTypeSuffixes,
+)
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
+    ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -16,15 +26,51 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
 )
 from great_expectations.util import generate_temporary_table_name
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+
+def _column_values_are_unique(metrics: Optional[Dict[str, Any]]) -> bool:
+    """Whether or not "COUNT(column)" equals "COUNT(DISTINCT column)", which proves that no value is duplicated."""
+    if not metrics or "column.distinct_values.count" not in metrics:
+        return False
+
+    return (
+        metrics["column.distinct_values.count"]
+        == metrics["column_values.nonnull.count"]
+    )
 
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
+    """
+    SQL and Spark implementations look for duplicated values with a window function (or "NOT IN" subquery), which
+    requires sorting or shuffling all rows.  Hence, they first compare number of non-null values with number of
+    distinct values (both computed by cheap aggregates, which are bundled with other aggregate metrics of the domain);
+    if these are equal, no value can be unexpected, and the condition short-circuits to constant True.
+    """
+
     condition_metric_name = "column_values.unique"
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         return ~column.duplicated(keep=False)
 
+    @column_condition_partial(engine=ArrowExecutionEngine)
+    def _arrow(cls, column, **kwargs):
+        value_counts = pc.value_counts(column)
+        duplicated_values = pc.filter(
+            value_counts.field("values"), pc.greater(value_counts.field("counts"), 1)
+        )
+        return pc.invert(pc.is_in(column, value_set=duplicated_values))
+
+    @column_condition_partial(engine=PolarsExecutionEngine)
+    def _polars(cls, column, **kwargs):
+        return ~column.is_duplicated()
+
     # NOTE: 20201119 - JPC - We cannot split per-dialect into window and non-window functions
     # @column_condition_partial(
     #     engine=SqlAlchemyExecutionEngine,
@@ -44,6 +90,9 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
         partial_fn_type=MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
     )
     def _sqlalchemy_window(cls, column, _table, **kwargs):
+        if _column_values_are_unique(metrics=kwargs.get("_metrics")):
+            return sa.true()
+
         # Will - 20210126
         # This is a special case that needs to be handled for mysql, where you cannot refer to a temp_table
         # more than once in the same query. So instead of passing dup_query as-is, a second temp_table is created with
@@ -82,4 +131,41 @@ class ColumnValuesUnique(ColumnMapMetricProvider):
         partial_fn_type=MetricPartialFunctionTypes.WINDOW_CONDITION_FN,
     )
     def _spark(cls, column, **kwargs):
+        if _column_values_are_unique(metrics=kwargs.get("_metrics")):
+            return F.lit(True)
+
         return F.count(F.lit(1)).over(pyspark.Window.partitionBy(column)) <= 1
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(
+            execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
+        ) and (
+            metric.metric_name
+            == f"{cls.condition_metric_name}.{MetricPartialFunctionTypeSuffixes.CONDITION.value}"
+        ):
+            for metric_name in (
+                "column.distinct_values.count",
+                "column_values.nonnull.count",
+            ):
+                dependencies[metric_name] = MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric.metric_domain_kwargs,
+                    metric_value_kwargs=None,
+                )
+
+        return dependencies
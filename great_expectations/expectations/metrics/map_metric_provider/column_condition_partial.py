@@ -7,12 +7,18 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Optional,
+    Tuple,
     Type,
     Union,
 )
 
+import pandas as pd
+
 from great_expectations._docs_decorators import public_api
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
@@ -21,11 +27,16 @@ from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypes,
 )
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasColumnCondition,
+)
 from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
 )
@@ -40,7 +51,7 @@ if TYPE_CHECKING:
 
 
 @public_api
-def column_condition_partial(  # noqa: C901, PLR0915
+def column_condition_partial(  # noqa: C901, PLR0912, PLR0915
     engine: Type[ExecutionEngine],
     partial_fn_type: Optional[MetricPartialFunctionTypes] = None,
     **kwargs,
@@ -56,7 +67,11 @@ def column_condition_partial(  # noqa: C901, PLR0915
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
         partial_fn_type: The metric function
-        **kwargs: Arguments passed to specified function
+        **kwargs: Arguments passed to specified function (for `PandasExecutionEngine`, `row_wise=True` declares that \
+            the condition of every value depends only on that value, so that it can be evaluated chunk by chunk)
+
+    If `PandasExecutionEngine` is configured with `fuse_map_conditions`, all conditions of the same Domain are
+    evaluated together, into one boolean matrix of unexpected values.
 
     Returns:
         An annotated metric_function which will be called with a simplified signature.
@@ -98,6 +113,54 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     batch_columns_list=metrics["table.columns"],
                 )
 
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
+                )
+
+                if kwargs.get(
+                    "row_wise", False
+                ) and execution_engine.has_chunked_batch_data(
+                    domain_kwargs=metric_domain_kwargs
+                ):
+                    split_domain_kwargs = execution_engine._split_domain_kwargs(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
+                    compute_domain_kwargs = split_domain_kwargs.compute
+                    accessor_domain_kwargs = split_domain_kwargs.accessor
+                    column_name: Union[
+                        str, sqlalchemy.quoted_name
+                    ] = accessor_domain_kwargs["column"]
+
+                    # Only the (boolean) condition is retained for every chunk of records.
+                    unexpected_condition_chunks: List[pd.Series] = []
+                    for df in execution_engine.iter_domain_records(
+                        domain_kwargs=compute_domain_kwargs
+                    ):
+                        column = df[column_name]
+                        if filter_column_isnull:
+                            column = column[column.notnull()]
+
+                        meets_expectation_series = metric_fn(
+                            cls,
+                            column,
+                            **metric_value_kwargs,
+                            _metrics=metrics,
+                        )
+                        if not isinstance(meets_expectation_series, pd.Series):
+                            meets_expectation_series = pd.Series(
+                                meets_expectation_series, index=column.index
+                            )
+
+                        unexpected_condition_chunks.append(~meets_expectation_series)
+
+                    return (
+                        unexpected_condition_chunks[0]
+                        if len(unexpected_condition_chunks) == 1
+                        else pd.concat(unexpected_condition_chunks),
+                        compute_domain_kwargs,
+                        accessor_domain_kwargs,
+                    )
+
                 (
                     df,
                     compute_domain_kwargs,
@@ -106,13 +169,8 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     domain_kwargs=metric_domain_kwargs, domain_type=domain_type
                 )
 
-                column_name: Union[
-                    str, sqlalchemy.quoted_name
-                ] = accessor_domain_kwargs["column"]
+                column_name = accessor_domain_kwargs["column"]
 
-                filter_column_isnull = kwargs.get(
-                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
-                )
                 if filter_column_isnull:
                     df = df[df[column_name].notnull()]
 
@@ -128,6 +186,47 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     accessor_domain_kwargs,
                 )
 
+            def build_column_condition(  # noqa: PLR0913
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ) -> Tuple[PandasColumnCondition, dict, dict]:
+                """Defers evaluation of "inner_func" to "PandasExecutionEngine.resolve_metric_bundle()"."""
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
+                )
+
+                # noinspection PyProtectedMember
+                split_domain_kwargs = execution_engine._split_domain_kwargs(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                def column_condition_fn(column: pd.Series) -> Any:
+                    return metric_fn(
+                        cls,
+                        column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
+                return (
+                    PandasColumnCondition(
+                        fn=column_condition_fn,
+                        filter_column_isnull=filter_column_isnull,
+                    ),
+                    split_domain_kwargs.compute,
+                    split_domain_kwargs.accessor,
+                )
+
+            inner_func.build_pandas_column_condition = build_column_condition  # type: ignore[attr-defined]
             return inner_func
 
         return wrapper
@@ -306,6 +405,141 @@ def column_condition_partial(  # noqa: C901, PLR0915
             return inner_func
 
         return wrapper
+
+    elif issubclass(engine, ArrowExecutionEngine):
+        if partial_fn_type is None:
+            partial_fn_type = MetricPartialFunctionTypes.MAP_CONDITION_SERIES
+
+        partial_fn_type = MetricPartialFunctionTypes(partial_fn_type)
+        if partial_fn_type not in [MetricPartialFunctionTypes.MAP_CONDITION_SERIES]:
+            raise ValueError(
+                f"""ArrowExecutionEngine only supports "{MetricPartialFunctionTypes.MAP_CONDITION_SERIES.value}" for \
+"column_condition_partial" "partial_fn_type" property."""
+            )
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=ArrowExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+                **kwargs,
+            )
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: ArrowExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                (
+                    table,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                ) = execution_engine.get_compute_domain(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                column = table[accessor_domain_kwargs["column"]]
+                meets_expectation = metric_fn(
+                    cls,
+                    column,
+                    **metric_value_kwargs,
+                    _table=table,
+                    _metrics=metrics,
+                )
+
+                # Values, for which the condition evaluates to NULL, are not unexpected.
+                unexpected_condition = pc.fill_null(pc.invert(meets_expectation), False)
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
+                )
+                if filter_column_isnull:
+                    unexpected_condition = pc.and_(
+                        pc.is_valid(column), unexpected_condition
+                    )
+
+                return (
+                    unexpected_condition,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                )
+
+            return inner_func
+
+        return wrapper
+
+    elif issubclass(engine, PolarsExecutionEngine):
+        if partial_fn_type is None:
+            partial_fn_type = MetricPartialFunctionTypes.MAP_CONDITION_FN
+
+        partial_fn_type = MetricPartialFunctionTypes(partial_fn_type)
+        if partial_fn_type not in [MetricPartialFunctionTypes.MAP_CONDITION_FN]:
+            raise ValueError(
+                f"""PolarsExecutionEngine only supports "{MetricPartialFunctionTypes.MAP_CONDITION_FN.value}" for \
+"column_condition_partial" "partial_fn_type" property."""
+            )
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PolarsExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+                **kwargs,
+            )
+            @wraps(metric_fn)
+            def inner_func(  # noqa: PLR0913
+                cls,
+                execution_engine: PolarsExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    batch_columns_list=metrics["table.columns"],
+                )
+
+                # Condition is a (lazy) Polars expression; Domain records are not obtained here.
+                split_domain_kwargs = execution_engine._split_domain_kwargs(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+                compute_domain_kwargs = split_domain_kwargs.compute
+                accessor_domain_kwargs = split_domain_kwargs.accessor
+
+                column = pl.col(accessor_domain_kwargs["column"])
+                expected_condition = metric_fn(
+                    cls,
+                    column,
+                    **metric_value_kwargs,
+                    _metrics=metrics,
+                )
+
+                # Values, for which the condition evaluates to NULL, are not unexpected.
+                unexpected_condition = (~expected_condition).fill_null(False)
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", True)
+                )
+                if filter_column_isnull:
+                    unexpected_condition = column.is_not_null() & unexpected_condition
+
+                return (
+                    unexpected_condition,
+                    compute_domain_kwargs,
+                    accessor_domain_kwargs,
+                )
+
+            return inner_func
+
+        return wrapper
+
     else:
         raise ValueError(
             'Unsupported engine for "column_condition_partial" metric function decorator.'
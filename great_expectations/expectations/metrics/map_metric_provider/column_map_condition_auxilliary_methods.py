@@ -5,6 +5,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Optional,
     Tuple,
     Union,
 )
@@ -12,15 +13,20 @@ from typing import (
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.expectations.metrics.util import (
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
 )
 
 if TYPE_CHECKING:
     from great_expectations.execution_engine import (
+        ArrowExecutionEngine,
         PandasExecutionEngine,
+        PolarsExecutionEngine,
         SparkDFExecutionEngine,
         SqlAlchemyExecutionEngine,
     )
 
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
@@ -29,6 +35,8 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 )
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import pyspark, sqlalchemy
 
 
@@ -64,8 +72,6 @@ def _pandas_column_map_condition_values(
 
     column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
 
-    df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
-
     ###
     # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
     # currently handle filter_column_isnull differently than other map_fn / map_condition
@@ -74,16 +80,30 @@ def _pandas_column_map_condition_values(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
 
-    domain_values = df[column_name]
+    result_format = metric_value_kwargs["result_format"]
 
-    domain_values = domain_values[
-        boolean_mapped_unexpected_values == True  # noqa: E712
-    ]
+    if execution_engine.has_chunked_batch_data(domain_kwargs=compute_domain_kwargs):
+        return _pandas_column_map_condition_values_by_chunk(
+            execution_engine=execution_engine,
+            compute_domain_kwargs=compute_domain_kwargs,
+            column_name=column_name,
+            boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+            filter_column_isnull=filter_column_isnull,
+            limit=None
+            if result_format["result_format"] == "COMPLETE"
+            else result_format["partial_unexpected_count"],
+        )
 
-    result_format = metric_value_kwargs["result_format"]
+    df = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+
+    domain_values = get_pandas_unexpected_records(
+        records=df[column_name],
+        boolean_mapped_unexpected_values=(
+            boolean_mapped_unexpected_values == True  # noqa: E712
+        ),
+        nonnull_values=df[column_name] if filter_column_isnull else None,
+    )
 
     if result_format["result_format"] == "COMPLETE":
         return list(domain_values)
@@ -91,6 +111,36 @@ def _pandas_column_map_condition_values(
     return list(domain_values[: result_format["partial_unexpected_count"]])
 
 
+def _pandas_column_map_condition_values_by_chunk(  # noqa: PLR0913
+    execution_engine: PandasExecutionEngine,
+    compute_domain_kwargs: dict,
+    column_name: Union[str, sqlalchemy.quoted_name],
+    boolean_mapped_unexpected_values: pd.Series,
+    filter_column_isnull: bool,
+    limit: Optional[int],
+) -> list:
+    """Collects unexpected values chunk by chunk, reading no further chunks once "limit" values have been collected."""
+    unexpected_values: list = []
+    for df in execution_engine.iter_domain_records(domain_kwargs=compute_domain_kwargs):
+        domain_values = df[column_name]
+        if filter_column_isnull:
+            domain_values = domain_values[domain_values.notnull()]
+
+        domain_values = domain_values[
+            boolean_mapped_unexpected_values.reindex(
+                domain_values.index, fill_value=False
+            )
+        ]
+        if limit is not None:
+            domain_values = domain_values[: limit - len(unexpected_values)]
+
+        unexpected_values.extend(domain_values)
+        if limit is not None and len(unexpected_values) >= limit:
+            break
+
+    return unexpected_values
+
+
 # TODO: <Alex>11/15/2022: Please DO_NOT_DELETE this method (even though it is not currently utilized).  Thanks.</Alex>
 def _pandas_column_map_series_and_domain_values(
     cls,
@@ -205,22 +255,20 @@ def _pandas_column_map_condition_value_counts(
     filter_column_isnull = kwargs.get(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
 
-    domain_values = df[column_name]
+    domain_values = get_pandas_unexpected_records(
+        records=df[column_name],
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        nonnull_values=df[column_name] if filter_column_isnull else None,
+    )
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[boolean_mapped_unexpected_values].value_counts()
+        value_counts = domain_values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = domain_values.apply(tuple).value_counts()
         except ValueError:
             pass
 
@@ -439,3 +487,175 @@ def _spark_column_map_condition_value_counts(
     else:
         rows = value_counts.collect()[: result_format["partial_unexpected_count"]]
     return rows
+
+
+def _arrow_column_map_condition_values(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
+(_arrow_column_map_condition_values).
+"""
+        )
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
+
+    table = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    unexpected_values = pc.filter(table[column_name], unexpected_condition)
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return unexpected_values.to_pylist()
+
+    return unexpected_values.slice(
+        0, result_format["partial_unexpected_count"]
+    ).to_pylist()
+
+
+def _arrow_column_map_condition_value_counts(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns respective value counts for distinct column values"""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
+(_arrow_column_map_condition_value_counts).
+"""
+        )
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
+
+    table = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    value_counts = pc.value_counts(pc.filter(table[column_name], unexpected_condition))
+    value_counts = [
+        {"value": value_count["values"], "count": value_count["counts"]}
+        for value_count in value_counts.to_pylist()
+    ]
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return value_counts
+
+    return value_counts[: result_format["partial_unexpected_count"]]
+
+
+def _polars_column_map_condition_values(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
+(_polars_column_map_condition_values).
+"""
+        )
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
+
+    data = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    unexpected_values = data.filter(unexpected_condition).select(pl.col(column_name))
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        unexpected_values = unexpected_values.head(
+            result_format["partial_unexpected_count"]
+        )
+
+    return unexpected_values.collect().to_series().to_list()
+
+
+def _polars_column_map_condition_value_counts(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns respective value counts for distinct column values"""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    if "column" not in accessor_domain_kwargs:
+        raise ValueError(
+            """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
+(_polars_column_map_condition_value_counts).
+"""
+        )
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs["column"]
+
+    data = execution_engine.get_domain_records(domain_kwargs=compute_domain_kwargs)
+    value_counts = (
+        data.filter(unexpected_condition)
+        .group_by(column_name)
+        .agg(pl.len().alias("count"))
+        .sort("count", descending=True)
+    )
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        value_counts = value_counts.head(result_format["partial_unexpected_count"])
+
+    return [
+        {"value": value, "count": count}
+        for value, count in value_counts.collect().rows()
+    ]
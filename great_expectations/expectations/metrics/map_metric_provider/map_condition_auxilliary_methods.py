@@ -7,18 +7,27 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
+    cast,
 )
 
 import numpy as np
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.pyspark import pyspark
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.core.columnar_unexpected_results import (
+    FLAT_COLUMN_NAME,
+    ColumnarUnexpectedResults,
+    use_columnar_unexpected_results,
+)
 from great_expectations.core.metric_function_types import (
     SummarizationMetricNameSuffixes,
 )
@@ -30,6 +39,7 @@ from great_expectations.expectations.metrics.map_metric_provider.is_sqlalchemy_m
 from great_expectations.expectations.metrics.util import (
     compute_unexpected_pandas_indices,
     get_dbms_compatible_metric_domain_kwargs,
+    get_pandas_unexpected_records,
     get_sqlalchemy_source_table_and_schema,
     sql_statement_with_post_compile_to_string,
 )
@@ -41,8 +51,11 @@ from great_expectations.util import (
 if TYPE_CHECKING:
     import pandas as pd
 
+    from great_expectations.compatibility.pyarrow import pyarrow as pa
     from great_expectations.execution_engine import (
+        ArrowExecutionEngine,
         PandasExecutionEngine,
+        PolarsExecutionEngine,
         SparkDFExecutionEngine,
         SqlAlchemyExecutionEngine,
     )
@@ -70,7 +83,7 @@ def _pandas_map_condition_index(
     metric_value_kwargs: dict,
     metrics: Dict[str, Any],
     **kwargs,
-) -> Union[List[int], List[Dict[str, Any]]]:
+) -> Union[List[int], List[Dict[str, Any]], ColumnarUnexpectedResults]:
     (
         boolean_mapped_unexpected_values,
         compute_domain_kwargs,
@@ -90,6 +103,7 @@ def _pandas_map_condition_index(
     domain_records_df: pd.DataFrame = execution_engine.get_domain_records(
         domain_kwargs=domain_kwargs
     )
+    nonnull_values: Optional[pd.Series] = None
     domain_column_name_list: List[str] = list()
     # column map expectations
     if "column" in accessor_domain_kwargs:
@@ -106,9 +120,7 @@ def _pandas_map_condition_index(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            domain_records_df = domain_records_df[
-                domain_records_df[column_name].notnull()
-            ]
+            nonnull_values = domain_records_df[column_name]
 
         domain_column_name_list.append(column_name)
 
@@ -125,10 +137,14 @@ def _pandas_map_condition_index(
         domain_column_name_list = column_list
 
     result_format = metric_value_kwargs["result_format"]
-    domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
+    domain_records_df = get_pandas_unexpected_records(
+        records=domain_records_df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        nonnull_values=nonnull_values,
+    )
 
     unexpected_index_list: Union[
-        List[int], List[Dict[str, Any]]
+        List[int], List[Dict[str, Any]], ColumnarUnexpectedResults
     ] = compute_unexpected_pandas_indices(
         domain_records_df=domain_records_df,
         result_format=result_format,
@@ -184,6 +200,7 @@ def _pandas_map_condition_query(
     domain_records_df: pd.DataFrame = execution_engine.get_domain_records(
         domain_kwargs=domain_kwargs
     )
+    nonnull_values: Optional[pd.Series] = None
 
     if "column" in accessor_domain_kwargs:
         column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
@@ -194,11 +211,13 @@ def _pandas_map_condition_query(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            domain_records_df = domain_records_df[
-                domain_records_df[column_name].notnull()
-            ]
+            nonnull_values = domain_records_df[column_name]
 
-    domain_values_df_filtered = domain_records_df[boolean_mapped_unexpected_values]
+    domain_values_df_filtered = get_pandas_unexpected_records(
+        records=domain_records_df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        nonnull_values=nonnull_values,
+    )
     index_list = domain_values_df_filtered.index.to_list()
     return f"df.filter(items={index_list}, axis=0)"
 
@@ -229,6 +248,7 @@ def _pandas_map_condition_rows(
     """
     domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     df = execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
+    nonnull_values: Optional[pd.Series] = None
 
     if "column" in accessor_domain_kwargs:
         column_name: Union[str, sqlalchemy.quoted_name] = accessor_domain_kwargs[
@@ -244,11 +264,15 @@ def _pandas_map_condition_rows(
             "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
         )
         if filter_column_isnull:
-            df = df[df[column_name].notnull()]
+            nonnull_values = df[column_name]
 
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
+    df = get_pandas_unexpected_records(
+        records=df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        nonnull_values=nonnull_values,
+    )
 
     if result_format["result_format"] == "COMPLETE":
         return df
@@ -256,6 +280,370 @@ def _pandas_map_condition_rows(
     return df.iloc[: result_format["partial_unexpected_count"]]
 
 
+def _arrow_map_condition_unexpected_count(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns unexpected count for MapExpectations"""
+    return pc.sum(metrics["unexpected_condition"][0], min_count=0).as_py()
+
+
+def _arrow_unexpected_domain_records(
+    execution_engine: ArrowExecutionEngine,
+    metrics: Dict[str, Any],
+) -> Tuple[pa.Table, dict]:
+    """Returns Domain records, which do not meet an expected Expectation condition, and accessor Domain kwargs."""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    table: pa.Table = execution_engine.get_domain_records(domain_kwargs=domain_kwargs)
+    return table.filter(unexpected_condition), accessor_domain_kwargs
+
+
+def _arrow_map_condition_index(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Union[List[int], List[Dict[str, Any]], ColumnarUnexpectedResults]:
+    """
+    Returns row positions (within Domain records) of values, which do not meet an expected Expectation condition, or,
+    if `unexpected_index_column_names` is part of `result_format` dict, values of those (primary_key) columns.
+    """
+    result_format = metric_value_kwargs["result_format"]
+    unexpected_index_column_names: Optional[List[str]] = result_format.get(
+        "unexpected_index_column_names"
+    )
+    if not unexpected_index_column_names:
+        unexpected_condition = metrics["unexpected_condition"][0]
+        if use_columnar_unexpected_results(result_format=result_format):
+            return ColumnarUnexpectedResults(
+                columns={FLAT_COLUMN_NAME: pc.indices_nonzero(unexpected_condition)},
+                flat=True,
+            )
+
+        unexpected_index_list: List[int] = pc.indices_nonzero(
+            unexpected_condition
+        ).to_pylist()
+        if result_format["result_format"] == "COMPLETE":
+            return unexpected_index_list
+        return unexpected_index_list[: result_format["partial_unexpected_count"]]
+
+    unexpected_records, accessor_domain_kwargs = _arrow_unexpected_domain_records(
+        execution_engine=execution_engine, metrics=metrics
+    )
+
+    domain_column_name_list: List[str]
+    # column map expectations
+    if "column" in accessor_domain_kwargs:
+        domain_column_name_list = [accessor_domain_kwargs["column"]]
+    # column pair expectations
+    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        domain_column_name_list = [
+            accessor_domain_kwargs["column_A"],
+            accessor_domain_kwargs["column_B"],
+        ]
+    # multi-column map expectations
+    else:
+        domain_column_name_list = accessor_domain_kwargs.get("column_list", [])
+
+    for column_name in unexpected_index_column_names:
+        if column_name not in unexpected_records.column_names:
+            raise gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The unexpected_index_column: "{column_name}" in does not exist in Arrow Table. '
+                f"Please check your configuration and try again."
+            )
+
+    if result_format["result_format"] != "COMPLETE":
+        unexpected_records = unexpected_records.slice(
+            0, result_format["partial_unexpected_count"]
+        )
+
+    query_result: List[tuple] = list(
+        zip(
+            *(
+                unexpected_records[column_name].to_pylist()
+                for column_name in unexpected_index_column_names
+                + domain_column_name_list
+            )
+        )
+    )
+    return cast(
+        List[Dict[str, Any]],
+        _get_sqlalchemy_customized_unexpected_index_list(
+            exclude_unexpected_values=result_format.get(
+                "exclude_unexpected_values", False
+            ),
+            unexpected_index_column_names=unexpected_index_column_names,
+            query_result=query_result,  # type: ignore[arg-type]
+            domain_column_name_list=domain_column_name_list,
+            columnar=use_columnar_unexpected_results(result_format=result_format),
+        ),
+    )
+
+
+def _arrow_map_condition_query(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Optional[str]:
+    """
+    Returns query that will return all rows which do not meet an expected Expectation condition for instances
+    of ColumnMapExpectation. For Arrow, this is currently the full set of unexpected row positions.
+    """
+    result_format: dict = metric_value_kwargs["result_format"]
+
+    # We will not return map_condition_query if return_unexpected_index_query = False
+    return_unexpected_index_query: Optional[bool] = result_format.get(
+        "return_unexpected_index_query"
+    )
+    if return_unexpected_index_query is False:
+        return None
+
+    unexpected_condition = metrics["unexpected_condition"][0]
+    index_list: List[int] = pc.indices_nonzero(unexpected_condition).to_pylist()
+    return f"table.take({index_list})"
+
+
+def _arrow_map_condition_rows(
+    cls,
+    execution_engine: ArrowExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
+    unexpected_records, _ = _arrow_unexpected_domain_records(
+        execution_engine=execution_engine, metrics=metrics
+    )
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        unexpected_records = unexpected_records.slice(
+            0, result_format["partial_unexpected_count"]
+        )
+
+    return unexpected_records.to_pylist()
+
+
+def _polars_map_condition_unexpected_count_aggregate_fn(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns unexpected count for MapExpectations as Polars expression (bundled into one "select()" per Domain)."""
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics[
+        "unexpected_condition"
+    ]
+    return (
+        unexpected_condition.sum(),
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    )
+
+
+def _polars_unexpected_domain_records(
+    execution_engine: PolarsExecutionEngine,
+    metrics: Dict[str, Any],
+) -> Tuple[pl.LazyFrame, dict]:
+    """Returns (lazy) Domain records, which do not meet an expected Expectation condition, and accessor Domain kwargs."""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    accessor_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+        metric_domain_kwargs=accessor_domain_kwargs,
+        batch_columns_list=metrics["table.columns"],
+    )
+
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    data: pl.LazyFrame = execution_engine.get_domain_records(
+        domain_kwargs=domain_kwargs
+    )
+    return data.filter(unexpected_condition), accessor_domain_kwargs
+
+
+def _polars_unexpected_row_positions(
+    execution_engine: PolarsExecutionEngine,
+    metrics: Dict[str, Any],
+    limit: Optional[int] = None,
+) -> List[int]:
+    """Returns row positions (within Domain records) of values, which do not meet an expected Expectation condition."""
+    (
+        unexpected_condition,
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    ) = metrics["unexpected_condition"]
+
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    data: pl.LazyFrame = execution_engine.get_domain_records(
+        domain_kwargs=domain_kwargs
+    )
+    positions: pl.LazyFrame = data.select(
+        pl.int_range(pl.len()).filter(unexpected_condition).alias("__position")
+    )
+    if limit is not None:
+        positions = positions.head(limit)
+
+    return positions.collect().to_series().to_list()
+
+
+def _polars_map_condition_index(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Union[List[int], List[Dict[str, Any]], ColumnarUnexpectedResults]:
+    """
+    Returns row positions (within Domain records) of values, which do not meet an expected Expectation condition, or,
+    if `unexpected_index_column_names` is part of `result_format` dict, values of those (primary_key) columns.
+    """
+    result_format = metric_value_kwargs["result_format"]
+    limit: Optional[int] = (
+        None
+        if result_format["result_format"] == "COMPLETE"
+        else result_format["partial_unexpected_count"]
+    )
+    unexpected_index_column_names: Optional[List[str]] = result_format.get(
+        "unexpected_index_column_names"
+    )
+    if not unexpected_index_column_names:
+        return _polars_unexpected_row_positions(
+            execution_engine=execution_engine, metrics=metrics, limit=limit
+        )
+
+    unexpected_records, accessor_domain_kwargs = _polars_unexpected_domain_records(
+        execution_engine=execution_engine, metrics=metrics
+    )
+
+    domain_column_name_list: List[str]
+    # column map expectations
+    if "column" in accessor_domain_kwargs:
+        domain_column_name_list = [accessor_domain_kwargs["column"]]
+    # column pair expectations
+    elif "column_A" in accessor_domain_kwargs and "column_B" in accessor_domain_kwargs:
+        domain_column_name_list = [
+            accessor_domain_kwargs["column_A"],
+            accessor_domain_kwargs["column_B"],
+        ]
+    # multi-column map expectations
+    else:
+        domain_column_name_list = accessor_domain_kwargs.get("column_list", [])
+
+    for column_name in unexpected_index_column_names:
+        if column_name not in metrics["table.columns"]:
+            raise gx_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The unexpected_index_column: "{column_name}" in does not exist in Polars LazyFrame. '
+                f"Please check your configuration and try again."
+            )
+
+    if limit is not None:
+        unexpected_records = unexpected_records.head(limit)
+
+    query_result: List[tuple] = (
+        unexpected_records.select(
+            unexpected_index_column_names + domain_column_name_list
+        )
+        .collect()
+        .rows()
+    )
+    return cast(
+        List[Dict[str, Any]],
+        _get_sqlalchemy_customized_unexpected_index_list(
+            exclude_unexpected_values=result_format.get(
+                "exclude_unexpected_values", False
+            ),
+            unexpected_index_column_names=unexpected_index_column_names,
+            query_result=query_result,  # type: ignore[arg-type]
+            domain_column_name_list=domain_column_name_list,
+            columnar=use_columnar_unexpected_results(result_format=result_format),
+        ),
+    )
+
+
+def _polars_map_condition_query(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> Optional[str]:
+    """
+    Returns query that will return all rows which do not meet an expected Expectation condition for instances
+    of ColumnMapExpectation. For Polars, this is currently the full set of unexpected row positions.
+    """
+    result_format: dict = metric_value_kwargs["result_format"]
+
+    # We will not return map_condition_query if return_unexpected_index_query = False
+    return_unexpected_index_query: Optional[bool] = result_format.get(
+        "return_unexpected_index_query"
+    )
+    if return_unexpected_index_query is False:
+        return None
+
+    index_list: List[int] = _polars_unexpected_row_positions(
+        execution_engine=execution_engine, metrics=metrics
+    )
+    return f"df[{index_list}]"
+
+
+def _polars_map_condition_rows(
+    cls,
+    execution_engine: PolarsExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
+    unexpected_records, _ = _polars_unexpected_domain_records(
+        execution_engine=execution_engine, metrics=metrics
+    )
+
+    result_format = metric_value_kwargs["result_format"]
+    if result_format["result_format"] != "COMPLETE":
+        unexpected_records = unexpected_records.head(
+            result_format["partial_unexpected_count"]
+        )
+
+    return unexpected_records.collect().to_dicts()
+
+
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
@@ -511,7 +899,7 @@ def _sqlalchemy_map_condition_index(
     metric_value_kwargs: Dict,
     metrics: Dict[str, Any],
     **kwargs,
-) -> list[dict[str, Any]] | None:
+) -> list[dict[str, Any]] | ColumnarUnexpectedResults | None:
     """
     Returns indices of the metric values which do not meet an expected Expectation condition for instances
     of ColumnMapExpectation.
@@ -600,6 +988,7 @@ def _sqlalchemy_map_condition_index(
         unexpected_index_column_names=unexpected_index_column_names,
         query_result=query_result,
         domain_column_name_list=domain_column_name_list,
+        columnar=use_columnar_unexpected_results(result_format=result_format),
     )
 
 
@@ -688,7 +1077,7 @@ def _spark_map_condition_index(
     metric_value_kwargs: Dict,
     metrics: Dict[str, Any],
     **kwargs,
-) -> Union[List[Dict[str, Any]], None]:
+) -> Union[List[Dict[str, Any]], ColumnarUnexpectedResults, None]:
     """
     Returns indices of the metric values which do not meet an expected Expectation condition for instances
     of ColumnMapExpectation.
@@ -773,6 +1162,7 @@ def _spark_map_condition_index(
         unexpected_index_column_names=unexpected_index_column_names,
         filtered=filtered,
         columns_to_keep=columns_to_keep,
+        columnar=use_columnar_unexpected_results(result_format=result_format),
     )
 
 
@@ -844,7 +1234,20 @@ def _get_sqlalchemy_customized_unexpected_index_list(
     unexpected_index_column_names: List[str],
     query_result: List[sqlalchemy.Row],
     domain_column_name_list: List[Union[str, sqlalchemy.quoted_name]],
-) -> Union[List[Dict[str, Any]], None]:
+    columnar: bool = False,
+) -> Union[List[Dict[str, Any]], ColumnarUnexpectedResults, None]:
+    if columnar:
+        column_names: List[str] = unexpected_index_column_names
+        if not exclude_unexpected_values or len(unexpected_index_column_names) == 0:
+            column_names = unexpected_index_column_names + domain_column_name_list
+
+        values_by_column: List[tuple] = list(zip(*query_result)) or [
+            () for _ in column_names
+        ]
+        return ColumnarUnexpectedResults(
+            columns=dict(zip(column_names, values_by_column))
+        )
+
     unexpected_index_list: List[Dict[str, Any]] = []
 
     if (
@@ -880,7 +1283,22 @@ def _get_spark_customized_unexpected_index_list(
     unexpected_index_column_names: List[str],
     filtered: pyspark.sql.dataframe.DataFrame,
     columns_to_keep: List[str],
-) -> Union[List[Dict[str, Any]], None]:
+    columnar: bool = False,
+) -> Union[List[Dict[str, Any]], ColumnarUnexpectedResults, None]:
+    if columnar:
+        column_names: List[str] = (
+            unexpected_index_column_names
+            if exclude_unexpected_values
+            else columns_to_keep
+        )
+        rows: List[pyspark.Row] = filtered.select(column_names).collect()
+        return ColumnarUnexpectedResults(
+            columns={
+                column_name: [row[column_name] for row in rows]
+                for column_name in column_names
+            }
+        )
+
     unexpected_index_list: List[Dict[str, Any]] = []
 
     if exclude_unexpected_values and not filtered.isEmpty():
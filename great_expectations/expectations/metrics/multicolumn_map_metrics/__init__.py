@@ -1,4 +1,4 @@
-from .compound_columns_unique import CompoundColumnsUnique
+from .compound_columns_unique import CompoundColumnsHasDuplicates, CompoundColumnsUnique
 from .multicolumn_sum_equal import MulticolumnSumEqual
 from .select_column_values_unique_within_record import (
     SelectColumnValuesUniqueWithinRecord,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
 )
@@ -24,13 +25,35 @@ from great_expectations.expectations.metrics.map_metric_provider.multicolumn_con
 from great_expectations.expectations.metrics.map_metric_provider.multicolumn_function_partial import (
     multicolumn_function_partial,
 )
+from great_expectations.expectations.metrics.metric_provider import (
+    MetricProvider,
+    metric_value,
+)
+from great_expectations.expectations.metrics.util import (
+    get_dbms_compatible_metric_domain_kwargs,
+)
 from great_expectations.validator.validation_graph import MetricConfiguration
 
 if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
 
+COMPOUND_COLUMNS_DOMAIN_KEYS = (
+    "batch_id",
+    "table",
+    "column_list",
+    "row_condition",
+    "condition_parser",
+    "ignore_row_if",
+)
+
+
+def _compound_columns_are_unique(metrics: Optional[Dict[str, Any]]) -> bool:
+    """Whether or not "compound_columns.has_duplicates" metric dependency proves that compound columns are unique."""
+    return bool(metrics) and metrics.get("compound_columns.has_duplicates") is False
+
 
 class CompoundColumnsUnique(MulticolumnMapMetricProvider):
     """
@@ -38,18 +61,15 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
     implementation, which combines the "map" and "condition" parts in a single step, the support for
     "SqlAlchemyExecutionEngine" is more detailed.  Thus, the "map" and "condition" parts for "SqlAlchemyExecutionEngine"
     are handled separately, with the "condition" part relying on the "map" part as a metric dependency.
+
+    Both SQL "map" part and Spark window function must group all rows of table.  Hence, they depend on cheap
+    "compound_columns.has_duplicates" aggregate metric, and they skip grouping all rows if it proves that compound
+    columns are unique (in which case every group consists of one row, and no row is unexpected).
     """
 
     function_metric_name = "compound_columns.count"  # pre-requisite "map" style metric
     condition_metric_name = "compound_columns.unique"  # "condition" style metric required to be implemented by provider
-    condition_domain_keys = (
-        "batch_id",
-        "table",
-        "column_list",
-        "row_condition",
-        "condition_parser",
-        "ignore_row_if",
-    )
+    condition_domain_keys = COMPOUND_COLUMNS_DOMAIN_KEYS
 
     @multicolumn_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column_list, **kwargs):
@@ -100,6 +120,19 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
                 dialect_name = dialect.name
             except AttributeError:
                 dialect_name = ""
+
+        if _compound_columns_are_unique(metrics=kwargs.get("_metrics")):
+            table_columns_selector = [
+                sa.column(column_name) for column_name in table_columns
+            ]
+            return (
+                sa.select(
+                    *table_columns_selector, sa.literal_column("1").label("_num_rows")
+                )
+                .select_from(table)
+                .alias("records_with_grouped_column_counts_subquery")
+            )
+
         if dialect and dialect_name == "mysql":
             table_columns_selector = [
                 sa.column(column_name) for column_name in table_columns
@@ -195,6 +228,9 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
 
     @multicolumn_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column_list, **kwargs):
+        if _compound_columns_are_unique(metrics=kwargs.get("_metrics")):
+            return F.lit(True)
+
         column_names = column_list.columns
         row_wise_cond = (
             F.count(F.lit(1)).over(pyspark.Window.partitionBy(F.struct(*column_names)))
@@ -236,4 +272,111 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
                     metric_value_kwargs=None,
                 )
 
+        if (
+            isinstance(execution_engine, SqlAlchemyExecutionEngine)
+            and metric.metric_name
+            == f"compound_columns.count.{MetricPartialFunctionTypeSuffixes.MAP.value}"
+        ) or (
+            isinstance(execution_engine, SparkDFExecutionEngine)
+            and metric.metric_name
+            == f"compound_columns.unique.{MetricPartialFunctionTypeSuffixes.CONDITION.value}"
+        ):
+            dependencies["compound_columns.has_duplicates"] = MetricConfiguration(
+                metric_name="compound_columns.has_duplicates",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+
+        return dependencies
+
+
+class CompoundColumnsHasDuplicates(MetricProvider):
+    """Whether or not any combination of values of "column_list" occurs in more than one row of the domain.
+
+    Computed by one aggregate query (GROUP BY "column_list" HAVING COUNT(*) > 1), which does not need to join group
+    counts back to every row of table (SQL) or to partition all rows with window function (Spark).
+    """
+
+    metric_name = "compound_columns.has_duplicates"
+    domain_keys = COMPOUND_COLUMNS_DOMAIN_KEYS
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metrics: Dict[str, Any],
+        **kwargs,
+    ) -> bool:
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs,
+            domain_type=MetricDomainTypes.MULTICOLUMN,
+        )
+        column_list = [
+            sa.column(column_name)
+            for column_name in accessor_domain_kwargs["column_list"]
+        ]
+        duplicated_group_query: sqlalchemy.Select = (
+            sa.select(*column_list)
+            .select_from(selectable)
+            .group_by(*column_list)
+            .having(sa.func.count() > 1)
+            .limit(1)
+        )
+        return (
+            execution_engine.execute_query(duplicated_group_query).first() is not None
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metrics: Dict[str, Any],
+        **kwargs,
+    ) -> bool:
+        metric_domain_kwargs = get_dbms_compatible_metric_domain_kwargs(
+            metric_domain_kwargs=metric_domain_kwargs,
+            batch_columns_list=metrics["table.columns"],
+        )
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs,
+            domain_type=MetricDomainTypes.MULTICOLUMN,
+        )
+        duplicated_groups = (
+            df.groupBy(*accessor_domain_kwargs["column_list"])
+            .count()
+            .filter(F.col("count") > 1)
+        )
+        return len(duplicated_groups.take(1)) > 0
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        table_domain_kwargs: dict = {
+            k: v
+            for k, v in metric.metric_domain_kwargs.items()
+            if k not in ["column_list", "ignore_row_if"]
+        }
+        dependencies["table.columns"] = MetricConfiguration(
+            metric_name="table.columns",
+            metric_domain_kwargs=table_domain_kwargs,
+            metric_value_kwargs=None,
+        )
         return dependencies
@@ -6,7 +6,9 @@ from great_expectations.compatibility import pyspark, sqlalchemy
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.exceptions import GreatExpectationsError
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -34,12 +36,51 @@ class ColumnTypes(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
-        df, _, _ = execution_engine.get_compute_domain(
+        if execution_engine.has_chunked_batch_data(domain_kwargs=metric_domain_kwargs):
+            # Column names and types are those of the first chunk.
+            df = next(
+                execution_engine.iter_domain_records(domain_kwargs=metric_domain_kwargs)
+            )
+        else:
+            df, _, _ = execution_engine.get_compute_domain(
+                metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+            )
+
+        return [
+            {"name": name, "type": dtype}
+            for (name, dtype) in zip(df.columns, df.dtypes)
+        ]
+
+    @metric_value(engine=ArrowExecutionEngine)
+    def _arrow(  # noqa: PLR0913
+        cls,
+        execution_engine: ArrowExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        table, _, _ = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
+        return [{"name": field.name, "type": field.type} for field in table.schema]
+
+    @metric_value(engine=PolarsExecutionEngine)
+    def _polars(  # noqa: PLR0913
+        cls,
+        execution_engine: PolarsExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        data, _, _ = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+        )
+        # Schema is resolved from query plan, without reading any records.
         return [
             {"name": name, "type": dtype}
-            for (name, dtype) in zip(df.columns, df.dtypes)
+            for name, dtype in data.collect_schema().items()
         ]
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
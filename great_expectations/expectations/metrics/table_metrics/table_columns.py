@@ -4,8 +4,10 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     ExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -36,6 +38,30 @@ class TableColumns(TableMetricProvider):
         column_metadata = metrics["table.column_types"]
         return [col["name"] for col in column_metadata]
 
+    @metric_value(engine=ArrowExecutionEngine)
+    def _arrow(  # noqa: PLR0913
+        cls,
+        execution_engine: ArrowExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        column_metadata = metrics["table.column_types"]
+        return [col["name"] for col in column_metadata]
+
+    @metric_value(engine=PolarsExecutionEngine)
+    def _polars(  # noqa: PLR0913
+        cls,
+        execution_engine: PolarsExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        column_metadata = metrics["table.column_types"]
+        return [col["name"] for col in column_metadata]
+
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(  # noqa: PLR0913
         cls,
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from great_expectations.compatibility.polars import polars as pl
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.metric_function_types import MetricPartialFunctionTypes
 from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
     PandasExecutionEngine,
+    PolarsExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
@@ -32,11 +35,48 @@ class TableRowCount(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
+        if execution_engine.has_chunked_batch_data(domain_kwargs=metric_domain_kwargs):
+            return sum(
+                df.shape[0]
+                for df in execution_engine.iter_domain_records(
+                    domain_kwargs=metric_domain_kwargs
+                )
+            )
+
         df, _, _ = execution_engine.get_compute_domain(
             domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
         return df.shape[0]
 
+    @metric_value(engine=ArrowExecutionEngine)
+    def _arrow(  # noqa: PLR0913
+        cls,
+        execution_engine: ArrowExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        table, _, _ = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+        )
+        return table.num_rows
+
+    @metric_partial(
+        engine=PolarsExecutionEngine,
+        partial_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+        domain_type=MetricDomainTypes.TABLE,
+    )
+    def _polars(  # noqa: PLR0913
+        cls,
+        execution_engine: PolarsExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ):
+        return pl.len(), metric_domain_kwargs, {}
+
     @metric_partial(
         engine=SqlAlchemyExecutionEngine,
         partial_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
@@ -59,10 +99,17 @@ class TableRowCount(TableMetricProvider):
     )
     def _spark(  # noqa: PLR0913
         cls,
-        execution_engine: SqlAlchemyExecutionEngine,
+        execution_engine: SparkDFExecutionEngine,
         metric_domain_kwargs: dict,
         metric_value_kwargs: dict,
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
+        # Rows of filtered Domain are counted on unfiltered Batch, so as to be bundled with other aggregates of Batch.
+        condition, base_domain_kwargs = execution_engine.split_row_filtering_condition(
+            domain_kwargs=metric_domain_kwargs
+        )
+        if condition is not None:
+            return F.count(F.when(condition, F.lit(1))), base_domain_kwargs, {}
+
         return F.count(F.lit(1)), metric_domain_kwargs, {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from collections import UserDict
@@ -12,19 +13,28 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    TypeVar,
     overload,
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, sqlalchemy, trino
+from great_expectations.compatibility.pyarrow import compute as pc
+from great_expectations.compatibility.pyarrow import pyarrow as pa
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.columnar_unexpected_results import (
+    FLAT_COLUMN_NAME,
+    ColumnarUnexpectedResults,
+    use_columnar_unexpected_results,
+)
 from great_expectations.execution_engine import (
     PandasExecutionEngine,  # noqa: TCH001
     SqlAlchemyExecutionEngine,  # noqa: TCH001
@@ -69,7 +79,9 @@ from great_expectations.compatibility import bigquery as sqla_bigquery
 from great_expectations.compatibility.bigquery import bigquery_types_tuple
 
 if TYPE_CHECKING:
-    import pandas as pd
+    import numpy.typing as npt
+
+    PandasRecordsT = TypeVar("PandasRecordsT", pd.DataFrame, pd.Series)
 
 try:
     import teradatasqlalchemy.dialect
@@ -696,8 +708,11 @@ def get_dbms_compatible_metric_domain_kwargs(
         batch_columns_list: Actual "Batch" column list (e.g., output of "table.columns" metric).
 
     Returns:
-        metric_domain_kwargs: Updated "metric_domain_kwargs" dictionary with quoted column names, where appropriate.
+        metric_domain_kwargs: Updated copy of "metric_domain_kwargs" dictionary with quoted column names, where
+        appropriate (original may be immutable, e.g., when "MetricConfiguration" is frozen).
     """
+    metric_domain_kwargs = dict(metric_domain_kwargs)
+
     column_names: List[str | sqlalchemy.quoted_name]
     if "column" in metric_domain_kwargs:
         column_name: str | sqlalchemy.quoted_name = get_dbms_compatible_column_names(
@@ -887,6 +902,177 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def get_arrow_value_set(column: pa.ChunkedArray, value_set) -> pa.Array:
+    """Returns "value_set" as pyarrow Array of type of "column" (values that cannot be converted are not members)."""
+    if pa.types.is_temporal(column.type):
+        value_set = parse_value_set(value_set=value_set)
+
+    try:
+        return pa.array(value_set, type=column.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    compatible_values: list = []
+    for value in value_set:
+        try:
+            compatible_values.append(pa.scalar(value, type=column.type))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+
+    return pa.array(compatible_values, type=column.type)
+
+
+# Tokens, whose meaning in RE2 (the regex engine of "pyarrow.compute") differs from that in Python "re" (e.g., "$" also
+# matches before trailing newline and "\d" matches any Unicode digit in Python), or which RE2 does not support.
+_ARROW_INCOMPATIBLE_REGEX_TOKENS = (
+    "$",
+    "\\Z",
+    "\\d",
+    "\\D",
+    "\\w",
+    "\\W",
+    "\\s",
+    "\\S",
+    "\\b",
+    "\\B",
+    "(?",
+    "[:",
+)
+_REGEX_QUANTIFIER = re.compile(r"\{\d+(?:,\d*)?\}")
+_REGEX_NUMERIC_ESCAPE = re.compile(r"\\[0-9]")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_regex(regex: str) -> re.Pattern:
+    return re.compile(regex)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_arrow_compatible_regex(regex: str) -> bool:
+    """Whether or not "pyarrow.compute" regex kernels search for "regex" exactly as Python "re.search()" does."""
+    if not pa:
+        return False
+
+    # Braces, other than those of bounded repetition quantifiers, are literal in Python "re", but not in RE2.
+    regex_without_quantifiers: str = _REGEX_QUANTIFIER.sub("", regex)
+    if (
+        any(token in regex for token in _ARROW_INCOMPATIBLE_REGEX_TOKENS)
+        or _REGEX_NUMERIC_ESCAPE.search(regex)
+        or "{" in regex_without_quantifiers
+        or "}" in regex_without_quantifiers
+    ):
+        return False
+
+    try:
+        pc.match_substring_regex(pa.array([""], type=pa.string()), pattern=regex)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return False
+
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _combine_regex_list(regex_list: Tuple[str, ...]) -> Optional[str]:
+    """Combines regexes into one alternation, which matches wherever any of them does (None if they cannot be combined,
+    e.g., because group numbers of backreferences would change, or because of inline flags).
+    """
+    if len(regex_list) == 1:
+        return regex_list[0]
+
+    if any(
+        _REGEX_NUMERIC_ESCAPE.search(regex) or "(?" in regex for regex in regex_list
+    ):
+        return None
+
+    combined_regex: str = "|".join(f"(?:{regex})" for regex in regex_list)
+    try:
+        _compile_regex(combined_regex)
+    except re.error:
+        return None
+
+    return combined_regex
+
+
+class PandasColumnRegexMatcher:
+    """Searches values of pandas Series of column, as strings, for regular expressions (as "Series.str.contains()").
+
+    Values are converted to strings at most once (and only if they are not all strings already) for all regexes.  A
+    regex that means the same in RE2 as in Python "re" is searched for by "pyarrow.compute" kernel (if pyarrow is
+    installed); any other regex is searched for by compiled Python regex, once per distinct value.  Compiled regexes
+    are cached, so that they are reused across metrics, chunks, and Batches.
+
+    Args:
+        column: values to search
+    """
+
+    def __init__(self, column: pd.Series) -> None:
+        self._column = column
+        self._values: Optional[npt.NDArray] = None
+        self._arrow_values: Optional[pa.Array] = None
+        self._factorized_values: Optional[Tuple[npt.NDArray, npt.NDArray]] = None
+
+    def search(self, regex: str) -> pd.Series:
+        """Returns boolean Series, which is True for values, in which "regex" is found."""
+        return pd.Series(self._search(regex=regex), index=self._column.index)
+
+    def search_any(self, regex_list: Sequence[str]) -> pd.Series:
+        """Returns boolean Series, which is True for values, in which any of regexes is found (in one pass, if they can
+        be combined into one alternation)."""
+        if len(regex_list) == 0:
+            raise ValueError("At least one regex must be supplied in the regex_list.")
+
+        combined_regex: Optional[str] = _combine_regex_list(tuple(regex_list))
+        if combined_regex is not None:
+            return self.search(regex=combined_regex)
+
+        return pd.Series(
+            np.logical_or.reduce([self._search(regex=regex) for regex in regex_list]),
+            index=self._column.index,
+        )
+
+    def search_all(self, regex_list: Sequence[str]) -> pd.Series:
+        """Returns boolean Series, which is True for values, in which every one of regexes is found."""
+        if len(regex_list) == 0:
+            raise ValueError("At least one regex must be supplied in the regex_list.")
+
+        return pd.Series(
+            np.logical_and.reduce([self._search(regex=regex) for regex in regex_list]),
+            index=self._column.index,
+        )
+
+    def _search(self, regex: str) -> npt.NDArray[np.bool_]:
+        compiled_regex: re.Pattern = _compile_regex(regex)
+
+        if _is_arrow_compatible_regex(regex):
+            if self._arrow_values is None:
+                self._arrow_values = pa.array(self._get_values(), type=pa.string())
+
+            return pc.match_substring_regex(self._arrow_values, pattern=regex).to_numpy(
+                zero_copy_only=False
+            )
+
+        if self._factorized_values is None:
+            self._factorized_values = pd.factorize(self._get_values())
+
+        codes, distinct_values = self._factorized_values
+        distinct_matches: npt.NDArray[np.bool_] = np.fromiter(
+            (compiled_regex.search(value) is not None for value in distinct_values),
+            dtype=np.bool_,
+            count=len(distinct_values),
+        )
+        return distinct_matches[codes]
+
+    def _get_values(self) -> npt.NDArray:
+        if self._values is None:
+            column: pd.Series = self._column
+            if pd.api.types.infer_dtype(column, skipna=False) != "string":
+                column = column.astype(str)
+
+            self._values = column.to_numpy(dtype=object)
+
+        return self._values
+
+
 def get_dialect_like_pattern_expression(  # noqa: C901, PLR0912
     column, dialect, like_pattern, positive=True
 ):
@@ -1253,6 +1439,26 @@ def get_sqlalchemy_source_table_and_schema(
         return engine.batch_manager.active_batch_data.selectable
 
 
+def get_pandas_unexpected_records(
+    records: PandasRecordsT,
+    boolean_mapped_unexpected_values: pd.Series,
+    nonnull_values: Optional[pd.Series] = None,
+) -> PandasRecordsT:
+    """Selects records (DataFrame or column), flagged by unexpected condition of map metric.
+
+    Condition evaluated with "filter_column_isnull" spans only records, whose column values ("nonnull_values") are not
+    NULL; records are narrowed down to those first, unless condition already spans all of them (e.g., when evaluated by
+    "PandasExecutionEngine" with "fuse_map_conditions", or when there are no NULL values), which avoids copying them.
+    """
+    if nonnull_values is not None and not (
+        len(boolean_mapped_unexpected_values.index) == len(records.index)
+        and boolean_mapped_unexpected_values.index.equals(records.index)
+    ):
+        records = records[nonnull_values.notnull()]
+
+    return records[boolean_mapped_unexpected_values]
+
+
 def get_unexpected_indices_for_multiple_pandas_named_indices(
     domain_records_df: pd.DataFrame,
     unexpected_index_column_names: List[str],
@@ -1381,7 +1587,7 @@ def compute_unexpected_pandas_indices(
     result_format: Dict[str, Any],
     execution_engine: PandasExecutionEngine,
     metrics: Dict[str, Any],
-) -> List[int] | List[Dict[str, Any]]:
+) -> List[int] | List[Dict[str, Any]] | ColumnarUnexpectedResults:
     """
     Helper method to compute unexpected_index_list for PandasExecutionEngine. Handles logic needed for named indices.
 
@@ -1395,8 +1601,17 @@ def compute_unexpected_pandas_indices(
 
     Returns:
         list of unexpected_index_list values. It can either be a list of dicts or a list of numbers (if using default index).
+        If columnar unexpected results are requested in `result_format`, ColumnarUnexpectedResults are returned instead.
 
     """
+    if use_columnar_unexpected_results(result_format=result_format):
+        return _compute_columnar_unexpected_pandas_indices(
+            domain_records_df=domain_records_df,
+            expectation_domain_column_list=expectation_domain_column_list,
+            result_format=result_format,
+            metrics=metrics,
+        )
+
     unexpected_index_column_names: List[str]
     unexpected_index_list: List[Dict[str, Any]]
     exclude_unexpected_values: bool = result_format.get(
@@ -1477,3 +1692,56 @@ def compute_unexpected_pandas_indices(
         unexpected_index_list = list(domain_records_df.index)
 
     return unexpected_index_list
+
+
+def _compute_columnar_unexpected_pandas_indices(
+    domain_records_df: pd.DataFrame,
+    expectation_domain_column_list: List[str],
+    result_format: Dict[str, Any],
+    metrics: Dict[str, Any],
+) -> ColumnarUnexpectedResults:
+    """
+    Columnar counterpart of "compute_unexpected_pandas_indices()": copies whole columns of unexpected records, rather
+    than building dictionary for every unexpected row.
+    """
+    index_names: List[str] = [
+        index_name
+        for index_name in domain_records_df.index.names
+        if index_name is not None
+    ]
+    index_columns: Dict[str, Any] = {}
+    if index_names:
+        unexpected_index_column_names: List[str] = result_format.get(
+            "unexpected_index_column_names", index_names
+        )
+        for column_name in unexpected_index_column_names:
+            if column_name not in index_names:
+                raise gx_exceptions.MetricResolutionError(
+                    message=f"Error: The column {column_name} does not exist in the named indices. "
+                    f"Please check your configuration.",
+                    failed_metrics=["unexpected_index_list"],
+                )
+
+            index_columns[column_name] = domain_records_df.index.get_level_values(
+                column_name
+            )
+    elif result_format.get("unexpected_index_column_names"):
+        for column_name in result_format["unexpected_index_column_names"]:
+            column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
+                column_names=column_name,
+                batch_columns_list=metrics["table.columns"],
+                error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',
+            )
+            index_columns[column_name] = domain_records_df[column_name]
+    else:
+        return ColumnarUnexpectedResults(
+            columns={FLAT_COLUMN_NAME: domain_records_df.index}, flat=True
+        )
+
+    columns: Dict[str, Any] = {}
+    if not result_format.get("exclude_unexpected_values", False):
+        for domain_column_name in expectation_domain_column_list:
+            columns[domain_column_name] = domain_records_df[domain_column_name]
+
+    columns.update(index_columns)
+    return ColumnarUnexpectedResults(columns=columns)
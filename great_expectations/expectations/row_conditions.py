@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from string import punctuation
 from typing import TYPE_CHECKING
 
+from dateutil.parser import parse
 from pyparsing import (
     CaselessLiteral,
     Combine,
@@ -19,6 +20,8 @@ from pyparsing import (
 )
 
 import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.polars import polars as pl
+from great_expectations.compatibility.pyarrow import compute as pc
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
@@ -26,7 +29,7 @@ from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.types import SerializableDictDot
 
 if TYPE_CHECKING:
-    from great_expectations.compatibility import pyspark, sqlalchemy
+    from great_expectations.compatibility import pyarrow, pyspark, sqlalchemy
 
 
 def _set_notnull(s, l, t) -> None:  # noqa: E741 # ambiguous name `l`
@@ -161,6 +164,52 @@ def parse_condition_to_spark(  # type: ignore[return] # return or raise exists f
         raise ConditionParserError(f"unrecognized column condition: {row_condition}")
 
 
+def parse_condition_to_arrow(
+    row_condition: str,
+) -> pyarrow.compute.Expression:
+    parsed = _parse_great_expectations_condition(row_condition)
+    column = pc.field(parsed["column"])
+    if "date" in parsed:
+        return generate_condition_by_operator(
+            column, parsed["op"], parse(parsed["condition_value"]).date()
+        )
+    elif "condition_value" in parsed:
+        return generate_condition_by_operator(
+            column, parsed["op"], parsed["condition_value"]
+        )
+    elif "fnumber" in parsed:
+        number_value = parsed["fnumber"]
+        num = int(number_value) if number_value.isdigit() else float(number_value)
+        return generate_condition_by_operator(column, parsed["op"], num)
+    elif "notnull" in parsed and parsed["notnull"] is True:
+        return column.is_valid()
+    else:
+        raise ConditionParserError(f"unrecognized column condition: {row_condition}")
+
+
+def parse_condition_to_polars(
+    row_condition: str,
+) -> pl.Expr:
+    parsed = _parse_great_expectations_condition(row_condition)
+    column = pl.col(parsed["column"])
+    if "date" in parsed:
+        return generate_condition_by_operator(
+            column, parsed["op"], parse(parsed["condition_value"]).date()
+        )
+    elif "condition_value" in parsed:
+        return generate_condition_by_operator(
+            column, parsed["op"], parsed["condition_value"]
+        )
+    elif "fnumber" in parsed:
+        number_value = parsed["fnumber"]
+        num = int(number_value) if number_value.isdigit() else float(number_value)
+        return generate_condition_by_operator(column, parsed["op"], num)
+    elif "notnull" in parsed and parsed["notnull"] is True:
+        return column.is_not_null()
+    else:
+        raise ConditionParserError(f"unrecognized column condition: {row_condition}")
+
+
 def generate_condition_by_operator(column, op, value):
     operators = {
         "==": operator.eq,
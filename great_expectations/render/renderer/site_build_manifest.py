@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class SiteBuildManifest:
+    """Records, for each page of Data Docs site, hash of content of resource it was rendered from.
+
+    "SiteBuilder" (with "incremental" enabled) persists manifest alongside site pages; on subsequent builds, only
+    resources, whose content (or whose section's renderer configuration) changed, are rendered again.  Information,
+    which site index page shows for each resource (e.g., success of validation result), is recorded as well, so that
+    index page is updated without reading every resource from its source store.
+
+    Args:
+        manifest_dict: previously persisted manifest (as returned by "to_json_dict()"); empty manifest, if omitted.
+    """
+
+    VERSION = 1
+
+    def __init__(self, manifest_dict: Optional[dict] = None) -> None:
+        if manifest_dict is None or manifest_dict.get("version") != self.VERSION:
+            manifest_dict = {}
+
+        self._sections: Dict[str, dict] = manifest_dict.get("sections", {})
+        self._static_assets_fingerprint: Optional[str] = manifest_dict.get(
+            "static_assets_fingerprint"
+        )
+
+    @classmethod
+    def from_json(cls, manifest_json: Optional[Union[str, bytes]]) -> SiteBuildManifest:
+        """Loads manifest from its JSON representation (invalid or absent manifest yields empty one)."""
+        if not manifest_json:
+            return cls()
+
+        try:
+            return cls(manifest_dict=json.loads(manifest_json))
+        except (TypeError, ValueError):
+            logger.warning(
+                "Data Docs build manifest could not be parsed; all pages will be rendered."
+            )
+            return cls()
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_json_dict(), sort_keys=True)
+
+    def to_json_dict(self) -> dict:
+        return {
+            "version": self.VERSION,
+            "sections": self._sections,
+            "static_assets_fingerprint": self._static_assets_fingerprint,
+        }
+
+    @property
+    def static_assets_fingerprint(self) -> Optional[str]:
+        """Fingerprint (e.g., version of Great Expectations) of static assets, last copied to site."""
+        return self._static_assets_fingerprint
+
+    @static_assets_fingerprint.setter
+    def static_assets_fingerprint(self, value: Optional[str]) -> None:
+        self._static_assets_fingerprint = value
+
+    @staticmethod
+    def hash_content(serialized_value: Union[str, bytes, dict]) -> str:
+        """Returns hash of resource content, as retrieved from its store backend."""
+        if isinstance(serialized_value, dict):
+            serialized_value = json.dumps(serialized_value, sort_keys=True, default=str)
+
+        if isinstance(serialized_value, str):
+            serialized_value = serialized_value.encode("utf-8")
+
+        return hashlib.sha256(serialized_value).hexdigest()
+
+    def has_section(self, section_name: str) -> bool:
+        """Returns True if pages of section were built (and recorded) before."""
+        return section_name in self._sections
+
+    def set_section_fingerprint(self, section_name: str, fingerprint: str) -> bool:
+        """Records fingerprint of configuration, rendering section; entries of section are dropped if it changed.
+
+        Returns:
+            True if section was recorded before with same fingerprint (i.e., its recorded pages are current).
+        """
+        section: Optional[dict] = self._sections.get(section_name)
+        if section is not None and section.get("fingerprint") == fingerprint:
+            return True
+
+        self._sections[section_name] = {"fingerprint": fingerprint, "resources": {}}
+        return False
+
+    def get_resource_keys(self, section_name: str) -> List[Tuple[str, ...]]:
+        """Returns keys (as tuples) of resources, whose pages are recorded for section."""
+        return [
+            tuple(entry["key"])
+            for entry in self._get_section_resources(section_name=section_name).values()
+        ]
+
+    def get_content_hash(
+        self, section_name: str, resource_key: Tuple[str, ...]
+    ) -> Optional[str]:
+        entry: Optional[dict] = self._get_section_resources(
+            section_name=section_name
+        ).get(self._build_entry_id(resource_key=resource_key))
+        return None if entry is None else entry["content_hash"]
+
+    def get_index_info(
+        self, section_name: str, resource_key: Tuple[str, ...]
+    ) -> Optional[dict]:
+        """Returns information about resource, shown by site index page (None, if resource is not recorded)."""
+        entry: Optional[dict] = self._get_section_resources(
+            section_name=section_name
+        ).get(self._build_entry_id(resource_key=resource_key))
+        return None if entry is None else entry["index_info"]
+
+    def set_resource(
+        self,
+        section_name: str,
+        resource_key: Tuple[str, ...],
+        content_hash: str,
+        index_info: Optional[dict] = None,
+    ) -> None:
+        """Records that page of resource was rendered from content with supplied hash."""
+        self._sections.setdefault(section_name, {"fingerprint": None, "resources": {}})
+        self._get_section_resources(section_name=section_name)[
+            self._build_entry_id(resource_key=resource_key)
+        ] = {
+            "key": list(resource_key),
+            "content_hash": content_hash,
+            "index_info": index_info or {},
+        }
+
+    def remove_resource(self, section_name: str, resource_key: Tuple[str, ...]) -> None:
+        self._get_section_resources(section_name=section_name).pop(
+            self._build_entry_id(resource_key=resource_key), None
+        )
+
+    def _get_section_resources(self, section_name: str) -> dict:
+        return self._sections.get(section_name, {}).get("resources", {})
+
+    @staticmethod
+    def _build_entry_id(resource_key: Tuple[str, ...]) -> str:
+        return json.dumps(list(resource_key))
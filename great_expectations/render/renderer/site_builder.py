@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import heapq
 import logging
 import os
 import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
@@ -23,10 +26,14 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.render.renderer.site_build_manifest import SiteBuildManifest
 from great_expectations.render.util import resource_key_passes_run_name_filter
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 FALSEY_YAML_STRINGS = [
     "0",
     "None",
@@ -112,9 +119,16 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Setting ``incremental: true`` persists a build manifest (content hash of every rendered resource) alongside the
+    site; subsequent builds then render only new or changed resources, and update the index page from the manifest
+    (rather than by reading every validation result).
+
+    Setting ``max_rendering_workers`` (1 by default) to a larger number renders pages (and writes them to the site's
+    store backend) on that many threads; pages, index, and build manifest are the same as those of serial build.
     """
 
-    def __init__(  # noqa: C901, PLR0912, PLR0913
+    def __init__(  # noqa: C901, PLR0912, PLR0913, PLR0915
         self,
         data_context,
         store_backend,
@@ -126,12 +140,20 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental=False,
+        max_rendering_workers=1,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental = incremental
+        if not isinstance(max_rendering_workers, int) or max_rendering_workers < 1:
+            raise exceptions.InvalidConfigError(
+                f'"max_rendering_workers" must be a positive integer (got {max_rendering_workers}).'
+            )
+        self.max_rendering_workers = max_rendering_workers
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -245,6 +267,7 @@ class SiteBuilder:
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
                     "cloud_mode": self.cloud_mode,
+                    "max_rendering_workers": self.max_rendering_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -311,18 +334,50 @@ class SiteBuilder:
         :return:
         """
 
-        # copy static assets
+        build_manifest: Optional[SiteBuildManifest] = None
+        is_first_incremental_build = False
+        if self.incremental and not self.cloud_mode:
+            build_manifest = SiteBuildManifest.from_json(
+                self.target_store.read_build_manifest()
+            )
+            is_first_incremental_build = not any(
+                build_manifest.has_section(section_name=section_name)
+                for section_name in self.site_section_builders
+            )
+
         for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            if build_manifest is None:
+                site_section_builder.build(resource_identifiers=resource_identifiers)
+            else:
+                site_section_builder.build(
+                    resource_identifiers=resource_identifiers,
+                    build_manifest=build_manifest,
+                )
 
         # GX Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
         if self.cloud_mode:
             return
 
-        self.target_store.copy_static_assets()
+        # copy static assets
+        if build_manifest is None:
+            self.target_store.copy_static_assets()
+        elif build_manifest.static_assets_fingerprint != ge_version:
+            self.target_store.copy_static_assets()
+            build_manifest.static_assets_fingerprint = ge_version
+
+        index_links_dict: Optional[OrderedDict]
+        if build_manifest is None or is_first_incremental_build:
+            # Pages, which were rendered before manifest was recorded, are indexed (or cleaned) from target store.
+            _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        else:
+            _, index_links_dict = self.site_index_builder.build(
+                build_index=build_index, build_manifest=build_manifest
+            )
+
+        if build_manifest is not None:
+            self.target_store.write_build_manifest(build_manifest.to_json())
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -345,6 +400,17 @@ class SiteBuilder:
         )
 
 
+def _map_with_workers(
+    fn: Callable[[T], R], items: List[T], max_workers: int
+) -> List[R]:
+    """Applies "fn" to every item on up to "max_workers" threads; results are returned in order of "items"."""
+    if max_workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
 class DefaultSiteSectionBuilder:
     def __init__(  # noqa: PLR0913
         self,
@@ -363,6 +429,7 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_rendering_workers=1,
         **kwargs,
     ) -> None:
         self.name = name
@@ -373,6 +440,7 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_rendering_workers = max_rendering_workers
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -419,98 +487,248 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: PLR0912
-        source_store_keys = self.source_store.list_keys()
-        if self.name == "validations" and self.validation_results_limit:
-            source_store_keys = sorted(
-                source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
-            )[: self.validation_results_limit]
-
-        for resource_key in source_store_keys:
-            # if no resource_identifiers are passed, the section
-            # builder will build
-            # a page for every key in its source store.
-            # if the caller did pass resource_identifiers, the section builder
-            # will build pages only for the specified resources
-            if resource_identifiers and resource_key not in resource_identifiers:
+    def build(
+        self,
+        resource_identifiers=None,
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> None:
+        """Renders and writes page of every resource (or of every one of "resource_identifiers") of source store.
+
+        If "build_manifest" is supplied, resources whose content did not change since they were last rendered are
+        skipped, and resources that were rendered are recorded in "build_manifest".
+
+        Pages are built by up to "max_rendering_workers" workers; the build manifest is updated in order of source
+        store keys once all pages are written, so that result does not depend on order in which workers finish.
+        """
+        if build_manifest is not None and not build_manifest.set_section_fingerprint(
+            section_name=self.name, fingerprint=self._get_rendering_fingerprint()
+        ):
+            # Recorded pages (if any) were rendered with other configuration; all of them are rendered again.
+            resource_identifiers = None
+
+        source_store_keys = self._get_source_store_keys(
+            resource_identifiers=resource_identifiers, build_manifest=build_manifest
+        )
+
+        built_pages: List[Optional[Tuple[Optional[str], dict]]] = _map_with_workers(
+            lambda resource_key: self._build_page(
+                resource_key=resource_key,
+                resource_identifiers=resource_identifiers,
+                build_manifest=build_manifest,
+            ),
+            source_store_keys,
+            max_workers=self.max_rendering_workers,
+        )
+        if build_manifest is None:
+            return
+
+        for resource_key, built_page in zip(source_store_keys, built_pages):
+            if built_page is None:
                 continue
 
-            if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
-                if not resource_key_passes_run_name_filter(
-                    resource_key, self.run_name_filter
-                ):
-                    continue
-            try:
+            content_hash, index_info = built_page
+            build_manifest.set_resource(
+                section_name=self.name,
+                resource_key=resource_key.to_tuple(),
+                content_hash=content_hash,
+                index_info=index_info,
+            )
+
+    def _build_page(  # noqa: PLR0912
+        self,
+        resource_key,
+        resource_identifiers=None,
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> Optional[Tuple[Optional[str], dict]]:
+        """Renders and writes page of resource.
+
+        Returns:
+            Content hash and index information of resource, if its page was written (None, if it was skipped).
+        """
+        # if no resource_identifiers are passed, the section
+        # builder will build
+        # a page for every key in its source store.
+        # if the caller did pass resource_identifiers, the section builder
+        # will build pages only for the specified resources
+        if resource_identifiers and resource_key not in resource_identifiers:
+            return None
+
+        if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
+            if not resource_key_passes_run_name_filter(
+                resource_key, self.run_name_filter
+            ):
+                return None
+        content_hash: Optional[str] = None
+        try:
+            if build_manifest is None:
                 resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(
-                        **resource, data_context=self.data_context
-                    )
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+            else:
+                serialized_resource = self.source_store.store_backend.get(
+                    self.source_store.key_to_tuple(resource_key)
+                )
+                content_hash = SiteBuildManifest.hash_content(serialized_resource)
+                if content_hash == build_manifest.get_content_hash(
+                    section_name=self.name, resource_key=resource_key.to_tuple()
+                ):
+                    return None
+
+                resource = (
+                    self.source_store.deserialize(serialized_resource)
+                    if serialized_resource
+                    else None
                 )
-                continue
 
             if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.expectation_suite_name
+                resource = ExpectationSuite(**resource, data_context=self.data_context)
+        except exceptions.InvalidKeyError:
+            logger.warning(
+                f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
+            )
+            return None
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.expectation_suite_name
+            logger.debug(
+                f"        Rendering expectation suite {expectation_suite_name}"
+            )
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = (
+                resource_key.expectation_suite_identifier.expectation_suite_name
+            )
+            if self.name == "profiling":
                 logger.debug(
-                    f"        Rendering expectation suite {expectation_suite_name}"
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
                 )
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = (
-                    resource_key.expectation_suite_identifier.expectation_suite_name
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
                 )
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"
-                    )
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(
-                            resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
-                        ),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(
+                        resource_type=GXCloudRESTResource.RENDERED_DATA_DOC
+                    ),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+
+            return content_hash, self._get_index_info(
+                resource_key=resource_key, resource=resource
+            )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  '
-                    f'Traceback: "{exception_traceback}".'
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)
+            return None
+
+    def _get_source_store_keys(
+        self,
+        resource_identifiers=None,
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> list:
+        if build_manifest is not None and resource_identifiers:
+            # Pages of all other resources are up to date; there is no need to list source store.
+            source_store_keys = [
+                resource_identifier
+                for resource_identifier in resource_identifiers
+                if isinstance(resource_identifier, self.source_store.key_class)
+            ]
+        else:
+            source_store_keys = self.source_store.list_keys()
+            if build_manifest is not None:
+                self._remove_missing_resources(
+                    build_manifest=build_manifest, source_store_keys=source_store_keys
                 )
-                logger.error(exception_message)
+
+        if self.name == "validations" and self.validation_results_limit:
+            source_store_keys = heapq.nlargest(
+                self.validation_results_limit,
+                source_store_keys,
+                key=lambda x: x.run_id.run_time,
+            )
+
+        return source_store_keys
+
+    def _get_rendering_fingerprint(self) -> str:
+        """Identifies configuration, which determines rendered pages (pages rendered with other configuration are stale)."""
+        return "|".join(
+            str(part)
+            for part in (
+                ge_version,
+                type(self.renderer_class).__module__,
+                type(self.renderer_class).__qualname__,
+                type(self.view_class).__module__,
+                type(self.view_class).__qualname__,
+                getattr(self.view_class, "custom_styles_directory", None),
+                getattr(self.view_class, "custom_views_directory", None),
+                self.data_context_id,
+                self.show_how_to_buttons,
+            )
+        )
+
+    def _remove_missing_resources(
+        self, build_manifest: SiteBuildManifest, source_store_keys: list
+    ) -> None:
+        """Removes pages (and manifest entries) of resources, which are no longer in source store."""
+        source_store_key_tuples = {
+            source_store_key.to_tuple() for source_store_key in source_store_keys
+        }
+        resource_key: Tuple[str, ...]
+        for resource_key in build_manifest.get_resource_keys(section_name=self.name):
+            if resource_key in source_store_key_tuples:
+                continue
+
+            build_manifest.remove_resource(
+                section_name=self.name, resource_key=resource_key
+            )
+            target_store_backend = self.target_store.store_backends[
+                self.source_store.key_class
+            ]
+            if target_store_backend.has_key(resource_key):
+                target_store_backend.remove_key(resource_key)
+
+    @staticmethod
+    def _get_index_info(resource_key: Any, resource: Any) -> dict:
+        """Returns information about resource, shown by site index page (see "DefaultSiteIndexBuilder")."""
+        if not isinstance(resource_key, ValidationResultIdentifier):
+            return {}
+
+        return convert_to_json_serializable(
+            data={
+                "validation_success": resource.success,
+                "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+                "batch_spec": resource.meta.get("batch_spec", {}),
+            }
+        )
 
 
 class DefaultSiteIndexBuilder:
@@ -734,12 +952,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param build_manifest: if supplied, pages and their index information are taken from it (rather than from
+        listing of target store and reading of every validation result); section builders keep it up to date
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -755,17 +978,19 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
-        self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
+        self._add_expectations_to_index_links(
+            index_links_dict, skip_and_clean_missing, build_manifest
+        )
         validation_and_profiling_result_site_keys = (
             self._build_validation_and_profiling_result_site_keys(
-                skip_and_clean_missing
+                skip_and_clean_missing, build_manifest
             )
         )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, build_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, build_manifest
         )
 
         viewable_content = ""
@@ -791,10 +1016,29 @@ diagnose and repair the underlying issue.  Detailed information follows:
         return self.target_store.write_index_page(viewable_content), index_links_dict
 
     def _add_expectations_to_index_links(
-        self, index_links_dict: OrderedDict, skip_and_clean_missing: bool
+        self,
+        index_links_dict: OrderedDict,
+        skip_and_clean_missing: bool,
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> None:
         expectations = self.site_section_builders_config.get("expectations", "None")
-        if expectations and expectations not in FALSEY_YAML_STRINGS:
+        if (
+            expectations
+            and expectations not in FALSEY_YAML_STRINGS
+            and build_manifest is not None
+        ):
+            # Pages of suites, which are missing from source store, were removed by section builder.
+            for expectation_suite_tuple in sorted(
+                build_manifest.get_resource_keys(section_name="expectations")
+            ):
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=ExpectationSuiteIdentifier.from_tuple(
+                        expectation_suite_tuple
+                    ).expectation_suite_name,
+                    section_name="expectations",
+                )
+        elif expectations and expectations not in FALSEY_YAML_STRINGS:
             expectation_suite_source_keys = self.data_context.stores[
                 self.site_section_builders_config["expectations"].get(
                     "source_store_name"
@@ -825,12 +1069,23 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 )
 
     def _build_validation_and_profiling_result_site_keys(
-        self, skip_and_clean_missing: bool
+        self,
+        skip_and_clean_missing: bool,
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> List[ValidationResultIdentifier]:
         validation_and_profiling_result_site_keys = []
         validations = self.site_section_builders_config.get("validations", "None")
         profiling = self.site_section_builders_config.get("profiling", "None")
-        if (validations and validations not in FALSEY_YAML_STRINGS) or (
+        if build_manifest is not None:
+            # Pages of results, which are missing from source store, were removed by section builders.
+            validation_and_profiling_result_site_keys = [
+                ValidationResultIdentifier.from_tuple(validation_result_tuple)
+                for validation_result_tuple in sorted(
+                    set(build_manifest.get_resource_keys(section_name="validations"))
+                    | set(build_manifest.get_resource_keys(section_name="profiling"))
+                )
+            ]
+        elif (validations and validations not in FALSEY_YAML_STRINGS) or (
             profiling and profiling not in FALSEY_YAML_STRINGS
         ):
             source_store = (
@@ -873,6 +1128,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -886,39 +1142,41 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, profiling_run_name_filter
                 )
             ]
-            for profiling_result_key in profiling_result_site_keys:
-                try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
-                    )
-
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
-                    self.add_resource_info_to_index_links_dict(
-                        index_links_dict=index_links_dict,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
-                        section_name="profiling",
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        run_id=profiling_result_key.run_id,
-                        run_time=profiling_result_key.run_id.run_time,
-                        run_name=profiling_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
-                    )
-                except Exception:
+            index_infos = self._get_validation_result_index_infos(
+                section_name="profiling",
+                validation_result_keys=profiling_result_site_keys,
+                build_manifest=build_manifest,
+            )
+            for profiling_result_key, index_info in zip(
+                profiling_result_site_keys, index_infos
+            ):
+                if index_info is None:
                     error_msg = f"Profiling result not found: {profiling_result_key.to_tuple()!s:s} - skipping"
                     logger.warning(error_msg)
+                    continue
+
+                batch_kwargs = index_info["batch_kwargs"]
+                batch_spec = index_info["batch_spec"]
+
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=profiling_result_key.expectation_suite_identifier.expectation_suite_name,
+                    section_name="profiling",
+                    batch_identifier=profiling_result_key.batch_identifier,
+                    run_id=profiling_result_key.run_id,
+                    run_time=profiling_result_key.run_id.run_time,
+                    run_name=profiling_result_key.run_id.run_name,
+                    asset_name=batch_kwargs.get("data_asset_name")
+                    or batch_spec.get("data_asset_name"),
+                    batch_kwargs=batch_kwargs,
+                    batch_spec=batch_spec,
+                )
 
     def _add_validations_to_index_links(
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        build_manifest: Optional[SiteBuildManifest] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -932,45 +1190,100 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     validation_result_key, validations_run_name_filter
                 )
             ]
-            validation_result_site_keys = sorted(
-                validation_result_site_keys,
-                key=lambda x: x.run_id.run_time,
-                reverse=True,
-            )
             if self.validation_results_limit:
-                validation_result_site_keys = validation_result_site_keys[
-                    : self.validation_results_limit
-                ]
-            for validation_result_key in validation_result_site_keys:
-                try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
-                    )
-
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
-
-                    self.add_resource_info_to_index_links_dict(
-                        index_links_dict=index_links_dict,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
-                        section_name="validations",
-                        batch_identifier=validation_result_key.batch_identifier,
-                        run_id=validation_result_key.run_id,
-                        validation_success=validation_success,
-                        run_time=validation_result_key.run_id.run_time,
-                        run_name=validation_result_key.run_id.run_name,
-                        asset_name=batch_kwargs.get("data_asset_name")
-                        or batch_spec.get("data_asset_name"),
-                        batch_kwargs=batch_kwargs,
-                        batch_spec=batch_spec,
-                    )
-                except Exception:
+                validation_result_site_keys = heapq.nlargest(
+                    self.validation_results_limit,
+                    validation_result_site_keys,
+                    key=lambda x: x.run_id.run_time,
+                )
+            else:
+                validation_result_site_keys = sorted(
+                    validation_result_site_keys,
+                    key=lambda x: x.run_id.run_time,
+                    reverse=True,
+                )
+            index_infos = self._get_validation_result_index_infos(
+                section_name="validations",
+                validation_result_keys=validation_result_site_keys,
+                build_manifest=build_manifest,
+            )
+            for validation_result_key, index_info in zip(
+                validation_result_site_keys, index_infos
+            ):
+                if index_info is None:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"
                     logger.warning(error_msg)
+                    continue
+
+                validation_success = index_info["validation_success"]
+                batch_kwargs = index_info["batch_kwargs"]
+                batch_spec = index_info["batch_spec"]
+
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                    section_name="validations",
+                    batch_identifier=validation_result_key.batch_identifier,
+                    run_id=validation_result_key.run_id,
+                    validation_success=validation_success,
+                    run_time=validation_result_key.run_id.run_time,
+                    run_name=validation_result_key.run_id.run_name,
+                    asset_name=batch_kwargs.get("data_asset_name")
+                    or batch_spec.get("data_asset_name"),
+                    batch_kwargs=batch_kwargs,
+                    batch_spec=batch_spec,
+                )
+
+    def _get_validation_result_index_infos(
+        self,
+        section_name: str,
+        validation_result_keys: List[ValidationResultIdentifier],
+        build_manifest: Optional[SiteBuildManifest] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Returns index information of validation results (None for those that could not be retrieved), in order.
+
+        Validation results, which are not recorded in build manifest, are read from their source store with one bulk
+        call (which cloud store backends serve concurrently).
+        """
+        index_infos: List[Optional[Dict[str, Any]]] = [
+            build_manifest.get_index_info(
+                section_name=section_name,
+                resource_key=validation_result_key.to_tuple(),
+            )
+            or None
+            if build_manifest is not None
+            else None
+            for validation_result_key in validation_result_keys
+        ]
+        unrecorded_indices: List[int] = [
+            idx for idx, index_info in enumerate(index_infos) if index_info is None
+        ]
+        if not unrecorded_indices:
+            return index_infos
+
+        validations_store_name: str = (
+            self.source_stores.get(section_name)
+            or self.data_context.validations_store_name
+        )
+        try:
+            validations: list = self.data_context.stores[
+                validations_store_name
+            ].get_many([validation_result_keys[idx] for idx in unrecorded_indices])
+        except Exception as e:
+            logger.warning(
+                f"Validation results could not be retrieved from {validations_store_name}: {e!s}"
+            )
+            return index_infos
+
+        for idx, validation in zip(unrecorded_indices, validations):
+            if validation:
+                index_infos[idx] = {
+                    "validation_success": validation.success,
+                    "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                    "batch_spec": validation.meta.get("batch_spec", {}),
+                }
+
+        return index_infos
 
 
 class CallToActionButton:
@@ -10,6 +10,9 @@ from typing import Any, Sequence
 import pandas as pd
 
 from great_expectations._docs_decorators import public_api
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+)
 from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
@@ -395,9 +398,11 @@ def _convert_unexpected_indices_to_df(
     domain_column_name_list: list[str]
     if unexpected_index_column_names:
         # if we have defined unexpected_index_column_names for ID/PK
-        unexpected_index_df: pd.DataFrame = pd.DataFrame(
-            unexpected_index_list, dtype="string"
-        )
+        unexpected_index_df: pd.DataFrame
+        if isinstance(unexpected_index_list, ColumnarUnexpectedResults):
+            unexpected_index_df = unexpected_index_list.to_pandas().astype("string")
+        else:
+            unexpected_index_df = pd.DataFrame(unexpected_index_list, dtype="string")
         unexpected_index_df = unexpected_index_df.fillna(value="null")
         first_unexpected_index = unexpected_index_list[0]
         if isinstance(first_unexpected_index, dict):
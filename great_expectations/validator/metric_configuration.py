@@ -5,7 +5,7 @@ from typing import Optional, Tuple
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.core.domain import Domain
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import convert_to_json_serializable
 
@@ -49,6 +49,8 @@ class MetricConfiguration:
 
         self._metric_dependencies: IDDict = IDDict({})
 
+        self._id: Optional[Tuple[str, str, str]] = None
+
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
 
@@ -75,6 +77,23 @@ class MetricConfiguration:
     def metric_value_kwargs_id(self) -> str:
         return self.metric_value_kwargs.to_id()
 
+    @property
+    def is_frozen(self) -> bool:
+        return self._id is not None
+
+    def freeze(self) -> MetricConfiguration:
+        """Makes "metric_domain_kwargs" and "metric_value_kwargs" immutable, so that "id" is computed only once.
+
+        Returns:
+            This "MetricConfiguration" object.
+        """
+        if self._id is None:
+            self._metric_domain_kwargs = FrozenIDDict(self._metric_domain_kwargs)
+            self._metric_value_kwargs = FrozenIDDict(self._metric_value_kwargs)
+            self._id = self._compute_id()
+
+        return self
+
     @property
     def metric_dependencies(self) -> IDDict:
         return self._metric_dependencies
@@ -153,6 +172,12 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
+        if self._id is not None:
+            return self._id
+
+        return self._compute_id()
+
+    def _compute_id(self) -> Tuple[str, str, str]:
         return (
             self.metric_name,
             self.metric_domain_kwargs_id,
@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     import pandas as pd
     from typing_extensions import TypeAlias
 
+    from great_expectations.data_context.types.base import ConcurrencyConfig
     from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ class MetricsCalculator:
         self,
         execution_engine: ExecutionEngine,
         show_progress_bars: bool = False,
+        concurrency: Optional[ConcurrencyConfig] = None,
     ) -> None:
         """
         MetricsCalculator accepts and processes metrics calculation requests.
@@ -40,9 +42,11 @@ class MetricsCalculator:
         Args:
             execution_engine: ExecutionEngine to perform metrics computation.
             show_progress_bars: Directive for whether or not to show progress bars.
+            concurrency: Concurrency config; if enabled, independent metrics are resolved concurrently.
         """
         self._execution_engine: ExecutionEngine = execution_engine
         self._show_progress_bars: bool = show_progress_bars
+        self._concurrency: Optional[ConcurrencyConfig] = concurrency
 
     @property
     def show_progress_bars(self) -> bool:
@@ -288,9 +292,15 @@ class MetricsCalculator:
             _MetricKey,
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ]
+        # Metrics persisted from earlier runs on identical Batch data (if durable metric cache is configured).
+        persisted_metrics: _MetricsDict = self._execution_engine.get_persisted_metrics(
+            metric_configurations=graph.metric_configurations
+        )
         resolved_metrics, aborted_metrics_info = graph.resolve(
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
             show_progress_bars=self._show_progress_bars,
+            resolved_metrics=persisted_metrics,
+            concurrency=self._concurrency,
         )
         return resolved_metrics, aborted_metrics_info
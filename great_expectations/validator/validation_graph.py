@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -18,12 +19,14 @@ from tqdm.auto import tqdm
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.async_executor import AsyncExecutor
+from great_expectations.core.id_dict import IDDict
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
-    from great_expectations.core import IDDict
+    from great_expectations.data_context.types.base import ConcurrencyConfig
     from great_expectations.execution_engine import ExecutionEngine
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
@@ -45,6 +48,14 @@ logging.captureWarnings(True)
 
 MAX_METRIC_COMPUTATION_RETRIES: int = 3
 
+# Domain keys, which select data elements within compute domain (engines bundle metrics differing only in these keys).
+_ACCESSOR_DOMAIN_KEYS: Tuple[str, ...] = (
+    "column",
+    "column_A",
+    "column_B",
+    "column_list",
+)
+
 
 class MetricEdge:
     def __init__(
@@ -72,6 +83,89 @@ class MetricEdge:
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class _MetricScheduler:
+    """Indexes metric dependencies of "ValidationGraph" edges once, then emits ready metrics incrementally.
+
+    Every schedulable metric (left vertex of some edge) keeps count of its dependencies that are not yet resolved (its
+    in-degree); when a metric is resolved, counts of its dependents are decremented, and those reaching zero become ready.
+    Each resolution therefore costs time proportional to the number of its dependents, rather than a scan of all edges.
+    """
+
+    def __init__(
+        self,
+        edges: List[MetricEdge],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> None:
+        self._vertices: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependent_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        edge: MetricEdge
+        left_id: _MetricKey
+        right_id: Optional[_MetricKey]
+        for edge in edges:
+            left_id = edge.left.id
+            right_id = None if edge.right is None else edge.right.id
+            if left_id not in self._vertices:
+                self._vertices[left_id] = edge.left
+                dependency_ids[left_id] = set()
+
+            if right_id is not None:
+                dependency_ids[left_id].add(right_id)
+                self._dependent_ids.setdefault(right_id, set()).add(left_id)
+
+        self._resolved_ids: Set[_MetricKey] = set(metrics.keys())
+        self._unresolved_dependency_counts: Dict[_MetricKey, int] = {}
+        self._ready_ids: Set[_MetricKey] = set()
+        self._needed_ids: Set[_MetricKey] = set()
+
+        metric_id: _MetricKey
+        for metric_id, metric_dependency_ids in dependency_ids.items():
+            if metric_id in self._resolved_ids:
+                continue
+
+            unresolved_dependency_count: int = len(
+                metric_dependency_ids - self._resolved_ids
+            )
+            self._unresolved_dependency_counts[metric_id] = unresolved_dependency_count
+            if unresolved_dependency_count == 0:
+                self._ready_ids.add(metric_id)
+            else:
+                self._needed_ids.add(metric_id)
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Unresolved metrics, all of whose dependencies are resolved."""
+        return {self._vertices[metric_id] for metric_id in self._ready_ids}
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Unresolved metrics, some of whose dependencies are unresolved."""
+        return {self._vertices[metric_id] for metric_id in self._needed_ids}
+
+    def mark_resolved(self, metric_ids: Iterable[_MetricKey]) -> None:
+        """Records supplied metrics as resolved, promoting dependents whose dependencies are now all resolved."""
+        metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for metric_id in metric_ids:
+            if metric_id in self._resolved_ids:
+                continue
+
+            self._resolved_ids.add(metric_id)
+            self._ready_ids.discard(metric_id)
+            self._needed_ids.discard(metric_id)
+            self._unresolved_dependency_counts.pop(metric_id, None)
+
+            for dependent_id in self._dependent_ids.get(metric_id, ()):
+                if dependent_id not in self._unresolved_dependency_counts:
+                    continue
+
+                self._unresolved_dependency_counts[dependent_id] -= 1
+                if self._unresolved_dependency_counts[dependent_id] == 0:
+                    self._needed_ids.discard(dependent_id)
+                    self._ready_ids.add(dependent_id)
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -130,6 +224,8 @@ class ValidationGraph:
         ) = self.set_metric_configuration_default_kwargs_if_absent(
             metric_configuration=metric_configuration
         )
+        # Metric kwargs are complete; freezing them allows "id" of vertex to be computed only once.
+        metric_configuration.freeze()
 
         metric_dependencies = metric_impl_klass.get_evaluation_dependencies(
             metric=metric_configuration,
@@ -187,12 +283,28 @@ class ValidationGraph:
         )
         return metric_impl_klass, metric_provider
 
-    def resolve(
+    @property
+    def metric_configurations(self) -> List[MetricConfiguration]:
+        """Returns distinct "MetricConfiguration" objects (vertices) of this "ValidationGraph" object."""
+        metric_configurations_by_id: Dict[_MetricKey, MetricConfiguration] = {}
+
+        edge: MetricEdge
+        vertex: Optional[MetricConfiguration]
+        for edge in self._edges:
+            for vertex in (edge.left, edge.right):
+                if vertex is not None and vertex.id not in metric_configurations_by_id:
+                    metric_configurations_by_id[vertex.id] = vertex
+
+        return list(metric_configurations_by_id.values())
+
+    def resolve(  # noqa: PLR0913
         self,
         runtime_configuration: Optional[dict] = None,
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
         show_progress_bars: bool = True,
+        resolved_metrics: Optional[Dict[_MetricKey, MetricValue]] = None,
+        concurrency: Optional[ConcurrencyConfig] = None,
     ) -> Tuple[
         Dict[_MetricKey, MetricValue],
         Dict[
@@ -200,7 +312,13 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ],
     ]:
-        resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+        """Resolves metrics of this graph; metrics in "resolved_metrics" (if supplied) are not recomputed, and
+        dependencies needed only by them are skipped.
+
+        If "concurrency" is enabled (and "ExecutionEngine" supports it), metrics that are ready for computation are
+        dispatched concurrently, one group per compute domain, with results merged in deterministic order.
+        """
+        resolved_metrics = dict(resolved_metrics) if resolved_metrics else {}
 
         # updates graph with aborted metrics
         aborted_metrics_info: Dict[
@@ -211,16 +329,18 @@ class ValidationGraph:
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
             show_progress_bars=show_progress_bars,
+            concurrency=concurrency,
         )
 
         return resolved_metrics, aborted_metrics_info
 
-    def _resolve(  # noqa: C901, PLR0912, PLR0915
+    def _resolve(  # noqa: C901, PLR0912, PLR0913, PLR0915
         self,
         metrics: Dict[_MetricKey, MetricValue],
         runtime_configuration: Optional[dict] = None,
         min_graph_edges_pbar_enable: int = 0,  # Set to low number (e.g., 3) to suppress progress bar for small graphs.
         show_progress_bars: bool = True,
+        concurrency: Optional[ConcurrencyConfig] = None,
     ) -> Dict[
         _MetricKey,
         Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
@@ -228,6 +348,12 @@ class ValidationGraph:
         if metrics is None:
             metrics = {}
 
+        execute_concurrently: bool = bool(
+            concurrency
+            and concurrency.enabled
+            and self._execution_engine.supports_concurrent_metric_resolution
+        )
+
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -252,9 +378,16 @@ class ValidationGraph:
 
         progress_bar: Optional[tqdm] = None
 
+        # Metric IDs may change while graph is being built (defaults are applied to dependencies as they are visited);
+        # hence, dependency index is built once here, when graph is complete, rather than incrementally in "add()".
+        scheduler = _MetricScheduler(edges=self.edges, metrics=metrics)
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics, needed_metrics = (
+                scheduler.ready_metrics,
+                scheduler.needed_metrics,
+            )
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -279,48 +412,89 @@ class ValidationGraph:
                 else:
                     computable_metrics.add(metric)
 
-            try:
-                # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+            computable_metric_groups: List[List[MetricConfiguration]]
+            if not computable_metrics:
+                computable_metric_groups = []
+            elif execute_concurrently:
+                computable_metric_groups = self._group_metrics_by_compute_domain(
+                    metrics=computable_metrics
+                )
+            else:
+                computable_metric_groups = [list(computable_metrics)]
+
+            # Results are gathered before being merged, so that concurrently executing groups observe identical state.
+            group_results: List[
+                Tuple[Optional[Dict[_MetricKey, MetricValue]], Optional[Exception]]
+            ]
+            with AsyncExecutor(
+                concurrency_config=concurrency,
+                max_workers=len(computable_metric_groups)
+                if execute_concurrently
+                else 1,
+            ) as async_executor:
+                async_results = [
+                    async_executor.submit(
+                        self._resolve_metrics_group,
+                        metrics_to_resolve=computable_metric_group,
+                        metrics=metrics,
                         runtime_configuration=runtime_configuration,
                     )
-                )
-                progress_bar.update(len(computable_metrics))
-                progress_bar.refresh()
-            except gx_exceptions.MetricResolutionError as err:
-                if catch_exceptions:
-                    exception_traceback = traceback.format_exc()
-                    exception_message = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
+                    for computable_metric_group in computable_metric_groups
+                ]
+                group_results = [
+                    async_result.result() for async_result in async_results
+                ]
+
+            group_resolved_metrics: Optional[Dict[_MetricKey, MetricValue]]
+            err: Optional[Exception]
+            for computable_metric_group, (group_resolved_metrics, err) in zip(
+                computable_metric_groups, group_results
+            ):
+                if err is None:
+                    metrics.update(group_resolved_metrics)  # type: ignore[arg-type]  # not None without error
+                    scheduler.mark_resolved(
+                        metric_ids=[
+                            metric.id
+                            for metric in computable_metric_group
+                            if metric.id in group_resolved_metrics  # type: ignore[operator]  # not None without error
+                        ]
                     )
-                    for failed_metric in err.failed_metrics:
-                        if failed_metric.id in failed_metric_info:
-                            failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                            failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
-                        else:
-                            failed_metric_info[failed_metric.id] = {}
-                            failed_metric_info[failed_metric.id][
-                                "metric_configuration"
-                            ] = failed_metric
-                            failed_metric_info[failed_metric.id]["num_failures"] = 1
-                            failed_metric_info[failed_metric.id]["exception_info"] = {
-                                exception_info
-                            }
-                else:
-                    raise err
-            except Exception as e:
-                if catch_exceptions:
+                    progress_bar.update(len(computable_metric_group))
+                    progress_bar.refresh()
+                elif isinstance(err, gx_exceptions.MetricResolutionError):
+                    if catch_exceptions:
+                        exception_traceback = "".join(
+                            traceback.format_exception(
+                                type(err), err, err.__traceback__
+                            )
+                        )
+                        exception_message = str(err)
+                        exception_info = ExceptionInfo(
+                            exception_traceback=exception_traceback,
+                            exception_message=exception_message,
+                        )
+                        for failed_metric in err.failed_metrics:
+                            if failed_metric.id in failed_metric_info:
+                                failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                                failed_metric_info[failed_metric.id]["exception_info"].add(exception_info)  # type: ignore[union-attr]  # Incorrect flagging of 'Item "MetricConfiguration" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add" and Item "int" of "Union[MetricConfiguration, Set[ExceptionInfo], int]" has no attribute "add"' in deep "Union" structure.
+                            else:
+                                failed_metric_info[failed_metric.id] = {}
+                                failed_metric_info[failed_metric.id][
+                                    "metric_configuration"
+                                ] = failed_metric
+                                failed_metric_info[failed_metric.id]["num_failures"] = 1
+                                failed_metric_info[failed_metric.id][
+                                    "exception_info"
+                                ] = {exception_info}
+                    else:
+                        raise err
+                elif catch_exceptions:
                     logger.error(
-                        f"""Caught exception {e!s} while trying to resolve a set of {len(ready_metrics)} metrics; aborting graph resolution."""
+                        f"""Caught exception {err!s} while trying to resolve a set of {len(ready_metrics)} metrics; aborting graph resolution."""
                     )
                     done = True
                 else:
-                    raise e
+                    raise err
 
             if (len(ready_metrics) + len(needed_metrics) == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
@@ -331,29 +505,63 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
+    def _resolve_metrics_group(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+        runtime_configuration: dict,
+    ) -> Tuple[Optional[Dict[_MetricKey, MetricValue]], Optional[Exception]]:
+        """Resolves supplied metrics, returning either resolved metrics or the exception encountered (not both)."""
+        try:
+            # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
+            return (
+                self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=metrics_to_resolve,
+                    metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+                    runtime_configuration=runtime_configuration,
+                ),
+                None,
+            )
+        except Exception as e:
+            return None, e
+
+    @staticmethod
+    def _group_metrics_by_compute_domain(
+        metrics: Set[MetricConfiguration],
+    ) -> List[List[MetricConfiguration]]:
+        """Partitions metrics into groups that can be resolved independently of one another.
+
+        Metrics, whose domains differ only in accessor keys (e.g., "column"), share compute domain and are kept together
+        so that "ExecutionEngine" can still bundle their computation.  Groups (and metrics within them) are ordered by ID.
+        """
+        groups: Dict[str, List[MetricConfiguration]] = {}
+
+        metric: MetricConfiguration
+        for metric in metrics:
+            compute_domain_id: str = str(
+                IDDict(
+                    {
+                        key: value
+                        for key, value in metric.metric_domain_kwargs.items()
+                        if key not in _ACCESSOR_DOMAIN_KEYS
+                    }
+                ).to_id()
+            )
+            groups.setdefault(compute_domain_id, []).append(metric)
+
+        return [
+            sorted(groups[compute_domain_id], key=lambda metric: str(metric.id))
+            for compute_domain_id in sorted(groups)
+        ]
+
     def _parse(
         self,
         metrics: Dict[_MetricKey, MetricValue],
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        scheduler = _MetricScheduler(edges=self.edges, metrics=metrics)
+        return scheduler.ready_metrics, scheduler.needed_metrics
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
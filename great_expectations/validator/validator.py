@@ -102,6 +102,9 @@ if TYPE_CHECKING:
     from great_expectations.data_context.data_context import AbstractDataContext
     from great_expectations.datasource.fluent.interfaces import Batch as FluentBatch
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.execution_engine.query_instrumentation import (
+        QueryInstrumentation,
+    )
     from great_expectations.rule_based_profiler.expectation_configuration_builder import (
         ExpectationConfigurationBuilder,
     )
@@ -195,6 +198,7 @@ class Validator:
         self._metrics_calculator: MetricsCalculator = MetricsCalculator(
             execution_engine=execution_engine,
             show_progress_bars=self._determine_progress_bars(),
+            concurrency=data_context.concurrency if data_context else None,
         )
         execution_engine.batch_manager.reset_batch_cache()
         self._execution_engine: ExecutionEngine = execution_engine
@@ -806,6 +810,13 @@ class Validator:
         else:
             catch_exceptions = False
 
+        query_instrumentation: Optional[
+            QueryInstrumentation
+        ] = self._execution_engine.query_instrumentation
+        first_query_id: int = (
+            0 if query_instrumentation is None else query_instrumentation.query_count
+        )
+
         expectation_validation_graphs: List[ExpectationValidationGraph]
 
         evrs: List[ExpectationValidationResult]
@@ -832,18 +843,19 @@ class Validator:
         resolved_metrics: _MetricsDict
 
         try:
-            (
-                resolved_metrics,
-                evrs,
-                processed_configurations,
-            ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
-                graph=graph,
-                runtime_configuration=runtime_configuration,
-                expectation_validation_graphs=expectation_validation_graphs,
-                evrs=evrs,
-                processed_configurations=processed_configurations,
-                show_progress_bars=self._determine_progress_bars(),
-            )
+            with self._execution_engine.retaining_batch_data():
+                (
+                    resolved_metrics,
+                    evrs,
+                    processed_configurations,
+                ) = self._resolve_suite_level_graph_and_process_metric_evaluation_errors(
+                    graph=graph,
+                    runtime_configuration=runtime_configuration,
+                    expectation_validation_graphs=expectation_validation_graphs,
+                    evrs=evrs,
+                    processed_configurations=processed_configurations,
+                    show_progress_bars=self._determine_progress_bars(),
+                )
         except Exception as err:
             # If a general Exception occurs during the execution of "ValidationGraph.resolve()", then
             # all expectations in the suite are impacted, because it is impossible to attribute the failure to a metric.
@@ -859,6 +871,13 @@ class Validator:
             else:
                 raise err
 
+        expectation_validation_graph_by_configuration_id: Dict[
+            int, ExpectationValidationGraph
+        ] = {
+            id(expectation_validation_graph.configuration): expectation_validation_graph
+            for expectation_validation_graph in expectation_validation_graphs
+        }
+
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
         for configuration in processed_configurations:
@@ -871,6 +890,14 @@ class Validator:
                     execution_engine=self._execution_engine,
                     runtime_configuration=runtime_configuration_default,
                 )
+                self._add_query_instrumentation_to_result_meta(
+                    result=result,
+                    query_instrumentation=query_instrumentation,
+                    expectation_validation_graph=expectation_validation_graph_by_configuration_id.get(
+                        id(configuration)
+                    ),
+                    first_query_id=first_query_id,
+                )
                 evrs.append(result)
             except Exception as err:
                 if catch_exceptions:
@@ -886,6 +913,33 @@ class Validator:
 
         return evrs
 
+    @staticmethod
+    def _add_query_instrumentation_to_result_meta(
+        result: ExpectationValidationResult,
+        query_instrumentation: Optional[QueryInstrumentation],
+        expectation_validation_graph: Optional[ExpectationValidationGraph],
+        first_query_id: int,
+    ) -> None:
+        """Adds summary of queries, which served metrics of Expectation, to "meta" of its validation result.
+
+        Queries shared by several Expectations (e.g., bundled aggregates) are attributed to each of them in full.
+        """
+        if query_instrumentation is None or expectation_validation_graph is None:
+            return
+
+        metric_ids: Set[Tuple[str, str, str]] = set()
+        edge: MetricEdge
+        for edge in expectation_validation_graph.graph.edges:
+            metric_ids.add(edge.left.id)
+            if edge.right is not None:
+                metric_ids.add(edge.right.id)
+
+        result.meta["query_instrumentation"] = query_instrumentation.summarize(
+            query_records=query_instrumentation.get_records_for_metric_ids(
+                metric_ids=metric_ids, since=first_query_id
+            )
+        )
+
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
         self,
         expectation_configurations: List[ExpectationConfiguration],
@@ -1471,6 +1525,15 @@ class Validator:
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
 
+            query_instrumentation: Optional[
+                QueryInstrumentation
+            ] = self._execution_engine.query_instrumentation
+            first_query_id: int = (
+                0
+                if query_instrumentation is None
+                else query_instrumentation.query_count
+            )
+
             results = self.graph_validate(
                 configurations=expectations_to_evaluate,
                 runtime_configuration=runtime_configuration,
@@ -1512,6 +1575,31 @@ class Validator:
                 },
             )
 
+            if query_instrumentation is not None:
+                query_report: dict = query_instrumentation.to_json_dict(
+                    since=first_query_id
+                )
+                query_report["expectations"] = [
+                    {
+                        "expectation_type": validation_result.expectation_config.expectation_type,
+                        "kwargs": convert_to_json_serializable(
+                            validation_result.expectation_config.kwargs
+                        ),
+                        **validation_result.meta["query_instrumentation"],
+                    }
+                    for validation_result in results
+                    if "query_instrumentation" in validation_result.meta
+                ]
+                result.meta["query_instrumentation"] = query_report
+                query_instrumentation.write_report(
+                    report={
+                        "expectation_suite_name": expectation_suite_name,
+                        "run_id": convert_to_json_serializable(run_id),
+                        "validation_time": validation_time,
+                        **query_report,
+                    }
+                )
+
             self._data_context = validation_data_context
         except Exception:
             if handler := getattr(data_context, "_usage_statistics_handler", None):
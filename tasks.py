@@ -883,6 +883,7 @@ MARKER_DEPENDENCY_MAP: Final[Mapping[str, TestDependencies]] = {
         extra_pytest_args=("--mysql",),
     ),
     "pyarrow": TestDependencies(("reqs/requirements-dev-arrow.txt",)),
+    "polars": TestDependencies(("reqs/requirements-dev-polars.txt",)),
     "postgresql": TestDependencies(
         ("reqs/requirements-dev-postgresql.txt",),
         services=("postgresql",),
@@ -0,0 +1,116 @@
+import json
+import pathlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.columnar_unexpected_results import (
+    FLAT_COLUMN_NAME,
+    ColumnarUnexpectedResults,
+    use_columnar_unexpected_results,
+)
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "result_format,expected",
+    [
+        pytest.param({"result_format": "COMPLETE"}, False, id="not_requested"),
+        pytest.param(
+            {"result_format": "COMPLETE", "columnar_unexpected_results": True},
+            True,
+            id="complete",
+        ),
+        pytest.param(
+            {"result_format": "SUMMARY", "columnar_unexpected_results": True},
+            False,
+            id="summary",
+        ),
+    ],
+)
+def test_use_columnar_unexpected_results(result_format: dict, expected: bool):
+    assert use_columnar_unexpected_results(result_format=result_format) is expected
+
+
+@pytest.mark.unit
+def test_flat_results_behave_as_list():
+    results = ColumnarUnexpectedResults.from_rows([3, 1, 4, 1, 5])
+
+    assert results.flat
+    assert results.column_names == [FLAT_COLUMN_NAME]
+    assert results.columns[FLAT_COLUMN_NAME].dtype == np.int64
+    assert len(results) == 5
+    assert results[2] == 4
+    assert results[-1] == 5
+    assert results[1:3] == [1, 4]
+    assert list(results) == [3, 1, 4, 1, 5]
+    assert results == [3, 1, 4, 1, 5]
+    assert results.to_list() == [3, 1, 4, 1, 5]
+
+
+@pytest.mark.unit
+def test_dictionary_rows_are_stored_one_array_per_column():
+    rows = [{"pk": 2, "b": "z"}, {"pk": 5, "b": None}, {"pk": 9, "b": "q"}]
+
+    results = ColumnarUnexpectedResults.from_rows(rows)
+
+    assert not results.flat
+    assert results.column_names == ["pk", "b"]
+    assert results.columns["pk"].dtype == np.int64
+    assert results == rows
+    assert list(results.iter_pages(page_size=2)) == [rows[:2], rows[2:]]
+    pd.testing.assert_frame_equal(results.to_pandas(), pd.DataFrame(rows))
+
+
+@pytest.mark.unit
+def test_columnar_json_round_trip():
+    rows = [{"pk": 2, "b": "z"}, {"pk": 5, "b": "q"}]
+    results = ColumnarUnexpectedResults.from_rows(rows)
+
+    json_dict = convert_to_json_serializable(results)
+
+    assert json_dict == results.to_json_dict()
+    assert json_dict["columns"] == {"pk": [2, 5], "b": ["z", "q"]}
+    assert ColumnarUnexpectedResults.is_columnar_json_dict(json_dict)
+    assert (
+        ColumnarUnexpectedResults.from_json_dict(json.loads(json.dumps(json_dict)))
+        == rows
+    )
+
+
+@pytest.mark.unit
+def test_unbound_storage_key_reference_cannot_be_loaded():
+    results = ColumnarUnexpectedResults.from_json_dict(
+        {
+            "layout": "columnar",
+            "flat": True,
+            "num_rows": 2,
+            "column_names": [FLAT_COLUMN_NAME],
+            "storage_key": ["my", "key"],
+        }
+    )
+
+    assert len(results) == 2
+    assert not results.is_loaded
+    with pytest.raises(ValueError):
+        results.to_list()
+
+
+@pytest.mark.unit
+def test_parquet_round_trip_is_lazy(tmp_path: pathlib.Path):
+    pytest.importorskip("pyarrow")
+
+    rows = [{"pk": idx, "b": f"v{idx}", "c": [idx]} for idx in range(25)]
+    path = str(tmp_path / "unexpected.parquet")
+    ColumnarUnexpectedResults.from_rows(rows).to_parquet(path)
+
+    results = ColumnarUnexpectedResults.from_parquet(path, storage_key=("k",))
+
+    assert len(results) == 25
+    assert results.column_names == ["pk", "b", "c"]
+    assert list(results.iter_pages(page_size=10))[-1] == rows[20:]
+    assert not results.is_loaded
+    assert results == rows
+    assert results.is_loaded
@@ -1,4 +1,7 @@
+import datetime
+
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.core.util import convert_to_json_serializable
@@ -59,3 +62,76 @@ def test_serialization_numpy_datetime():
     datetime_to_test = "2022-12-08T12:56:23.423"
     data = np.datetime64(datetime_to_test)
     assert convert_to_json_serializable(data) == datetime_to_test
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(
+            np.array([1.5, np.nan, np.inf]), [1.5, None, np.inf], id="float_with_nan"
+        ),
+        pytest.param(np.array([[1, 2], [3, 4]]), [[1, 2], [3, 4]], id="2d_integer"),
+        pytest.param(np.array([True, False]), [True, False], id="boolean"),
+        pytest.param(np.array(["a", "b"]), ["a", "b"], id="string"),
+        pytest.param(
+            np.array(
+                ["2022-12-08T12:56:23.423", "2022-12-08", "NaT"],
+                dtype="datetime64[ms]",
+            ),
+            ["2022-12-08T12:56:23.423000", "2022-12-08T00:00:00", None],
+            id="datetime",
+        ),
+        pytest.param(
+            np.array(["2022-12-08T00:00:00.000000001"], dtype="datetime64[ns]"),
+            ["2022-12-08T00:00:00.000000001"],
+            id="datetime_nanoseconds",
+        ),
+        pytest.param(
+            np.array(["2022-12-08", "NaT"], dtype="datetime64[D]"),
+            ["2022-12-08", None],
+            id="date",
+        ),
+        pytest.param(
+            np.array([1, "a", None, np.nan], dtype=object),
+            [1, "a", None, None],
+            id="object",
+        ),
+    ],
+)
+def test_serialization_of_numpy_array(data: np.ndarray, expected: list):
+    assert convert_to_json_serializable(data) == expected
+
+
+@pytest.mark.unit
+def test_serialization_of_numpy_datetime_array_matches_isoformat():
+    data = np.array(
+        ["2022-12-08T12:56:23", "2022-12-08T12:56:23.000001", "1969-12-31T23:59:59.5"],
+        dtype="datetime64[us]",
+    )
+    assert convert_to_json_serializable(data) == [
+        value.isoformat() for value in data.tolist()
+    ]
+
+
+@pytest.mark.unit
+def test_serialization_of_pandas_series():
+    data = pd.Series(
+        [datetime.datetime(2022, 12, 8), None], index=[3, 4], name="my_column"
+    )
+    assert convert_to_json_serializable(data) == [
+        {"index": 3, "my_column": "2022-12-08T00:00:00"},
+        {"index": 4, "my_column": None},
+    ]
+
+
+@pytest.mark.unit
+def test_serialization_of_pyarrow_arrays():
+    pa = pytest.importorskip("pyarrow")
+    assert convert_to_json_serializable(pa.array([1.5, None, 3.0])) == [
+        1.5,
+        None,
+        3.0,
+    ]
+    assert convert_to_json_serializable(pa.array([1, None])) == [1, None]
+    assert convert_to_json_serializable(pa.chunked_array([[1, 2], [3]])) == [1, 2, 3]
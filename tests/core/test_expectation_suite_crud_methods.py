@@ -320,6 +320,29 @@ def test_find_expectation_indexes(
         )
 
 
+@pytest.mark.filesystem
+def test_find_expectation_indexes_after_suite_is_modified(
+    exp1, exp2, exp4, exp5, baseline_suite
+):
+    assert baseline_suite.find_expectation_indexes(exp4, "domain") == [1]
+
+    baseline_suite.add_expectation(exp5, send_usage_event=False)
+    assert baseline_suite.find_expectation_indexes(exp4, "domain") == [1]
+    assert baseline_suite.find_expectation_indexes(exp4, "runtime") == []
+    assert baseline_suite.find_expectation_indexes(exp5, "runtime") == [1]
+
+    # Modifications of list of configurations, made directly, are detected as well.
+    baseline_suite.expectation_configurations.insert(0, exp2)
+    assert baseline_suite.find_expectation_indexes(exp4, "domain") == [0, 2]
+
+    baseline_suite.expectation_configurations[0] = exp1
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == [0, 1]
+
+    baseline_suite.expectation_configurations = [exp4]
+    assert baseline_suite.find_expectation_indexes(exp1, "domain") == []
+    assert baseline_suite.find_expectation_indexes(exp5, "success") == [0]
+
+
 @pytest.mark.cloud
 def test_find_expectation_indexes_with_ge_cloud_suite(ge_cloud_suite, ge_cloud_id):
     # All expectations in `ge_cloud_suite` have our desired id
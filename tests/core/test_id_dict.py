@@ -0,0 +1,85 @@
+import copy
+import hashlib
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "source",
+    [
+        pytest.param({"column": "a", "batch_id": "b"}, id="scalars"),
+        pytest.param({"column": "a", "mostly": float("nan")}, id="nan"),
+        pytest.param({"value_set": [1, "2", None], "x": (3.5,)}, id="sequences"),
+        pytest.param({"nested": {1: {"a": [True]}}, "x": 1}, id="nested"),
+        pytest.param({"values": np.array([1.5, 2.5]), "x": np.int64(1)}, id="numpy"),
+    ],
+)
+def test_id_dict_id_does_not_depend_on_encoder(source: dict):
+    expected_id = hashlib.md5(
+        json.dumps(convert_to_json_serializable(data=source), sort_keys=True).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+
+    assert IDDict(source).to_id() == expected_id
+
+
+@pytest.mark.unit
+def test_id_dict_id_is_recomputed_after_modification():
+    id_dict = IDDict({"column": "a", "batch_id": "b"})
+    original_id = id_dict.to_id()
+
+    id_dict["column"] = "c"
+    modified_id = id_dict.to_id()
+
+    id_dict.update({"column": "a"})
+
+    assert modified_id != original_id
+    assert id_dict.to_id() == original_id
+    assert hash(id_dict) == hash(original_id)
+
+
+@pytest.mark.unit
+def test_id_dict_id_is_not_cached_for_mutable_values():
+    value_set = [1, 2]
+    id_dict = IDDict({"column": "a", "value_set": value_set})
+    original_id = id_dict.to_id()
+
+    value_set.append(3)
+
+    assert id_dict.to_id() != original_id
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_is_immutable():
+    frozen_id_dict = FrozenIDDict({"column": "a", "value_set": [1, 2]})
+
+    assert frozen_id_dict.to_id() == IDDict(frozen_id_dict).to_id()
+    with pytest.raises(TypeError):
+        frozen_id_dict["column"] = "b"
+    with pytest.raises(TypeError):
+        frozen_id_dict.pop("column")
+    with pytest.raises(TypeError):
+        frozen_id_dict.update({"column": "b"})
+
+
+@pytest.mark.unit
+def test_frozen_id_dict_copies_are_mutable():
+    frozen_id_dict = FrozenIDDict({"column": "a", "value_set": [1, 2]})
+
+    deep_copy = copy.deepcopy(frozen_id_dict)
+    deep_copy["column"] = "b"
+    shallow_copy = copy.copy(frozen_id_dict)
+    shallow_copy.pop("column")
+
+    assert type(deep_copy) is IDDict
+    assert deep_copy["value_set"] is not frozen_id_dict["value_set"]
+    assert type(shallow_copy) is IDDict
+    assert pickle.loads(pickle.dumps(frozen_id_dict)) == frozen_id_dict
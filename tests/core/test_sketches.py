@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import (
+    DEFAULT_APPROXIMATION_ERROR,
+    get_approximation_error,
+    hyperloglog_distinct_count,
+    hyperloglog_precision,
+    hyperloglog_relative_error,
+    quantile_sample_size,
+    sampled_quantiles,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.self_check.util import build_pandas_validator_with_data
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "approximate,expected_error",
+    [
+        pytest.param(False, None, id="exact"),
+        pytest.param(None, None, id="none"),
+        pytest.param(True, DEFAULT_APPROXIMATION_ERROR, id="default"),
+        pytest.param(0.05, 0.05, id="explicit"),
+    ],
+)
+def test_get_approximation_error(approximate, expected_error):
+    assert get_approximation_error(approximate=approximate) == expected_error
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("approximate", [0.0, 1.0, -0.5, "0.1"])
+def test_get_approximation_error_rejects_invalid_values(approximate):
+    with pytest.raises(ValueError):
+        get_approximation_error(approximate=approximate)
+
+
+@pytest.mark.unit
+def test_hyperloglog_precision_satisfies_relative_error():
+    precision = hyperloglog_precision(relative_error=0.01)
+
+    assert hyperloglog_relative_error(precision=precision) <= 0.01
+    assert hyperloglog_relative_error(precision=precision - 1) > 0.01
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("number_of_distinct_values", [0, 10, 1000, 200000])
+def test_hyperloglog_distinct_count(number_of_distinct_values):
+    rng = np.random.default_rng(seed=0)
+    column = pd.Series(rng.permutation(number_of_distinct_values).repeat(3))
+
+    estimate = hyperloglog_distinct_count(
+        column=column, precision=hyperloglog_precision(relative_error=0.01)
+    )
+
+    assert estimate == pytest.approx(number_of_distinct_values, rel=0.04, abs=1)
+
+
+@pytest.mark.unit
+def test_sampled_quantiles_are_within_rank_error():
+    column = pd.Series(np.arange(1000000, dtype=np.float64))
+
+    values = sampled_quantiles(
+        column=column, quantiles=[0.1, 0.5, 0.9], rank_error=0.01
+    )
+
+    assert quantile_sample_size(rank_error=0.01) < len(column)
+    assert values == pytest.approx([100000, 500000, 900000], abs=10000)
+
+
+@pytest.mark.unit
+def test_approximate_expectations_report_error_bounds():
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame({"a": rng.integers(low=0, high=5000, size=100000)})
+    validator = build_pandas_validator_with_data(df=df)
+
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_unique_value_count_to_be_between",
+                kwargs={"column": "a", "min_value": 4800, "approximate": True},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_median_to_be_between",
+                kwargs={
+                    "column": "a",
+                    "min_value": 2400,
+                    "max_value": 2600,
+                    "approximate": 0.005,
+                },
+            ),
+        ]
+    )
+
+    assert all(result.success for result in results)
+    assert results[0].result["details"]["approximation"]["method"] == "hyperloglog"
+    assert results[1].result["details"]["approximation"] == {
+        "method": "sampled_quantiles",
+        "rank_error": 0.005,
+        "confidence": 0.99,
+    }
@@ -7,6 +7,7 @@ from unittest import mock
 import boto3
 import pyparsing as pp
 import pytest
+from botocore.paginate import Paginator
 from moto import mock_s3
 
 from great_expectations.core.data_context_key import DataContextVariableKey
@@ -18,6 +19,7 @@ from great_expectations.data_context.data_context_variables import (
     DataContextVariableSchema,
 )
 from great_expectations.data_context.store import (
+    DatabaseStoreBackend,
     InMemoryStoreBackend,
     StoreBackend,
     TupleAzureBlobStoreBackend,
@@ -1088,7 +1090,7 @@ def test_TupleGCSStoreBackend():  # noqa: PLR0915
         my_store.list_keys()
 
         mock_client.list_blobs.assert_called_once_with(
-            "leakybucket", prefix="this_is_a_test_prefix"
+            "leakybucket", prefix="this_is_a_test_prefix/my_file_", delimiter="/"
         )
 
         my_store.remove_key("leakybucket")
@@ -1159,8 +1161,8 @@ def test_TupleAzureBlobStoreBackend_credential():
         )
 
         my_store.list_keys()
-        mock_container_client.list_blobs.assert_called_once_with(
-            name_starts_with="this_is_a_test_prefix"
+        mock_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with="this_is_a_test_prefix/", delimiter="/"
         )
 
 
@@ -1201,8 +1203,8 @@ def test_TupleAzureBlobStoreBackend_connection_string():
         )
 
         my_store.list_keys()
-        mock_container_client.list_blobs.assert_called_once_with(
-            name_starts_with="this_is_a_test_prefix"
+        mock_container_client.walk_blobs.assert_called_once_with(
+            name_starts_with="this_is_a_test_prefix/", delimiter="/"
         )
 
 
@@ -1240,6 +1242,62 @@ def test_TupleAzureBlobStoreBackend_account_url():
             mock_azure_credential.assert_called_once()
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_list_keys_with_prefix(tmp_path):
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=str(tmp_path),
+        base_directory="store",
+        filepath_template="{0}/{1}-{2}.json",
+    )
+    for key in [("run1", "a", "x"), ("run1", "b", "y"), ("run10", "a", "z")]:
+        my_store.set(key, "value")
+
+    assert sorted(my_store.list_keys(prefix=("run1",))) == [
+        ("run1", "a", "x"),
+        ("run1", "b", "y"),
+    ]
+    assert list(my_store.iter_keys(prefix=("run1", "b"))) == [("run1", "b", "y")]
+    assert my_store.list_keys(prefix=("run2",)) == []
+
+
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_list_keys_with_prefix(aws_credentials):
+    bucket = "leakybucket"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(bucket=bucket, prefix="my_prefix")
+    for key in [
+        ("run1", "a", "x"),
+        ("run1", "b", "y"),
+        ("run1", "c"),
+        ("run10", "a", "z"),
+        ("run2", "a", "w"),
+    ]:
+        my_store.set(key, "value")
+
+    with mock.patch.object(
+        Paginator, "paginate", autospec=True, side_effect=Paginator.paginate
+    ) as mock_paginate:
+        keys = my_store.iter_keys(prefix=("run1",))
+        assert next(keys) == ("run1", "a", "x")
+        assert sorted([("run1", "a", "x"), *keys]) == [
+            ("run1", "a", "x"),
+            ("run1", "b", "y"),
+            ("run1", "c"),
+        ]
+
+    # Only objects under "my_prefix/run1" are listed (its sub-prefixes are listed separately).
+    assert sorted(call.kwargs["Prefix"] for call in mock_paginate.call_args_list) == [
+        "my_prefix/run1",
+        "my_prefix/run1/",
+        "my_prefix/run10/",
+    ]
+    assert my_store.has_key(("run1", "c"))
+    assert not my_store.has_key(("run1", "d"))
+
+
 @mock_s3
 @pytest.mark.slow  # 14.36s
 @pytest.mark.aws_deps
@@ -1605,3 +1663,63 @@ def test_store_backend_path_special_character_escape():
         escaped_path
         == "/validations/default/pandas_data_asset/20230315T205136.109084Z/default_pandas_datasource-%23ephemeral_pandas_asset.html"
     )
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_bulk_operations(tmp_path):
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=str(tmp_path), base_directory="store"
+    )
+
+    my_store.set_many([(("a", "1"), "aaa"), (("b", "2"), "bbb")])
+    assert my_store.get_many([("b", "2"), ("c", "3"), ("a", "1")]) == [
+        "bbb",
+        None,
+        "aaa",
+    ]
+    assert my_store.get_many([]) == []
+
+    my_store.remove_many([("a", "1"), ("c", "3")])
+    assert my_store.has_key(("a", "1")) is False
+    assert my_store.get_many([("a", "1"), ("b", "2")]) == [None, "bbb"]
+
+    with pytest.raises(TypeError):
+        my_store.get_many([("a", 1)])
+
+
+@pytest.mark.sqlite
+def test_DatabaseStoreBackend_bulk_operations_issue_single_statements(sa):
+    engine = sa.create_engine("sqlite://")
+    my_store = DatabaseStoreBackend(
+        engine=engine, table_name="bulk_store", key_columns=["k1", "k2"]
+    )
+    my_store.set(("a", "1"), "aaa")
+
+    statements = []
+
+    def _record_statement(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    sa.event.listen(engine, "before_cursor_execute", _record_statement)
+    try:
+        my_store.set_many(
+            [(("a", "1"), "AAA"), (("b", "1"), "bbb"), (("a", "2"), "ccc")]
+        )
+        assert statements == ["SELECT", "INSERT", "UPDATE"]
+
+        statements.clear()
+        assert my_store.get_many([("a", "2"), ("x", "y"), ("a", "1"), ("b", "1")]) == [
+            "ccc",
+            None,
+            "AAA",
+            "bbb",
+        ]
+        assert statements == ["SELECT"]
+
+        statements.clear()
+        my_store.remove_many([("a", "1"), ("a", "2")])
+        assert statements == ["DELETE"]
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", _record_statement)
+
+    assert sorted(my_store.list_keys()) == [("b", "1")]
@@ -1,4 +1,5 @@
 import datetime
+import pathlib
 from unittest import mock
 
 import boto3
@@ -6,7 +7,14 @@ import pytest
 from freezegun import freeze_time
 from moto import mock_s3
 
-from great_expectations.core import ExpectationSuiteValidationResult
+from great_expectations.core import (
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.core.columnar_unexpected_results import (
+    ColumnarUnexpectedResults,
+)
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context.store import ValidationsStore
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -382,3 +390,60 @@ def test_gx_cloud_response_json_to_object_dict() -> None:
     actual = ValidationsStore.gx_cloud_response_json_to_object_dict(response_json)
 
     assert actual == expected
+
+
+@pytest.mark.unit
+def test_ValidationsStore_with_TupleFileSystemStoreBackend_stores_columnar_unexpected_results_as_parquet(
+    tmp_path: pathlib.Path,
+):
+    pytest.importorskip("pyarrow")
+
+    my_store = ValidationsStore(
+        store_backend={
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": str(tmp_path),
+        },
+    )
+    ns_1 = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("asset.quarantine"),
+        run_id=RunIdentifier(
+            run_name="prod-100",
+            run_time=datetime.datetime(2019, 9, 26, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier="batch_id",
+    )
+    unexpected_index_list = [{"pk": 2, "b": "z"}, {"pk": 9, "b": "q"}]
+    my_store.set(
+        ns_1,
+        ExpectationSuiteValidationResult(
+            success=False,
+            results=[
+                ExpectationValidationResult(
+                    success=False,
+                    result={
+                        "unexpected_list": ColumnarUnexpectedResults.from_rows(
+                            ["z", "q"]
+                        ),
+                        "unexpected_index_list": ColumnarUnexpectedResults.from_rows(
+                            unexpected_index_list
+                        ),
+                    },
+                )
+            ],
+        ),
+    )
+
+    parquet_files = sorted(
+        path.relative_to(tmp_path).as_posix() for path in tmp_path.rglob("*.parquet")
+    )
+    assert parquet_files == [
+        "asset/quarantine/prod-100/20190926T000000.000000Z/batch_id/0_unexpected_index_list.parquet",
+        "asset/quarantine/prod-100/20190926T000000.000000Z/batch_id/0_unexpected_list.parquet",
+    ]
+    assert set(my_store.list_keys()) == {ns_1}
+
+    result = my_store.get(ns_1).results[0].result
+    assert isinstance(result["unexpected_index_list"], ColumnarUnexpectedResults)
+    assert not result["unexpected_index_list"].is_loaded
+    assert result["unexpected_index_list"] == unexpected_index_list
+    assert result["unexpected_list"] == ["z", "q"]
@@ -3,6 +3,7 @@ import pytest
 from great_expectations.data_context import get_context
 from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
+    ConcurrencyConfigSchema,
     DataContextConfig,
     InMemoryStoreBackendDefaults,
 )
@@ -33,3 +34,38 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_max_database_query_concurrency_defaults_to_unbounded_pool():
+    concurrency_config = ConcurrencyConfig(enabled=True)
+    parameters = {}
+    concurrency_config.add_sqlalchemy_create_engine_parameters(parameters)
+
+    assert (
+        concurrency_config.max_database_query_concurrency
+        == ConcurrencyConfig.DEFAULT_MAX_DATABASE_QUERY_CONCURRENCY
+    )
+    assert parameters == {"pool_size": 0, "max_overflow": -1}
+    assert ConcurrencyConfigSchema().dump(concurrency_config) == {"enabled": True}
+
+
+def test_max_database_query_concurrency_sizes_connection_pool():
+    concurrency_config = ConcurrencyConfig(
+        **ConcurrencyConfigSchema().load(
+            {"enabled": True, "max_database_query_concurrency": 8}
+        )
+    )
+    parameters = {"max_overflow": 2}
+    concurrency_config.add_sqlalchemy_create_engine_parameters(parameters)
+
+    assert concurrency_config.max_database_query_concurrency == 8
+    assert parameters == {"pool_size": 8, "max_overflow": 2}
+    assert ConcurrencyConfigSchema().dump(concurrency_config) == {
+        "enabled": True,
+        "max_database_query_concurrency": 8,
+    }
+
+
+def test_max_database_query_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        ConcurrencyConfig(enabled=True, max_database_query_concurrency=0)
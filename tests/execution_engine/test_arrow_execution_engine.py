@@ -0,0 +1,209 @@
+import pathlib
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.exceptions import ExecutionEngineError
+from great_expectations.execution_engine import (
+    ArrowExecutionEngine,
+    ExecutionEngine,
+    PandasExecutionEngine,
+)
+from great_expectations.execution_engine.arrow_batch_data import ArrowBatchData
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+pa = pytest.importorskip("pyarrow")
+
+pytestmark = pytest.mark.pyarrow
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    return pd.DataFrame(
+        {
+            "a": rng.normal(size=1000),
+            "b": rng.choice(["x", "y", "z", None], size=1000),
+            "c": rng.integers(low=0, high=100, size=1000),
+        }
+    )
+
+
+@pytest.fixture
+def parquet_path(df: pd.DataFrame, tmp_path: pathlib.Path) -> str:
+    path = str(tmp_path / "data.parquet")
+    df.to_parquet(path, index=False)
+    return path
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={}),
+        MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={}),
+        MetricConfiguration(
+            metric_name="column.max", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.min", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.mean", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.median", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.standard_deviation",
+            metric_domain_kwargs={"column": "c"},
+        ),
+        MetricConfiguration(
+            metric_name="column.sum", metric_domain_kwargs={"column": "c"}
+        ),
+        MetricConfiguration(
+            metric_name="column.distinct_values.count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"value_set": ["x", "y"]},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.between.unexpected_count",
+            metric_domain_kwargs={"column": "c"},
+            metric_value_kwargs={"min_value": 10, "max_value": 90},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.unique.unexpected_count",
+            metric_domain_kwargs={"column": "c"},
+        ),
+    ]
+
+
+def _compute_metrics(
+    execution_engine: ExecutionEngine, context: AbstractDataContext
+) -> list:
+    validator = Validator(execution_engine=execution_engine, data_context=context)
+    metric_configurations = _build_metric_configurations()
+    resolved_metrics = validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )[0]
+    return [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ]
+
+
+@pytest.mark.unit
+def test_arrow_metrics_match_pandas_metrics(
+    df: pd.DataFrame,
+    parquet_path: str,
+    in_memory_runtime_context: AbstractDataContext,
+):
+    pandas_execution_engine = PandasExecutionEngine()
+    pandas_execution_engine.load_batch_data(batch_id="my_batch", batch_data=df)
+    expected_values = _compute_metrics(
+        execution_engine=pandas_execution_engine, context=in_memory_runtime_context
+    )
+
+    arrow_execution_engine = ArrowExecutionEngine()
+    batch_data, _ = arrow_execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=parquet_path)
+    )
+    arrow_execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    values = _compute_metrics(
+        execution_engine=arrow_execution_engine, context=in_memory_runtime_context
+    )
+
+    assert isinstance(batch_data, ArrowBatchData)
+    assert values[:2] == expected_values[:2]
+    assert values[2:8] == pytest.approx(expected_values[2:8])
+    assert values[8:] == expected_values[8:]
+
+
+@pytest.mark.unit
+def test_arrow_unexpected_values_respect_row_condition(
+    in_memory_runtime_context: AbstractDataContext,
+):
+    execution_engine = ArrowExecutionEngine()
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(
+            batch_data=pa.table(
+                {
+                    "a": [1, 2, 3, None, 5],
+                    "b": ["x", "y", "zz", "x", None],
+                }
+            )
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    validator = Validator(
+        execution_engine=execution_engine, data_context=in_memory_runtime_context
+    )
+
+    result = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": "b",
+                    "value_set": ["x", "y"],
+                    "result_format": "COMPLETE",
+                },
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": "a",
+                    "min_value": 2,
+                    "max_value": 4,
+                    "row_condition": 'col("b")!="zz"',
+                    "condition_parser": "great_expectations__experimental__",
+                    "result_format": "COMPLETE",
+                },
+            ),
+        ]
+    )
+
+    assert result[0].result["unexpected_list"] == ["zz"]
+    assert result[0].result["unexpected_index_list"] == [2]
+    assert result[1].result["unexpected_count"] == 1
+    assert result[1].result["unexpected_list"] == [1]
+
+
+@pytest.mark.unit
+def test_arrow_execution_engine_reads_memory_mapped_feather(
+    df: pd.DataFrame, tmp_path: pathlib.Path
+):
+    path = str(tmp_path / "data.feather")
+    df.to_feather(path)
+
+    batch_data, _ = ArrowExecutionEngine().get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=path)
+    )
+
+    assert batch_data.table.equals(pa.Table.from_pandas(df, preserve_index=False))
+
+
+@pytest.mark.unit
+def test_arrow_execution_engine_does_not_support_sampling(parquet_path: str):
+    with pytest.raises(ExecutionEngineError):
+        ArrowExecutionEngine().get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=parquet_path,
+                sampling_method="sample_using_limit",
+                sampling_kwargs={"n": 10},
+            )
+        )
@@ -0,0 +1,115 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import (
+    DomainRecordsCache,
+)
+
+
+@pytest.mark.unit
+def test_domain_records_cache_build_key():
+    assert DomainRecordsCache.build_key(domain_kwargs={"column": "a"}) is None
+
+    key = DomainRecordsCache.build_key(
+        domain_kwargs={
+            "batch_id": "my_batch",
+            "column": "a",
+            "row_condition": 'b=="x"',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    )
+    # Name of the column does not affect which records are returned; presence of "column" does.
+    assert key == DomainRecordsCache.build_key(
+        domain_kwargs={
+            "column": "b",
+            "row_condition": 'b=="x"',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    )
+    assert key != DomainRecordsCache.build_key(
+        domain_kwargs={
+            "row_condition": 'b=="x"',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    )
+    assert key != DomainRecordsCache.build_key(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": 'b=="y"',
+            "condition_parser": "great_expectations__experimental__",
+        }
+    )
+
+
+@pytest.mark.unit
+def test_domain_records_cache_is_keyed_by_source_identity():
+    cache = DomainRecordsCache(max_entries=2)
+    source = object()
+    cache.set(source=source, key="k", records="records")
+
+    assert cache.get(source=source, key="k") == "records"
+    assert cache.get(source=object(), key="k") is None
+
+
+@pytest.mark.unit
+def test_domain_records_cache_evicts_least_recently_used_entries():
+    on_evict = mock.Mock()
+    cache = DomainRecordsCache(max_entries=2, on_evict=on_evict)
+    source = object()
+    cache.set(source=source, key="a", records="records_a")
+    cache.set(source=source, key="b", records="records_b")
+    cache.get(source=source, key="a")
+    cache.set(source=source, key="c", records="records_c")
+
+    assert cache.get(source=source, key="b") is None
+    assert cache.get(source=source, key="a") == "records_a"
+    assert cache.get(source=source, key="c") == "records_c"
+    on_evict.assert_called_once_with("records_b")
+
+
+@pytest.mark.unit
+def test_domain_records_cache_respects_memory_budget():
+    cache = DomainRecordsCache(max_size_bytes=10, sizeof=len)
+    source = object()
+    cache.set(source=source, key="a", records="x" * 6)
+    cache.set(source=source, key="b", records="x" * 6)
+    cache.set(source=source, key="c", records="x" * 11)
+
+    assert len(cache) == 1
+    assert cache.get(source=source, key="a") is None
+    assert cache.get(source=source, key="b") == "x" * 6
+    assert cache.get(source=source, key="c") is None
+
+
+@pytest.mark.unit
+def test_get_domain_records_filters_each_row_condition_once():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [5, 6, 7, 8]})
+    execution_engine = PandasExecutionEngine()
+    execution_engine.load_batch_data(
+        batch_id="my_batch", batch_data=Batch(data=df).data
+    )
+
+    row_condition_kwargs = {
+        "row_condition": "a>2",
+        "condition_parser": "pandas",
+    }
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "_filter_domain_records",
+        wraps=PandasExecutionEngine._filter_domain_records,
+    ) as mock_filter_domain_records:
+        records_a = execution_engine.get_domain_records(
+            domain_kwargs={"column": "a", **row_condition_kwargs}
+        )
+        records_b = execution_engine.get_domain_records(
+            domain_kwargs={"column": "b", **row_condition_kwargs}
+        )
+        execution_engine.get_domain_records(domain_kwargs={"column": "b"})
+
+    assert records_a is records_b
+    assert records_a["b"].tolist() == [7, 8]
+    assert mock_filter_domain_records.call_count == 2
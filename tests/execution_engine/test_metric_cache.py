@@ -0,0 +1,290 @@
+import pathlib
+import threading
+import time
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch, BatchMarkers
+from great_expectations.core.batch_spec import BatchSpec
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    SqliteMetricCache,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    hash_pandas_dataframe,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def sqlite_metric_cache_path(tmp_path: pathlib.Path) -> str:
+    return str(tmp_path / "metric_cache" / "metrics.db")
+
+
+def _build_validator(
+    df: pd.DataFrame,
+    execution_engine: PandasExecutionEngine,
+    context: AbstractDataContext,
+) -> Validator:
+    batch = Batch(
+        data=df,
+        batch_spec=BatchSpec({"data_asset_name": "my_asset"}),
+        batch_markers=BatchMarkers(
+            {
+                "ge_load_time": "20230101T000000.000000Z",
+                "pandas_data_fingerprint": hash_pandas_dataframe(df),
+            }
+        ),
+    )
+    return Validator(
+        execution_engine=execution_engine, batches=[batch], data_context=context
+    )
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_round_trip(sqlite_metric_cache_path: str):
+    metric_cache = SqliteMetricCache(path=sqlite_metric_cache_path)
+    metric_cache.set_many(items={"a": 1, "b": [1.5, None], "c": {"x": "y"}})
+
+    assert metric_cache.get_many(keys=["a", "b", "c", "d"]) == {
+        "a": 1,
+        "b": [1.5, None],
+        "c": {"x": "y"},
+    }
+
+    # A new instance on the same file sees the same entries.
+    assert SqliteMetricCache(path=sqlite_metric_cache_path).get_many(keys=["a"]) == {
+        "a": 1
+    }
+
+    metric_cache.clear()
+    assert len(metric_cache) == 0
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_skips_unpicklable_and_oversized_values(
+    sqlite_metric_cache_path: str,
+):
+    metric_cache = SqliteMetricCache(
+        path=sqlite_metric_cache_path, max_entry_size_bytes=100
+    )
+    metric_cache.set_many(
+        items={"lock": threading.Lock(), "big": "x" * 1000, "small": 1}
+    )
+
+    assert metric_cache.get_many(keys=["lock", "big", "small"]) == {"small": 1}
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_evicts_least_recently_used_entries(
+    sqlite_metric_cache_path: str,
+):
+    metric_cache = SqliteMetricCache(path=sqlite_metric_cache_path, max_entries=2)
+    with mock.patch("time.time", return_value=1.0):
+        metric_cache.set_many(items={"a": 1})
+    with mock.patch("time.time", return_value=2.0):
+        metric_cache.set_many(items={"b": 2})
+    with mock.patch("time.time", return_value=3.0):
+        metric_cache.get_many(keys=["a"])
+    with mock.patch("time.time", return_value=4.0):
+        metric_cache.set_many(items={"c": 3})
+
+    assert metric_cache.get_many(keys=["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_evicts_by_total_size(sqlite_metric_cache_path: str):
+    metric_cache = SqliteMetricCache(path=sqlite_metric_cache_path, max_size_bytes=250)
+    for idx, key in enumerate(["a", "b", "c"]):
+        with mock.patch("time.time", return_value=float(idx)):
+            metric_cache.set_many(items={key: "x" * 100})
+
+    assert set(metric_cache.get_many(keys=["a", "b", "c"]).keys()) == {"b", "c"}
+
+
+@pytest.mark.unit
+def test_sqlite_metric_cache_expires_entries(sqlite_metric_cache_path: str):
+    metric_cache = SqliteMetricCache(path=sqlite_metric_cache_path, ttl_seconds=10)
+    now = time.time()
+    with mock.patch("time.time", return_value=now - 20):
+        metric_cache.set_many(items={"old": 1})
+    metric_cache.set_many(items={"new": 2})
+
+    assert metric_cache.get_many(keys=["old", "new"]) == {"new": 2}
+    assert len(metric_cache) == 1
+
+
+@pytest.mark.unit
+def test_metric_cache_build_key_depends_on_fingerprint_and_metric_id():
+    metric_id = ("column.max", "column=a", "")
+    key = MetricCache.build_key(batch_fingerprint="abc", metric_id=metric_id)
+
+    assert key == MetricCache.build_key(batch_fingerprint="abc", metric_id=metric_id)
+    assert key != MetricCache.build_key(batch_fingerprint="abd", metric_id=metric_id)
+    assert key != MetricCache.build_key(
+        batch_fingerprint="abc", metric_id=("column.min", "column=a", "")
+    )
+
+
+@pytest.mark.unit
+def test_execution_engine_instantiates_metric_cache_from_config(
+    sqlite_metric_cache_path: str,
+):
+    execution_engine = PandasExecutionEngine(
+        metric_cache={
+            "class_name": "SqliteMetricCache",
+            "path": sqlite_metric_cache_path,
+            "max_entries": 10,
+        }
+    )
+
+    assert isinstance(execution_engine.persisted_metric_cache, SqliteMetricCache)
+    assert execution_engine.persisted_metric_cache.path == sqlite_metric_cache_path
+
+
+@pytest.mark.unit
+def test_persisted_metrics_are_reused_for_unchanged_batch(
+    sqlite_metric_cache_path: str,
+    in_memory_runtime_context: AbstractDataContext,
+):
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "z", None]})
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+    ]
+
+    validator = _build_validator(
+        df=df,
+        execution_engine=PandasExecutionEngine(
+            metric_cache=SqliteMetricCache(path=sqlite_metric_cache_path)
+        ),
+        context=in_memory_runtime_context,
+    )
+    expected_metrics = validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )[0]
+    metric_ids = [
+        metric_configuration.id for metric_configuration in metric_configurations
+    ]
+    assert [expected_metrics[metric_id] for metric_id in metric_ids] == [4, 1]
+
+    # Fresh engine and validator for the same data are served from the durable cache without computation.
+    validator = _build_validator(
+        df=df.copy(),
+        execution_engine=PandasExecutionEngine(
+            metric_cache=SqliteMetricCache(path=sqlite_metric_cache_path)
+        ),
+        context=in_memory_runtime_context,
+    )
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "resolve_metrics",
+        side_effect=AssertionError("metrics must not be recomputed"),
+    ):
+        resolved_metrics = validator.compute_metrics(
+            metric_configurations=[
+                MetricConfiguration(
+                    metric_name="column.max",
+                    metric_domain_kwargs={"column": "a"},
+                ),
+                MetricConfiguration(
+                    metric_name="column_values.nonnull.unexpected_count",
+                    metric_domain_kwargs={"column": "b"},
+                ),
+            ]
+        )[0]
+
+    assert [resolved_metrics[metric_id] for metric_id in metric_ids] == [4, 1]
+
+
+@pytest.mark.unit
+def test_persisted_metrics_are_not_reused_for_changed_batch(
+    sqlite_metric_cache_path: str,
+    in_memory_runtime_context: AbstractDataContext,
+):
+    validator = _build_validator(
+        df=pd.DataFrame({"a": [1, 2, 3, 4]}),
+        execution_engine=PandasExecutionEngine(
+            metric_cache=SqliteMetricCache(path=sqlite_metric_cache_path)
+        ),
+        context=in_memory_runtime_context,
+    )
+    assert (
+        validator.get_metric(
+            MetricConfiguration(
+                metric_name="column.max", metric_domain_kwargs={"column": "a"}
+            )
+        )
+        == 4
+    )
+
+    validator = _build_validator(
+        df=pd.DataFrame({"a": [1, 2, 3, 5]}),
+        execution_engine=PandasExecutionEngine(
+            metric_cache=SqliteMetricCache(path=sqlite_metric_cache_path)
+        ),
+        context=in_memory_runtime_context,
+    )
+    assert (
+        validator.get_metric(
+            MetricConfiguration(
+                metric_name="column.max", metric_domain_kwargs={"column": "a"}
+            )
+        )
+        == 5
+    )
+
+
+@pytest.mark.unit
+def test_batch_without_content_fingerprint_is_not_persisted(
+    sqlite_metric_cache_path: str,
+    in_memory_runtime_context: AbstractDataContext,
+):
+    metric_cache = SqliteMetricCache(path=sqlite_metric_cache_path)
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    batch = Batch(data=df)
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(metric_cache=metric_cache),
+        batches=[batch],
+        data_context=in_memory_runtime_context,
+    )
+    assert (
+        validator.get_metric(
+            MetricConfiguration(
+                metric_name="column.max", metric_domain_kwargs={"column": "a"}
+            )
+        )
+        == 4
+    )
+
+    assert validator.execution_engine.get_batch_fingerprint(batch_id=batch.id) is None
+    assert len(metric_cache) == 0
+
+
+@pytest.mark.unit
+def test_batch_fingerprint_tracks_local_file_changes(tmp_path: pathlib.Path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a\n1\n2\n")
+
+    execution_engine = PandasExecutionEngine()
+    batch = Batch(
+        data=pd.read_csv(csv_path),
+        batch_spec=BatchSpec({"path": str(csv_path)}),
+    )
+    execution_engine.batch_manager.load_batch_list(batch_list=[batch])
+    fingerprint = execution_engine.get_batch_fingerprint(batch_id=batch.id)
+    assert fingerprint is not None
+
+    csv_path.write_text("a\n1\n2\n3\n")
+    assert execution_engine.get_batch_fingerprint(batch_id=batch.id) != fingerprint
@@ -0,0 +1,156 @@
+import pathlib
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.exceptions import ExecutionEngineError
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasChunkedBatchData,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def csv_path(tmp_path: pathlib.Path) -> str:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(size=1000),
+            "b": rng.choice(["x", "y", "z", None], size=1000),
+            "c": rng.integers(low=0, high=100, size=1000),
+        }
+    )
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={}),
+        MetricConfiguration(
+            metric_name="column.max", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.mean", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.standard_deviation",
+            metric_domain_kwargs={"column": "c"},
+        ),
+        MetricConfiguration(
+            metric_name="column.sum",
+            metric_domain_kwargs={
+                "column": "c",
+                "row_condition": "a>0",
+                "condition_parser": "pandas",
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"value_set": ["x", "y"]},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_values",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={
+                "value_set": ["x", "y"],
+                "result_format": {
+                    "result_format": "BASIC",
+                    "partial_unexpected_count": 5,
+                },
+            },
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+    ]
+
+
+def _compute_metrics(
+    csv_path: str, reader_options: dict, context: AbstractDataContext
+) -> tuple:
+    execution_engine = PandasExecutionEngine()
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=csv_path, reader_method="read_csv", reader_options=reader_options
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    validator = Validator(execution_engine=execution_engine, data_context=context)
+    metric_configurations = _build_metric_configurations()
+    resolved_metrics = validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )[0]
+    return batch_data, [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ]
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_metrics_match_and_do_not_read_all_chunks_into_memory(
+    csv_path: str, in_memory_runtime_context: AbstractDataContext
+):
+    _, expected_values = _compute_metrics(
+        csv_path=csv_path, reader_options={}, context=in_memory_runtime_context
+    )
+    batch_data, values = _compute_metrics(
+        csv_path=csv_path,
+        reader_options={"chunksize": 128},
+        context=in_memory_runtime_context,
+    )
+
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    assert not batch_data.is_materialized
+    assert values[0] == expected_values[0] == 1000
+    assert values[1:5] == pytest.approx(expected_values[1:5])
+    assert values[5:] == expected_values[5:]
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_is_read_into_memory_for_metrics_not_computed_by_chunk(
+    csv_path: str, in_memory_runtime_context: AbstractDataContext
+):
+    execution_engine = PandasExecutionEngine()
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=csv_path, reader_method="read_csv", reader_options={"chunksize": 128}
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    validator = Validator(
+        execution_engine=execution_engine, data_context=in_memory_runtime_context
+    )
+
+    median = validator.get_metric(
+        MetricConfiguration(
+            metric_name="column.median", metric_domain_kwargs={"column": "c"}
+        )
+    )
+
+    assert batch_data.is_materialized
+    assert median == pd.read_csv(csv_path)["c"].median()
+    assert batch_data.dataframe.index.equals(pd.RangeIndex(1000))
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_does_not_support_sampling(csv_path: str):
+    with pytest.raises(ExecutionEngineError):
+        PandasExecutionEngine().get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=csv_path,
+                reader_method="read_csv",
+                reader_options={"chunksize": 128},
+                sampling_method="sample_using_limit",
+                sampling_kwargs={"n": 10},
+            )
+        )
@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 from unittest import mock
 
 import pandas as pd
@@ -11,12 +11,18 @@ from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.data_context import AbstractDataContext
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -415,6 +421,138 @@ def test_resolve_metric_bundle():
     )
 
 
+@pytest.mark.unit
+def test_resolve_metric_bundle_obtains_domain_records_once_per_domain():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4],
+            "b": [1.5, None, 3.5, 4.5],
+            "c": ["x", "y", "w", "z"],
+        }
+    )
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    row_condition_domain_kwargs = {
+        "row_condition": "a > 1",
+        "condition_parser": "pandas",
+    }
+    metric_specs = [
+        ("column.max", {"column": "a"}, 4),
+        ("column.min", {"column": "a"}, 1),
+        ("column.mean", {"column": "b"}, 9.5 / 3),
+        ("column.max", {"column": "c"}, "z"),
+        ("column.sum", {"column": "a", **row_condition_domain_kwargs}, 9),
+        ("column.max", {"column": "b", **row_condition_domain_kwargs}, 4.5),
+    ]
+    desired_metrics = []
+    for metric_name, metric_domain_kwargs, _ in metric_specs:
+        metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(metric)
+
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "get_domain_records",
+        side_effect=PandasExecutionEngine.get_domain_records,
+        autospec=True,
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    assert [results[metric.id] for metric in desired_metrics] == [
+        expected_value for _, _, expected_value in metric_specs
+    ]
+    # Numeric reductions are vectorized, yet produce the same types as computing them on each column separately.
+    assert type(results[desired_metrics[0].id]) is type(df["a"].max())
+    assert mock_get_domain_records.call_count == 2
+
+
+@pytest.mark.unit
+def test_fuse_map_conditions_evaluates_conditions_of_domain_in_one_pass(
+    in_memory_runtime_context: AbstractDataContext,
+):
+    df = pd.DataFrame(
+        {
+            "pk": [1, 2, 3, 4, 5, 6],
+            "a": [1.0, None, 3.0, 4.0, None, 6.0],
+            "b": ["x", "y", "zz", None, "x", "q"],
+        }
+    )
+    result_format = {
+        "result_format": "COMPLETE",
+        "unexpected_index_column_names": ["pk"],
+    }
+    configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "a",
+                "min_value": 2,
+                "max_value": 5,
+                "result_format": result_format,
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": "b",
+                "value_set": ["x", "y"],
+                "result_format": result_format,
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": result_format},
+        ),
+    ]
+
+    def _validate(execution_engine: PandasExecutionEngine) -> List[dict]:
+        execution_engine.load_batch_data(batch_id="my_batch", batch_data=df)
+        validator = Validator(
+            execution_engine=execution_engine, data_context=in_memory_runtime_context
+        )
+        return [
+            convert_to_json_serializable(result.result)
+            for result in validator.graph_validate(configurations=configurations)
+        ]
+
+    expected_results = _validate(execution_engine=PandasExecutionEngine())
+
+    execution_engine = PandasExecutionEngine(fuse_map_conditions=True)
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "_resolve_column_conditions",
+        side_effect=PandasExecutionEngine._resolve_column_conditions,
+        autospec=True,
+    ) as mock_resolve_column_conditions:
+        results = _validate(execution_engine=execution_engine)
+
+    assert results == expected_results
+    assert results[0]["unexpected_index_list"] == [
+        {"a": 1.0, "pk": 1},
+        {"a": 6.0, "pk": 6},
+    ]
+    assert mock_resolve_column_conditions.call_count == 1
+    # Matrix is no longer retained, once unexpected counts of its conditions have been resolved.
+    assert not execution_engine._fused_map_conditions
+    assert execution_engine.config["fuse_map_conditions"] is True
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 @pytest.mark.unit
 def test_resolve_metric_bundle_with_nonexistent_metric():
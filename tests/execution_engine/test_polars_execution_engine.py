@@ -0,0 +1,230 @@
+import pathlib
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.exceptions import ExecutionEngineError
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    PolarsExecutionEngine,
+)
+from great_expectations.execution_engine.polars_batch_data import PolarsBatchData
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+pl = pytest.importorskip("polars")
+
+pytestmark = pytest.mark.polars
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=0)
+    return pd.DataFrame(
+        {
+            "a": rng.normal(size=1000),
+            "b": rng.choice(["x", "y", "z", None], size=1000),
+            "c": rng.integers(low=0, high=100, size=1000),
+        }
+    )
+
+
+@pytest.fixture
+def csv_path(df: pd.DataFrame, tmp_path: pathlib.Path) -> str:
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _build_metric_configurations() -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(metric_name="table.row_count", metric_domain_kwargs={}),
+        MetricConfiguration(metric_name="table.columns", metric_domain_kwargs={}),
+        MetricConfiguration(
+            metric_name="column.max", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.min", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.mean", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.median", metric_domain_kwargs={"column": "a"}
+        ),
+        MetricConfiguration(
+            metric_name="column.standard_deviation",
+            metric_domain_kwargs={"column": "c"},
+        ),
+        MetricConfiguration(
+            metric_name="column.sum", metric_domain_kwargs={"column": "c"}
+        ),
+        MetricConfiguration(
+            metric_name="column.distinct_values.count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.in_set.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"value_set": ["x", "y"]},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.between.unexpected_count",
+            metric_domain_kwargs={"column": "c"},
+            metric_value_kwargs={"min_value": 10, "max_value": 90},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.nonnull.unexpected_count",
+            metric_domain_kwargs={"column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column_values.unique.unexpected_count",
+            metric_domain_kwargs={"column": "c"},
+        ),
+    ]
+
+
+def _compute_metrics(
+    execution_engine: ExecutionEngine, context: AbstractDataContext
+) -> list:
+    validator = Validator(execution_engine=execution_engine, data_context=context)
+    metric_configurations = _build_metric_configurations()
+    resolved_metrics = validator.compute_metrics(
+        metric_configurations=metric_configurations
+    )[0]
+    return [
+        resolved_metrics[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ]
+
+
+@pytest.mark.unit
+def test_polars_metrics_match_pandas_metrics(
+    df: pd.DataFrame,
+    csv_path: str,
+    in_memory_runtime_context: AbstractDataContext,
+):
+    pandas_execution_engine = PandasExecutionEngine()
+    pandas_execution_engine.load_batch_data(batch_id="my_batch", batch_data=df)
+    expected_values = _compute_metrics(
+        execution_engine=pandas_execution_engine, context=in_memory_runtime_context
+    )
+
+    polars_execution_engine = PolarsExecutionEngine()
+    batch_data, _ = polars_execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=csv_path)
+    )
+    polars_execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    values = _compute_metrics(
+        execution_engine=polars_execution_engine, context=in_memory_runtime_context
+    )
+
+    assert isinstance(batch_data, PolarsBatchData)
+    assert isinstance(batch_data.dataframe, pl.LazyFrame)
+    assert values[:2] == expected_values[:2]
+    assert values[2:8] == pytest.approx(expected_values[2:8])
+    assert values[8:] == expected_values[8:]
+
+
+@pytest.mark.unit
+def test_polars_aggregate_metrics_of_domain_are_bundled_into_one_query(
+    df: pd.DataFrame,
+    in_memory_runtime_context: AbstractDataContext,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    number_of_queries_per_collect: List[int] = []
+    collect_all = pl.collect_all
+
+    def _collect_all(queries, *args, **kwargs):
+        number_of_queries_per_collect.append(len(queries))
+        return collect_all(queries, *args, **kwargs)
+
+    monkeypatch.setattr(pl, "collect_all", _collect_all)
+
+    execution_engine = PolarsExecutionEngine()
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=df)
+    validator = Validator(
+        execution_engine=execution_engine, data_context=in_memory_runtime_context
+    )
+    validator.compute_metrics(
+        metric_configurations=[
+            MetricConfiguration(
+                metric_name=metric_name, metric_domain_kwargs={"column": column}
+            )
+            for metric_name in ("column.max", "column.min", "column.mean")
+            for column in ("a", "c")
+        ]
+    )
+
+    # "table.row_count" is resolved first; all six column aggregates share one "select()".
+    assert number_of_queries_per_collect == [1, 1]
+
+
+@pytest.mark.unit
+def test_polars_unexpected_values_respect_row_condition(
+    in_memory_runtime_context: AbstractDataContext,
+):
+    execution_engine = PolarsExecutionEngine()
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeDataBatchSpec(
+            batch_data=pl.DataFrame(
+                {
+                    "a": [1, 2, 3, None, 5],
+                    "b": ["x", "y", "zz", "x", None],
+                }
+            )
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+    validator = Validator(
+        execution_engine=execution_engine, data_context=in_memory_runtime_context
+    )
+
+    result = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={
+                    "column": "b",
+                    "value_set": ["x", "y"],
+                    "result_format": "COMPLETE",
+                },
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_between",
+                kwargs={
+                    "column": "a",
+                    "min_value": 2,
+                    "max_value": 4,
+                    "row_condition": 'col("b")!="zz"',
+                    "condition_parser": "great_expectations__experimental__",
+                    "result_format": "COMPLETE",
+                },
+            ),
+        ]
+    )
+
+    assert result[0].result["unexpected_list"] == ["zz"]
+    assert result[0].result["unexpected_index_list"] == [2]
+    assert result[1].result["unexpected_count"] == 1
+    assert result[1].result["unexpected_list"] == [1]
+
+
+@pytest.mark.unit
+def test_polars_execution_engine_does_not_support_sampling(csv_path: str):
+    with pytest.raises(ExecutionEngineError):
+        PolarsExecutionEngine().get_batch_data_and_markers(
+            batch_spec=PathBatchSpec(
+                path=csv_path,
+                sampling_method="sample_using_limit",
+                sampling_kwargs={"n": 10},
+            )
+        )
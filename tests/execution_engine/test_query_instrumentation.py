@@ -0,0 +1,134 @@
+import json
+import pathlib
+import threading
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.execution_engine.query_instrumentation import (
+    QueryInstrumentation,
+)
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validator import Validator
+
+
+@pytest.mark.unit
+def test_queries_are_attributed_to_metric_ids_of_their_thread():
+    query_instrumentation = QueryInstrumentation()
+    metric_id_1 = ("column.max", "domain_1", ())
+    metric_id_2 = ("column.min", "domain_2", ())
+
+    def _record_query_on_other_thread():
+        with query_instrumentation.attribute_to(metric_ids=[metric_id_2]):
+            query_instrumentation.record(query="SELECT 2", wall_time_seconds=2.0)
+
+    with query_instrumentation.attribute_to(metric_ids=[metric_id_1]):
+        thread = threading.Thread(target=_record_query_on_other_thread)
+        thread.start()
+        thread.join()
+        query_instrumentation.record(
+            query="SELECT 1", wall_time_seconds=1.0, row_count=1
+        )
+
+    query_instrumentation.record(query="SELECT 3", wall_time_seconds=3.0)
+
+    assert [
+        (query_record.query, query_record.metric_ids)
+        for query_record in query_instrumentation.get_records()
+    ] == [
+        ("SELECT 2", [metric_id_2]),
+        ("SELECT 1", [metric_id_1]),
+        ("SELECT 3", []),
+    ]
+    assert query_instrumentation.summarize(
+        query_records=query_instrumentation.get_records_for_metric_ids(
+            metric_ids={metric_id_1, metric_id_2}, since=1
+        )
+    ) == {
+        "query_count": 1,
+        "query_ids": [1],
+        "wall_time_seconds": 1.0,
+        "row_count": 1,
+        "bytes_processed": None,
+    }
+
+
+@pytest.mark.sqlite
+def test_validation_results_carry_cost_of_queries_of_their_expectations(
+    sa, tmp_path: pathlib.Path, in_memory_runtime_context: AbstractDataContext
+):
+    engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, None], "b": [4, 5, 6]}).to_sql(
+        name="test", con=engine, index=False
+    )
+    report_path = tmp_path / "query_reports.jsonl"
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=engine,
+        query_instrumentation={"explain": True, "report_path": str(report_path)},
+    )
+    batch = Batch(
+        data=SqlAlchemyBatchData(execution_engine=execution_engine, table_name="test")
+    )
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[batch],
+        data_context=in_memory_runtime_context,
+    )
+
+    suite = ExpectationSuite(
+        name="my_suite",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a"},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "b", "min_value": 0, "max_value": 10},
+            ),
+        ],
+    )
+    suite_validation_result = validator.validate(expectation_suite=suite)
+
+    query_report: dict = suite_validation_result.meta["query_instrumentation"]
+    queries_by_id = {query["query_id"]: query for query in query_report["queries"]}
+    assert all(query["explain_plan"] for query in queries_by_id.values())
+
+    expectation_query_ids = {}
+    for validation_result in suite_validation_result.results:
+        query_ids = validation_result.meta["query_instrumentation"]["query_ids"]
+        assert query_ids
+        expectation_query_ids[
+            validation_result.expectation_config.expectation_type
+        ] = query_ids
+
+    assert any(
+        "max(b)" in queries_by_id[query_id]["query"]
+        for query_id in expectation_query_ids["expect_column_max_to_be_between"]
+    )
+    assert not any(
+        "max(b)" in queries_by_id[query_id]["query"]
+        for query_id in expectation_query_ids["expect_column_values_to_not_be_null"]
+    )
+
+    reports = [json.loads(line) for line in report_path.read_text().splitlines()]
+    assert len(reports) == 1
+    assert reports[0]["expectation_suite_name"] == "my_suite"
+    assert reports[0]["queries"] == query_report["queries"]
+    assert [
+        expectation["expectation_type"] for expectation in reports[0]["expectations"]
+    ] == [
+        validation_result.expectation_config.expectation_type
+        for validation_result in suite_validation_result.results
+    ]
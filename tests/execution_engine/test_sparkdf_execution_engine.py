@@ -1167,6 +1167,134 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(
         assert False, str(e)
 
 
+def test_resolve_metric_bundle_computes_row_filtered_aggregates_on_unfiltered_batch(
+    caplog, spark_session
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 3, 4], "b": [10, 20, 30, 40]},
+        ),
+        batch_id="1234",
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    metric_domain_kwargs_by_metric_name: Dict[str, dict] = {
+        "column.max": {
+            "column": "a",
+            "row_condition": 'col("b")<35',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        "column.min": {
+            "column": "b",
+            "row_condition": "a > 1",
+            "condition_parser": "spark",
+        },
+        "column.sum": {"column": "a"},
+    }
+
+    aggregate_fn_metrics: Dict[str, MetricConfiguration] = {}
+    for (
+        metric_name,
+        metric_domain_kwargs,
+    ) in metric_domain_kwargs_by_metric_name.items():
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics[metric_name] = aggregate_fn_metric
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics.values(), metrics=metrics
+    )
+    metrics.update(results)
+
+    # Row filtering is folded into aggregates, which are all computed on the same (unfiltered) compute Domain.
+    assert all(
+        metrics[aggregate_fn_metric.id][1] == {}
+        for aggregate_fn_metric in aggregate_fn_metrics.values()
+    )
+
+    desired_metrics: Dict[str, MetricConfiguration] = {}
+    for metric_name, aggregate_fn_metric in aggregate_fn_metrics.items():
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs_by_metric_name[metric_name],
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics[metric_name] = desired_metric
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics.values(), metrics=metrics
+    )
+
+    assert results[desired_metrics["column.max"].id] == 3
+    assert results[desired_metrics["column.min"].id] == 20
+    assert results[desired_metrics["column.sum"].id] == 10
+    assert any(
+        record.message == "SparkDFExecutionEngine computed 3 metrics on domain_id ()"
+        for record in caplog.records
+    )
+
+
+def test_batch_data_is_persisted_at_storage_level_while_retained(spark_session):
+    df: pyspark.DataFrame = spark_session.createDataFrame(
+        pd.DataFrame({"a": [1, 2, 3]})
+    )
+    cached_df: pyspark.DataFrame = spark_session.createDataFrame(
+        pd.DataFrame({"a": [4, 5, 6]})
+    ).cache()
+
+    engine = SparkDFExecutionEngine(
+        storage_level="MEMORY_AND_DISK",
+        batch_data_dict={"my_id": df, "my_cached_id": cached_df},
+        force_reuse_spark_context=True,
+    )
+    assert engine.config["storage_level"] == "MEMORY_AND_DISK"
+    assert df.is_cached
+    assert df.storageLevel == pyspark.StorageLevel.MEMORY_AND_DISK
+
+    with engine.retaining_batch_data():
+        with engine.retaining_batch_data():
+            pass
+
+        assert df.is_cached
+
+    # DataFrames persisted by engine are unpersisted; those persisted by caller are left as they are.
+    assert not df.is_cached
+    assert cached_df.is_cached
+
+    with engine.retaining_batch_data():
+        assert df.is_cached
+
+    assert not df.is_cached
+
+
+def test_unrecognized_storage_level_raises_error(spark_session):
+    with pytest.raises(ValueError):
+        SparkDFExecutionEngine(
+            storage_level="NOT_A_STORAGE_LEVEL",
+            force_reuse_spark_context=True,
+        )
+
+
 # Making sure dataframe property is functional
 def test_dataframe_property_given_loaded_batch(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -1,6 +1,7 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+import threading
+from typing import Dict, List, Tuple, cast
 from unittest import mock
 
 import pandas as pd
@@ -21,7 +22,11 @@ from great_expectations.core.metric_function_types import (
     MetricPartialFunctionTypeSuffixes,
     SummarizationMetricNameSuffixes,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
+from great_expectations.execution_engine.execution_engine import (
+    MetricComputationConfiguration,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -448,6 +453,98 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+@pytest.mark.sqlite
+def test_sa_batch_aggregate_metrics_on_row_filtered_domains_share_single_query(
+    caplog, sa
+):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {
+                "a": [1, 2, None, 4, 5, 6],
+                "b": [10.0, None, 30.0, 40.0, None, 60.0],
+                "c": ["x", "y", "x", "y", "x", None],
+            }
+        ),
+        sa,
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(
+        execution_engine=execution_engine
+    )
+    metrics.update(results)
+
+    row_condition_domain_kwargs = {
+        "row_condition": 'col("c")=="x"',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    metric_specs = [
+        ("column.max", {"column": "a"}, 6.0),
+        ("column.min", {"column": "b"}, 10.0),
+        ("column.mean", {"column": "a", **row_condition_domain_kwargs}, 3.0),
+        ("column.sum", {"column": "b", **row_condition_domain_kwargs}, 40.0),
+        ("table.row_count", row_condition_domain_kwargs, 3),
+        ("table.row_count", {}, 6),
+    ]
+
+    aggregate_fn_metrics = []
+    for metric_name, metric_domain_kwargs, _ in metric_specs:
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics = []
+    for (metric_name, metric_domain_kwargs, _), aggregate_fn_metric in zip(
+        metric_specs, aggregate_fn_metrics
+    ):
+        desired_metric = MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[desired_metric.id] for desired_metric in desired_metrics] == [
+        expected_value for _, _, expected_value in metric_specs
+    ]
+
+    # Column aggregates filter NULL values of their own column, and some Domains carry "row_condition"; yet, all
+    # metrics are computed by one query of the unfiltered table.
+    computed_messages = [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SqlAlchemyExecutionEngine computed")
+    ]
+    assert computed_messages == [
+        "SqlAlchemyExecutionEngine computed 6 metrics on domain_id ()"
+    ]
+
+
 @pytest.mark.sqlite
 def test_get_domain_records_with_column_domain(sa):
     df = pd.DataFrame(
@@ -1142,6 +1239,100 @@ def test_resolve_metric_bundle_with_compute_domain_kwargs_json_serialization(sa)
         assert False, str(e)
 
 
+@pytest.mark.sqlite
+def test_resolve_metric_bundle_executes_domain_queries_concurrently(
+    sa, tmp_path, monkeypatch
+):
+    sqlalchemy_engine = sa.create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [1, 2, 3]}), name="test_1", con=sqlalchemy_engine
+    )
+    add_dataframe_to_db(
+        df=pd.DataFrame({"a": [4, 5, 6, 7]}), name="test_2", con=sqlalchemy_engine
+    )
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency={"enabled": True},
+        create_temp_table=False,
+    )
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=execution_engine, table_name="test_1"
+    )
+    execution_engine.load_batch_data(batch_id="1234", batch_data=batch_data)
+
+    # SQLite shares single persisted connection; emulate pooled dialect by giving each query its own connection.
+    monkeypatch.setattr(
+        SqlAlchemyExecutionEngine,
+        "supports_concurrent_metric_resolution",
+        property(lambda self: True),
+    )
+
+    # Both domain queries must be in flight at the same time for the barrier to be passed.
+    barrier = threading.Barrier(parties=2, timeout=10)
+
+    def _execute_query(query):
+        barrier.wait()
+        with sqlalchemy_engine.connect() as connection:
+            rows = connection.execute(query).fetchall()
+
+        return mock.Mock(fetchall=lambda: rows)
+
+    monkeypatch.setattr(execution_engine, "execute_query", _execute_query)
+
+    metric_fn_bundle = []
+    for table_name, metric_name in (
+        ("test_2", "table.row_count"),
+        ("test_1", "column.max"),
+    ):
+        metric_fn_bundle.append(
+            MetricComputationConfiguration(
+                metric_configuration=MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs={"table": table_name},
+                    metric_value_kwargs=None,
+                ),
+                metric_fn=sa.func.count()
+                if metric_name == "table.row_count"
+                else sa.func.max(sa.column("a")),
+                metric_provider_kwargs={},
+                compute_domain_kwargs={"table": table_name},
+            )
+        )
+
+    results = execution_engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert results == {
+        metric_fn_bundle[0].metric_configuration.id: 4,
+        metric_fn_bundle[1].metric_configuration.id: 3,
+    }
+    assert list(results.keys()) == [
+        metric_computation_configuration.metric_configuration.id
+        for metric_computation_configuration in metric_fn_bundle
+    ]
+
+
+@pytest.mark.sqlite
+def test_concurrency_config_of_execution_engine_overrides_that_of_data_context(sa):
+    data_context = mock.Mock(concurrency=ConcurrencyConfig(enabled=False))
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"),
+        data_context=data_context,
+        concurrency={"enabled": True, "max_database_query_concurrency": 4},
+    )
+
+    assert execution_engine._concurrency.enabled
+    assert execution_engine._concurrency.max_database_query_concurrency == 4
+    assert execution_engine.config["concurrency"] == {
+        "enabled": True,
+        "max_database_query_concurrency": 4,
+    }
+
+
 @pytest.mark.sqlite
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
@@ -1162,6 +1353,30 @@ def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     assert batch_markers.get("ge_load_time") is not None
 
 
+@pytest.mark.sqlite
+def test_close_drops_temp_tables_materialized_for_batches(sa, test_df):
+    execution_engine = SqlAlchemyExecutionEngine(
+        engine=sa.create_engine("sqlite://"), create_temp_table=True
+    )
+    add_dataframe_to_db(df=test_df, name="test_table_0", con=execution_engine.engine)
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=RuntimeQueryBatchSpec(query="SELECT * FROM test_table_0")
+    )
+    temp_table_name: str = batch_data.selectable.name
+    assert temp_table_name in get_sqlite_temp_table_names(execution_engine)
+
+    executed_statements: List[str] = []
+
+    def _record_statement(conn, cursor, statement, parameters, context, executemany):
+        executed_statements.append(statement)
+
+    sa.event.listen(execution_engine.engine, "before_cursor_execute", _record_statement)
+    execution_engine.close()
+
+    assert executed_statements == [f"\nDROP TABLE IF EXISTS {temp_table_name}"]
+
+
 @pytest.mark.sqlite
 def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     def validate_tmp_tables(execution_engine):
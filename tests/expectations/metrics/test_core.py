@@ -39,6 +39,7 @@ from great_expectations.self_check.util import (
 from great_expectations.util import isclose
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -2720,6 +2721,75 @@ def test_map_unique_empty_query_sa(sa):
     assert results[desired_metric.id] == 0
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "metric_domain_kwargs,expected_unexpected_count,expected_grouped_queries",
+    [
+        pytest.param({"column": "a"}, 0, 0, id="unique_column"),
+        pytest.param({"column": "b"}, 2, 2, id="column_with_duplicates"),
+        pytest.param({"column_list": ["a", "b"]}, 0, 1, id="unique_compound_columns"),
+        pytest.param(
+            {"column_list": ["b", "c"]}, 2, 3, id="compound_columns_with_duplicates"
+        ),
+    ],
+)
+def test_map_unique_groups_rows_only_if_duplicates_exist_sa(
+    sa,
+    in_memory_runtime_context,
+    metric_domain_kwargs: dict,
+    expected_unexpected_count: int,
+    expected_grouped_queries: int,
+):
+    engine = build_sa_execution_engine(
+        pd.DataFrame(
+            {"a": [1, 2, 3, None], "b": [1, 1, 2, 3], "c": [5, 5, 6, 6]},
+        ),
+        sa,
+    )
+    statements = []
+    sa.event.listen(
+        engine.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    metric_name = (
+        "column_values.unique"
+        if "column" in metric_domain_kwargs
+        else "compound_columns.unique"
+    )
+    unexpected_count_metric_name = (
+        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+    )
+    unexpected_rows_metric_name = (
+        f"{metric_name}.{SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value}"
+    )
+    validator = Validator(
+        execution_engine=engine, data_context=in_memory_runtime_context
+    )
+
+    metrics = validator.get_metrics(
+        metrics={
+            unexpected_count_metric_name: MetricConfiguration(
+                metric_name=unexpected_count_metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+            ),
+            unexpected_rows_metric_name: MetricConfiguration(
+                metric_name=unexpected_rows_metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs={"result_format": {"result_format": "COMPLETE"}},
+            ),
+        }
+    )
+
+    assert metrics[unexpected_count_metric_name] == expected_unexpected_count
+    assert len(metrics[unexpected_rows_metric_name]) == expected_unexpected_count
+    # Duplicates are searched for (with GROUP BY subquery) only if cheap check found that they exist.
+    assert (
+        sum("GROUP BY" in statement for statement in statements)
+        == expected_grouped_queries
+    )
+
+
 @pytest.mark.spark
 def test_map_unique_column_exists_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
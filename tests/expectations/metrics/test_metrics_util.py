@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import random
-from typing import TYPE_CHECKING, Final, List, Union
+import warnings
+from typing import Final, List, Union
 
+import numpy as np
+import pandas as pd
 import pytest
 from _pytest import monkeypatch
 
@@ -16,6 +19,7 @@ from great_expectations.exceptions import MetricResolutionError
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.expectations.metrics.util import (
     CaseInsensitiveString,
+    PandasColumnRegexMatcher,
     get_dbms_compatible_metric_domain_kwargs,
     get_unexpected_indices_for_multiple_pandas_named_indices,
     get_unexpected_indices_for_single_pandas_named_index,
@@ -32,9 +36,6 @@ from tests.test_utils import (
     get_snowflake_connection_url,
 )
 
-if TYPE_CHECKING:
-    import pandas as pd
-
 # The following class allows for declarative instantiation of base class for SqlAlchemy. Adopted from
 # https://docs.sqlalchemy.org/en/14/faq/sqlexpressions.html#rendering-postcompile-parameters-as-bound-parameters
 
@@ -644,5 +645,89 @@ class TestCaseInsensitiveString:
             assert input_case_insensitive != other
 
 
+_REGEX_MATCHER_VALUES: Final[List] = [
+    "abc",
+    "abc\n",
+    "a1",
+    "a\u0663",
+    "x y",
+    "ABC",
+    "a.b",
+    "aaa",
+    "",
+    "foo{bar}",
+    "\u00e9",
+    "ab\ncd",
+    1,
+    2.5,
+]
+
+
+def _str_contains(column: pd.Series, regex: str) -> pd.Series:
+    with warnings.catch_warnings():
+        # pandas warns about regexes with groups, which "Series.str.contains()" does not extract.
+        warnings.simplefilter("ignore", UserWarning)
+        return column.astype(str).str.contains(regex)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "regex",
+    [
+        "^a",
+        "c$",
+        "\\d",
+        "[0-9]",
+        "\\w+",
+        "a\\.b",
+        "(?i)abc",
+        "a{2}",
+        "o{b",
+        "^$",
+        "(a)\\1",
+        "cd\\Z",
+        "^(abc|a1)$",
+    ],
+)
+def test_pandas_column_regex_matcher_search_matches_str_contains(regex: str):
+    column = pd.Series(_REGEX_MATCHER_VALUES, dtype=object)
+
+    expected = _str_contains(column=column, regex=regex)
+
+    pd.testing.assert_series_equal(
+        PandasColumnRegexMatcher(column).search(regex=regex), expected
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "regex_list",
+    [["^a", "c$"], ["(?i)abc", "x"], ["(a)\\1", "b"], ["\\d", "\u00e9"]],
+)
+def test_pandas_column_regex_matcher_search_any_and_all(regex_list: List[str]):
+    column = pd.Series(_REGEX_MATCHER_VALUES, dtype=object, index=range(10, 24))
+    matcher = PandasColumnRegexMatcher(column)
+    matches = [_str_contains(column=column, regex=regex) for regex in regex_list]
+
+    assert matcher.search_any(regex_list=regex_list).index.equals(column.index)
+    np.testing.assert_array_equal(
+        matcher.search_any(regex_list=regex_list), np.logical_or.reduce(matches)
+    )
+    np.testing.assert_array_equal(
+        matcher.search_all(regex_list=regex_list), np.logical_and.reduce(matches)
+    )
+
+
+@pytest.mark.unit
+def test_pandas_column_regex_matcher_requires_regexes():
+    matcher = PandasColumnRegexMatcher(pd.Series(["a"]))
+
+    with pytest.raises(ValueError):
+        matcher.search_any(regex_list=[])
+
+    with pytest.raises(ValueError):
+        matcher.search_all(regex_list=[])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
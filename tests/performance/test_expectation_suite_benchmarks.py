@@ -0,0 +1,95 @@
+"""
+Microbenchmarks of building and querying large "ExpectationSuite" objects.
+
+Run with:  pytest tests/performance/test_expectation_suite_benchmarks.py --performance-tests
+"""
+
+from typing import List
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.expectation_suite import ExpectationSuite
+from great_expectations.data_context import AbstractDataContext
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+
+pytestmark = pytest.mark.performance
+
+
+def _build_expectation_configurations(
+    number_of_expectations: int,
+) -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": f"c{idx}", "value_set": [1, 2, 3]},
+        )
+        for idx in range(number_of_expectations)
+    ]
+
+
+@pytest.mark.parametrize("number_of_expectations", [1_000, 10_000])
+def test_expectation_suite_add_expectation_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    in_memory_runtime_context: AbstractDataContext,
+    number_of_expectations: int,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    expectation_configurations = _build_expectation_configurations(
+        number_of_expectations=number_of_expectations
+    )
+
+    def _build_suite() -> ExpectationSuite:
+        suite = ExpectationSuite(
+            name="benchmark_suite", data_context=in_memory_runtime_context
+        )
+        for expectation_configuration in expectation_configurations:
+            suite.add_expectation(
+                expectation_configuration=expectation_configuration,
+                send_usage_event=False,
+            )
+
+        return suite
+
+    suite: ExpectationSuite = benchmark.pedantic(_build_suite, rounds=3, iterations=1)
+
+    assert len(suite.expectation_configurations) == number_of_expectations
+
+
+@pytest.mark.parametrize("number_of_expectations", [1_000, 10_000])
+def test_expectation_suite_find_expectation_indexes_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    in_memory_runtime_context: AbstractDataContext,
+    number_of_expectations: int,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    expectation_configurations = _build_expectation_configurations(
+        number_of_expectations=number_of_expectations
+    )
+    suite = ExpectationSuite(
+        name="benchmark_suite",
+        data_context=in_memory_runtime_context,
+        expectations=expectation_configurations,
+    )
+
+    def _find_all() -> List[List[int]]:
+        return [
+            suite.find_expectation_indexes(
+                expectation_configuration=expectation_configuration,
+                match_type="domain",
+            )
+            for expectation_configuration in expectation_configurations
+        ]
+
+    indexes: List[List[int]] = benchmark.pedantic(_find_all, rounds=3, iterations=1)
+
+    assert indexes == [[idx] for idx in range(number_of_expectations)]
@@ -0,0 +1,87 @@
+"""
+Microbenchmarks of "ValidationGraph" scheduling, using synthetic graphs and an execution engine that resolves instantly.
+
+Run with:  pytest tests/performance/test_validation_graph_benchmarks.py --performance-tests
+"""
+
+from typing import Dict, Iterable, Optional, Tuple, cast
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+pytestmark = pytest.mark.performance
+
+
+class _InstantExecutionEngine:
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        return {metric.id: 0 for metric in metrics_to_resolve}
+
+
+def _build_layered_graph(
+    number_of_edges: int, width: int = 100, fan_in: int = 4
+) -> ValidationGraph:
+    """Builds graph of layers of "width" metrics, each depending on "fan_in" metrics of the layer below it."""
+    graph = ValidationGraph(
+        execution_engine=cast(ExecutionEngine, _InstantExecutionEngine())
+    )
+    layer = [
+        MetricConfiguration(
+            metric_name="metric_0", metric_domain_kwargs={"column": f"c{idx}"}
+        )
+        for idx in range(width)
+    ]
+    for metric in layer:
+        graph.add(MetricEdge(left=metric))
+
+    depth: int = 1
+    while len(graph.edges) < number_of_edges:
+        next_layer = [
+            MetricConfiguration(
+                metric_name=f"metric_{depth}",
+                metric_domain_kwargs={"column": f"c{idx}"},
+            )
+            for idx in range(width)
+        ]
+        for idx, metric in enumerate(next_layer):
+            for offset in range(fan_in):
+                graph.add(MetricEdge(left=metric, right=layer[(idx + offset) % width]))
+
+        layer = next_layer
+        depth += 1
+
+    return graph
+
+
+@pytest.mark.parametrize("number_of_edges", [10_000, 100_000])
+def test_validation_graph_resolve_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_edges: int,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    graph = _build_layered_graph(number_of_edges=number_of_edges)
+
+    resolved_metrics, aborted_metrics_info = benchmark.pedantic(
+        graph.resolve, rounds=3, iterations=1
+    )
+
+    assert not aborted_metrics_info
+    assert len(resolved_metrics) == len(
+        {
+            metric_configuration.id
+            for metric_configuration in graph.metric_configurations
+        }
+    )
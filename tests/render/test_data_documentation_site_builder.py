@@ -1,9 +1,11 @@
 import os
+import pathlib
 import shutil
 from typing import Dict
 
 import pytest
 
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
@@ -13,6 +15,9 @@ from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -131,3 +136,95 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     assert profiling_site_section_builder.run_name_filter == {
         "equals": "custom_profiling_filter"
     }
+
+
+def test_incremental_site_builder_renders_only_changed_resources(
+    empty_data_context, mocker
+):
+    context = empty_data_context
+    context.suites.add(ExpectationSuite(name="unchanged_suite"))
+    changed_suite = context.suites.add(ExpectationSuite(name="changed_suite"))
+    removed_suite = context.suites.add(ExpectationSuite(name="removed_suite"))
+
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    local_site_config["incremental"] = True
+    site_builder = instantiate_class_from_config(
+        config=local_site_config,
+        runtime_environment={
+            "data_context": context,
+            "root_directory": context.root_directory,
+            "site_name": "local_site",
+        },
+        config_defaults={
+            "module_name": "great_expectations.render.renderer.site_builder"
+        },
+    )
+    site_dir = pathlib.Path(context.root_directory) / "uncommitted/data_docs/local_site"
+    expectations_section_builder = site_builder.site_section_builders["expectations"]
+
+    _, index_links_dict = site_builder.build()
+
+    assert (site_dir / "data_docs_build_manifest.json").is_file()
+    assert (site_dir / "expectations/removed_suite.html").is_file()
+    assert sorted(
+        link["expectation_suite_name"]
+        for link in index_links_dict["expectations_links"]
+    ) == ["changed_suite", "removed_suite", "unchanged_suite"]
+
+    changed_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal", kwargs={"value": 1}
+        )
+    )
+    changed_suite.save()
+    context.suites.delete(suite=removed_suite)
+    render_spy = mocker.spy(expectations_section_builder.renderer_class, "render")
+
+    _, index_links_dict = site_builder.build()
+
+    assert [call.args[0].name for call in render_spy.call_args_list] == [
+        "changed_suite"
+    ]
+    assert not (site_dir / "expectations/removed_suite.html").exists()
+    assert sorted(
+        link["expectation_suite_name"]
+        for link in index_links_dict["expectations_links"]
+    ) == ["changed_suite", "unchanged_suite"]
+
+
+def test_site_builder_with_rendering_workers_builds_same_site_as_serial_build(
+    empty_data_context,
+):
+    context = empty_data_context
+    for suite_name in ("suite_c", "suite_a", "suite_b"):
+        context.suites.add(ExpectationSuite(name=suite_name))
+
+    def _build_site(site_name: str, max_rendering_workers: int):
+        site_config = dict(context._project_config.data_docs_sites["local_site"])
+        site_config["store_backend"] = {
+            "class_name": "TupleFilesystemStoreBackend",
+            "base_directory": f"uncommitted/data_docs/{site_name}/",
+        }
+        site_config["max_rendering_workers"] = max_rendering_workers
+        site_builder = instantiate_class_from_config(
+            config=site_config,
+            runtime_environment={
+                "data_context": context,
+                "root_directory": context.root_directory,
+                "site_name": site_name,
+            },
+            config_defaults={
+                "module_name": "great_expectations.render.renderer.site_builder"
+            },
+        )
+        _, index_links_dict = site_builder.build()
+        index_links_dict.pop("site_name")
+        site_dir = pathlib.Path(context.root_directory) / "uncommitted/data_docs"
+        site_dir /= site_name
+        return index_links_dict, sorted(
+            str(path.relative_to(site_dir)) for path in site_dir.rglob("*.html")
+        )
+
+    assert _build_site("serial_site", max_rendering_workers=1) == _build_site(
+        "parallel_site", max_rendering_workers=4
+    )
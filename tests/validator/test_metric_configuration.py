@@ -63,3 +63,21 @@ def test_metric_configuration_get_domain(
             "column": "my_column",
         },
     )
+
+
+@pytest.mark.unit
+def test_metric_configuration_freeze_makes_kwargs_immutable_and_caches_id() -> None:
+    metric_configuration = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_count",
+        metric_domain_kwargs={"column": "my_column", "batch_id": "abc123"},
+        metric_value_kwargs={"value_set": [1, 2, 3]},
+    )
+    expected_id = metric_configuration.id
+
+    assert not metric_configuration.is_frozen
+    assert metric_configuration.freeze() is metric_configuration
+    assert metric_configuration.is_frozen
+    assert metric_configuration.id == expected_id
+
+    with pytest.raises(TypeError):
+        metric_configuration.metric_value_kwargs["value_set"] = [4]
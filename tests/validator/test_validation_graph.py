@@ -1,5 +1,6 @@
 import sys
-from typing import Dict, Iterable, Optional, Set, Tuple, Union, cast
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 from unittest import mock
 
 import pytest
@@ -18,6 +19,7 @@ from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
     MetricEdge,
     ValidationGraph,
+    _MetricScheduler,
 )
 from great_expectations.validator.validator import ValidationDependencies
 
@@ -402,6 +404,132 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true():
     )
 
 
+@pytest.mark.unit
+def test_group_metrics_by_compute_domain_keeps_bundleable_metrics_together():
+    metrics = {
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_batch", "column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column.min",
+            metric_domain_kwargs={"batch_id": "my_batch", "column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={
+                "batch_id": "my_batch",
+                "column": "a",
+                "row_condition": 'b=="x"',
+                "condition_parser": "pandas",
+            },
+        ),
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": "my_other_batch"},
+        ),
+    }
+
+    groups = ValidationGraph._group_metrics_by_compute_domain(metrics=metrics)
+
+    assert sorted(len(group) for group in groups) == [1, 1, 2]
+    assert groups == ValidationGraph._group_metrics_by_compute_domain(metrics=metrics)
+    assert {
+        metric.metric_name for group in groups if len(group) == 2 for metric in group
+    } == {
+        "column.max",
+        "column.min",
+    }
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_concurrently_by_compute_domain():
+    from great_expectations.data_context.types.base import ConcurrencyConfig
+
+    metric_configurations = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_batch", "column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_batch", "column": "b"},
+        ),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_other_batch", "column": "a"},
+        ),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": "my_failing_batch", "column": "a"},
+        ),
+    ]
+    failed_metric_configuration = metric_configurations[-1]
+
+    calls: List[Tuple[str, ...]] = []
+    thread_names: Set[str] = set()
+
+    class ConcurrentExecutionEngineFake:
+        supports_concurrent_metric_resolution = True
+
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            thread_names.add(threading.current_thread().name)
+            calls.append(
+                tuple(
+                    metric_configuration.metric_domain_kwargs["batch_id"]
+                    for metric_configuration in metrics_to_resolve
+                )
+            )
+            if failed_metric_configuration in metrics_to_resolve:
+                raise gx_exceptions.MetricResolutionError(
+                    message="Error: failing batch.",
+                    failed_metrics=[failed_metric_configuration],
+                )
+
+            return {
+                metric_configuration.id: metric_configuration.metric_domain_kwargs[
+                    "column"
+                ]
+                for metric_configuration in metrics_to_resolve
+            }
+
+    execution_engine = cast(ExecutionEngine, ConcurrentExecutionEngineFake())
+    graph = ValidationGraph(
+        execution_engine=execution_engine,
+        edges=[
+            MetricEdge(left=metric_configuration)
+            for metric_configuration in metric_configurations
+        ],
+    )
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        runtime_configuration={"catch_exceptions": True},
+        show_progress_bars=False,
+        concurrency=ConcurrencyConfig(enabled=True),
+    )
+
+    assert resolved_metrics == {
+        metric_configuration.id: metric_configuration.metric_domain_kwargs["column"]
+        for metric_configuration in metric_configurations[:-1]
+    }
+    assert list(aborted_metrics_info.keys()) == [failed_metric_configuration.id]
+    assert (
+        aborted_metrics_info[failed_metric_configuration.id]["num_failures"]
+        == MAX_METRIC_COMPUTATION_RETRIES
+    )
+    # Column metrics on the same Batch share compute domain and are resolved together.
+    assert ("my_batch", "my_batch") in calls
+    assert calls.count(("my_failing_batch",)) == MAX_METRIC_COMPUTATION_RETRIES
+    # First frontier (three compute domains) is dispatched to worker threads.
+    assert thread_names - {threading.main_thread().name}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "show_progress_bars, are_progress_bars_disabled, ",
@@ -436,11 +564,8 @@ def test_progress_bar_config(
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
-        return_value=(
-            {},
-            {},
-        ),
+        "great_expectations.validator.validation_graph._MetricScheduler",
+        return_value=mock.Mock(ready_metrics=set(), needed_metrics=set()),
     ), mock.patch(
         "great_expectations.validator.validation_graph.ValidationGraph.edges",
         new_callable=mock.PropertyMock,
@@ -474,6 +599,82 @@ def test_progress_bar_config(
         assert mock_tqdm.call_args[1]["disable"] is are_progress_bars_disabled
 
 
+@pytest.mark.unit
+def test_metric_scheduler_emits_metrics_as_dependencies_resolve():
+    root = MetricConfiguration(metric_name="root", metric_domain_kwargs={})
+    left = MetricConfiguration(metric_name="left", metric_domain_kwargs={})
+    right = MetricConfiguration(metric_name="right", metric_domain_kwargs={})
+    leaf = MetricConfiguration(metric_name="leaf", metric_domain_kwargs={})
+    edges = [
+        MetricEdge(left=root, right=left),
+        MetricEdge(left=root, right=right),
+        MetricEdge(left=left, right=leaf),
+        MetricEdge(left=right, right=leaf),
+        MetricEdge(left=leaf),
+    ]
+
+    scheduler = _MetricScheduler(edges=edges, metrics={})
+    assert scheduler.ready_metrics == {leaf}
+    assert scheduler.needed_metrics == {root, left, right}
+
+    scheduler.mark_resolved(metric_ids=[leaf.id])
+    assert scheduler.ready_metrics == {left, right}
+    assert scheduler.needed_metrics == {root}
+
+    # Resolving the same metric again must not count towards its dependents twice.
+    scheduler.mark_resolved(metric_ids=[leaf.id, left.id])
+    assert scheduler.ready_metrics == {right}
+    assert scheduler.needed_metrics == {root}
+
+    scheduler.mark_resolved(metric_ids=[right.id])
+    assert scheduler.ready_metrics == {root}
+    assert scheduler.needed_metrics == set()
+
+    # Metrics resolved up front are neither ready nor needed.
+    scheduler = _MetricScheduler(edges=edges, metrics={leaf.id: 1, left.id: 2})
+    assert scheduler.ready_metrics == {right}
+    assert scheduler.needed_metrics == {root}
+
+
+@pytest.mark.unit
+def test_resolve_validation_graph_resolves_dependency_chain_level_by_level():
+    class ChainExecutionEngine:
+        def __init__(self) -> None:
+            self.calls: List[Set[str]] = []
+
+        def resolve_metrics(
+            self,
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            self.calls.append({metric.metric_name for metric in metrics_to_resolve})
+            return {metric.id: metric.metric_name for metric in metrics_to_resolve}
+
+    chain_length = 5
+    metric_configurations = [
+        MetricConfiguration(metric_name=f"metric_{idx}", metric_domain_kwargs={})
+        for idx in range(chain_length)
+    ]
+    execution_engine = ChainExecutionEngine()
+    graph = ValidationGraph(execution_engine=cast(ExecutionEngine, execution_engine))
+    graph.add(MetricEdge(left=metric_configurations[-1]))
+    for dependent, dependency in zip(
+        metric_configurations[:-1], metric_configurations[1:]
+    ):
+        graph.add(MetricEdge(left=dependent, right=dependency))
+
+    resolved_metrics, aborted_metrics_info = graph.resolve()
+
+    assert aborted_metrics_info == {}
+    assert execution_engine.calls == [
+        {f"metric_{idx}"} for idx in reversed(range(chain_length))
+    ]
+    assert {
+        metric_configuration.id for metric_configuration in metric_configurations
+    } <= set(resolved_metrics.keys())
+
+
 if __name__ == "__main__":
     argv: list = sys.argv[1:]
 